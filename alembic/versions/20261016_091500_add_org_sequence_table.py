@@ -0,0 +1,50 @@
+"""add_org_sequence_table
+
+Revision ID: 7c1e5a9d2b34
+Revises: 4a8b2c3d5e6f
+Create Date: 2026-10-16 09:15:00.000000
+
+Adds the k_org_sequence counter table used to allocate task and feature numbers
+per organization, and backfills it from the IDs already in k_task and k_feature
+(including soft-deleted rows, whose IDs still occupy the primary key).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# Import sqlmodel for SQLModel-specific types (AutoString, etc.)
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5a9d2b34'
+down_revision: Union[str, Sequence[str], None] = '4a8b2c3d5e6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('k_org_sequence',
+    sa.Column('org_id', sa.Uuid(), nullable=False),
+    sa.Column('kind', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+    sa.Column('last_value', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['org_id'], ['k_organization.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('org_id', 'kind')
+    )
+
+    # Seed counters from existing IDs (last UUID section holds the number)
+    for kind, table in (('task', 'k_task'), ('feature', 'k_feature')):
+        op.execute(
+            f"""
+            INSERT INTO k_org_sequence (org_id, kind, last_value)
+            SELECT org_id, '{kind}', MAX(CAST(split_part(id::text, '-', 5) AS BIGINT))
+            FROM {table}
+            GROUP BY org_id
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('k_org_sequence')
@@ -0,0 +1,39 @@
+"""add_fido2_challenge_table
+
+Revision ID: b5d2e8f41c07
+Revises: 7c1e5a9d2b34
+Create Date: 2026-10-16 14:00:00.000000
+
+Adds k_fido2_challenge, which holds pending FIDO2 ceremony challenges so that a
+ceremony's begin and complete requests can be served by different workers.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# Import sqlmodel for SQLModel-specific types (AutoString, etc.)
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d2e8f41c07'
+down_revision: Union[str, Sequence[str], None] = '7c1e5a9d2b34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('k_fido2_challenge',
+    sa.Column('session_id', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+    sa.Column('challenge', sa.LargeBinary(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('session_id')
+    )
+    op.create_index(op.f('ix_k_fido2_challenge_expires_at'), 'k_fido2_challenge', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_k_fido2_challenge_expires_at'), table_name='k_fido2_challenge')
+    op.drop_table('k_fido2_challenge')
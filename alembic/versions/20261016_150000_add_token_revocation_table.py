@@ -0,0 +1,47 @@
+"""add_token_revocation_table
+
+Revision ID: c81f4a6e9d25
+Revises: b5d2e8f41c07
+Create Date: 2026-10-16 15:00:00.000000
+
+Adds k_token_revocation, which records revoked JWTs (by jti) and revoked
+principals until the tokens they cover have expired.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# Import sqlmodel for SQLModel-specific types (AutoString, etc.)
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f4a6e9d25'
+down_revision: Union[str, Sequence[str], None] = 'b5d2e8f41c07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('k_token_revocation',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('jti', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True),
+    sa.Column('principal_id', sa.Uuid(), nullable=False),
+    sa.Column('revoked_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_k_token_revocation_expires_at'), 'k_token_revocation', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_k_token_revocation_jti'), 'k_token_revocation', ['jti'], unique=False)
+    op.create_index(op.f('ix_k_token_revocation_principal_id'), 'k_token_revocation', ['principal_id'], unique=False)
+    op.create_index(op.f('ix_k_token_revocation_revoked_at'), 'k_token_revocation', ['revoked_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_k_token_revocation_revoked_at'), table_name='k_token_revocation')
+    op.drop_index(op.f('ix_k_token_revocation_principal_id'), table_name='k_token_revocation')
+    op.drop_index(op.f('ix_k_token_revocation_jti'), table_name='k_token_revocation')
+    op.drop_index(op.f('ix_k_token_revocation_expires_at'), table_name='k_token_revocation')
+    op.drop_table('k_token_revocation')
@@ -0,0 +1,49 @@
+"""add_task_feature_list_indexes
+
+Revision ID: d4a7e1c93b58
+Revises: c81f4a6e9d25
+Create Date: 2026-10-16 16:00:00.000000
+
+Adds composite partial indexes (WHERE deleted_at IS NULL) backing the task
+and feature list filters and the (created, id) keyset pagination order.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7e1c93b58'
+down_revision: Union[str, Sequence[str], None] = 'c81f4a6e9d25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOT_DELETED = sa.text('deleted_at IS NULL')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_k_task_org_created', 'k_task', ['org_id', 'created', 'id'], unique=False, postgresql_where=NOT_DELETED)
+    op.create_index('ix_k_task_org_status', 'k_task', ['org_id', 'status'], unique=False, postgresql_where=NOT_DELETED)
+    op.create_index('ix_k_task_org_team', 'k_task', ['org_id', 'team_id'], unique=False, postgresql_where=NOT_DELETED)
+    op.create_index('ix_k_task_org_review_result', 'k_task', ['org_id', 'review_result'], unique=False, postgresql_where=NOT_DELETED)
+    op.create_index('ix_k_task_org_last_modified', 'k_task', ['org_id', 'last_modified'], unique=False, postgresql_where=NOT_DELETED)
+    op.create_index('ix_k_feature_org_created', 'k_feature', ['org_id', 'created', 'id'], unique=False, postgresql_where=NOT_DELETED)
+    op.create_index('ix_k_feature_org_type', 'k_feature', ['org_id', 'feature_type'], unique=False, postgresql_where=NOT_DELETED)
+    op.create_index('ix_k_feature_org_parent', 'k_feature', ['org_id', 'parent'], unique=False, postgresql_where=NOT_DELETED)
+    op.create_index('ix_k_feature_org_review_result', 'k_feature', ['org_id', 'review_result'], unique=False, postgresql_where=NOT_DELETED)
+    op.create_index('ix_k_feature_org_last_modified', 'k_feature', ['org_id', 'last_modified'], unique=False, postgresql_where=NOT_DELETED)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_k_feature_org_last_modified', table_name='k_feature')
+    op.drop_index('ix_k_feature_org_review_result', table_name='k_feature')
+    op.drop_index('ix_k_feature_org_parent', table_name='k_feature')
+    op.drop_index('ix_k_feature_org_type', table_name='k_feature')
+    op.drop_index('ix_k_feature_org_created', table_name='k_feature')
+    op.drop_index('ix_k_task_org_last_modified', table_name='k_task')
+    op.drop_index('ix_k_task_org_review_result', table_name='k_task')
+    op.drop_index('ix_k_task_org_team', table_name='k_task')
+    op.drop_index('ix_k_task_org_status', table_name='k_task')
+    op.drop_index('ix_k_task_org_created', table_name='k_task')
@@ -0,0 +1,36 @@
+"""add_doc_content_digest
+
+Revision ID: e5b8f2d04a69
+Revises: d4a7e1c93b58
+Create Date: 2026-10-16 17:00:00.000000
+
+Adds k_doc.content_length and k_doc.content_hash so doc listings can describe
+content without selecting it, and backfills them for existing docs.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8f2d04a69'
+down_revision: Union[str, Sequence[str], None] = 'd4a7e1c93b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('k_doc', sa.Column('content_length', sa.Integer(), nullable=True))
+    op.add_column('k_doc', sa.Column('content_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True))
+    op.execute(
+        "UPDATE k_doc SET content_length = length(content), "
+        "content_hash = encode(sha256(convert_to(content, 'UTF8')), 'hex')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('k_doc', 'content_hash')
+    op.drop_column('k_doc', 'content_length')
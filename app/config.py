@@ -34,6 +34,58 @@ class Settings(SecureReprMixin, BaseSettings):
     db_name: str = Field(default="skrm_local", description="Database name")
     db_user: str = Field(default="skrm_user", description="Database user")
     db_password: str = Field(default="P@ssword12", description="Database password")
+    db_pool_size: int = Field(
+        default=5, description="Connections kept open in each worker's pool"
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        description="Extra connections a worker may open beyond db_pool_size under load",
+    )
+    db_pool_timeout: float = Field(
+        default=30.0,
+        description="Seconds to wait for a pooled connection before failing the request",
+    )
+    db_pool_recycle: int = Field(
+        default=3600, description="Recycle pooled connections after this many seconds"
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description="Test each connection with a round trip before handing it out",
+    )
+    db_replica_host: str | None = Field(
+        default=None,
+        description="Read-replica host for read-only routes (unset sends all reads to the primary)",
+    )
+    db_replica_port: int | None = Field(
+        default=None, description="Read-replica port (defaults to db_port)"
+    )
+    db_replica_max_lag_seconds: float = Field(
+        default=5.0,
+        description="Seconds a principal reads from the primary after writing (should exceed replica lag)",
+    )
+    db_statement_cache_size: int = Field(
+        default=100,
+        description="Prepared statement cache size per connection (0 when behind PgBouncer in transaction mode)",
+    )
+    sql_n_plus_one_threshold: int = Field(
+        default=5,
+        description="Log a request that runs the same SQL statement shape more than this many times (0 disables)",
+    )
+    slow_query_threshold_ms: float = Field(
+        default=200.0,
+        description="Log statements slower than this many milliseconds (0 disables)",
+    )
+    slow_query_explain_sample_rate: float = Field(
+        default=0.01,
+        description="Fraction of slow SELECTs re-run with EXPLAIN (ANALYZE, BUFFERS) on a side connection (0 disables)",
+    )
+    slow_query_max_plans: int = Field(
+        default=100, description="Number of captured slow-query plans kept per worker"
+    )
+    server_timing_enabled: bool = Field(
+        default=False,
+        description="Add a Server-Timing header with per-request database time and statement count",
+    )
 
     # Security configuration
     secret_key: str = Field(
@@ -51,6 +103,14 @@ class Settings(SecureReprMixin, BaseSettings):
         default=1,
         description="Absolute refresh token expiration in months from session start",
     )
+    token_revocation_sync_interval_seconds: float = Field(
+        default=5.0,
+        description="Seconds between polls for token revocations made by other workers (0 disables)",
+    )
+    token_revocation_sweep_interval_seconds: float = Field(
+        default=3600.0,
+        description="Seconds between deletions of expired token revocations (0 disables)",
+    )
     cookie_secure: bool = Field(
         default=True,
         description="Set Secure flag on cookies (True for HTTPS, False for HTTP in development). Auto-set to False when debug=True",
@@ -72,6 +132,25 @@ class Settings(SecureReprMixin, BaseSettings):
         default=False,
         description="Require resident key (discoverable credential) for registration",
     )
+    fido2_challenge_store: Literal["memory", "postgres"] = Field(
+        default="postgres",
+        description="Where pending FIDO2 challenges are kept (memory only works with a single worker)",
+    )
+    fido2_challenge_ttl_seconds: float = Field(
+        default=300.0, description="Seconds a FIDO2 ceremony may take to complete"
+    )
+    fido2_challenge_sweep_interval_seconds: float = Field(
+        default=60.0,
+        description="Seconds between sweeps of expired FIDO2 challenges (0 disables)",
+    )
+    fido2_credential_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="Time-to-live (in seconds) for cached FIDO2 credential descriptors (0 disables)",
+    )
+    fido2_credential_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of principals with cached FIDO2 credential descriptors",
+    )
 
     # CORS configuration
     cors_origins: list[str] = Field(
@@ -93,6 +172,83 @@ class Settings(SecureReprMixin, BaseSettings):
         default=600, description="Maximum age (in seconds) for CORS preflight cache"
     )
 
+    # Password hashing configuration
+    password_hash_max_workers: int = Field(
+        default=4,
+        description="Threads computing bcrypt hashes and checks off the event loop",
+    )
+    password_hash_max_queue: int = Field(
+        default=64,
+        description="Password hashes allowed to wait for a thread before requests get 503",
+    )
+    password_hash_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor for new password hashes (each step doubles the work)",
+    )
+
+    # List pagination configuration
+    list_page_default_size: int = Field(
+        default=100,
+        ge=1,
+        description="Items per page for list requests that do not set a limit",
+    )
+    list_page_max_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum items per page a list request may ask for",
+    )
+    list_stream_batch_size: int = Field(
+        default=500,
+        ge=1,
+        description="Rows fetched per server-side cursor batch when streaming a list as NDJSON",
+    )
+    doc_excerpt_max_length: int = Field(
+        default=1000,
+        ge=1,
+        description="Longest content excerpt a doc listing may ask for, in characters",
+    )
+
+    # In-process cache configuration
+    membership_cache_ttl_seconds: float = Field(
+        default=30.0,
+        description="Time-to-live (in seconds) for cached organization memberships (0 disables)",
+    )
+    membership_cache_max_entries: int = Field(
+        default=10000, description="Maximum number of cached organization memberships"
+    )
+    principal_cache_ttl_seconds: float = Field(
+        default=30.0,
+        description="Time-to-live (in seconds) for cached principals of authenticated requests (0 disables)",
+    )
+    principal_cache_max_entries: int = Field(
+        default=10000, description="Maximum number of cached principals"
+    )
+    authorization_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="Time-to-live (in seconds) for materialized per-organization principal grants (0 disables)",
+    )
+    authorization_cache_max_entries: int = Field(
+        default=10000, description="Maximum number of cached principal grants"
+    )
+    token_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of verified JWT payloads cached until they expire (0 disables)",
+    )
+    metrics_log_interval_seconds: float = Field(
+        default=60.0,
+        description="Seconds between metrics snapshots written to the log (0 disables)",
+    )
+    cache_invalidation_enabled: bool = Field(
+        default=True,
+        description="Broadcast cache invalidations to other workers via Postgres LISTEN/NOTIFY",
+    )
+    cache_invalidation_channel: str = Field(
+        default="skrm_cache_invalidation",
+        description="Postgres notification channel used for cache invalidations",
+    )
+
     @field_validator("cors_origins", mode="before")
     @classmethod
     def parse_cors_origins(cls, v: str | list[str]) -> list[str]:
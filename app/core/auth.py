@@ -1,5 +1,7 @@
 """Authentication and security utilities for the application."""
 
+import hashlib
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid7
@@ -8,11 +10,16 @@ import bcrypt
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy import select
+from sqlmodel import col
 
 from app.schemas.user import UserDetail
 
 from ..config import settings
 from ..models import KPrincipal, KPrincipalIdentity
+from .cache import TTLCache
+from .metrics import metrics_registry
+from .password_hasher import password_hasher
+from .revocation import token_revocations
 
 SECRET_KEY = settings.secret_key
 ALGORITHM = settings.algorithm
@@ -21,9 +28,19 @@ REFRESH_TOKEN_EXPIRE_DAYS = settings.refresh_token_expire_days
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Verified token payloads keyed by the SHA-256 digest of the token, so raw tokens
+# are never held in memory. Each entry expires at the token's own ``exp`` claim.
+verified_token_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+    "verified_tokens", maxsize=settings.token_cache_max_entries, ttl=0
+)
+metrics_registry.register("verified_tokens", verified_token_cache.metrics)
+metrics_registry.register("password_hasher", password_hasher.metrics)
 
-async def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
+_REQUIRED_CLAIMS = ("sub", "scope", "iss", "aud", "jti", "iat", "exp", "ss")
+
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against its bcrypt hash (blocking)."""
     password_bytes = plain_password.encode("utf-8")
 
     if len(password_bytes) > 72:
@@ -33,17 +50,37 @@ async def verify_password(plain_password: str, hashed_password: str) -> bool:
     return correct_password
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
+def _hash_password(password: str) -> str:
+    """Hash a password using bcrypt (blocking)."""
     password_bytes = password.encode("utf-8")
 
     if len(password_bytes) > 72:
         password_bytes = password_bytes[:72]
 
-    hashed_password: str = bcrypt.hashpw(password_bytes, bcrypt.gensalt()).decode()
+    hashed_password: str = bcrypt.hashpw(
+        password_bytes, bcrypt.gensalt(rounds=settings.password_hash_rounds)
+    ).decode()
     return hashed_password
 
 
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash, off the event loop.
+
+    Raises:
+        PasswordHashingUnavailableException: If too many checks are already queued
+    """
+    return await password_hasher.run(_check_password, plain_password, hashed_password)
+
+
+async def get_password_hash(password: str) -> str:
+    """Hash a password using bcrypt, off the event loop.
+
+    Raises:
+        PasswordHashingUnavailableException: If too many hashes are already queued
+    """
+    return await password_hasher.run(_hash_password, password)
+
+
 async def create_access_token(
     data: dict[str, Any],
     now: datetime,
@@ -70,7 +107,6 @@ async def create_access_token(
     to_encode.update({"iat": int(now_utc.timestamp())})
     to_encode.update({"exp": int(expire_utc.timestamp())})
     to_encode.update({"ss": int(session_start_utc.timestamp())})
-    print(f"create_access_token to_encode: {to_encode}")
     encoded_jwt: str = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -101,7 +137,6 @@ async def create_refresh_token(
     to_encode.update({"iat": int(now_utc.timestamp())})
     to_encode.update({"exp": int(expire_utc.timestamp())})
     to_encode.update({"ss": int(session_start_utc.timestamp())})
-    print(f"create_refresh_token: to_encode: {to_encode}")
     encoded_jwt: str = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -109,6 +144,10 @@ async def create_refresh_token(
 async def verify_token(token: str) -> dict[str, Any] | None:
     """Verify a JWT token and return payload if valid.
 
+    Verified payloads are cached until the token expires, so a client reusing the
+    same access token skips the decode and signature check. Revoked tokens are
+    rejected on every call, cached or not, without a database query.
+
     Parameters
     ----------
     token: str
@@ -117,8 +156,15 @@ async def verify_token(token: str) -> dict[str, Any] | None:
     Returns
     -------
     dict[str, Any] | None
-        Token payload if the token is valid, None otherwise.
+        Token payload if the token is valid and not revoked, None otherwise.
     """
+    cache_key = hashlib.sha256(token.encode()).digest()
+    cached = verified_token_cache.get(cache_key)
+    if cached is not None:
+        if token_revocations.is_revoked(cached):
+            return None
+        return dict(cached)
+
     try:
         # Decode without audience verification since we're not validating against a specific audience
         # but keep expiration verification enabled
@@ -130,16 +176,21 @@ async def verify_token(token: str) -> dict[str, Any] | None:
         )
 
         # Verify all required JWT claims are present
-        required_claims = ["sub", "scope", "iss", "aud", "jti", "iat", "exp", "ss"]
-        for claim in required_claims:
+        for claim in _REQUIRED_CLAIMS:
             if claim not in payload:
                 return None
 
-        return payload
-
     except JWTError:
         return None
 
+    ttl = payload["exp"] - time.time()
+    if ttl > 0 and verified_token_cache.maxsize > 0:
+        verified_token_cache.set(cache_key, dict(payload), ttl=ttl)
+
+    if token_revocations.is_revoked(payload):
+        return None
+    return payload
+
 
 async def authenticate_user(
     username: str,
@@ -156,32 +207,33 @@ async def authenticate_user(
     Returns:
         UserDetail if authentication successful, None otherwise
     """
-    stmt = select(KPrincipal).where(
-        KPrincipal.scope == "global",  # type: ignore[arg-type]
-        KPrincipal.human == True,  # type: ignore[arg-type]  # noqa: E712
-        KPrincipal.enabled == True,  # type: ignore[arg-type]  # noqa: E712
-        KPrincipal.username == username,  # type: ignore[arg-type]
-        KPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
+    # One round trip for the principal and its password hash
+    stmt = (
+        select(KPrincipal, col(KPrincipalIdentity.password))
+        .join(
+            KPrincipalIdentity,
+            col(KPrincipalIdentity.principal_id) == KPrincipal.id,
+        )
+        .where(
+            col(KPrincipal.scope) == "global",
+            col(KPrincipal.human) == True,  # noqa: E712
+            col(KPrincipal.enabled) == True,  # noqa: E712
+            col(KPrincipal.username) == username,
+            col(KPrincipal.deleted_at).is_(None),
+            col(KPrincipalIdentity.password).is_not(None),
+        )
+        .limit(1)
     )
     result = await db.execute(stmt)
-    principal = result.scalar_one_or_none()
+    row = result.first()
 
-    if not principal:
+    if row is None:
         return None
 
-    # Query for the user's password hash
-    identity_stmt = select(KPrincipalIdentity).where(
-        KPrincipalIdentity.principal_id == principal.id,
-        KPrincipalIdentity.password != None,  # type: ignore[arg-type]  # noqa: E711
-    )
-    identity_result = await db.execute(identity_stmt)
-    principal_identity = identity_result.scalar_one_or_none()
-
-    if not principal_identity or not principal_identity.password:
-        return None
+    principal, password_hash = row
 
     # Verify the password
-    if await verify_password(password, principal_identity.password):
+    if await verify_password(password, password_hash):
         return UserDetail.model_validate(principal)
 
     return None
@@ -190,8 +242,10 @@ async def authenticate_user(
 __all__ = [
     "oauth2_scheme",
     "verify_password",
+    "get_password_hash",
     "create_access_token",
     "create_refresh_token",
     "verify_token",
+    "verified_token_cache",
     "authenticate_user",
 ]
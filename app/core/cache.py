@@ -0,0 +1,191 @@
+"""In-process caches with LRU eviction and per-entry expiry.
+
+These caches live in a single worker process. Anything cached here must either
+tolerate staleness up to the entry TTL or be explicitly invalidated by the
+logic-layer functions that change the underlying rows.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple, cast
+
+_MISSING: Any = object()
+
+
+class CacheStats(NamedTuple):
+    """Snapshot of a cache's counters."""
+
+    name: str
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache[K: Hashable, V]:
+    """Bounded LRU cache whose entries expire after a time-to-live.
+
+    Lookups and writes are O(1). Expired entries are dropped lazily when they are
+    looked up or when they reach the LRU end of the cache.
+
+    Example:
+        cache: TTLCache[str, int] = TTLCache("example", maxsize=1024, ttl=30.0)
+        cache.set("answer", 42)
+        cache.get("answer")  # 42
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            name: Name used in stats and log output
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl: Default time-to-live for entries, in seconds
+            clock: Monotonic clock returning seconds (overridable for tests)
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._entries.get(cast(K, key))
+        return entry is not None and entry[1] > self._clock()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Get a cached value, counting the lookup as a hit or miss.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached value, or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds for this entry (defaults to the cache TTL)
+        """
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        """Remove a single entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed
+        """
+        return self._entries.pop(key, _MISSING) is not _MISSING
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> int:
+        """Remove every entry whose key matches a predicate.
+
+        This scans the whole cache, so it is meant for rare, coarse invalidations
+        (e.g. dropping everything for a deleted organization).
+
+        Args:
+            predicate: Function returning True for keys to remove
+
+        Returns:
+            Number of entries removed
+        """
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def invalidate_items_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Remove every entry whose key and value match a predicate.
+
+        Like ``invalidate_where`` this scans the whole cache, but it can also look
+        at the cached values (e.g. to drop entries that reference a changed row).
+
+        Args:
+            predicate: Function returning True for (key, value) pairs to remove
+
+        Returns:
+            Number of entries removed
+        """
+        keys = [
+            key for key, (value, _) in self._entries.items() if predicate(key, value)
+        ]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters."""
+        return CacheStats(
+            name=self.name,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+    def metrics(self) -> dict[str, Any]:
+        """Get the cache counters as a metrics source for ``metrics_registry``."""
+        stats = self.stats()
+        return {
+            **stats._asdict(),
+            "hit_ratio": round(stats.hit_ratio, 4),
+        }
+
+
+__all__ = ["CacheStats", "TTLCache"]
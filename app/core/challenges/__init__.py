@@ -0,0 +1,23 @@
+"""Single-use, expiring challenge storage for FIDO2 ceremonies."""
+
+from ...config import settings
+from .memory import InMemoryChallengeStore
+from .postgres import PostgresChallengeStore
+from .store import ChallengeStore
+
+
+def create_challenge_store() -> ChallengeStore:
+    """Create the challenge store selected by ``fido2_challenge_store``."""
+    if settings.fido2_challenge_store == "memory":
+        return InMemoryChallengeStore()
+    return PostgresChallengeStore(
+        sweep_interval=settings.fido2_challenge_sweep_interval_seconds
+    )
+
+
+__all__ = [
+    "ChallengeStore",
+    "InMemoryChallengeStore",
+    "PostgresChallengeStore",
+    "create_challenge_store",
+]
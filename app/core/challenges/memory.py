@@ -0,0 +1,94 @@
+"""In-process challenge store.
+
+Only valid with a single worker: a ceremony that begins on one worker and
+completes on another will not find its challenge. Used in tests and development.
+"""
+
+import heapq
+import time
+from collections.abc import Callable
+
+
+class InMemoryChallengeStore:
+    """Challenge store backed by a dict and a heap of expiry deadlines.
+
+    Lookups are O(1). Expired entries are dropped from the front of the deadline
+    heap on every call, so expiry costs O(log n) per entry instead of a scan of
+    the whole store.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the store.
+
+        Args:
+            clock: Monotonic clock returning seconds (overridable for tests)
+        """
+        self._clock = clock
+        self._challenges: dict[str, tuple[bytes, float]] = {}
+        self._deadlines: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._challenges)
+
+    async def put(self, session_id: str, challenge: bytes, ttl: float) -> None:
+        """Store a challenge.
+
+        Args:
+            session_id: Unique session identifier
+            challenge: Challenge bytes
+            ttl: Seconds until the challenge expires
+        """
+        self._expire()
+        deadline = self._clock() + ttl
+        self._challenges[session_id] = (challenge, deadline)
+        heapq.heappush(self._deadlines, (deadline, session_id))
+
+    async def pop(self, session_id: str) -> bytes | None:
+        """Take a challenge out of the store.
+
+        Args:
+            session_id: Unique session identifier
+
+        Returns:
+            Challenge bytes if found and not expired, None otherwise
+        """
+        self._expire()
+        entry = self._challenges.pop(session_id, None)
+        if entry is None or entry[1] <= self._clock():
+            return None
+        return entry[0]
+
+    async def sweep(self) -> int:
+        """Delete expired challenges.
+
+        Returns:
+            Number of challenges deleted
+        """
+        return self._expire()
+
+    async def start(self) -> None:
+        """Nothing to start; expiry happens on access."""
+
+    async def stop(self) -> None:
+        """Nothing to stop."""
+
+    def clear(self) -> None:
+        """Remove all challenges."""
+        self._challenges.clear()
+        self._deadlines.clear()
+
+    def _expire(self) -> int:
+        """Drop challenges whose deadline has passed."""
+        now = self._clock()
+        expired = 0
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, session_id = heapq.heappop(self._deadlines)
+            entry = self._challenges.get(session_id)
+            # Skip heap entries for challenges already taken or stored again
+            if entry is not None and entry[1] == deadline:
+                del self._challenges[session_id]
+                expired += 1
+        return expired
+
+
+__all__ = ["InMemoryChallengeStore"]
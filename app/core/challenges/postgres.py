@@ -0,0 +1,135 @@
+"""Postgres-backed challenge store shared by all workers.
+
+Challenges live in ``k_fido2_challenge``. Taking one is a single
+``DELETE ... RETURNING`` that only matches unexpired rows, so a challenge can
+be used at most once even when two workers race for it. Abandoned ceremonies
+are removed by a periodic sweep.
+"""
+
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from ...models import KFido2Challenge
+from ..db.database import get_db_session
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _utcnow() -> datetime:
+    """Get the current time as naive UTC, as stored in ``expires_at``."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class PostgresChallengeStore:
+    """Challenge store backed by the ``k_fido2_challenge`` table."""
+
+    def __init__(
+        self,
+        sweep_interval: float,
+        db_session_factory: Callable[
+            [], AbstractAsyncContextManager[AsyncSession]
+        ] = get_db_session,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            sweep_interval: Seconds between sweeps of expired rows (0 disables)
+            db_session_factory: Factory opening a primary database session
+            clock: Function returning the current naive UTC time (overridable for tests)
+        """
+        self.sweep_interval = sweep_interval
+        self._db_session_factory = db_session_factory
+        self._clock = clock
+        self._sweep_task: asyncio.Task[None] | None = None
+
+    async def put(self, session_id: str, challenge: bytes, ttl: float) -> None:
+        """Store a challenge.
+
+        Args:
+            session_id: Unique session identifier
+            challenge: Challenge bytes
+            ttl: Seconds until the challenge expires
+        """
+        async with self._db_session_factory() as session:
+            await session.execute(
+                insert(KFido2Challenge).values(
+                    session_id=session_id,
+                    challenge=challenge,
+                    expires_at=self._clock() + timedelta(seconds=ttl),
+                )
+            )
+            await session.commit()
+
+    async def pop(self, session_id: str) -> bytes | None:
+        """Take a challenge out of the store.
+
+        Args:
+            session_id: Unique session identifier
+
+        Returns:
+            Challenge bytes if found and not expired, None otherwise
+        """
+        async with self._db_session_factory() as session:
+            result = await session.execute(
+                delete(KFido2Challenge)
+                .where(
+                    KFido2Challenge.session_id == session_id,  # type: ignore[arg-type]
+                    KFido2Challenge.expires_at > self._clock(),  # type: ignore[arg-type]
+                )
+                .returning(col(KFido2Challenge.challenge))
+            )
+            challenge = result.scalar_one_or_none()
+            await session.commit()
+        return challenge
+
+    async def sweep(self) -> int:
+        """Delete expired challenges.
+
+        Returns:
+            Number of challenges deleted
+        """
+        async with self._db_session_factory() as session:
+            result = await session.execute(
+                delete(KFido2Challenge).where(
+                    KFido2Challenge.expires_at <= self._clock()  # type: ignore[arg-type]
+                )
+            )
+            await session.commit()
+        return result.rowcount  # type: ignore[attr-defined, no-any-return]
+
+    async def start(self) -> None:
+        """Start sweeping expired challenges in the background."""
+        if self.sweep_interval <= 0 or self._sweep_task is not None:
+            return
+        self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def stop(self) -> None:
+        """Stop the background sweep."""
+        if self._sweep_task is None:
+            return
+        self._sweep_task.cancel()
+        await asyncio.gather(self._sweep_task, return_exceptions=True)
+        self._sweep_task = None
+
+    async def _sweep_loop(self) -> None:
+        """Sweep periodically until cancelled."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                deleted = await self.sweep()
+            except Exception as e:
+                logger.warning("Failed to sweep expired FIDO2 challenges", error=str(e))
+                continue
+            if deleted:
+                logger.debug("Swept expired FIDO2 challenges", count=deleted)
+
+
+__all__ = ["PostgresChallengeStore"]
@@ -0,0 +1,53 @@
+"""Challenge store interface for FIDO2 ceremonies.
+
+A ceremony stores its challenge in ``begin`` and takes it back exactly once in
+``complete``. The two requests may land on different workers, so production
+deployments use the shared Postgres store; the in-memory store serves tests and
+single-process development.
+"""
+
+from typing import Protocol
+
+
+class ChallengeStore(Protocol):
+    """Stores single-use challenges that expire after a time-to-live."""
+
+    async def put(self, session_id: str, challenge: bytes, ttl: float) -> None:
+        """Store a challenge.
+
+        Args:
+            session_id: Unique session identifier
+            challenge: Challenge bytes
+            ttl: Seconds until the challenge expires
+        """
+        ...
+
+    async def pop(self, session_id: str) -> bytes | None:
+        """Take a challenge out of the store.
+
+        Args:
+            session_id: Unique session identifier
+
+        Returns:
+            Challenge bytes if found and not expired, None otherwise
+        """
+        ...
+
+    async def sweep(self) -> int:
+        """Delete expired challenges.
+
+        Returns:
+            Number of challenges deleted
+        """
+        ...
+
+    async def start(self) -> None:
+        """Start background maintenance (called during application startup)."""
+        ...
+
+    async def stop(self) -> None:
+        """Stop background maintenance (called during application shutdown)."""
+        ...
+
+
+__all__ = ["ChallengeStore"]
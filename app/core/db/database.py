@@ -13,7 +13,13 @@ from sqlalchemy.ext.asyncio import (
 from sqlmodel import SQLModel
 
 from ...config import settings
+from ..context import principal_id_var
 from ..logging import get_logger
+from ..metrics import metrics_registry
+from .instrumentation import sql_instrumentation
+from .pool_metrics import PoolMetrics, instrumented_pool_class
+from .replica import REPLICA_INFO_KEY, PrimarySession, read_your_writes
+from .slow_query import slow_query_log
 
 logger = get_logger(__name__)
 
@@ -24,34 +30,92 @@ class DatabaseConfig:
     def __init__(self) -> None:
         self.engine: AsyncEngine | None = None
         self.session_factory: async_sessionmaker[AsyncSession] | None = None
+        self.pool_metrics = PoolMetrics()
+        self.replica_engine: AsyncEngine | None = None
+        self.replica_session_factory: async_sessionmaker[AsyncSession] | None = None
+        self.replica_pool_metrics = PoolMetrics()
         self._initialized = False
 
-    def initialize(self) -> None:
-        """Initialize the database engine and session factory."""
-        if self._initialized:
-            return
+    def _create_engine(
+        self, host: str, port: int, pool_metrics: PoolMetrics
+    ) -> AsyncEngine:
+        """Create an engine for one database server using the shared pool settings.
 
+        Args:
+            host: Database host
+            port: Database port
+            pool_metrics: Metrics to record pool checkouts into
+
+        Returns:
+            The async engine, with SQL instrumentation and the slow-query log attached
+        """
         # Use direct connection parameters instead of URL to avoid asyncpg macOS issues
-        self.engine = create_async_engine(
+        engine = create_async_engine(
             settings.database_url,
             echo=settings.debug,
             future=True,
-            pool_pre_ping=True,  # Verify connections before use
-            pool_recycle=3600,  # Recycle connections after 1 hour
+            poolclass=instrumented_pool_class(pool_metrics),
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
             connect_args={
-                "host": settings.db_host,
-                "port": settings.db_port,
+                "host": host,
+                "port": port,
                 "user": settings.db_user,
                 "password": settings.db_password,
                 "database": settings.db_name,
+                # asyncpg's own cache and SQLAlchemy's adapter cache
+                "statement_cache_size": settings.db_statement_cache_size,
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
             },
         )
+        sql_instrumentation.attach(engine)
+        slow_query_log.attach(engine)
+        return engine
+
+    def initialize(self) -> None:
+        """Initialize the database engines and session factories."""
+        if self._initialized:
+            return
 
+        self.engine = self._create_engine(
+            settings.db_host, settings.db_port, self.pool_metrics
+        )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
             class_=AsyncSession,
+            sync_session_class=PrimarySession,
             expire_on_commit=False,
         )
+        metrics_registry.register("db_pool", self.pool_metrics.snapshot)
+        metrics_registry.register("sql", sql_instrumentation.metrics)
+        metrics_registry.register("slow_queries", slow_query_log.metrics)
+
+        if settings.db_replica_host:
+            self.replica_engine = self._create_engine(
+                settings.db_replica_host,
+                settings.db_replica_port or settings.db_port,
+                self.replica_pool_metrics,
+            )
+            self.replica_session_factory = async_sessionmaker(
+                bind=self.replica_engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                info={REPLICA_INFO_KEY: True},
+            )
+            read_your_writes.enabled = True
+            if not settings.cache_invalidation_enabled:
+                # Pins then only apply in the worker that saw the write
+                logger.warning(
+                    "Read replica configured without cache invalidation; "
+                    "read-your-writes only holds within a worker"
+                )
+            metrics_registry.register(
+                "db_replica_pool", self.replica_pool_metrics.snapshot
+            )
+            metrics_registry.register("read_your_writes", read_your_writes.metrics)
 
         self._initialized = True
 
@@ -66,7 +130,9 @@ class DatabaseConfig:
             await conn.run_sync(SQLModel.metadata.create_all)
 
     async def close(self) -> None:
-        """Close the database engine."""
+        """Close the database engines."""
+        if self.replica_engine is not None:
+            await self.replica_engine.dispose()
         if self.engine is not None:
             await self.engine.dispose()
             self._initialized = False
@@ -77,15 +143,28 @@ db_config = DatabaseConfig()
 
 
 @asynccontextmanager
-async def get_db_session() -> AsyncGenerator[AsyncSession]:
-    """Get a database session with proper cleanup."""
+async def get_db_session(read_only: bool = False) -> AsyncGenerator[AsyncSession]:
+    """Get a database session with proper cleanup.
+
+    Args:
+        read_only: Use the read replica, if one is configured and the current
+            principal has not written recently
+    """
     if not db_config._initialized:
         db_config.initialize()
 
     if db_config.session_factory is None:
         raise RuntimeError("Database session factory not initialized")
 
-    async with db_config.session_factory() as session:
+    session_factory = db_config.session_factory
+    if (
+        read_only
+        and db_config.replica_session_factory is not None
+        and not read_your_writes.is_pinned(principal_id_var.get())
+    ):
+        session_factory = db_config.replica_session_factory
+
+    async with session_factory() as session:
         try:
             yield session
         except Exception:
@@ -96,11 +175,29 @@ async def get_db_session() -> AsyncGenerator[AsyncSession]:
 
 
 async def get_db() -> AsyncGenerator[AsyncSession]:
-    """Dependency for FastAPI to get database session."""
+    """Dependency for FastAPI to get database session.
+
+    The session checks out a pooled connection on its first statement, not when it
+    is created, so requests rejected before touching the database never take one.
+    Declare it with ``Depends(get_db, scope="function")`` so the session, and its
+    connection, are released as soon as the route function returns rather than
+    after the response has been serialized and sent.
+    """
     async with get_db_session() as session:
         yield session
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession]:
+    """Dependency for FastAPI to get a session for read-only routes.
+
+    Uses the read replica when one is configured, except for principals who wrote
+    within the last ``db_replica_max_lag_seconds`` (so they see their own writes).
+    Declare it with ``scope="function"``, as for ``get_db``.
+    """
+    async with get_db_session(read_only=True) as session:
+        yield session
+
+
 async def create_all_tables() -> None:
     """Create all database tables. Called during application startup. This should be done by Alembic."""
     if not db_config._initialized:
@@ -119,6 +216,8 @@ async def cleanup_database() -> None:
     if db_config._initialized and db_config.engine is not None:
         logger.info("Closing database engine (async)")
         try:
+            if db_config.replica_engine is not None:
+                await db_config.replica_engine.dispose()
             await db_config.engine.dispose()
             db_config._initialized = False
             logger.info("Database engine closed (async)")
@@ -0,0 +1,269 @@
+"""Per-request SQL instrumentation.
+
+Cursor events on each engine add the statement count, time spent in the database
+and rows returned to the stats of the request that issued them, looked up by the
+``request_id_var`` set by ``RequestContextMiddleware``. Statements are also
+counted by shape (SQL text with placeholders normalized), so a request that runs
+the same query in a loop - an N+1 pattern - can be flagged when it finishes.
+
+This module only depends on the request context (not on logging or metrics) so
+that the logging setup can read the current stats without an import cycle.
+"""
+
+import re
+import time
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..context import request_id_var
+
+_QUERY_START_KEY = "instrumentation_query_start"
+
+# Bind placeholders for asyncpg ($1), sqlite/qmark (?) and pyformat (%(name)s)
+_PLACEHOLDER = re.compile(r"\$\d+|\?|%\(\w+\)s")
+# Expanded IN lists vary in length per call; collapse them to a single shape
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+# Called after every statement with (connection, statement, parameters,
+# duration in seconds, executemany)
+StatementObserver = Callable[[Connection, str, Any, float, bool], None]
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so calls with different parameters compare equal.
+
+    Args:
+        statement: SQL text as sent to the driver
+
+    Returns:
+        Statement with placeholders replaced by ``?``, IN lists collapsed and
+        whitespace squeezed
+    """
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("?, ...", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def _row_count(cursor: Any) -> int:
+    """Get the number of rows a statement returned or affected.
+
+    Row-returning statements report a rowcount of -1 on SQLAlchemy's asyncpg and
+    aiosqlite adapters, so their buffered rows are counted instead; the rowcount
+    is only used for statements without a result (INSERT/UPDATE/DELETE).
+    """
+    rowcount = getattr(cursor, "rowcount", -1)
+    if rowcount is not None and rowcount >= 0:
+        return rowcount
+    rows = getattr(cursor, "_rows", None)
+    return len(rows) if rows is not None else 0
+
+
+class QueryStats:
+    """SQL statistics for a single request."""
+
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self.statements = 0
+        self.duration = 0.0
+        self.rows = 0
+        self.shapes: Counter[str] = Counter()
+
+    @property
+    def duration_ms(self) -> float:
+        """Total time spent executing statements, in milliseconds."""
+        return round(self.duration * 1000, 3)
+
+    def record(self, statement: str, duration: float, rows: int) -> None:
+        """Record one executed statement.
+
+        Args:
+            statement: SQL text as sent to the driver
+            duration: Seconds spent executing it
+            rows: Rows returned or affected
+        """
+        self.statements += 1
+        self.duration += duration
+        self.rows += rows
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Get statement shapes executed more than ``threshold`` times.
+
+        Args:
+            threshold: Maximum executions of one shape before it is reported
+
+        Returns:
+            (shape, count) pairs, most frequent first
+        """
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count > threshold
+        ]
+
+    def server_timing(self) -> str:
+        """Format the stats as a ``Server-Timing`` header value."""
+        return f'db;dur={self.duration_ms};desc="{self.statements} queries"'
+
+    def log_context(self) -> dict[str, Any]:
+        """Get the stats as structured log fields."""
+        return {
+            "db_statements": self.statements,
+            "db_time_ms": self.duration_ms,
+            "db_rows": self.rows,
+        }
+
+
+class SQLInstrumentation:
+    """Collects SQL statistics per request from engine cursor events."""
+
+    def __init__(self) -> None:
+        """Initialize the instrumentation."""
+        self._active: dict[UUID, QueryStats] = {}
+        self._observers: list[StatementObserver] = []
+        self.requests = 0
+        self.statements = 0
+        self.max_statements = 0
+        self.n_plus_one_requests = 0
+        self.n_plus_one_routes: Counter[str] = Counter()
+
+    def attach(self, engine: AsyncEngine | Engine) -> None:
+        """Listen to cursor events on an engine.
+
+        Args:
+            engine: Engine whose statements should be counted
+        """
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        if event.contains(sync_engine, "before_cursor_execute", self._before_execute):
+            return
+        event.listen(sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_execute)
+
+    def observe(self, observer: StatementObserver) -> None:
+        """Hand every timed statement to another consumer (e.g. the slow-query log).
+
+        Observers reuse this instrumentation's timing instead of registering their
+        own cursor listeners, so each statement is timed once.
+
+        Args:
+            observer: Function called after each statement
+        """
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def begin(self, request_id: UUID) -> QueryStats:
+        """Start collecting stats for a request.
+
+        Args:
+            request_id: ID of the request, as stored in ``request_id_var``
+
+        Returns:
+            The (empty) stats for the request
+        """
+        stats = QueryStats()
+        self._active[request_id] = stats
+        return stats
+
+    def end(
+        self, request_id: UUID, route: str | None = None, n_plus_one_threshold: int = 0
+    ) -> QueryStats | None:
+        """Stop collecting stats for a request and fold them into the metrics.
+
+        Args:
+            request_id: ID of the request
+            route: Route the request matched, used to attribute N+1 patterns
+            n_plus_one_threshold: Executions of one shape above which the request
+                is counted as N+1 (0 disables)
+
+        Returns:
+            The request's stats, or None if collection was not started
+        """
+        stats = self._active.pop(request_id, None)
+        if stats is None:
+            return None
+
+        self.requests += 1
+        self.statements += stats.statements
+        self.max_statements = max(self.max_statements, stats.statements)
+        if n_plus_one_threshold > 0 and stats.repeated_statements(n_plus_one_threshold):
+            self.n_plus_one_requests += 1
+            if route is not None:
+                self.n_plus_one_routes[route] += 1
+        return stats
+
+    def current(self) -> QueryStats | None:
+        """Get the stats of the request running in the current context."""
+        request_id = request_id_var.get()
+        if request_id is None:
+            return None
+        return self._active.get(request_id)
+
+    def reset(self) -> None:
+        """Drop all active stats and clear the metrics."""
+        self._active.clear()
+        self.requests = 0
+        self.statements = 0
+        self.max_statements = 0
+        self.n_plus_one_requests = 0
+        self.n_plus_one_routes.clear()
+
+    def metrics(self) -> dict[str, Any]:
+        """Get aggregate counters as a metrics source for ``metrics_registry``."""
+        return {
+            "active_requests": len(self._active),
+            "requests": self.requests,
+            "statements": self.statements,
+            "max_statements_per_request": self.max_statements,
+            "n_plus_one_requests": self.n_plus_one_requests,
+            "n_plus_one_routes": dict(self.n_plus_one_routes.most_common()),
+        }
+
+    def _before_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        conn.info[_QUERY_START_KEY] = time.perf_counter()
+
+    def _after_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        started = conn.info.pop(_QUERY_START_KEY, None)
+        if started is None:
+            return
+
+        duration = time.perf_counter() - started
+        stats = self.current()
+        if stats is not None:
+            stats.record(statement, duration, _row_count(cursor))
+        for observer in self._observers:
+            observer(conn, statement, parameters, duration, executemany)
+
+
+# Global SQL instrumentation
+sql_instrumentation = SQLInstrumentation()
+
+__all__ = [
+    "QueryStats",
+    "SQLInstrumentation",
+    "StatementObserver",
+    "sql_instrumentation",
+    "statement_shape",
+]
@@ -0,0 +1,136 @@
+"""Connection pool telemetry.
+
+Tracks how long requests wait for the pool to hand out a connection and how often
+they give up, alongside the pool's live occupancy. Together these show whether
+``db_pool_size``/``db_max_overflow`` are sized correctly for the number of workers
+and tasks sharing the database's ``max_connections``.
+"""
+
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from ..logging import get_logger
+from ..metrics import Histogram
+
+logger = get_logger(__name__)
+
+# Checkout wait buckets, in seconds (most checkouts should land in the first bucket)
+CHECKOUT_WAIT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class PoolMetrics:
+    """Counters and checkout wait histogram for one connection pool."""
+
+    def __init__(self) -> None:
+        """Initialize the pool metrics."""
+        self.checkout_wait = Histogram(CHECKOUT_WAIT_BUCKETS)
+        self.checkout_timeouts = 0
+        self.pool: AsyncAdaptedQueuePool | None = None
+        self.max_overflow: int | None = None
+
+    def observe_checkout(self, wait: float) -> None:
+        """Record a successful checkout.
+
+        Args:
+            wait: Seconds spent waiting for the pool to hand out a connection
+        """
+        self.checkout_wait.observe(wait)
+
+    def observe_timeout(self, wait: float) -> None:
+        """Record a checkout that timed out.
+
+        Args:
+            wait: Seconds spent waiting before giving up
+        """
+        self.checkout_timeouts += 1
+        pool = self.pool
+        logger.warning(
+            "Database pool checkout timed out",
+            waited=round(wait, 3),
+            pool_size=pool.size() if pool else None,
+            checked_out=pool.checkedout() if pool else None,
+            overflow=pool.overflow() if pool else None,
+        )
+
+    def reset(self) -> None:
+        """Clear the counters and histogram."""
+        self.checkout_wait.reset()
+        self.checkout_timeouts = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get live pool occupancy plus the checkout counters."""
+        pool = self.pool
+        occupancy: dict[str, Any] = {}
+        if pool is not None:
+            occupancy = {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": self.max_overflow,
+                "timeout": pool.timeout(),
+            }
+
+        return {
+            **occupancy,
+            "checkout_timeouts": self.checkout_timeouts,
+            "checkout_wait_seconds": self.checkout_wait.snapshot(),
+        }
+
+
+def instrumented_pool_class(metrics: PoolMetrics) -> type[AsyncAdaptedQueuePool]:
+    """Create an async queue pool class that reports checkouts to ``metrics``.
+
+    Only the pool's own ``_do_get`` is timed: the wait on the queue, plus opening a
+    new connection when the pool overflows. Pre-ping and checkout events run after
+    it and are not included, so the histogram reflects pool sizing.
+
+    A class is created per metrics object because SQLAlchemy instantiates the pool
+    itself (and again on ``dispose``), so it cannot be handed extra arguments.
+
+    Args:
+        metrics: Metrics to record checkouts into
+
+    Returns:
+        Pool class to pass as ``poolclass`` to ``create_async_engine``
+    """
+
+    class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+        """AsyncAdaptedQueuePool that times every checkout."""
+
+        def __init__(
+            self, creator: Any, *, max_overflow: int = 10, **kwargs: Any
+        ) -> None:
+            super().__init__(creator, max_overflow=max_overflow, **kwargs)
+            metrics.pool = self
+            metrics.max_overflow = max_overflow
+
+        def _do_get(self) -> ConnectionPoolEntry:
+            started = time.perf_counter()
+            try:
+                record = super()._do_get()
+            except exc.TimeoutError:
+                metrics.observe_timeout(time.perf_counter() - started)
+                raise
+            metrics.observe_checkout(time.perf_counter() - started)
+            return record
+
+    return InstrumentedAsyncAdaptedQueuePool
+
+
+__all__ = ["CHECKOUT_WAIT_BUCKETS", "PoolMetrics", "instrumented_pool_class"]
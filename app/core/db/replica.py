@@ -0,0 +1,154 @@
+"""Read-replica routing with read-your-writes stickiness.
+
+Read-only routes use ``get_read_db``, which hands out replica sessions when a
+replica is configured. A replica lags the primary slightly, so a principal who
+just wrote something could read stale data from it. Primary sessions detect
+committed writes and pin the writing principal to the primary for
+``db_replica_max_lag_seconds``. The pin applies in the writing worker at once
+and is broadcast over the invalidation bus to the other workers. Cross-worker
+stickiness therefore depends on the bus: with ``cache_invalidation_enabled`` off,
+a principal whose next request lands on another worker may read from the replica.
+"""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from ...config import settings
+from ..cache import TTLCache
+from ..context import principal_id_var
+from ..invalidation import (
+    InvalidationBus,
+    InvalidationKind,
+    InvalidationMessage,
+    invalidation_bus,
+)
+
+# Session.info key marking a session that wrote since its last commit or rollback
+_WROTE_KEY = "wrote"
+
+# Session.info key marking replica sessions
+REPLICA_INFO_KEY = "replica"
+
+
+class ReadYourWritesTracker:
+    """Tracks principals who must read from the primary after writing."""
+
+    def __init__(
+        self,
+        window: float,
+        maxsize: int = 100000,
+        bus: InvalidationBus = invalidation_bus,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            window: Seconds a principal stays pinned to the primary after a write
+            maxsize: Maximum number of pinned principals tracked
+            bus: Invalidation bus used to share pins with other workers
+        """
+        self.enabled = False
+        self._bus = bus
+        self._pins: TTLCache[str, bool] = TTLCache(
+            "read_your_writes", maxsize=maxsize, ttl=window
+        )
+        bus.subscribe(InvalidationKind.PRINCIPAL_WRITE, self._pin_from_message)
+
+    def pin(self, principal_id: str) -> None:
+        """Pin a principal to the primary in this worker.
+
+        Args:
+            principal_id: Principal ID (the JWT ``sub`` claim)
+        """
+        self._pins.set(principal_id, True)
+
+    def is_pinned(self, principal_id: str | None) -> bool:
+        """Check whether a principal's reads must go to the primary.
+
+        Args:
+            principal_id: Principal ID, or None for anonymous requests
+
+        Returns:
+            True if the principal wrote within the stickiness window
+        """
+        return principal_id is not None and principal_id in self._pins
+
+    def record_write(self, principal_id: str | None) -> None:
+        """Pin a principal who just committed a write, in every worker.
+
+        The pin applies in this worker immediately; other workers pick it up once
+        the bus broadcasts it (never, if the bus is not running).
+
+        Args:
+            principal_id: Principal ID, or None for anonymous requests
+        """
+        if not self.enabled or principal_id is None:
+            return
+
+        self.pin(principal_id)
+        try:
+            entity_id = UUID(principal_id)
+        except ValueError:
+            return
+
+        self._bus.publish(InvalidationKind.PRINCIPAL_WRITE, entity_id=entity_id)
+
+    def clear(self) -> None:
+        """Remove all pins."""
+        self._pins.clear()
+
+    def metrics(self) -> dict[str, Any]:
+        """Get pin counters as a metrics source."""
+        return self._pins.metrics()
+
+    def _pin_from_message(self, message: InvalidationMessage) -> None:
+        """Apply a broadcast write from another worker."""
+        if message.entity_id is not None:
+            self.pin(str(message.entity_id))
+
+
+class PrimarySession(Session):
+    """Session class for the primary database that reports committed writes."""
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _mark_flush_write(session: Session, flush_context: Any) -> None:
+    """Flushes only run when there are pending ORM changes."""
+    session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _mark_statement_write(orm_execute_state: ORMExecuteState) -> None:
+    """Catch bulk and Core INSERT/UPDATE/DELETE statements."""
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _pin_writer(session: Session) -> None:
+    """Pin the current principal once their write is committed."""
+    if session.info.pop(_WROTE_KEY, False):
+        read_your_writes.record_write(principal_id_var.get())
+
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _forget_write(session: Session) -> None:
+    """Rolled back writes are invisible everywhere, so no pin is needed."""
+    session.info.pop(_WROTE_KEY, None)
+
+
+# Global read-your-writes tracker (enabled when a replica is configured)
+read_your_writes = ReadYourWritesTracker(window=settings.db_replica_max_lag_seconds)
+
+__all__ = [
+    "REPLICA_INFO_KEY",
+    "PrimarySession",
+    "ReadYourWritesTracker",
+    "read_your_writes",
+]
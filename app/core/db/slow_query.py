@@ -0,0 +1,319 @@
+"""Slow-query log with sampled EXPLAIN capture.
+
+Statements slower than ``slow_query_threshold_ms`` are logged with their
+normalized SQL, the types of their bound parameters, the application function
+that issued them and the request ID (added by the logging setup). A sampled
+fraction of slow ``SELECT`` statements is re-run as ``EXPLAIN (ANALYZE, BUFFERS)``
+on a separate pooled connection, and the plans are kept in a bounded ring buffer
+for the admin endpoint. ``ANALYZE`` executes the statement again, so only plain
+``SELECT`` statements without locking clauses are explained, the side
+transaction is read-only and it is always rolled back.
+
+Statements are timed once, by ``SQLInstrumentation``, which hands each duration
+to this log.
+"""
+
+import asyncio
+import random
+import re
+import sys
+from collections import deque
+from collections.abc import Callable
+from datetime import UTC, datetime
+from types import FrameType
+from typing import Any, NamedTuple
+from uuid import UUID
+
+import greenlet
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ...config import settings
+from ..context import request_id_var
+from ..logging import get_logger
+from .instrumentation import SQLInstrumentation, sql_instrumentation, statement_shape
+
+logger = get_logger(__name__)
+
+# Application packages whose frames are reported as the caller
+_CALLER_MODULE_PREFIX = "app."
+_IGNORED_MODULE_PREFIXES = ("app.core.",)
+
+# Upper bound on how long an EXPLAIN ANALYZE may run
+_EXPLAIN_TIMEOUT_MS = 10000
+
+_EXPLAINABLE_PREFIX = "SELECT"
+# Clauses that make a SELECT write or take row locks (FOR UPDATE/SHARE, SELECT INTO)
+_UNSAFE_TO_EXPLAIN = re.compile(
+    r"\b(?:INSERT|UPDATE|DELETE|MERGE|INTO|FOR\s+(?:NO\s+KEY\s+|KEY\s+)?"
+    r"(?:UPDATE|SHARE))\b",
+    re.IGNORECASE,
+)
+
+
+class SlowQuery(NamedTuple):
+    """A slow statement and, if it was sampled, its execution plan."""
+
+    captured_at: datetime
+    statement: str
+    parameters: list[str] | dict[str, str]
+    duration_ms: float
+    caller: str | None
+    request_id: UUID | None
+    plan: str | None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            **self._asdict(),
+            "captured_at": self.captured_at.isoformat(),
+            "request_id": str(self.request_id) if self.request_id else None,
+        }
+
+
+def parameter_shape(parameters: Any) -> list[str] | dict[str, str]:
+    """Describe bound parameters by type, without logging their values.
+
+    Args:
+        parameters: Parameters as passed to the driver (sequence or mapping)
+
+    Returns:
+        Type names, keyed by name for mappings
+    """
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, list | tuple):
+        return [type(value).__name__ for value in parameters]
+    return []
+
+
+def _parent_greenlet_frame() -> FrameType | None:
+    """Get the frame the current greenlet was switched to from, if any.
+
+    SQLAlchemy's async engine runs driver calls in a child greenlet, whose stack
+    ends at ``greenlet_spawn``. The awaiting coroutine's frames live on the parent.
+    """
+    parent = greenlet.getcurrent().parent
+    return parent.gr_frame if parent is not None else None
+
+
+def calling_function() -> str | None:
+    """Find the application function (outside ``app.core``) that ran a statement.
+
+    Returns:
+        Qualified name like ``app.logic.v1.tasks.list_tasks``, or None if the
+        statement did not come from application code
+    """
+    frame: FrameType | None = sys._getframe(1)
+    crossed_greenlet = False
+    while True:
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith(_CALLER_MODULE_PREFIX) and not module.startswith(
+                _IGNORED_MODULE_PREFIXES
+            ):
+                return f"{module}.{frame.f_code.co_qualname}"
+            frame = frame.f_back
+
+        if crossed_greenlet:
+            return None
+        frame = _parent_greenlet_frame()
+        crossed_greenlet = True
+
+
+class SlowQueryLog:
+    """Logs slow statements and keeps sampled execution plans."""
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        explain_sample_rate: float,
+        max_plans: int,
+        sampler: Callable[[], float] = random.random,
+        instrumentation: SQLInstrumentation = sql_instrumentation,
+    ) -> None:
+        """Initialize the slow-query log.
+
+        Args:
+            threshold_ms: Statements slower than this are logged (0 disables)
+            explain_sample_rate: Fraction of slow SELECTs to EXPLAIN (0 disables)
+            max_plans: Number of captured plans to keep
+            sampler: Function returning a float in [0, 1) (overridable for tests)
+            instrumentation: Instrumentation that times statements for this log
+        """
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self._sampler = sampler
+        self._instrumentation = instrumentation
+        self._engines: dict[Engine, AsyncEngine] = {}
+        self._plans: deque[SlowQuery] = deque(maxlen=max_plans)
+        self._explain_task: asyncio.Task[None] | None = None
+        self.slow_queries = 0
+        self.explains = 0
+        self.explain_failures = 0
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Check the statements of an engine, as timed by the instrumentation.
+
+        Args:
+            engine: Engine whose statements should be checked
+        """
+        self._engines[engine.sync_engine] = engine
+        self._instrumentation.attach(engine)
+        self._instrumentation.observe(self._on_statement)
+
+    def plans(self) -> list[SlowQuery]:
+        """Get captured plans, newest first."""
+        return list(reversed(self._plans))
+
+    def clear(self) -> None:
+        """Drop captured plans and reset counters."""
+        self._plans.clear()
+        self.slow_queries = 0
+        self.explains = 0
+        self.explain_failures = 0
+
+    def metrics(self) -> dict[str, Any]:
+        """Get the counters as a metrics source for ``metrics_registry``."""
+        return {
+            "threshold_ms": self.threshold_ms,
+            "slow_queries": self.slow_queries,
+            "explains": self.explains,
+            "explain_failures": self.explain_failures,
+            "plans": len(self._plans),
+        }
+
+    def record(
+        self,
+        engine: AsyncEngine | None,
+        statement: str,
+        parameters: Any,
+        duration_ms: float,
+        executemany: bool = False,
+    ) -> None:
+        """Log a statement that exceeded the threshold and maybe explain it.
+
+        Args:
+            engine: Engine the statement ran on (used for the EXPLAIN connection)
+            statement: SQL text as sent to the driver
+            parameters: Bound parameters as sent to the driver
+            duration_ms: Execution time in milliseconds
+            executemany: Whether the statement ran once per parameter set
+        """
+        self.slow_queries += 1
+        shape = statement_shape(statement)
+        params = parameter_shape(
+            parameters[0] if executemany and parameters else parameters
+        )
+        caller = calling_function()
+        logger.warning(
+            "Slow query",
+            statement=shape,
+            parameters=params,
+            duration_ms=round(duration_ms, 3),
+            caller=caller,
+            executemany=executemany,
+        )
+
+        if engine is None or not self._should_explain(engine, shape, executemany):
+            return
+
+        query = SlowQuery(
+            captured_at=datetime.now(UTC).replace(tzinfo=None),
+            statement=shape,
+            parameters=params,
+            duration_ms=round(duration_ms, 3),
+            caller=caller,
+            request_id=request_id_var.get(),
+            plan=None,
+        )
+        self._explain_task = asyncio.get_running_loop().create_task(
+            self._explain(engine, query, statement, parameters)
+        )
+
+    def _should_explain(
+        self, engine: AsyncEngine, shape: str, executemany: bool
+    ) -> bool:
+        """Decide whether to capture a plan for a slow statement."""
+        if executemany or self.explain_sample_rate <= 0:
+            return False
+        if engine.dialect.name != "postgresql":
+            return False
+        if not shape.upper().startswith(_EXPLAINABLE_PREFIX):
+            return False
+        if _UNSAFE_TO_EXPLAIN.search(shape):
+            return False
+        # One EXPLAIN at a time, so a burst of slow queries cannot drain the pool
+        if self._explain_task is not None and not self._explain_task.done():
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return self._sampler() < self.explain_sample_rate
+
+    async def _explain(
+        self, engine: AsyncEngine, query: SlowQuery, statement: str, parameters: Any
+    ) -> None:
+        """Run EXPLAIN (ANALYZE, BUFFERS) on a side connection and keep the plan."""
+        # This task copied the request's context; detach from the request so the
+        # EXPLAIN statements are not counted in its SQL stats
+        request_id_var.set(None)
+        try:
+            async with engine.connect() as conn:
+                await conn.exec_driver_sql("SET TRANSACTION READ ONLY")
+                await conn.exec_driver_sql(
+                    f"SET LOCAL statement_timeout = {_EXPLAIN_TIMEOUT_MS}"
+                )
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+                )
+                plan = "\n".join(row[0] for row in result)
+                await conn.rollback()
+        except Exception as e:
+            self.explain_failures += 1
+            logger.warning(
+                "Failed to explain slow query", statement=query.statement, error=str(e)
+            )
+            return
+
+        self.explains += 1
+        self._plans.append(query._replace(plan=plan))
+
+    def _on_statement(
+        self,
+        conn: Connection,
+        statement: str,
+        parameters: Any,
+        duration: float,
+        executemany: bool,
+    ) -> None:
+        if self.threshold_ms <= 0:
+            return
+
+        duration_ms = duration * 1000
+        if duration_ms < self.threshold_ms or statement.startswith("EXPLAIN"):
+            return
+        self.record(
+            self._engines.get(conn.engine),
+            statement,
+            parameters,
+            duration_ms,
+            executemany,
+        )
+
+
+# Global slow-query log
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.slow_query_threshold_ms,
+    explain_sample_rate=settings.slow_query_explain_sample_rate,
+    max_plans=settings.slow_query_max_plans,
+)
+
+__all__ = [
+    "SlowQuery",
+    "SlowQueryLog",
+    "calling_function",
+    "parameter_shape",
+    "slow_query_log",
+]
@@ -266,6 +266,14 @@ class InvalidCredentialsException(DomainException):
         self.username = username
 
 
+class PasswordHashingUnavailableException(DomainException):
+    """Raised when too many password hashes are already running or queued."""
+
+    def __init__(self) -> None:
+        message = "Too many concurrent password checks, please retry shortly"
+        super().__init__(message, entity_type="password")
+
+
 # ============================================================================
 # Authorization-related exceptions
 # ============================================================================
@@ -446,6 +454,20 @@ class DocUpdateConflictException(DomainException):
         self.scope = scope
 
 
+class DocContentRangeNotSatisfiableException(DomainException):
+    """Raised when a content range starts beyond the end of a doc's content."""
+
+    def __init__(self, doc_id: UUID, start: int, content_length: int):
+        message = (
+            f"Range starting at {start} is beyond the end of doc '{doc_id}' "
+            f"({content_length} characters)"
+        )
+        super().__init__(message, entity_type="doc", entity_id=doc_id)
+        self.doc_id = doc_id
+        self.start = start
+        self.content_length = content_length
+
+
 # ============================================================================
 # Deployment Environment-related exceptions
 # ============================================================================
@@ -527,7 +549,7 @@ class FeatureUpdateConflictException(DomainException):
 
 
 class FeatureCreationFailedException(DomainException):  # pragma: no cover
-    """Raised when feature creation fails after retries."""
+    """Raised when a feature cannot be created (e.g. its allocated ID is taken)."""
 
     def __init__(self, message: str, org_id: UUID | None = None):
         super().__init__(message, entity_type="feature", entity_id=org_id)
@@ -552,7 +574,7 @@ class TaskNotFoundException(DomainException):
 
 
 class TaskCreationFailedException(DomainException):  # pragma: no cover
-    """Raised when task creation fails after retries."""
+    """Raised when a task cannot be created (e.g. its allocated ID is taken)."""
 
     def __init__(self, message: str, org_id: UUID | None = None):
         super().__init__(message, entity_type="task", entity_id=org_id)
@@ -793,3 +815,31 @@ class SprintTeamAlreadyExistsException(DomainException):
         self.sprint_id = sprint_id
         self.team_id = team_id
         self.scope = scope
+
+
+# ============================================================================
+# Pagination-related exceptions
+# ============================================================================
+
+
+class InvalidCursorException(DomainException):
+    """Raised when a list cursor is malformed or belongs to a different sort order."""
+
+    def __init__(self, cursor: str):
+        message = "Invalid pagination cursor"
+        super().__init__(message, entity_type="cursor", entity_id=cursor)
+        self.cursor = cursor
+
+
+# ============================================================================
+# Projection-related exceptions
+# ============================================================================
+
+
+class InvalidFieldsException(DomainException):
+    """Raised when a read requests fields the entity does not have."""
+
+    def __init__(self, entity_type: str, fields: list[str]):
+        message = f"Unknown {entity_type} fields: {', '.join(fields) or '(none)'}"
+        super().__init__(message, entity_type=entity_type)
+        self.fields = fields
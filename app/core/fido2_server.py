@@ -2,7 +2,7 @@
 
 import base64
 import secrets
-from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from fido2.server import Fido2Server
@@ -16,33 +16,44 @@ from fido2.webauthn import (
 )
 
 from ..config import settings
+from .challenges import ChallengeStore, create_challenge_store
 
-# In-memory challenge storage (use Redis in production)
-_challenge_store: dict[str, tuple[bytes, datetime]] = {}
+# Pending ceremony challenges (shared across workers unless configured as "memory")
+challenge_store: ChallengeStore = create_challenge_store()
+
+
+@lru_cache(maxsize=4)
+def _build_fido2_server(rp_id: str, rp_name: str) -> Fido2Server:
+    """Build a FIDO2Server for one set of RP settings."""
+    rp = PublicKeyCredentialRpEntity(name=rp_name, id=rp_id)
+    return Fido2Server(rp, attestation="none")  # type: ignore[arg-type]
 
 
 def get_fido2_server() -> Fido2Server:
     """Get configured FIDO2Server instance.
 
+    The server holds no per-ceremony state (that is returned to the caller), so
+    one instance per RP configuration is built and shared by all requests.
+
     Returns:
         Fido2Server instance configured with RP settings
     """
-    rp = PublicKeyCredentialRpEntity(name=settings.rp_name, id=settings.rp_id)
-    return Fido2Server(rp, attestation="none")  # type: ignore[arg-type]
+    return _build_fido2_server(settings.rp_id, settings.rp_name)
 
 
-def store_challenge(session_id: str, challenge: bytes) -> None:
-    """Store a challenge temporarily.
+async def store_challenge(session_id: str, challenge: bytes) -> None:
+    """Store a challenge until it is retrieved or expires.
 
     Args:
         session_id: Unique session identifier
         challenge: Challenge bytes to store
     """
-    expiration = datetime.now() + timedelta(minutes=5)
-    _challenge_store[session_id] = (challenge, expiration)
+    await challenge_store.put(
+        session_id, challenge, ttl=settings.fido2_challenge_ttl_seconds
+    )
 
 
-def retrieve_challenge(session_id: str) -> bytes | None:
+async def retrieve_challenge(session_id: str) -> bytes | None:
     """Retrieve and remove a stored challenge.
 
     Args:
@@ -51,18 +62,7 @@ def retrieve_challenge(session_id: str) -> bytes | None:
     Returns:
         Challenge bytes if found and not expired, None otherwise
     """
-    # Clean up expired challenges
-    now = datetime.now()
-    expired_keys = [k for k, (_, exp) in _challenge_store.items() if exp < now]
-    for key in expired_keys:
-        del _challenge_store[key]
-
-    # Retrieve and remove challenge
-    if session_id in _challenge_store:
-        challenge, expiration = _challenge_store.pop(session_id)
-        if expiration > now:
-            return challenge
-    return None
+    return await challenge_store.pop(session_id)
 
 
 def generate_session_id() -> str:
@@ -219,6 +219,7 @@ def encode_options_for_client(options: dict[str, Any]) -> dict[str, Any]:
 
 
 __all__ = [
+    "challenge_store",
     "get_fido2_server",
     "store_challenge",
     "retrieve_challenge",
@@ -0,0 +1,22 @@
+"""Cross-worker cache invalidation over Postgres LISTEN/NOTIFY."""
+
+from .bus import (
+    InvalidationBus,
+    InvalidationKind,
+    InvalidationMessage,
+    InvalidationTransport,
+    invalidation_bus,
+)
+from .memory import InMemoryInvalidationHub, InMemoryTransport
+from .postgres import PostgresNotifyTransport
+
+__all__ = [
+    "InMemoryInvalidationHub",
+    "InMemoryTransport",
+    "InvalidationBus",
+    "InvalidationKind",
+    "InvalidationMessage",
+    "InvalidationTransport",
+    "PostgresNotifyTransport",
+    "invalidation_bus",
+]
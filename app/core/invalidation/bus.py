@@ -0,0 +1,315 @@
+"""Cross-worker cache invalidation bus.
+
+Each worker keeps its own in-process caches (see ``app.core.cache``). When the
+logic layer changes a cached row it publishes a compact invalidation message.
+The bus evicts the local entries straight away, then batches the message and
+broadcasts it through a transport so every other worker evicts its copy too.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from enum import StrEnum
+from typing import NamedTuple, Protocol
+from uuid import UUID, uuid7
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+# Keep each broadcast well under Postgres' 8000 byte NOTIFY payload limit
+MAX_MESSAGES_PER_PAYLOAD = 64
+
+
+class InvalidationKind(StrEnum):
+    """Kinds of cached entities that can be invalidated."""
+
+    ORGANIZATION = "organization"
+    ORGANIZATION_PRINCIPAL = "organization_principal"
+    # A principal's own row changed (entity_id is the principal)
+    PRINCIPAL = "principal"
+    # A principal committed a write; pin their reads to the primary
+    PRINCIPAL_WRITE = "principal_write"
+    # A principal's FIDO2 credentials changed (entity_id is the principal)
+    FIDO2_CREDENTIAL = "fido2_credential"
+    # A token or principal was revoked; sync revocations from the database
+    TOKEN_REVOCATION = "token_revocation"
+    # A principal joined or left a team (entity_id is the principal)
+    TEAM_MEMBER = "team_member"
+    # A principal became or stopped being a team reviewer (entity_id is the principal)
+    TEAM_REVIEWER = "team_reviewer"
+    # A team was added to or removed from a project (entity_id is the team)
+    PROJECT_TEAM = "project_team"
+
+
+class InvalidationMessage(NamedTuple):
+    """A single invalidation: which kind of entity changed, and where."""
+
+    kind: str
+    org_id: UUID | None = None
+    entity_id: UUID | None = None
+
+    def encode(self) -> str:
+        """Encode the message as ``kind|org_id|entity_id``."""
+        org_id = self.org_id.hex if self.org_id else ""
+        entity_id = self.entity_id.hex if self.entity_id else ""
+        return f"{self.kind}|{org_id}|{entity_id}"
+
+    @classmethod
+    def decode(cls, line: str) -> InvalidationMessage:
+        """Decode a message produced by ``encode``.
+
+        Raises:
+            ValueError: If the line is malformed
+        """
+        kind, org_id, entity_id = line.split("|")
+        return cls(
+            kind=kind,
+            org_id=UUID(org_id) if org_id else None,
+            entity_id=UUID(entity_id) if entity_id else None,
+        )
+
+
+type InvalidationHandler = Callable[[InvalidationMessage], None]
+type ResetHandler = Callable[[], None]
+
+
+class InvalidationTransport(Protocol):
+    """Broadcast channel shared by all workers."""
+
+    async def run(
+        self,
+        on_payload: Callable[[str], None],
+        on_connected: Callable[[], None],
+    ) -> None:
+        """Receive payloads until cancelled, reconnecting as needed.
+
+        ``on_connected`` must be called every time the transport starts listening,
+        since broadcasts sent while it was not listening were missed.
+        """
+        ...
+
+    async def send(self, payload: str) -> None:
+        """Broadcast a payload to all workers (including this one).
+
+        Raises:
+            ConnectionError: If the payload could not be sent
+        """
+        ...
+
+    async def close(self) -> None:
+        """Release the transport's connection."""
+        ...
+
+
+class InvalidationBus:
+    """Publishes and applies cache invalidations across workers.
+
+    Caches register handlers with ``subscribe`` at import time. ``publish`` may be
+    called whether or not the bus is running; it always evicts locally, and only
+    broadcasts once ``start`` has attached a transport.
+
+    Example usage:
+        invalidation_bus.subscribe(InvalidationKind.ORGANIZATION, evict_org)
+        invalidation_bus.publish(InvalidationKind.ORGANIZATION, org_id=org.id)
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 0.05,
+        retry_interval: float = 1.0,
+        max_pending: int = 10000,
+    ) -> None:
+        """Initialize the invalidation bus.
+
+        Args:
+            flush_interval: Seconds to wait for more messages before broadcasting a batch
+            retry_interval: Seconds to wait before retrying a failed broadcast
+            max_pending: Maximum number of unsent messages kept while the transport is down
+        """
+        self.flush_interval = flush_interval
+        self.retry_interval = retry_interval
+        self.sender_id = uuid7().hex
+        self._handlers: dict[str, list[InvalidationHandler]] = {}
+        self._reset_handlers: list[ResetHandler] = []
+        self._pending: deque[InvalidationMessage] = deque(maxlen=max_pending)
+        self._pending_event: asyncio.Event | None = None
+        self._transport: InvalidationTransport | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether a transport is attached."""
+        return self._transport is not None
+
+    def subscribe(self, kind: str, handler: InvalidationHandler) -> None:
+        """Register a handler for invalidations of a kind.
+
+        Args:
+            kind: Kind of entity
+            handler: Function evicting the local cache entries matching a message
+        """
+        self._handlers.setdefault(kind, []).append(handler)
+
+    def on_reset(self, handler: ResetHandler) -> None:
+        """Register a handler that clears a cache when invalidations may have been missed.
+
+        Args:
+            handler: Function clearing a local cache
+        """
+        self._reset_handlers.append(handler)
+
+    def publish(
+        self, kind: str, org_id: UUID | None = None, entity_id: UUID | None = None
+    ) -> None:
+        """Invalidate an entity locally and queue the invalidation for broadcast.
+
+        Call this after the change has been committed.
+
+        Args:
+            kind: Kind of entity that changed
+            org_id: Organization the entity belongs to, if any
+            entity_id: ID of the entity, if any (None means every entity of the kind)
+        """
+        message = InvalidationMessage(kind=kind, org_id=org_id, entity_id=entity_id)
+        self._dispatch(message)
+
+        if self._transport is not None and self._pending_event is not None:
+            self._pending.append(message)
+            self._pending_event.set()
+
+    async def start(self, transport: InvalidationTransport) -> None:
+        """Attach a transport and start receiving and broadcasting invalidations.
+
+        This should be called during FastAPI application startup. Connecting happens
+        in the background, so an unavailable broker does not block startup.
+
+        Args:
+            transport: Broadcast transport
+        """
+        if self._transport is not None:
+            logger.warning("Cache invalidation bus already started")
+            return
+
+        self._transport = transport
+        self._pending_event = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(transport.run(self._receive, self.reset)),
+            asyncio.create_task(self._flush_loop(self._pending_event)),
+        ]
+        logger.info("Cache invalidation bus started", sender_id=self.sender_id)
+
+    async def stop(self) -> None:
+        """Broadcast anything still queued, then detach the transport.
+
+        This should be called during FastAPI application shutdown.
+        """
+        if self._transport is None:
+            return
+
+        try:
+            await self._flush()
+        except ConnectionError as e:
+            logger.warning(
+                "Dropping unsent cache invalidations",
+                count=len(self._pending),
+                error=str(e),
+            )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        await self._transport.close()
+        self._transport = None
+        self._pending_event = None
+        self._pending.clear()
+        logger.info("Cache invalidation bus stopped")
+
+    def reset(self) -> None:
+        """Clear every subscribed cache.
+
+        Called by the transport whenever it (re)connects, because invalidations
+        broadcast while it was not listening were missed.
+        """
+        logger.info("Resetting local caches", handlers=len(self._reset_handlers))
+        for handler in self._reset_handlers:
+            handler()
+
+    def _dispatch(self, message: InvalidationMessage) -> None:
+        """Apply a message to the local caches."""
+        for handler in self._handlers.get(message.kind, ()):
+            handler(message)
+
+    def _receive(self, payload: str) -> None:
+        """Apply a broadcast payload, skipping this worker's own messages."""
+        sender_id, _, body = payload.partition("\n")
+        if sender_id == self.sender_id:
+            return
+
+        for line in body.splitlines():
+            try:
+                message = InvalidationMessage.decode(line)
+            except ValueError:
+                logger.warning("Ignoring malformed cache invalidation", line=line)
+                continue
+            self._dispatch(message)
+
+    async def _flush(self) -> None:
+        """Broadcast all pending messages, deduplicated and split into payloads.
+
+        Raises:
+            ConnectionError: If the transport is unavailable; unsent messages are requeued
+        """
+        if self._transport is None or not self._pending:
+            return
+
+        messages = list(dict.fromkeys(self._pending))
+        self._pending.clear()
+
+        for start in range(0, len(messages), MAX_MESSAGES_PER_PAYLOAD):
+            batch = messages[start : start + MAX_MESSAGES_PER_PAYLOAD]
+            payload = "\n".join([self.sender_id, *(m.encode() for m in batch)])
+            try:
+                await self._transport.send(payload)
+            except ConnectionError:
+                self._pending.extendleft(reversed(messages[start:]))
+                raise
+
+    async def _flush_loop(self, pending_event: asyncio.Event) -> None:
+        """Broadcast pending messages in batches until cancelled.
+
+        Args:
+            pending_event: Event set whenever a message is queued
+        """
+        while True:
+            await pending_event.wait()
+            # Give concurrent writes a moment to join the batch
+            await asyncio.sleep(self.flush_interval)
+            pending_event.clear()
+
+            try:
+                await self._flush()
+            except ConnectionError as e:
+                logger.warning(
+                    "Cache invalidation broadcast failed, will retry",
+                    pending=len(self._pending),
+                    error=str(e),
+                )
+                await asyncio.sleep(self.retry_interval)
+                pending_event.set()
+
+
+# Global invalidation bus instance
+invalidation_bus = InvalidationBus()
+
+__all__ = [
+    "InvalidationBus",
+    "InvalidationHandler",
+    "InvalidationKind",
+    "InvalidationMessage",
+    "InvalidationTransport",
+    "ResetHandler",
+    "invalidation_bus",
+]
@@ -0,0 +1,121 @@
+"""In-process transport for the cache invalidation bus.
+
+Used in tests (and single-process development setups) where there is no Postgres
+server to LISTEN on, e.g. with the SQLite test engine. Every transport created
+from the same hub behaves like a separate worker connected to the same channel.
+"""
+
+import asyncio
+from collections.abc import Callable
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class InMemoryInvalidationHub:
+    """Shared channel connecting in-memory transports."""
+
+    def __init__(self) -> None:
+        """Initialize the hub."""
+        self.connected = True
+        self.outages = 0
+        self.sent: list[str] = []
+        self._transports: list[InMemoryTransport] = []
+        self._state_changed = asyncio.Condition()
+
+    def transport(self) -> InMemoryTransport:
+        """Create a transport attached to this hub."""
+        transport = InMemoryTransport(self)
+        self._transports.append(transport)
+        return transport
+
+    async def disconnect(self) -> None:
+        """Simulate losing the broker: sends fail until ``reconnect`` is called."""
+        await self._set_connected(False)
+
+    async def reconnect(self) -> None:
+        """Simulate the broker coming back; listening transports resume."""
+        await self._set_connected(True)
+
+    def deliver(self, payload: str) -> None:
+        """Deliver a payload to every listening transport."""
+        self.sent.append(payload)
+        for transport in self._transports:
+            if transport.on_payload is not None:
+                transport.on_payload(payload)
+
+    async def wait_for(self, predicate: Callable[[], bool]) -> None:
+        """Block until a predicate on the hub state holds."""
+        async with self._state_changed:
+            await self._state_changed.wait_for(predicate)
+
+    async def wait_for_outage(self, since: int) -> None:
+        """Block until another outage has started since the given outage count."""
+        await self.wait_for(lambda: self.outages != since)
+
+    async def _set_connected(self, connected: bool) -> None:
+        """Change the connection state and wake waiting transports."""
+        async with self._state_changed:
+            if self.connected and not connected:
+                self.outages += 1
+            self.connected = connected
+            self._state_changed.notify_all()
+
+
+class InMemoryTransport:
+    """Transport delivering payloads synchronously through an in-memory hub."""
+
+    def __init__(self, hub: InMemoryInvalidationHub) -> None:
+        """Initialize the transport.
+
+        Args:
+            hub: Hub shared with the other simulated workers
+        """
+        self.hub = hub
+        self.on_payload: Callable[[str], None] | None = None
+
+    async def run(
+        self,
+        on_payload: Callable[[str], None],
+        on_connected: Callable[[], None],
+    ) -> None:
+        """Listen on the hub until cancelled, resuming after simulated outages.
+
+        Args:
+            on_payload: Called with each delivered payload
+            on_connected: Called every time listening starts (or resumes)
+        """
+        try:
+            while True:
+                await self.hub.wait_for(lambda: self.hub.connected)
+                outages = self.hub.outages
+                self.on_payload = on_payload
+                on_connected()
+
+                # Resume only after an outage, even if it was over before we noticed
+                await self.hub.wait_for_outage(since=outages)
+                self.on_payload = None
+                logger.debug("In-memory invalidation transport disconnected")
+        finally:
+            self.on_payload = None
+
+    async def send(self, payload: str) -> None:
+        """Deliver a payload to every transport on the hub.
+
+        Args:
+            payload: Payload to deliver
+
+        Raises:
+            ConnectionError: If the hub is disconnected
+        """
+        if not self.hub.connected:
+            raise ConnectionError("In-memory invalidation hub is disconnected")
+        self.hub.deliver(payload)
+
+    async def close(self) -> None:
+        """Detach from the hub."""
+        self.on_payload = None
+
+
+__all__ = ["InMemoryInvalidationHub", "InMemoryTransport"]
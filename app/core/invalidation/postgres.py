@@ -0,0 +1,161 @@
+"""Postgres LISTEN/NOTIFY transport for the cache invalidation bus."""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+
+import asyncpg
+
+from ...config import settings
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+
+async def _connect() -> asyncpg.Connection:
+    """Open a dedicated connection using the application database settings."""
+    return await asyncpg.connect(
+        host=settings.db_host,
+        port=settings.db_port,
+        user=settings.db_user,
+        password=settings.db_password,
+        database=settings.db_name,
+        timeout=10,
+    )
+
+
+class PostgresNotifyTransport:
+    """Broadcasts invalidations with NOTIFY and receives them with LISTEN.
+
+    Uses one dedicated asyncpg connection outside the SQLAlchemy pool, because a
+    LISTEN is tied to its connection and pooled connections are handed out to
+    other requests. If the connection drops, it reconnects with exponential
+    backoff and jitter.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        connect: Callable[[], Awaitable[asyncpg.Connection]] = _connect,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            channel: Postgres notification channel name
+            connect: Factory opening a new asyncpg connection
+            initial_backoff: Seconds to wait before the first reconnect attempt
+            max_backoff: Upper bound for the reconnect delay, in seconds
+            health_check_interval: Seconds between liveness checks on an idle connection
+        """
+        self.channel = channel
+        self._connect = connect
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.health_check_interval = health_check_interval
+        self._connection: asyncpg.Connection | None = None
+
+    async def run(
+        self,
+        on_payload: Callable[[str], None],
+        on_connected: Callable[[], None],
+    ) -> None:
+        """Listen for invalidations until cancelled, reconnecting as needed.
+
+        Args:
+            on_payload: Called with each received notification payload
+            on_connected: Called every time listening starts (or resumes)
+        """
+        backoff = self.initial_backoff
+        while True:
+            try:
+                connection = await self._listen(on_payload)
+            except (OSError, TimeoutError, asyncpg.PostgresError) as e:
+                delay = backoff + random.uniform(0, backoff / 2)
+                logger.warning(
+                    "Cache invalidation listener could not connect",
+                    channel=self.channel,
+                    retry_in=round(delay, 2),
+                    error=str(e),
+                )
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, self.max_backoff)
+                continue
+
+            backoff = self.initial_backoff
+            self._connection = connection
+            logger.info("Cache invalidation listener connected", channel=self.channel)
+            on_connected()
+
+            try:
+                await self._wait_until_lost(connection)
+            finally:
+                self._connection = None
+                if not connection.is_closed():
+                    connection.terminate()
+
+            logger.warning("Cache invalidation listener lost connection")
+
+    async def send(self, payload: str) -> None:
+        """Broadcast a payload with NOTIFY.
+
+        Args:
+            payload: Notification payload
+
+        Raises:
+            ConnectionError: If there is no live connection or the NOTIFY failed
+        """
+        connection = self._connection
+        if connection is None or connection.is_closed():
+            raise ConnectionError("Cache invalidation listener is not connected")
+
+        try:
+            await connection.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+        except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            raise ConnectionError(str(e)) from e
+
+    async def close(self) -> None:
+        """Close the dedicated connection."""
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            await connection.close()
+
+    async def _listen(self, on_payload: Callable[[str], None]) -> asyncpg.Connection:
+        """Open a connection and LISTEN on the channel."""
+        connection = await self._connect()
+        try:
+            await connection.add_listener(
+                self.channel,
+                lambda _connection, _pid, _channel, payload: on_payload(payload),
+            )
+        except BaseException:
+            connection.terminate()
+            raise
+        return connection
+
+    async def _wait_until_lost(self, connection: asyncpg.Connection) -> None:
+        """Wait until the connection terminates or stops answering health checks."""
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _connection: lost.set())
+
+        while not lost.is_set():
+            try:
+                await asyncio.wait_for(lost.wait(), timeout=self.health_check_interval)
+            except TimeoutError:
+                try:
+                    await asyncio.wait_for(
+                        connection.fetchval("SELECT 1"),
+                        timeout=self.health_check_interval,
+                    )
+                except (
+                    OSError,
+                    TimeoutError,
+                    asyncpg.PostgresError,
+                    asyncpg.InterfaceError,
+                ):
+                    return
+
+
+__all__ = ["PostgresNotifyTransport"]
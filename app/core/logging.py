@@ -7,6 +7,7 @@ from structlog.types import EventDict, Processor
 
 from ..config import settings
 from .context import get_principal_id, get_request_id, get_request_time
+from .db.instrumentation import sql_instrumentation
 
 
 def add_log_level(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
@@ -30,7 +31,8 @@ def add_request_context(
     """Add request context variables to the event dict.
 
     This processor automatically includes request_id, principal_id, and request_time
-    in all log messages when available from the request context.
+    in all log messages when available from the request context, along with the
+    request's SQL statistics so far (db_statements, db_time_ms, db_rows).
     """
     request_id = get_request_id()
     principal_id = get_principal_id()
@@ -45,6 +47,10 @@ def add_request_context(
     if request_time is not None:
         event_dict["request_time"] = request_time.isoformat()
 
+    query_stats = sql_instrumentation.current()
+    if query_stats is not None:
+        event_dict.update(query_stats.log_context())
+
     return event_dict
 
 
@@ -0,0 +1,148 @@
+"""Lightweight in-process metrics.
+
+Subsystems register a snapshot function under a name. Snapshots are served as JSON
+by the ``/metrics`` endpoint and periodically written to the log, so they can be
+scraped or queried from the log pipeline without a metrics client dependency.
+Values are per worker process.
+"""
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Callable
+from typing import Any
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+type MetricsSource = Callable[[], dict[str, Any]]
+
+# Default latency buckets, in seconds
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values.
+
+    Buckets are cumulative upper bounds, as in Prometheus: ``le_0.1`` counts every
+    observation less than or equal to 0.1.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize the histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds
+        """
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def reset(self) -> None:
+        """Clear all observations."""
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get cumulative bucket counts, total count and sum."""
+        cumulative: dict[str, int] = {}
+        running = 0
+        for bound, count in zip(self.buckets, self._counts, strict=False):
+            running += count
+            cumulative[f"le_{bound:g}"] = running
+        cumulative["le_inf"] = self.count
+
+        return {"buckets": cumulative, "count": self.count, "sum": round(self.sum, 6)}
+
+
+class MetricsRegistry:
+    """Named collection of metrics sources."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._sources: dict[str, MetricsSource] = {}
+        self._report_task: asyncio.Task[None] | None = None
+
+    def register(self, name: str, source: MetricsSource) -> None:
+        """Register (or replace) a metrics source.
+
+        Args:
+            name: Name of the section in the snapshot
+            source: Function returning the current metrics as a JSON-serializable dict
+        """
+        self._sources[name] = source
+
+    def unregister(self, name: str) -> None:
+        """Remove a metrics source if it is registered."""
+        self._sources.pop(name, None)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Collect the current metrics from every source.
+
+        A failing source is reported as an error instead of failing the snapshot.
+        """
+        snapshot: dict[str, dict[str, Any]] = {}
+        for name, source in self._sources.items():
+            try:
+                snapshot[name] = source()
+            except Exception as e:
+                snapshot[name] = {"error": str(e)}
+        return snapshot
+
+    async def start_reporting(self, interval: float) -> None:
+        """Start logging a snapshot every ``interval`` seconds.
+
+        Args:
+            interval: Seconds between log lines (0 or less disables reporting)
+        """
+        if interval <= 0 or self._report_task is not None:
+            return
+        self._report_task = asyncio.create_task(self._report_loop(interval))
+
+    async def stop_reporting(self) -> None:
+        """Stop periodic logging."""
+        if self._report_task is None:
+            return
+
+        self._report_task.cancel()
+        await asyncio.gather(self._report_task, return_exceptions=True)
+        self._report_task = None
+
+    async def _report_loop(self, interval: float) -> None:
+        """Log a snapshot periodically until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            logger.info("Metrics snapshot", metrics=self.snapshot())
+
+
+# Global metrics registry
+metrics_registry = MetricsRegistry()
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "Histogram",
+    "MetricsRegistry",
+    "MetricsSource",
+    "metrics_registry",
+]
@@ -2,20 +2,55 @@
 
 This middleware automatically extracts request context (principal ID, request ID, timestamp)
 and makes it available throughout the request lifecycle via context variables.
+
+It is written as a plain ASGI middleware rather than on Starlette's
+``BaseHTTPMiddleware``, which runs the app in a separate task and re-streams the
+response body through a memory channel. Here the app runs in the caller's task
+and messages pass straight through, so streaming responses are not buffered.
 """
 
 from datetime import UTC, datetime
 from uuid import uuid7
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from ..config import settings
 from .auth import verify_token
 from .context import principal_id_var, request_id_var, request_time_var
+from .db.instrumentation import QueryStats, sql_instrumentation
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Longest statement text included in an N+1 warning
+_MAX_LOGGED_STATEMENT_LENGTH = 500
+
+
+def _route_name(scope: Scope) -> str:
+    """Get the method and route template (or raw path if unrouted) of a request."""
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope["path"]
+    return f"{scope['method']} {path}"
+
+
+def _log_repeated_statements(scope: Scope, stats: QueryStats) -> None:
+    """Warn about statements a request ran more than the N+1 threshold."""
+    threshold = settings.sql_n_plus_one_threshold
+    if threshold <= 0:
+        return
+
+    for statement, count in stats.repeated_statements(threshold):
+        logger.warning(
+            "Possible N+1 query",
+            route=_route_name(scope),
+            count=count,
+            statement=statement[:_MAX_LOGGED_STATEMENT_LENGTH],
+            **stats.log_context(),
+        )
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+class RequestContextMiddleware:
     """Middleware that populates request context variables for each request.
 
     This middleware:
@@ -23,29 +58,40 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
     - Creates a UTC timestamp for when the request started
     - Extracts the principal ID from the JWT token (if present and valid)
     - Stores all three values in context variables for use throughout the request
+    - Collects the request's SQL statistics, warns about repeated statements (N+1)
+      and optionally reports database time in a ``Server-Timing`` header
 
-    Context variables are automatically cleared after the request completes.
+    Context variables are restored after the request completes. Non-HTTP scopes
+    (websocket, lifespan) are passed through untouched.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Process request and populate context variables.
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
 
         Args:
-            request: The incoming FastAPI request
-            call_next: The next middleware/handler in the chain
+            app: The next ASGI application in the chain
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and populate context variables.
 
-        Returns:
-            The response from the next handler
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate request ID and timestamp
         request_id = uuid7()
         request_time = datetime.now(UTC).replace(tzinfo=None)
 
         # Extract principal ID from JWT token if present
         principal_id: str | None = None
-        auth_header = request.headers.get("Authorization")
+        auth_header = Headers(scope=scope).get("Authorization")
 
         if auth_header and auth_header.startswith("Bearer "):
             token = auth_header[7:]  # Remove "Bearer " prefix
@@ -57,24 +103,41 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
 
                 # Cache the validated token and payload for reuse in dependencies
                 # This eliminates duplicate JWT validation in protected endpoints
-                request.state.jwt_token = token
-                request.state.jwt_payload = payload
+                # (scope["state"] backs request.state)
+                state = scope.setdefault("state", {})
+                state["jwt_token"] = token
+                state["jwt_payload"] = payload
 
         # Set context variables
-        request_id_var.set(request_id)
-        principal_id_var.set(principal_id)
-        request_time_var.set(request_time)
+        request_id_token = request_id_var.set(request_id)
+        principal_id_token = principal_id_var.set(principal_id)
+        request_time_token = request_time_var.set(request_time)
+        query_stats = sql_instrumentation.begin(request_id)
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", query_stats.server_timing())
+            await send(message)
 
         try:
             # Process the request
-            response = await call_next(request)
-            return response
+            await self.app(
+                scope,
+                receive,
+                send_with_server_timing if settings.server_timing_enabled else send,
+            )
         finally:
-            # Context variables are automatically cleared when the context ends,
-            # but we can explicitly clear them for clarity
-            request_id_var.set(None)
-            principal_id_var.set(None)
-            request_time_var.set(None)
+            sql_instrumentation.end(
+                request_id,
+                route=_route_name(scope),
+                n_plus_one_threshold=settings.sql_n_plus_one_threshold,
+            )
+            _log_repeated_statements(scope, query_stats)
+
+            request_id_var.reset(request_id_token)
+            principal_id_var.reset(principal_id_token)
+            request_time_var.reset(request_time_token)
 
 
 __all__ = ["RequestContextMiddleware"]
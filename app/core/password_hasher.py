@@ -0,0 +1,117 @@
+"""Bounded off-loop executor for password hashing.
+
+bcrypt is deliberately slow (tens to hundreds of milliseconds per call). Run on the
+event loop, every hash or check stalls all other requests and WebSocket traffic in
+the worker. ``PasswordHasher`` runs them on a small thread pool instead - bcrypt
+releases the GIL while hashing - and applies admission control: at most
+``max_workers`` calls run at once, at most ``max_queue`` more wait, and anything
+beyond that is rejected straight away rather than piling up during a login storm.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from ..config import settings
+from .exceptions.domain_exceptions import PasswordHashingUnavailableException
+from .metrics import Histogram
+
+# Queue wait buckets, in seconds
+QUEUE_WAIT_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PasswordHasher:
+    """Runs password hashing on a bounded thread pool with admission control."""
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        """Initialize the hasher.
+
+        Args:
+            max_workers: Maximum number of hashes computed concurrently
+            max_queue: Maximum number of calls waiting for a free worker
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight = 0
+        self.queue_wait = Histogram(QUEUE_WAIT_BUCKETS)
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls running or waiting for a worker."""
+        return self._in_flight
+
+    async def run[T](self, func: Callable[..., T], *args: Any) -> T:
+        """Run a hashing function on the pool.
+
+        Args:
+            func: Blocking function to run
+            *args: Arguments for the function
+
+        Returns:
+            The function's result
+
+        Raises:
+            PasswordHashingUnavailableException: If the pool and its queue are full
+        """
+        if self._in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHashingUnavailableException()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hasher"
+            )
+
+        submitted = time.perf_counter()
+
+        def timed() -> tuple[float, T]:
+            return time.perf_counter(), func(*args)
+
+        self._in_flight += 1
+        try:
+            started, result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, timed
+            )
+        finally:
+            self._in_flight -= 1
+
+        self.queue_wait.observe(started - submitted)
+        self.completed += 1
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once running calls finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def reset(self) -> None:
+        """Clear the counters and histogram."""
+        self.queue_wait.reset()
+        self.completed = 0
+        self.rejected = 0
+
+    def metrics(self) -> dict[str, Any]:
+        """Get pool occupancy and counters as a metrics source."""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_wait": self.queue_wait.snapshot(),
+        }
+
+
+# Global password hasher
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hash_max_workers,
+    max_queue=settings.password_hash_max_queue,
+)
+
+__all__ = ["PasswordHasher", "password_hasher"]
@@ -0,0 +1,27 @@
+"""Revocation of JWTs by token ID and by principal."""
+
+from datetime import timedelta
+
+from ...config import settings
+from ..metrics import metrics_registry
+from .bloom import BloomFilter
+from .index import RevocationIndex
+from .service import TokenRevocations
+
+# Global token revocations
+token_revocations = TokenRevocations(
+    sync_interval=settings.token_revocation_sync_interval_seconds,
+    sweep_interval=settings.token_revocation_sweep_interval_seconds,
+    max_token_lifetime=max(
+        timedelta(minutes=settings.access_token_expire_minutes),
+        timedelta(days=settings.refresh_token_expire_days),
+    ),
+)
+metrics_registry.register("token_revocations", token_revocations.metrics)
+
+__all__ = [
+    "BloomFilter",
+    "RevocationIndex",
+    "TokenRevocations",
+    "token_revocations",
+]
@@ -0,0 +1,49 @@
+"""Bloom filter over strings."""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter.
+
+    Answers "definitely absent" or "possibly present" for a string in a few bit
+    lookups, with a false positive rate of about ``error_rate`` while it holds at
+    most ``capacity`` items. Items cannot be removed; rebuild the filter instead.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """Initialize an empty filter.
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: Target false positive rate at capacity
+        """
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = max(
+            8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[i >> 3] & (1 << (i & 7)) for i in self._positions(item))
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        for i in self._positions(item):
+            self._bits[i >> 3] |= 1 << (i & 7)
+        self.count += 1
+
+    def _positions(self, item: str) -> list[int]:
+        """Get the bit positions of an item (double hashing over one digest)."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+
+__all__ = ["BloomFilter"]
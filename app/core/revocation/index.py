@@ -0,0 +1,146 @@
+"""In-memory index of revoked tokens and principals."""
+
+import heapq
+
+from .bloom import BloomFilter
+
+# Fewest revoked tokens the Bloom filter is sized for
+MIN_BLOOM_CAPACITY = 1024
+
+
+class RevocationIndex:
+    """Answers whether a token is revoked without touching the database.
+
+    Revoked token IDs are held in an exact map guarded by a Bloom filter, so the
+    common case - a token that was never revoked - is rejected after a few bit
+    lookups. Principal revocations map each principal to a cutoff: tokens issued
+    at or before it are revoked. Entries are pruned once the tokens they cover
+    have expired, since an expired token fails verification anyway.
+
+    Times are Unix timestamps in whole seconds, like the ``iat`` and ``exp``
+    claims.
+    """
+
+    def __init__(self, error_rate: float = 0.01) -> None:
+        """Initialize an empty index.
+
+        Args:
+            error_rate: Target false positive rate of the Bloom filter
+        """
+        self.error_rate = error_rate
+        self._tokens: dict[str, int] = {}
+        self._deadlines: list[tuple[int, str]] = []
+        self._principals: dict[str, tuple[int, int]] = {}
+        self._bloom = BloomFilter(MIN_BLOOM_CAPACITY, error_rate)
+
+    @property
+    def tokens(self) -> int:
+        """Number of revoked tokens held."""
+        return len(self._tokens)
+
+    @property
+    def principals(self) -> int:
+        """Number of revoked principals held."""
+        return len(self._principals)
+
+    def add_token(self, jti: str, expires: int) -> None:
+        """Revoke a single token.
+
+        Args:
+            jti: Token ID
+            expires: When the token expires
+        """
+        known = self._tokens.get(jti)
+        if known is not None and known >= expires:
+            return
+
+        self._tokens[jti] = expires
+        heapq.heappush(self._deadlines, (expires, jti))
+        if known is None:
+            if len(self._tokens) > self._bloom.capacity:
+                self._rebuild_bloom()
+            else:
+                self._bloom.add(jti)
+
+    def add_principal(self, principal_id: str, cutoff: int, expires: int) -> None:
+        """Revoke every token of a principal issued at or before a cutoff.
+
+        Args:
+            principal_id: Principal ID, as in the ``sub`` claim
+            cutoff: Latest ``iat`` that is revoked
+            expires: When the last token covered by the cutoff expires
+        """
+        current = self._principals.get(principal_id)
+        if current is not None:
+            cutoff = max(cutoff, current[0])
+            expires = max(expires, current[1])
+        self._principals[principal_id] = (cutoff, expires)
+
+    def is_revoked(self, jti: str, principal_id: str, issued_at: int) -> bool:
+        """Check whether a token is revoked.
+
+        Args:
+            jti: Token ID
+            principal_id: Principal the token was issued to
+            issued_at: When the token was issued
+
+        Returns:
+            True if the token or its principal has been revoked
+        """
+        if self._principals:
+            principal = self._principals.get(principal_id)
+            if principal is not None and issued_at <= principal[0]:
+                return True
+        return jti in self._bloom and jti in self._tokens
+
+    def prune(self, now: int) -> int:
+        """Drop entries whose tokens have all expired.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Number of entries dropped
+        """
+        pruned = 0
+        while self._deadlines and self._deadlines[0][0] <= now:
+            expires, jti = heapq.heappop(self._deadlines)
+            # Skip heap entries superseded by a later expiry for the same token
+            if self._tokens.get(jti) == expires:
+                del self._tokens[jti]
+                pruned += 1
+        if pruned:
+            self._rebuild_bloom()
+
+        expired = [p for p, (_, expires) in self._principals.items() if expires <= now]
+        for principal_id in expired:
+            del self._principals[principal_id]
+        return pruned + len(expired)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._tokens.clear()
+        self._deadlines.clear()
+        self._principals.clear()
+        self._bloom = BloomFilter(MIN_BLOOM_CAPACITY, self.error_rate)
+
+    def metrics(self) -> dict[str, int]:
+        """Get the index size as a metrics source."""
+        return {
+            "tokens": len(self._tokens),
+            "principals": len(self._principals),
+            "bloom_bits": self._bloom.size,
+            "bloom_hashes": self._bloom.hashes,
+        }
+
+    def _rebuild_bloom(self) -> None:
+        """Rebuild the Bloom filter from the exact map, with room to grow."""
+        bloom = BloomFilter(
+            max(MIN_BLOOM_CAPACITY, 2 * len(self._tokens)), self.error_rate
+        )
+        for jti in self._tokens:
+            bloom.add(jti)
+        self._bloom = bloom
+
+
+__all__ = ["RevocationIndex"]
@@ -0,0 +1,274 @@
+"""Token revocation shared by all workers.
+
+Revocations are persisted to ``k_token_revocation`` and mirrored into a
+``RevocationIndex`` on every worker, so checking a token never queries the
+database. The revoking worker updates its index at once and broadcasts a
+``TOKEN_REVOCATION`` invalidation; every worker then pulls the rows revoked since
+its last sync. A periodic sync covers workers that missed the broadcast (or run
+without the bus), and a periodic sweep deletes rows whose tokens have expired.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from ...models import KTokenRevocation
+from ..db.database import get_db_session
+from ..invalidation import (
+    InvalidationBus,
+    InvalidationKind,
+    InvalidationMessage,
+    invalidation_bus,
+)
+from ..logging import get_logger
+from .index import RevocationIndex
+
+logger = get_logger(__name__)
+
+# Rows revoked this long before the newest row seen are read again on every sync,
+# covering transactions that committed out of order and clock skew between hosts
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+def _utcnow() -> datetime:
+    """Get the current time as naive UTC, as stored in the revocation table."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _timestamp(value: datetime) -> int:
+    """Convert a naive UTC datetime to a Unix timestamp in whole seconds."""
+    return int(value.replace(tzinfo=UTC).timestamp())
+
+
+class TokenRevocations:
+    """Revokes tokens and principals, and checks tokens against the revocations."""
+
+    def __init__(
+        self,
+        sync_interval: float,
+        sweep_interval: float,
+        max_token_lifetime: timedelta,
+        db_session_factory: Callable[
+            [], AbstractAsyncContextManager[AsyncSession]
+        ] = get_db_session,
+        bus: InvalidationBus = invalidation_bus,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        """Initialize the revocations.
+
+        Args:
+            sync_interval: Seconds between polls for revocations made by other workers (0 disables)
+            sweep_interval: Seconds between deletions of expired rows (0 disables)
+            max_token_lifetime: Lifetime of the longest-lived token, which bounds how
+                long a principal revocation must be kept
+            db_session_factory: Factory opening a primary database session
+            bus: Invalidation bus used to notify other workers
+            clock: Function returning the current naive UTC time (overridable for tests)
+        """
+        self.sync_interval = sync_interval
+        self.sweep_interval = sweep_interval
+        self.max_token_lifetime = max_token_lifetime
+        self.index = RevocationIndex()
+        self._db_session_factory = db_session_factory
+        self._bus = bus
+        self._clock = clock
+        self._watermark: datetime | None = None
+        self._last_sweep = 0.0
+        self._sync_event: asyncio.Event | None = None
+        self._sync_task: asyncio.Task[None] | None = None
+        bus.subscribe(InvalidationKind.TOKEN_REVOCATION, self._on_message)
+        bus.on_reset(self.request_sync)
+
+    def is_revoked(self, payload: dict[str, Any]) -> bool:
+        """Check whether a verified token has been revoked.
+
+        Args:
+            payload: Verified token payload
+
+        Returns:
+            True if the token or its principal has been revoked
+        """
+        return self.index.is_revoked(payload["jti"], payload["sub"], payload["iat"])
+
+    async def revoke_token(self, db: AsyncSession, payload: dict[str, Any]) -> None:
+        """Revoke a single token until it expires.
+
+        Args:
+            db: Database session
+            payload: Verified token payload
+        """
+        expires_at = datetime.fromtimestamp(payload["exp"], tz=UTC).replace(tzinfo=None)
+        await self._insert(
+            db,
+            jti=payload["jti"],
+            principal_id=UUID(payload["sub"]),
+            expires_at=expires_at,
+        )
+        self.index.add_token(payload["jti"], payload["exp"])
+        self._bus.publish(InvalidationKind.TOKEN_REVOCATION)
+
+    async def revoke_principal(self, db: AsyncSession, principal_id: UUID) -> None:
+        """Revoke every token issued to a principal so far.
+
+        Tokens are compared by their whole-second ``iat``, so tokens issued during
+        the same second as the revocation are revoked too.
+
+        Args:
+            db: Database session
+            principal_id: Principal ID
+        """
+        revoked_at = self._clock()
+        expires_at = revoked_at + self.max_token_lifetime
+        await self._insert(
+            db,
+            jti=None,
+            principal_id=principal_id,
+            revoked_at=revoked_at,
+            expires_at=expires_at,
+        )
+        self.index.add_principal(
+            str(principal_id), _timestamp(revoked_at), _timestamp(expires_at)
+        )
+        self._bus.publish(InvalidationKind.TOKEN_REVOCATION)
+
+    async def sync(self) -> int:
+        """Load revocations made since the last sync, and prune expired ones.
+
+        Returns:
+            Number of revocation rows read
+        """
+        now = self._clock()
+        stmt = select(
+            col(KTokenRevocation.jti),
+            col(KTokenRevocation.principal_id),
+            col(KTokenRevocation.revoked_at),
+            col(KTokenRevocation.expires_at),
+        ).where(col(KTokenRevocation.expires_at) > now)
+        if self._watermark is not None:
+            stmt = stmt.where(
+                col(KTokenRevocation.revoked_at) >= self._watermark - SYNC_OVERLAP
+            )
+
+        async with self._db_session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+
+        for jti, principal_id, revoked_at, expires_at in rows:
+            if jti is not None:
+                self.index.add_token(jti, _timestamp(expires_at))
+            else:
+                self.index.add_principal(
+                    str(principal_id), _timestamp(revoked_at), _timestamp(expires_at)
+                )
+            if self._watermark is None or revoked_at > self._watermark:
+                self._watermark = revoked_at
+
+        self.index.prune(_timestamp(now))
+        return len(rows)
+
+    async def sweep(self) -> int:
+        """Delete revocation rows whose tokens have all expired.
+
+        Returns:
+            Number of rows deleted
+        """
+        async with self._db_session_factory() as session:
+            result = await session.execute(
+                delete(KTokenRevocation).where(
+                    KTokenRevocation.expires_at <= self._clock()  # type: ignore[arg-type]
+                )
+            )
+            await session.commit()
+        return result.rowcount  # type: ignore[attr-defined, no-any-return]
+
+    def request_sync(self) -> None:
+        """Wake the background sync, if it is running."""
+        if self._sync_event is not None:
+            self._sync_event.set()
+
+    async def start(self) -> None:
+        """Load the current revocations and keep them in sync in the background.
+
+        This should be called during FastAPI application startup.
+        """
+        if self._sync_task is not None:
+            return
+
+        try:
+            loaded = await self.sync()
+            logger.info("Loaded token revocations", count=loaded)
+        except Exception as e:
+            logger.error("Failed to load token revocations", error=str(e))
+
+        self._last_sweep = time.monotonic()
+        self._sync_event = asyncio.Event()
+        self._sync_task = asyncio.create_task(self._sync_loop(self._sync_event))
+
+    async def stop(self) -> None:
+        """Stop the background sync.
+
+        This should be called during FastAPI application shutdown.
+        """
+        if self._sync_task is None:
+            return
+        self._sync_task.cancel()
+        await asyncio.gather(self._sync_task, return_exceptions=True)
+        self._sync_task = None
+        self._sync_event = None
+
+    def clear(self) -> None:
+        """Forget every revocation held in memory (the next sync reloads them)."""
+        self.index.clear()
+        self._watermark = None
+
+    def metrics(self) -> dict[str, Any]:
+        """Get the index size as a metrics source."""
+        return self.index.metrics()
+
+    def _on_message(self, message: InvalidationMessage) -> None:
+        """Sync when another worker broadcasts a revocation."""
+        self.request_sync()
+
+    async def _insert(self, db: AsyncSession, **values: Any) -> None:
+        """Persist a revocation row."""
+        values.setdefault("revoked_at", self._clock())
+        await db.execute(insert(KTokenRevocation).values(**values))
+        await db.commit()
+
+    async def _sync_loop(self, sync_event: asyncio.Event) -> None:
+        """Sync when woken or every ``sync_interval`` seconds, until cancelled.
+
+        Args:
+            sync_event: Event set when another worker broadcasts a revocation
+        """
+        while True:
+            try:
+                await asyncio.wait_for(
+                    sync_event.wait(), timeout=self.sync_interval or None
+                )
+            except TimeoutError:
+                pass
+            sync_event.clear()
+
+            try:
+                await self.sync()
+                if (
+                    self.sweep_interval > 0
+                    and time.monotonic() - self._last_sweep >= self.sweep_interval
+                ):
+                    self._last_sweep = time.monotonic()
+                    deleted = await self.sweep()
+                    if deleted:
+                        logger.debug("Swept expired token revocations", count=deleted)
+            except Exception as e:
+                logger.warning("Failed to sync token revocations", error=str(e))
+
+
+__all__ = ["TokenRevocations"]
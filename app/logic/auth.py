@@ -7,6 +7,7 @@ from uuid import UUID
 from fido2.utils import websafe_encode
 from fido2.webauthn import (
     AuthenticatorAttachment,
+    PublicKeyCredentialDescriptor,
     ResidentKeyRequirement,
     UserVerificationRequirement,
 )
@@ -20,6 +21,7 @@ from ..core.auth import (
     create_refresh_token,
     verify_token,
 )
+from ..core.cache import TTLCache
 from ..core.exceptions.domain_exceptions import (
     InvalidCredentialsException,
     InvalidTokenException,
@@ -37,6 +39,9 @@ from ..core.fido2_server import (
     retrieve_challenge,
     store_challenge,
 )
+from ..core.invalidation import InvalidationKind, InvalidationMessage, invalidation_bus
+from ..core.metrics import metrics_registry
+from ..core.revocation import token_revocations
 from ..models.k_fido2_credential import KFido2Credential
 from ..models.k_principal import KPrincipal
 from ..schemas.fido2 import (
@@ -46,6 +51,76 @@ from ..schemas.fido2 import (
 )
 from ..schemas.user import Token
 
+# Descriptors of each principal's active credentials, used as the exclude list when
+# registering and the allow list when authenticating. Evicted in every worker when
+# a credential is registered, renamed or deleted.
+credential_descriptor_cache: TTLCache[
+    UUID, tuple[PublicKeyCredentialDescriptor, ...]
+] = TTLCache(
+    "fido2_credential_descriptors",
+    maxsize=settings.fido2_credential_cache_max_entries,
+    ttl=settings.fido2_credential_cache_ttl_seconds,
+)
+
+
+def _evict_credential_descriptors(message: InvalidationMessage) -> None:
+    """Evict cached descriptors matching an invalidation message."""
+    if message.entity_id is None:
+        credential_descriptor_cache.clear()
+    else:
+        credential_descriptor_cache.invalidate(message.entity_id)
+
+
+invalidation_bus.subscribe(
+    InvalidationKind.FIDO2_CREDENTIAL, _evict_credential_descriptors
+)
+invalidation_bus.on_reset(credential_descriptor_cache.clear)
+metrics_registry.register(
+    "fido2_credential_descriptors", credential_descriptor_cache.metrics
+)
+
+
+async def get_credential_descriptors(
+    principal_id: UUID, db: AsyncSession
+) -> tuple[PublicKeyCredentialDescriptor, ...]:
+    """Get descriptors for a principal's active FIDO2 credentials.
+
+    Args:
+        principal_id: Principal ID
+        db: Database session
+
+    Returns:
+        Credential descriptors (cached per principal)
+    """
+    cached = credential_descriptor_cache.get(principal_id)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        select(KFido2Credential.credential_id, KFido2Credential.transports).where(  # type: ignore[call-overload]
+            KFido2Credential.principal_id == principal_id,
+            KFido2Credential.deleted_at.is_(None),  # type: ignore[union-attr]
+        )
+    )
+    descriptors = tuple(
+        credential_to_descriptor(credential_id, transports)
+        for credential_id, transports in result.all()
+    )
+    if credential_descriptor_cache.ttl > 0:
+        credential_descriptor_cache.set(principal_id, descriptors)
+    return descriptors
+
+
+def invalidate_credential_descriptors(principal_id: UUID) -> None:
+    """Drop a principal's cached credential descriptors, in every worker.
+
+    Must be called after a change to the principal's credentials has been committed.
+
+    Args:
+        principal_id: Principal ID
+    """
+    invalidation_bus.publish(InvalidationKind.FIDO2_CREDENTIAL, entity_id=principal_id)
+
 
 async def perform_login(
     username: str,
@@ -83,9 +158,6 @@ async def perform_login(
     access_token = await create_access_token(data=token_data, now=now)
     refresh_token = await create_refresh_token(data=token_data, now=now)
 
-    print(f"Access token: {access_token}")
-    print(f"Refresh token: {refresh_token}")
-
     return Token(
         access_token=access_token,
         token_type="bearer",
@@ -155,6 +227,40 @@ async def refresh_access_token(refresh_token: str) -> Token:
     )
 
 
+async def perform_logout(
+    access_token: str,
+    db: AsyncSession,
+    refresh_token: str | None = None,
+    all_sessions: bool = False,
+) -> None:
+    """Revoke the tokens of the session being logged out.
+
+    Args:
+        access_token: Access token of the current request
+        db: Database session
+        refresh_token: Refresh token of the session, if the client sent one
+        all_sessions: Revoke every token issued to the user so far, on all devices
+
+    Raises:
+        InvalidTokenException: If the access token is invalid, expired or revoked
+    """
+    payload = await verify_token(access_token)
+    if payload is None:
+        raise InvalidTokenException(reason="Token verification failed")
+
+    if all_sessions:
+        await token_revocations.revoke_principal(db, UUID(payload["sub"]))
+        return
+
+    await token_revocations.revoke_token(db, payload)
+
+    if refresh_token:
+        refresh_payload = await verify_token(refresh_token)
+        # Ignore refresh tokens that are already invalid or belong to someone else
+        if refresh_payload is not None and refresh_payload["sub"] == payload["sub"]:
+            await token_revocations.revoke_token(db, refresh_payload)
+
+
 # FIDO2 Registration Logic
 
 
@@ -179,17 +285,8 @@ async def begin_fido2_registration(
     if not user:
         raise InvalidCredentialsException(username=str(user_id))
 
-    # Get existing credentials for this user to exclude them
-    existing_result = await db.execute(
-        select(KFido2Credential).where(KFido2Credential.principal_id == user_id, KFido2Credential.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    )
-    existing_credentials = existing_result.scalars().all()
-
-    # Create exclude list
-    exclude_credentials = [
-        credential_to_descriptor(cred.credential_id, cred.transports)
-        for cred in existing_credentials
-    ]
+    # Exclude the user's existing credentials
+    exclude_credentials = await get_credential_descriptors(user_id, db)
 
     # Generate registration options
     server = get_fido2_server()
@@ -213,7 +310,7 @@ async def begin_fido2_registration(
 
     # Store challenge
     session_id = generate_session_id()
-    store_challenge(session_id, state["challenge"])
+    await store_challenge(session_id, state["challenge"])
 
     # Convert to client format
     options_dict = {
@@ -290,7 +387,7 @@ async def complete_fido2_registration(
         InvalidTokenException: If challenge is invalid or verification fails
     """
     # Retrieve challenge
-    challenge = retrieve_challenge(session_id)
+    challenge = await retrieve_challenge(session_id)
     if not challenge:
         raise InvalidTokenException(reason="Invalid or expired registration session")
 
@@ -343,6 +440,7 @@ async def complete_fido2_registration(
         db.add(credential)
         await db.commit()
         await db.refresh(credential)
+        invalidate_credential_descriptors(user_id)
 
         return credential_id_to_base64(credential.credential_id)
 
@@ -385,15 +483,8 @@ async def begin_fido2_authentication(
         )
         user = result.scalar_one_or_none()
         if user:
-            # Get user's credentials
-            creds_result = await db.execute(
-                select(KFido2Credential).where(KFido2Credential.principal_id == user.id, KFido2Credential.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-            )
-            credentials = creds_result.scalars().all()
-            allow_credentials = [
-                credential_to_descriptor(cred.credential_id, cred.transports)
-                for cred in credentials
-            ]
+            # Allow the user's credentials
+            allow_credentials = list(await get_credential_descriptors(user.id, db))
 
     # Generate authentication options
     server = get_fido2_server()
@@ -408,7 +499,7 @@ async def begin_fido2_authentication(
 
     # Store challenge
     session_id = generate_session_id()
-    store_challenge(session_id, state["challenge"])
+    await store_challenge(session_id, state["challenge"])
 
     # Convert to client format
     options_dict = {
@@ -454,7 +545,7 @@ async def complete_fido2_authentication(
         InvalidCredentialsException: If verification fails or credential not found
     """
     # Retrieve challenge
-    challenge = retrieve_challenge(session_id)
+    challenge = await retrieve_challenge(session_id)
     if not challenge:
         raise InvalidTokenException(reason="Invalid or expired authentication session")
 
@@ -690,6 +781,7 @@ async def update_credential_nickname(
     credential.last_modified_by = user_id
 
     await db.commit()
+    invalidate_credential_descriptors(user_id)
 
 
 async def delete_credential(
@@ -723,3 +815,4 @@ async def delete_credential(
         credential.deleted_at = datetime.now()
         credential.last_modified = datetime.now()
     await db.commit()
+    invalidate_credential_descriptors(user_id)
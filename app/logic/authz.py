@@ -0,0 +1,371 @@
+"""Business logic for authorizing principals against teams and projects.
+
+A principal's effective permissions in an organization are materialized into a
+``PrincipalGrants`` value built from ``k_organization_principal``,
+``k_team_member``, ``k_team_reviewer`` and ``k_project_team`` in a single query.
+Grants are cached per (org_id, principal_id) and evicted through the
+invalidation bus when those relationship rows change, so only the principals a
+change affects are rebuilt. Checks against cached grants are set lookups and
+never query the database.
+"""
+
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy import CompoundSelect, event, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlmodel import col
+
+from ..config import settings
+from ..core.cache import TTLCache
+from ..core.db.replica import REPLICA_INFO_KEY
+from ..core.exceptions.domain_exceptions import (
+    InsufficientPrivilegesException,
+    UnauthorizedOrganizationAccessException,
+)
+from ..core.invalidation import InvalidationKind, InvalidationMessage, invalidation_bus
+from ..core.metrics import metrics_registry
+from ..models import KOrganizationPrincipal, KProjectTeam, KTeamMember, KTeamReviewer
+
+
+class PrincipalGrants(NamedTuple):
+    """Effective permissions of a principal in one organization."""
+
+    org_id: UUID
+    principal_id: UUID
+    org_role: str | None
+    teams: frozenset[UUID]
+    reviewed_teams: frozenset[UUID]
+    projects: frozenset[UUID]
+    reviewed_projects: frozenset[UUID]
+
+    def is_team_member(self, team_id: UUID) -> bool:
+        """Whether the principal is a member of a team."""
+        return team_id in self.teams
+
+    def is_team_reviewer(self, team_id: UUID) -> bool:
+        """Whether the principal is a reviewer of a team."""
+        return team_id in self.reviewed_teams
+
+    def is_project_member(self, project_id: UUID) -> bool:
+        """Whether one of the principal's teams is assigned to a project."""
+        return project_id in self.projects
+
+    def is_project_reviewer(self, project_id: UUID) -> bool:
+        """Whether one of the teams the principal reviews is assigned to a project."""
+        return project_id in self.reviewed_projects
+
+    def references_team(self, team_id: UUID) -> bool:
+        """Whether the grants depend on a team's project assignments."""
+        return team_id in self.teams or team_id in self.reviewed_teams
+
+
+# Row kinds returned by the grants query
+_ORG = "org"
+_TEAM_MEMBER = "team_member"
+_TEAM_REVIEWER = "team_reviewer"
+_PROJECT_MEMBER = "project_member"
+_PROJECT_REVIEWER = "project_reviewer"
+
+# Grants of organization members keyed by (org_id, principal_id). Non-members are
+# not cached, so a newly added principal is never denied by a stale entry.
+authorization_cache: TTLCache[tuple[UUID, UUID], PrincipalGrants] = TTLCache(
+    "authorizations",
+    maxsize=settings.authorization_cache_max_entries,
+    ttl=settings.authorization_cache_ttl_seconds,
+)
+
+# Organizations whose grants changed recently. A lagging replica may still show the
+# old relationships, so replica reads must not repopulate the cache for them.
+_recently_changed_orgs: TTLCache[UUID, bool] = TTLCache(
+    "recently_changed_grant_orgs",
+    maxsize=settings.authorization_cache_max_entries,
+    ttl=settings.db_replica_max_lag_seconds,
+)
+
+
+def _evict_principal_grants(message: InvalidationMessage) -> None:
+    """Evict the grants of the principal named by an invalidation message."""
+    if message.org_id is not None:
+        _recently_changed_orgs.set(message.org_id, True)
+
+    if message.entity_id is not None:
+        authorization_cache.invalidate((message.org_id, message.entity_id))  # type: ignore[arg-type]
+    else:
+        authorization_cache.invalidate_where(lambda key: key[0] == message.org_id)
+
+
+def _evict_team_grants(message: InvalidationMessage) -> None:
+    """Evict the grants of every principal who belongs to or reviews a team."""
+    if message.org_id is not None:
+        _recently_changed_orgs.set(message.org_id, True)
+
+    team_id = message.entity_id
+    authorization_cache.invalidate_items_where(
+        lambda key, grants: (
+            key[0] == message.org_id
+            and (team_id is None or grants.references_team(team_id))
+        )
+    )
+
+
+invalidation_bus.subscribe(InvalidationKind.TEAM_MEMBER, _evict_principal_grants)
+invalidation_bus.subscribe(InvalidationKind.TEAM_REVIEWER, _evict_principal_grants)
+invalidation_bus.subscribe(
+    InvalidationKind.ORGANIZATION_PRINCIPAL, _evict_principal_grants
+)
+invalidation_bus.subscribe(InvalidationKind.ORGANIZATION, _evict_principal_grants)
+invalidation_bus.subscribe(InvalidationKind.PROJECT_TEAM, _evict_team_grants)
+invalidation_bus.on_reset(authorization_cache.clear)
+invalidation_bus.on_reset(_recently_changed_orgs.clear)
+metrics_registry.register("authorizations", authorization_cache.metrics)
+
+# Session.info key holding invalidations to publish once the session commits
+_PENDING_INFO_KEY = "pending_grant_invalidations"
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    """Publish grant invalidations once the change behind them is committed."""
+    for message in session.info.pop(_PENDING_INFO_KEY, ()):
+        invalidation_bus.publish(
+            message.kind, org_id=message.org_id, entity_id=message.entity_id
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+    """Rolled back changes never reached other sessions, so nothing is invalidated."""
+    session.info.pop(_PENDING_INFO_KEY, None)
+
+
+def _invalidate_on_commit(
+    db: AsyncSession, kind: InvalidationKind, org_id: UUID, entity_id: UUID
+) -> None:
+    """Queue an invalidation to be published when the session's transaction commits.
+
+    Relationship writes may run inside a ``txs`` transaction that commits (or rolls
+    back) long after the logic function returns, so publishing straight away could
+    let a concurrent request cache the old grants again before the commit.
+    """
+    pending: dict[InvalidationMessage, None] = db.info.setdefault(_PENDING_INFO_KEY, {})
+    pending[InvalidationMessage(kind=kind, org_id=org_id, entity_id=entity_id)] = None
+
+
+def invalidate_team_member(org_id: UUID, principal_id: UUID, db: AsyncSession) -> None:
+    """Rebuild a principal's grants after their team membership changes.
+
+    Must be called before the session commits the change; the invalidation is
+    published, in every worker, once it has been committed.
+
+    Args:
+        org_id: Organization ID
+        principal_id: Principal whose team membership changed
+        db: Database session making the change
+    """
+    _invalidate_on_commit(db, InvalidationKind.TEAM_MEMBER, org_id, principal_id)
+
+
+def invalidate_team_reviewer(
+    org_id: UUID, principal_id: UUID, db: AsyncSession
+) -> None:
+    """Rebuild a principal's grants after their team reviewer assignment changes.
+
+    Must be called before the session commits the change; the invalidation is
+    published, in every worker, once it has been committed.
+
+    Args:
+        org_id: Organization ID
+        principal_id: Principal whose reviewer assignment changed
+        db: Database session making the change
+    """
+    _invalidate_on_commit(db, InvalidationKind.TEAM_REVIEWER, org_id, principal_id)
+
+
+def invalidate_project_team(org_id: UUID, team_id: UUID, db: AsyncSession) -> None:
+    """Rebuild the grants of a team's members and reviewers after its projects change.
+
+    Must be called before the session commits the change; the invalidation is
+    published, in every worker, once it has been committed.
+
+    Args:
+        org_id: Organization ID
+        team_id: Team added to or removed from a project
+        db: Database session making the change
+    """
+    _invalidate_on_commit(db, InvalidationKind.PROJECT_TEAM, org_id, team_id)
+
+
+def _grants_query(org_id: UUID, principal_id: UUID) -> CompoundSelect:
+    """Build the query returning (kind, target_id, role) rows for a principal's grants."""
+    org = select(
+        literal(_ORG).label("kind"),
+        col(KOrganizationPrincipal.org_id),
+        col(KOrganizationPrincipal.role),
+    ).where(
+        col(KOrganizationPrincipal.org_id) == org_id,
+        col(KOrganizationPrincipal.principal_id) == principal_id,
+        col(KOrganizationPrincipal.deleted_at).is_(None),
+    )
+    teams = [
+        select(literal(kind), col(model.team_id), col(model.role)).where(
+            col(model.org_id) == org_id,
+            col(model.principal_id) == principal_id,
+            col(model.deleted_at).is_(None),
+        )
+        for kind, model in (
+            (_TEAM_MEMBER, KTeamMember),
+            (_TEAM_REVIEWER, KTeamReviewer),
+        )
+    ]
+    projects = [
+        select(literal(kind), col(KProjectTeam.project_id), col(KProjectTeam.role))
+        .join(model, col(model.team_id) == col(KProjectTeam.team_id))
+        .where(
+            col(KProjectTeam.org_id) == org_id,
+            col(KProjectTeam.deleted_at).is_(None),
+            col(model.principal_id) == principal_id,
+            col(model.deleted_at).is_(None),
+        )
+        for kind, model in (
+            (_PROJECT_MEMBER, KTeamMember),
+            (_PROJECT_REVIEWER, KTeamReviewer),
+        )
+    ]
+    return union_all(org, *teams, *projects)
+
+
+async def get_principal_grants(
+    org_id: UUID, principal_id: UUID, db: AsyncSession
+) -> PrincipalGrants:
+    """Get a principal's effective permissions in an organization.
+
+    Grants are served from the cache when possible and otherwise built with a
+    single query. This also verifies organization membership, so callers do not
+    need ``verify_organization_membership`` as well.
+
+    Args:
+        org_id: Organization ID
+        principal_id: Principal ID
+        db: Database session
+
+    Returns:
+        The principal's grants
+
+    Raises:
+        UnauthorizedOrganizationAccessException: If the principal is not a member of the organization
+    """
+    cache_key = (org_id, principal_id)
+    cached = authorization_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(_grants_query(org_id, principal_id))
+    targets: dict[str, set[UUID]] = {
+        _TEAM_MEMBER: set(),
+        _TEAM_REVIEWER: set(),
+        _PROJECT_MEMBER: set(),
+        _PROJECT_REVIEWER: set(),
+    }
+    is_member = False
+    org_role: str | None = None
+    for kind, target_id, role in result.all():
+        if kind == _ORG:
+            is_member = True
+            org_role = role
+        else:
+            targets[kind].add(target_id)
+
+    if not is_member:
+        raise UnauthorizedOrganizationAccessException(
+            org_id=org_id, user_id=principal_id
+        )
+
+    grants = PrincipalGrants(
+        org_id=org_id,
+        principal_id=principal_id,
+        org_role=org_role,
+        teams=frozenset(targets[_TEAM_MEMBER]),
+        reviewed_teams=frozenset(targets[_TEAM_REVIEWER]),
+        projects=frozenset(targets[_PROJECT_MEMBER]),
+        reviewed_projects=frozenset(targets[_PROJECT_REVIEWER]),
+    )
+
+    from_stale_replica = (
+        db.info.get(REPLICA_INFO_KEY, False) and org_id in _recently_changed_orgs
+    )
+    if authorization_cache.ttl > 0 and not from_stale_replica:
+        authorization_cache.set(cache_key, grants)
+
+    return grants
+
+
+def check_team_member(grants: PrincipalGrants, team_id: UUID) -> None:
+    """Check that a principal is a member of a team.
+
+    Args:
+        grants: The principal's grants
+        team_id: Team ID
+
+    Raises:
+        InsufficientPrivilegesException: If the principal is not a member of the team
+    """
+    if not grants.is_team_member(team_id):
+        raise InsufficientPrivilegesException(
+            required_privilege=f"member of team {team_id}",
+            user_id=grants.principal_id,
+        )
+
+
+def check_team_member_or_reviewer(grants: PrincipalGrants, team_id: UUID) -> None:
+    """Check that a principal is a member or reviewer of a team.
+
+    Args:
+        grants: The principal's grants
+        team_id: Team ID
+
+    Raises:
+        InsufficientPrivilegesException: If the principal neither belongs to nor reviews the team
+    """
+    if not (grants.is_team_member(team_id) or grants.is_team_reviewer(team_id)):
+        raise InsufficientPrivilegesException(
+            required_privilege=f"member or reviewer of team {team_id}",
+            user_id=grants.principal_id,
+        )
+
+
+def check_project_member(grants: PrincipalGrants, project_id: UUID) -> None:
+    """Check that a principal belongs to a team assigned to a project.
+
+    Args:
+        grants: The principal's grants
+        project_id: Project ID
+
+    Raises:
+        InsufficientPrivilegesException: If none of the principal's teams is on the project
+    """
+    if not grants.is_project_member(project_id):
+        raise InsufficientPrivilegesException(
+            required_privilege=f"member of project {project_id}",
+            user_id=grants.principal_id,
+        )
+
+
+def check_project_member_or_reviewer(grants: PrincipalGrants, project_id: UUID) -> None:
+    """Check that a principal belongs to or reviews a team assigned to a project.
+
+    Args:
+        grants: The principal's grants
+        project_id: Project ID
+
+    Raises:
+        InsufficientPrivilegesException: If the principal has no team on the project
+    """
+    if not (
+        grants.is_project_member(project_id) or grants.is_project_reviewer(project_id)
+    ):
+        raise InsufficientPrivilegesException(
+            required_privilege=f"member or reviewer of project {project_id}",
+            user_id=grants.principal_id,
+        )
@@ -1,12 +1,17 @@
 """Business logic for dependency operations (user lookup, token verification, etc.)."""
 
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
 
+from ..config import settings
 from ..core.auth import verify_token
+from ..core.cache import TTLCache
+from ..core.db.replica import REPLICA_INFO_KEY
 from ..core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
     InvalidTokenException,
@@ -14,9 +19,72 @@ from ..core.exceptions.domain_exceptions import (
     UnauthorizedOrganizationAccessException,
     UserNotFoundException,
 )
+from ..core.invalidation import InvalidationKind, InvalidationMessage, invalidation_bus
+from ..core.metrics import metrics_registry
 from ..models import KOrganizationPrincipal, KPrincipal
 from ..models.k_principal import SystemRole
-from ..schemas.user import TokenData, UserDetail
+from ..schemas.user import FrozenUserDetail, TokenData, UserDetail
+from .authz import authorization_cache
+from .projection import row_fields
+from .writes import WriteReturning, execute_returning
+
+# Positive organization memberships keyed by (org_id, principal_id). Only confirmed
+# memberships are cached, so a newly added principal is never denied by a stale entry.
+membership_cache: TTLCache[tuple[UUID, UUID], bool] = TTLCache(
+    "organization_membership",
+    maxsize=settings.membership_cache_max_entries,
+    ttl=settings.membership_cache_ttl_seconds,
+)
+
+# Organizations whose memberships changed recently. A lagging replica may still show
+# the old membership, so replica reads must not repopulate the cache for them.
+_recently_changed_orgs: TTLCache[UUID, bool] = TTLCache(
+    "recently_changed_orgs",
+    maxsize=settings.membership_cache_max_entries,
+    ttl=settings.db_replica_max_lag_seconds,
+)
+
+
+def _evict_memberships(message: InvalidationMessage) -> None:
+    """Evict cached memberships matching an invalidation message."""
+    if message.org_id is not None:
+        _recently_changed_orgs.set(message.org_id, True)
+
+    if message.entity_id is not None:
+        membership_cache.invalidate((message.org_id, message.entity_id))  # type: ignore[arg-type]
+    else:
+        membership_cache.invalidate_where(lambda key: key[0] == message.org_id)
+
+
+invalidation_bus.subscribe(InvalidationKind.ORGANIZATION_PRINCIPAL, _evict_memberships)
+invalidation_bus.subscribe(InvalidationKind.ORGANIZATION, _evict_memberships)
+invalidation_bus.on_reset(membership_cache.clear)
+invalidation_bus.on_reset(_recently_changed_orgs.clear)
+metrics_registry.register("membership_cache", membership_cache.metrics)
+
+# Principals of authenticated requests keyed by ID. None marks a principal that does
+# not exist or was deleted, so tokens of deleted users do not query on every request.
+principal_cache: TTLCache[UUID, FrozenUserDetail | None] = TTLCache(
+    "principals",
+    maxsize=settings.principal_cache_max_entries,
+    ttl=settings.principal_cache_ttl_seconds,
+)
+
+# Sentinel distinguishing a cache miss from a cached deleted principal
+_NOT_CACHED: Any = object()
+
+
+def _evict_principal(message: InvalidationMessage) -> None:
+    """Evict a cached principal matching an invalidation message."""
+    if message.entity_id is None:
+        principal_cache.clear()
+    else:
+        principal_cache.invalidate(message.entity_id)
+
+
+invalidation_bus.subscribe(InvalidationKind.PRINCIPAL, _evict_principal)
+invalidation_bus.on_reset(principal_cache.clear)
+metrics_registry.register("principals", principal_cache.metrics)
 
 
 async def get_token_data(token: str) -> TokenData:
@@ -29,14 +97,13 @@ async def get_token_data(token: str) -> TokenData:
         Token data with all JWT claims
 
     Raises:
-        InvalidTokenException: If token is invalid or expired
+        InvalidTokenException: If token is invalid, expired or revoked
     """
+    # verify_token also rejects tokens revoked by token ID or principal
     payload = await verify_token(token)
     if payload is None:
         raise InvalidTokenException(reason="Token verification failed")
 
-    # TODO: Check blacklist of tokens or principal IDs.
-
     # Convert Unix timestamps back to datetime objects
     iat = datetime.fromtimestamp(payload["iat"], tz=UTC).replace(tzinfo=None)
     exp = datetime.fromtimestamp(payload["exp"], tz=UTC).replace(tzinfo=None)
@@ -57,6 +124,10 @@ async def get_token_data(token: str) -> TokenData:
 async def get_user_by_id(user_id: UUID, db: AsyncSession) -> UserDetail:
     """Get a user by their ID.
 
+    Users, and the absence of deleted users, are cached for
+    ``principal_cache_ttl_seconds``. The returned model is immutable and may be
+    shared with other requests.
+
     Args:
         user_id: UUID of the user
         db: Database session
@@ -67,14 +138,24 @@ async def get_user_by_id(user_id: UUID, db: AsyncSession) -> UserDetail:
     Raises:
         UserNotFoundException: If user is not found in database
     """
+    cached = principal_cache.get(user_id, _NOT_CACHED)
+    if cached is None:
+        raise UserNotFoundException(user_id=user_id)
+    if cached is not _NOT_CACHED:
+        return cached
+
     stmt = select(KPrincipal).where(KPrincipal.id == user_id, KPrincipal.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
 
-    if not user:
+    detail = FrozenUserDetail.model_validate(user) if user else None
+    if principal_cache.ttl > 0:
+        principal_cache.set(user_id, detail)
+
+    if detail is None:
         raise UserNotFoundException(user_id=user_id)
 
-    return UserDetail.model_validate(user)
+    return detail
 
 
 async def get_user_from_token(token: str, db: AsyncSession) -> UserDetail:
@@ -259,6 +340,9 @@ async def verify_organization_membership(
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
     """
+    if _is_cached_member(org_id, user_id):
+        return
+
     stmt = select(KOrganizationPrincipal).where(
         KOrganizationPrincipal.org_id == org_id,  # type: ignore[arg-type]
         KOrganizationPrincipal.principal_id == user_id,  # type: ignore[arg-type]
@@ -268,3 +352,181 @@ async def verify_organization_membership(
 
     if not membership:
         raise UnauthorizedOrganizationAccessException(org_id=org_id, user_id=user_id)
+
+    _cache_membership(org_id, user_id, db)
+
+
+async def _get_org_row(
+    stmt: Select[Any], org_id: UUID, user_id: UUID, db: AsyncSession
+) -> Row[Any] | None:
+    """Fetch the single row of an organization entity SELECT and verify membership.
+
+    When membership is not cached, the row carries an extra trailing is_member column.
+    """
+    if _is_cached_member(org_id, user_id):
+        result = await db.execute(stmt)
+        return result.one_or_none()
+
+    is_member = exists().where(
+        KOrganizationPrincipal.org_id == org_id,  # type: ignore[arg-type]
+        KOrganizationPrincipal.principal_id == user_id,  # type: ignore[arg-type]
+    )
+    result = await db.execute(stmt.add_columns(is_member.label("is_member")))
+    row = result.one_or_none()
+
+    if row is None:
+        await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+        return None
+
+    if not row[-1]:
+        raise UnauthorizedOrganizationAccessException(org_id=org_id, user_id=user_id)
+
+    _cache_membership(org_id, user_id, db)
+    return row
+
+
+async def get_org_entity[M: SQLModel](
+    stmt: Select[tuple[M]], org_id: UUID, user_id: UUID, db: AsyncSession
+) -> M | None:
+    """Fetch a single entity of an organization and verify membership in one query.
+
+    The membership check rides along as an EXISTS column on the entity's SELECT,
+    so a successful lookup costs one round trip (none for the membership when it
+    is already cached). When the SELECT matches nothing, membership is verified
+    separately so non-members still get an authorization error rather than a
+    not found.
+
+    Args:
+        stmt: SELECT of the entity, already filtered down to at most one row
+        org_id: Organization ID the entity must belong to
+        user_id: User ID to verify
+        db: Database session
+
+    Returns:
+        The entity, or None if the SELECT matched nothing
+
+    Raises:
+        UnauthorizedOrganizationAccessException: If user is not a member of the organization
+    """
+    row = await _get_org_row(stmt, org_id, user_id, db)
+    return None if row is None else row[0]
+
+
+async def get_org_entity_fields(
+    stmt: Select[Any], org_id: UUID, user_id: UUID, db: AsyncSession
+) -> dict[str, Any] | None:
+    """Fetch selected columns of a single organization entity and verify membership.
+
+    Like get_org_entity, but for a SELECT of columns (see ``projection.select_fields``)
+    rather than of the entity, so no ORM object is hydrated.
+
+    Args:
+        stmt: SELECT of the entity's columns, already filtered down to at most one row
+        org_id: Organization ID the entity must belong to
+        user_id: User ID to verify
+        db: Database session
+
+    Returns:
+        The selected fields keyed by name, or None if the SELECT matched nothing
+
+    Raises:
+        UnauthorizedOrganizationAccessException: If user is not a member of the organization
+    """
+    row = await _get_org_row(stmt, org_id, user_id, db)
+    if row is None:
+        return None
+    return row_fields(row, list(stmt.selected_columns))  # type: ignore[arg-type]
+
+
+async def write_org_entity[T](
+    stmt: WriteReturning[T], org_id: UUID, user_id: UUID, db: AsyncSession
+) -> T | None:
+    """Write a single entity of an organization and verify membership in one query.
+
+    The membership check is added as an EXISTS condition to the statement's
+    WHERE clause (skipped when membership is already cached), so a successful
+    write costs one round trip. When nothing is written, membership is verified
+    separately so non-members still get an authorization error rather than a
+    not found.
+
+    Args:
+        stmt: UPDATE or DELETE ... RETURNING, already filtered down to at most one row
+        org_id: Organization ID the entity must belong to
+        user_id: User ID to verify
+        db: Database session
+
+    Returns:
+        The first returned column, or None if the statement matched nothing
+
+    Raises:
+        UnauthorizedOrganizationAccessException: If user is not a member of the organization
+    """
+    cached = _is_cached_member(org_id, user_id)
+    if not cached:
+        is_member = exists().where(
+            KOrganizationPrincipal.org_id == org_id,  # type: ignore[arg-type]
+            KOrganizationPrincipal.principal_id == user_id,  # type: ignore[arg-type]
+        )
+        stmt = stmt.where(is_member)
+    written = await execute_returning(stmt, db)
+
+    if cached:
+        return written
+    if written is None:
+        await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+        return None
+
+    _cache_membership(org_id, user_id, db)
+    return written
+
+
+def _is_cached_member(org_id: UUID, user_id: UUID) -> bool:
+    """Check the membership and grant caches for a confirmed membership."""
+    cache_key = (org_id, user_id)
+    # Cached grants are only kept for members, so they answer the check as well
+    return bool(membership_cache.get(cache_key)) or cache_key in authorization_cache
+
+
+def _cache_membership(org_id: UUID, user_id: UUID, db: AsyncSession) -> None:
+    """Remember a membership confirmed by a query on the given session."""
+    from_stale_replica = (
+        db.info.get(REPLICA_INFO_KEY, False) and org_id in _recently_changed_orgs
+    )
+    if membership_cache.ttl > 0 and not from_stale_replica:
+        membership_cache.set((org_id, user_id), True)
+
+
+def invalidate_organization_membership(org_id: UUID, principal_id: UUID) -> None:
+    """Drop the cached membership of a principal in an organization, in every worker.
+
+    Must be called after any change to the principal's organization membership
+    has been committed.
+
+    Args:
+        org_id: Organization ID
+        principal_id: Principal ID
+    """
+    invalidation_bus.publish(
+        InvalidationKind.ORGANIZATION_PRINCIPAL, org_id=org_id, entity_id=principal_id
+    )
+
+
+def invalidate_principal(principal_id: UUID) -> None:
+    """Drop a cached principal, in every worker.
+
+    Must be called after the principal's row has been updated or deleted,
+    including when it is enabled or disabled.
+
+    Args:
+        principal_id: Principal ID
+    """
+    invalidation_bus.publish(InvalidationKind.PRINCIPAL, entity_id=principal_id)
+
+
+def invalidate_organization_memberships(org_id: UUID) -> None:
+    """Drop every cached membership for an organization, in every worker.
+
+    Args:
+        org_id: Organization ID
+    """
+    invalidation_bus.publish(InvalidationKind.ORGANIZATION, org_id=org_id)
@@ -0,0 +1,228 @@
+"""Business logic for keyset (cursor) pagination of list operations.
+
+Pages are ordered by a sort column with the primary key as tie-breaker, and the
+next page starts after the last row of the previous one. Unlike OFFSET paging,
+fetching a page costs the same no matter how deep it is, and rows inserted or
+deleted meanwhile do not shift pages.
+
+Cursors are opaque to clients: URL-safe base64 of the sort key and the last
+row's sort values. A cursor only resumes the sort order it was issued for.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any, NamedTuple, overload
+from uuid import UUID
+
+from sqlalchemy import Label, Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from ..core.exceptions.domain_exceptions import InvalidCursorException
+from ..schemas.pagination import PageParams
+from .projection import projection_columns, row_fields
+
+
+class SortKey(NamedTuple):
+    """Column a list is ordered by; the primary key breaks ties."""
+
+    field: str = "created"
+    descending: bool = False
+
+
+DEFAULT_SORT = SortKey()
+
+
+class Page[T](list[T]):
+    """A page of list results and the cursor of the page after it.
+
+    Behaves as the list of items, so callers that only need the items are unaffected.
+    """
+
+    def __init__(self, items: list[T], next_cursor: str | None = None) -> None:
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def sort_columns(model: type[SQLModel], sort: SortKey) -> list[Any]:
+    """Get the columns a page is ordered by: the sort column, then the primary key."""
+    table = model.__table__  # type: ignore[attr-defined]
+    primary_key = list(table.primary_key.columns)
+    if sort.field not in table.columns:
+        raise ValueError(f"{model.__name__} has no column {sort.field!r}")
+    column = table.columns[sort.field]
+    return primary_key if column in primary_key else [column, *primary_key]
+
+
+def _dump(value: Any) -> Any:
+    """Convert a sort value to JSON."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _load(column: Any, value: Any) -> Any:
+    """Convert a JSON sort value back to the column's Python type."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:  # custom types such as SQLModel's AutoString
+        return value
+    if value is None or isinstance(value, python_type):
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(sort: SortKey, values: list[Any]) -> str:
+    """Encode the sort values of the last row of a page as a cursor.
+
+    Args:
+        sort: Sort order of the page
+        values: Sort column and primary key values of the last row
+
+    Returns:
+        Opaque cursor string
+    """
+    payload = {"s": sort.field, "d": sort.descending, "v": [_dump(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, sort: SortKey, columns: list[Any]) -> list[Any]:
+    """Decode a cursor into the sort values of the row to resume after.
+
+    Args:
+        cursor: Cursor returned with the previous page
+        sort: Sort order of the requested page
+        columns: Columns the page is ordered by
+
+    Returns:
+        Sort column and primary key values
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed or was issued for another sort order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["s"] != sort.field or payload["d"] != sort.descending:
+            raise InvalidCursorException(cursor=cursor)
+        return [
+            _load(column, value)
+            for column, value in zip(columns, payload["v"], strict=True)
+        ]
+    except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorException(cursor=cursor) from e
+
+
+@overload
+async def paginate[M: SQLModel](
+    stmt: Select[tuple[M]],
+    model: type[M],
+    db: AsyncSession,
+    page: PageParams | None = None,
+    sort: SortKey = DEFAULT_SORT,
+    fields: None = None,
+    expressions: Sequence[Label[Any]] = (),
+) -> Page[M]: ...
+
+
+@overload
+async def paginate[M: SQLModel](
+    stmt: Select[tuple[M]],
+    model: type[M],
+    db: AsyncSession,
+    page: PageParams | None = None,
+    sort: SortKey = DEFAULT_SORT,
+    *,
+    fields: Sequence[str],
+    expressions: Sequence[Label[Any]] = (),
+) -> Page[dict[str, Any]]: ...
+
+
+@overload
+async def paginate[M: SQLModel](
+    stmt: Select[tuple[M]],
+    model: type[M],
+    db: AsyncSession,
+    page: PageParams | None = None,
+    sort: SortKey = DEFAULT_SORT,
+    fields: Sequence[str] | None = None,
+    expressions: Sequence[Label[Any]] = (),
+) -> Page[M] | Page[dict[str, Any]]: ...
+
+
+async def paginate[M: SQLModel](
+    stmt: Select[tuple[M]],
+    model: type[M],
+    db: AsyncSession,
+    page: PageParams | None = None,
+    sort: SortKey = DEFAULT_SORT,
+    fields: Sequence[str] | None = None,
+    expressions: Sequence[Label[Any]] = (),
+) -> Page[M] | Page[dict[str, Any]]:
+    """Fetch one page of a list query.
+
+    Args:
+        stmt: SELECT of the entities, with its filters but no ordering or limit
+        model: Model class of the entities
+        db: Database session
+        page: Page size and cursor (defaults to the first page of the default size)
+        sort: Column to order by
+        fields: Fields to return; when given, only these columns are selected
+            and the page holds mappings of field names to values, not entities
+        expressions: Labeled SQL expressions (e.g. an excerpt of a long column)
+            to return alongside the fields, keyed by label; only used with fields
+
+    Returns:
+        The page of entities (or field mappings) and the cursor of the next page
+        (None on the last page)
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed or was issued for another sort order
+        InvalidFieldsException: If a requested field is not a column of the model
+    """
+    page = page or PageParams()
+    columns = sort_columns(model, sort)
+
+    if page.cursor is not None:
+        after = decode_cursor(page.cursor, sort, columns)
+        keys = tuple_(*columns)
+        stmt = stmt.where(
+            keys < tuple_(*after) if sort.descending else keys > tuple_(*after)
+        )
+
+    order = [column.desc() if sort.descending else column.asc() for column in columns]
+    if fields is None:
+        # One extra row tells whether there is a next page without a COUNT query
+        result = await db.execute(stmt.order_by(*order).limit(page.limit + 1))
+        items = list(result.scalars().all())
+        if len(items) <= page.limit:
+            return Page(items)
+        items = items[: page.limit]
+        last = items[-1]
+        return Page(items, encode_cursor(sort, [getattr(last, c.key) for c in columns]))
+
+    # The sort columns are selected too, to build the cursor, but not returned
+    selected = projection_columns(model, fields)
+    selected_keys = {column.key for column in selected}
+    extra = [column for column in columns if column.key not in selected_keys]
+    returned = [*selected, *expressions]
+    projected = stmt.with_only_columns(*returned, *extra)
+    result = await db.execute(projected.order_by(*order).limit(page.limit + 1))
+    rows = list(result.all())
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        next_cursor = encode_cursor(sort, [rows[-1]._mapping[c] for c in columns])
+    return Page([row_fields(row, returned) for row in rows], next_cursor)
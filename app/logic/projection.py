@@ -0,0 +1,73 @@
+"""Business logic for column projection (sparse fieldsets) of read operations.
+
+Reads that request specific fields select only those columns instead of whole
+entities. Unrequested columns, such as long text and JSON, are then neither
+transferred from the database nor hydrated into ORM objects.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Column, Row, Select
+from sqlalchemy.sql.elements import KeyedColumnElement
+from sqlmodel import SQLModel
+
+from ..core.exceptions.domain_exceptions import InvalidFieldsException
+
+
+def projection_columns(model: type[SQLModel], fields: Sequence[str]) -> list[Column]:
+    """Get the columns of a model to select for the requested fields.
+
+    Args:
+        model: Model class of the entities
+        fields: Names of the fields to return
+
+    Returns:
+        Columns in the order requested, without duplicates
+
+    Raises:
+        InvalidFieldsException: If no fields are requested or a field is not a column
+    """
+    table = model.__table__  # type: ignore[attr-defined]
+    unknown = [field for field in fields if field not in table.columns]
+    if unknown or not fields:
+        raise InvalidFieldsException(
+            entity_type=table.name.removeprefix("k_"), fields=unknown
+        )
+    return [table.columns[field] for field in dict.fromkeys(fields)]
+
+
+def select_fields[T](
+    stmt: Select[tuple[T]], model: type[SQLModel], fields: Sequence[str]
+) -> Select[Any]:
+    """Replace the entity selected by a SELECT with the requested columns.
+
+    Filters, joins and ordering of the statement are kept.
+
+    Args:
+        stmt: SELECT of the entities
+        model: Model class of the entities
+        fields: Names of the fields to return
+
+    Returns:
+        SELECT of only the requested columns
+
+    Raises:
+        InvalidFieldsException: If no fields are requested or a field is not a column
+    """
+    return stmt.with_only_columns(*projection_columns(model, fields))
+
+
+def row_fields(
+    row: Row[Any], columns: Sequence[KeyedColumnElement[Any]]
+) -> dict[str, Any]:
+    """Convert a projected row into a mapping of field names to values.
+
+    Args:
+        row: Row of a projected SELECT
+        columns: Columns (or labeled expressions) to include
+
+    Returns:
+        Field values keyed by field name
+    """
+    return {column.key: row._mapping[column] for column in columns}
@@ -0,0 +1,119 @@
+"""Business logic for per-organization sequence allocation.
+
+Task and feature IDs embed an incrementing per-organization number. Instead of
+scanning every existing ID to find the current maximum, numbers are handed out
+from a counter row in ``k_org_sequence`` that is bumped atomically with
+``UPDATE ... RETURNING``, so an allocation costs a single round trip.
+"""
+
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import ReturningInsert
+from sqlmodel import col
+
+from ..core.feature_id import extract_feature_number
+from ..core.task_id import extract_task_number
+from ..models import KFeature, KOrgSequence, KTask
+
+
+class SequenceKind(StrEnum):
+    """Kinds of entities numbered by a per-organization sequence."""
+
+    TASK = "task"
+    FEATURE = "feature"
+
+
+# Existing rows used to seed a counter the first time it is used for an organization
+_SEED_SOURCES: dict[SequenceKind, tuple[Any, Callable[[UUID], int]]] = {
+    SequenceKind.TASK: (KTask, extract_task_number),
+    SequenceKind.FEATURE: (KFeature, extract_feature_number),
+}
+
+
+async def _get_seed_value(org_id: UUID, kind: SequenceKind, db: AsyncSession) -> int:
+    """Get the highest number already in use for an organization.
+
+    Soft-deleted rows are included because their IDs still occupy the primary key.
+
+    Args:
+        org_id: Organization ID
+        kind: Kind of entity being numbered
+        db: Database session
+
+    Returns:
+        The highest existing number (0 if no rows exist)
+    """
+    model, extract_number = _SEED_SOURCES[kind]
+    stmt = select(model.id).where(model.org_id == org_id)
+    result = await db.execute(stmt)
+    return max((extract_number(entity_id) for entity_id in result.scalars()), default=0)
+
+
+async def _insert_counter(
+    org_id: UUID, kind: SequenceKind, first_value: int, db: AsyncSession
+) -> int:
+    """Create the counter row, or bump it if another request created it first.
+
+    Args:
+        org_id: Organization ID
+        kind: Kind of entity being numbered
+        first_value: Value to allocate if the row does not exist yet
+        db: Database session
+
+    Returns:
+        The allocated number
+    """
+    dialect_name = db.get_bind().dialect.name
+    insert = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+
+    table = KOrgSequence.__table__  # type: ignore[attr-defined]
+    values = insert(table).values(org_id=org_id, kind=str(kind), last_value=first_value)
+    stmt: ReturningInsert[Any] = values.on_conflict_do_update(
+        index_elements=[table.c.org_id, table.c.kind],
+        set_={"last_value": table.c.last_value + 1},
+    ).returning(table.c.last_value)
+
+    result = await db.execute(stmt)
+    allocated: int = result.scalar_one()
+    return allocated
+
+
+async def allocate_next_number(
+    org_id: UUID, kind: SequenceKind, db: AsyncSession
+) -> int:
+    """Allocate the next number for an entity kind within an organization.
+
+    The counter is bumped inside the caller's transaction, so the number is
+    released again if that transaction rolls back.
+
+    Args:
+        org_id: Organization ID
+        kind: Kind of entity being numbered
+        db: Database session
+
+    Returns:
+        The allocated number (1 for the first entity of its kind)
+    """
+    stmt = (
+        update(KOrgSequence)
+        .where(
+            col(KOrgSequence.org_id) == org_id,
+            col(KOrgSequence.kind) == str(kind),
+        )
+        .values(last_value=col(KOrgSequence.last_value) + 1)
+        .returning(col(KOrgSequence.last_value))
+    )
+    result = await db.execute(stmt)
+    allocated = result.scalar_one_or_none()
+    if allocated is not None:
+        return int(allocated)
+
+    # First allocation for this organization: seed past any existing rows
+    seed_value = await _get_seed_value(org_id, kind, db)
+    return await _insert_counter(org_id, kind, seed_value + 1, db)
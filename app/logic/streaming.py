@@ -0,0 +1,110 @@
+"""Business logic for streaming whole lists from a server-side cursor.
+
+Unlike pages, a stream returns every row of a list query. Rows are fetched in
+batches of ``list_stream_batch_size`` with ``yield_per``, so only one batch is
+held in memory at a time however large the list is.
+"""
+
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any, overload
+
+from sqlalchemy import Label, Select
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncScalarResult, AsyncSession
+from sqlmodel import SQLModel
+
+from ..config import settings
+from .pagination import DEFAULT_SORT, SortKey, sort_columns
+from .projection import projection_columns, row_fields
+
+
+async def _batches(
+    result: AsyncResult[Any] | AsyncScalarResult[Any],
+    convert: Callable[[Any], Any] | None = None,
+) -> AsyncIterator[list[Any]]:
+    """Yield the rows of a streamed result in batches, closing its cursor at the end."""
+    try:
+        async for rows in result.partitions():
+            yield list(rows) if convert is None else [convert(row) for row in rows]
+    finally:
+        await result.close()
+
+
+@overload
+async def stream_batches[M: SQLModel](
+    stmt: Select[tuple[M]],
+    model: type[M],
+    db: AsyncSession,
+    sort: SortKey = DEFAULT_SORT,
+    fields: None = None,
+    expressions: Sequence[Label[Any]] = (),
+) -> AsyncIterator[list[M]]: ...
+
+
+@overload
+async def stream_batches[M: SQLModel](
+    stmt: Select[tuple[M]],
+    model: type[M],
+    db: AsyncSession,
+    sort: SortKey = DEFAULT_SORT,
+    *,
+    fields: Sequence[str],
+    expressions: Sequence[Label[Any]] = (),
+) -> AsyncIterator[list[dict[str, Any]]]: ...
+
+
+@overload
+async def stream_batches[M: SQLModel](
+    stmt: Select[tuple[M]],
+    model: type[M],
+    db: AsyncSession,
+    sort: SortKey = DEFAULT_SORT,
+    fields: Sequence[str] | None = None,
+    expressions: Sequence[Label[Any]] = (),
+) -> AsyncIterator[list[M]] | AsyncIterator[list[dict[str, Any]]]: ...
+
+
+async def stream_batches[M: SQLModel](
+    stmt: Select[tuple[M]],
+    model: type[M],
+    db: AsyncSession,
+    sort: SortKey = DEFAULT_SORT,
+    fields: Sequence[str] | None = None,
+    expressions: Sequence[Label[Any]] = (),
+) -> AsyncIterator[list[M]] | AsyncIterator[list[dict[str, Any]]]:
+    """Run a list query on a server-side cursor.
+
+    The query is executed before this returns, so database and field errors are
+    raised here rather than while the batches are consumed. The session must stay
+    open until the batches are exhausted.
+
+    Args:
+        stmt: SELECT of the entities, with its filters but no ordering or limit
+        model: Model class of the entities
+        db: Database session
+        sort: Column to order by
+        fields: Fields to return; when given, only these columns are selected
+            and batches hold mappings of field names to values, not entities
+        expressions: Labeled SQL expressions to return alongside the fields
+
+    Returns:
+        Batches of entities (or field mappings) in sort order
+
+    Raises:
+        InvalidFieldsException: If a requested field is not a column of the model
+    """
+    order = [
+        column.desc() if sort.descending else column.asc()
+        for column in sort_columns(model, sort)
+    ]
+    options = {"yield_per": settings.list_stream_batch_size}
+
+    if fields is None:
+        result = await db.stream_scalars(
+            stmt.order_by(*order).execution_options(**options)
+        )
+        return _batches(result)
+
+    returned = [*projection_columns(model, fields), *expressions]
+    projected = stmt.with_only_columns(*returned).order_by(*order)
+    rows = await db.stream(projected.execution_options(**options))
+    return _batches(rows, lambda row: row_fields(row, returned))
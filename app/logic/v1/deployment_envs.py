@@ -1,6 +1,7 @@
 """Business logic for deployment environment management operations."""
 
-from datetime import datetime
+from collections.abc import Sequence
+from typing import Any, overload
 from uuid import UUID
 
 from sqlalchemy import select
@@ -14,7 +15,16 @@ from ...core.exceptions.domain_exceptions import (
 )
 from ...models import KDeploymentEnv
 from ...schemas.deployment_env import DeploymentEnvCreate, DeploymentEnvUpdate
-from ..deps import verify_organization_membership
+from ...schemas.pagination import PageParams
+from ..deps import (
+    get_org_entity,
+    get_org_entity_fields,
+    verify_organization_membership,
+    write_org_entity,
+)
+from ..pagination import Page, paginate
+from ..projection import select_fields
+from ..writes import delete_returning, insert_returning, update_returning
 
 
 async def create_deployment_env(
@@ -52,16 +62,11 @@ async def create_deployment_env(
         last_modified_by=user_id,
     )
 
-    db.add(new_deployment_env)
-
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:
+        new_deployment_env = await insert_returning(new_deployment_env, db)
+        if not in_transaction:
             # No active transaction, commit our changes
             await db.commit()
-        await db.refresh(new_deployment_env)
     except IntegrityError as e:  # pragma: no cover
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
@@ -72,18 +77,46 @@ async def create_deployment_env(
     return new_deployment_env
 
 
+@overload
+async def list_deployment_envs(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: None = None,
+) -> Page[KDeploymentEnv]: ...
+
+
+@overload
+async def list_deployment_envs(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    *,
+    fields: Sequence[str],
+) -> Page[dict[str, Any]]: ...
+
+
 async def list_deployment_envs(
-    org_id: UUID, user_id: UUID, db: AsyncSession
-) -> list[KDeploymentEnv]:
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: Sequence[str] | None = None,
+) -> Page[KDeploymentEnv] | Page[dict[str, Any]]:
     """List all deployment environments in the given organization.
 
     Args:
         org_id: Organization ID to filter deployment environments by
         user_id: ID of the user making the request
         db: Database session
+        page: Page size and cursor
+        fields: Fields to return; when given, the page holds mappings of field
+            names to values instead of models
 
     Returns:
-        List of deployment environment models
+        Page of deployment environment models
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
@@ -92,14 +125,36 @@ async def list_deployment_envs(
     await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
 
     stmt = select(KDeploymentEnv).where(KDeploymentEnv.org_id == org_id, KDeploymentEnv.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    deployment_envs = result.scalars().all()
-    return list(deployment_envs)
+    return await paginate(stmt, KDeploymentEnv, db, page, fields=fields)
 
 
+@overload
 async def get_deployment_env(
-    deployment_env_id: UUID, org_id: UUID, user_id: UUID, db: AsyncSession
-) -> KDeploymentEnv:
+    deployment_env_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: None = None,
+) -> KDeploymentEnv: ...
+
+
+@overload
+async def get_deployment_env(
+    deployment_env_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str],
+) -> dict[str, Any]: ...
+
+
+async def get_deployment_env(
+    deployment_env_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str] | None = None,
+) -> KDeploymentEnv | dict[str, Any]:
     """Get a single deployment environment by ID.
 
     Args:
@@ -107,6 +162,8 @@ async def get_deployment_env(
         org_id: Organization ID to filter by
         user_id: ID of the user making the request
         db: Database session
+        fields: Fields to return; when given, only these columns are selected
+            and a mapping of field names to values is returned
 
     Returns:
         The deployment environment model
@@ -114,13 +171,21 @@ async def get_deployment_env(
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
         DeploymentEnvNotFoundException: If the deployment environment is not found in the given organization
+        InvalidFieldsException: If a requested field is not a column of the deployment env
     """
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
     stmt = select(KDeploymentEnv).where(KDeploymentEnv.id == deployment_env_id, KDeploymentEnv.org_id == org_id, KDeploymentEnv.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    deployment_env = result.scalar_one_or_none()
+    deployment_env: KDeploymentEnv | dict[str, Any] | None
+    if fields is None:
+        deployment_env = await get_org_entity(
+            stmt, org_id=org_id, user_id=user_id, db=db
+        )
+    else:
+        deployment_env = await get_org_entity_fields(
+            select_fields(stmt, KDeploymentEnv, fields),
+            org_id=org_id,
+            user_id=user_id,
+            db=db,
+        )
 
     if not deployment_env:
         raise DeploymentEnvNotFoundException(
@@ -156,45 +221,30 @@ async def update_deployment_env(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
-    stmt = select(KDeploymentEnv).where(KDeploymentEnv.id == deployment_env_id, KDeploymentEnv.org_id == org_id, KDeploymentEnv.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    deployment_env = result.scalar_one_or_none()
-
-    if not deployment_env:
-        raise DeploymentEnvNotFoundException(
-            deployment_env_id=deployment_env_id, scope=str(org_id)
-        )
-
-    # Update only provided fields
-    if deployment_env_data.name is not None:
-        deployment_env.name = deployment_env_data.name
-    if deployment_env_data.meta is not None:
-        deployment_env.meta = deployment_env_data.meta
-
-    # Update audit fields
-    deployment_env.last_modified = datetime.now()
-    deployment_env.last_modified_by = user_id
+    stmt = update_returning(KDeploymentEnv, deployment_env_data, user_id, KDeploymentEnv.id == deployment_env_id, KDeploymentEnv.org_id == org_id, KDeploymentEnv.deleted_at.is_(None))  # type: ignore[union-attr]
 
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:  # pragma: no cover - hard to test due to autobegin
-            # No active transaction, commit our changes
-            await db.commit()  # pragma: no cover
-        await db.refresh(deployment_env)
+        deployment_env = await write_org_entity(
+            stmt, org_id=org_id, user_id=user_id, db=db
+        )
     except IntegrityError as e:  # pragma: no cover
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
         raise DeploymentEnvUpdateConflictException(  # pragma: no cover
             deployment_env_id=deployment_env_id,
-            name=deployment_env_data.name or deployment_env.name,
+            name=deployment_env_data.name or "",
             scope=str(org_id),
         ) from e
 
+    if not deployment_env:
+        raise DeploymentEnvNotFoundException(
+            deployment_env_id=deployment_env_id, scope=str(org_id)
+        )
+
+    if not in_transaction:  # pragma: no cover - hard to test due to autobegin
+        # No active transaction, commit our changes
+        await db.commit()  # pragma: no cover
+
     return deployment_env
 
 
@@ -221,24 +271,14 @@ async def delete_deployment_env(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
-    stmt = select(KDeploymentEnv).where(KDeploymentEnv.id == deployment_env_id, KDeploymentEnv.org_id == org_id, KDeploymentEnv.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    deployment_env = result.scalar_one_or_none()
+    stmt = delete_returning(KDeploymentEnv, user_id, KDeploymentEnv.id == deployment_env_id, KDeploymentEnv.org_id == org_id, KDeploymentEnv.deleted_at.is_(None), hard_delete=hard_delete)  # type: ignore[union-attr]
+    deleted_id = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
 
-    if not deployment_env:
+    if not deleted_id:
         raise DeploymentEnvNotFoundException(
             deployment_env_id=deployment_env_id, scope=str(org_id)
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(deployment_env)  # pragma: no cover
-    else:
-        deployment_env.deleted_at = datetime.now()
-        deployment_env.last_modified = datetime.now()
-        deployment_env.last_modified_by = user_id
     if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No active transaction, commit our changes
         await db.commit()  # pragma: no cover
@@ -1,20 +1,49 @@
 """Business logic for doc management operations."""
 
-from datetime import datetime
+import hashlib
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, overload
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Label, Select, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
 
 from ...core.exceptions.domain_exceptions import (
     DocAlreadyExistsException,
+    DocContentRangeNotSatisfiableException,
     DocNotFoundException,
     DocUpdateConflictException,
 )
 from ...models import KDoc
-from ...schemas.doc import DocCreate, DocUpdate
-from ..deps import verify_organization_membership
+from ...schemas.doc import DocContent, DocCreate, DocUpdate
+from ...schemas.pagination import PageParams
+from ..deps import (
+    get_org_entity,
+    get_org_entity_fields,
+    verify_organization_membership,
+    write_org_entity,
+)
+from ..pagination import Page, paginate
+from ..projection import select_fields
+from ..streaming import stream_batches
+from ..writes import delete_returning, insert_returning, update_returning
+
+# Fields of doc listings: every column except the (potentially large) content
+DOC_SUMMARY_FIELDS: tuple[str, ...] = tuple(
+    column.key
+    for column in KDoc.__table__.columns  # type: ignore[attr-defined]
+    if column.key != "content"
+)
+
+
+def _content_digest(content: str) -> dict[str, Any]:
+    """Get the length and SHA-256 hash stored alongside a doc's content."""
+    return {
+        "content_length": len(content),
+        "content_hash": hashlib.sha256(content.encode()).hexdigest(),
+    }
 
 
 async def create_doc(
@@ -48,22 +77,18 @@ async def create_doc(
         name=doc_data.name,
         description=doc_data.description,
         content=doc_data.content,
+        **_content_digest(doc_data.content),
         org_id=org_id,
         meta=doc_data.meta,
         created_by=user_id,
         last_modified_by=user_id,
     )
 
-    db.add(new_doc)
-
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:
+        new_doc = await insert_returning(new_doc, db)
+        if not in_transaction:
             # No active transaction, commit our changes
             await db.commit()
-        await db.refresh(new_doc)
     except IntegrityError as e:  # pragma: no cover
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
@@ -74,16 +99,140 @@ async def create_doc(
     return new_doc
 
 
-async def list_docs(org_id: UUID, user_id: UUID, db: AsyncSession) -> list[KDoc]:
+@overload
+async def list_docs(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: None = None,
+) -> Page[KDoc]: ...
+
+
+@overload
+async def list_docs(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    *,
+    fields: Sequence[str],
+) -> Page[dict[str, Any]]: ...
+
+
+async def list_docs(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: Sequence[str] | None = None,
+) -> Page[KDoc] | Page[dict[str, Any]]:
     """List all docs in the given organization.
 
     Args:
         org_id: Organization ID to filter docs by
         user_id: ID of the user making the request
         db: Database session
+        page: Page size and cursor
+        fields: Fields to return; when given, the page holds mappings of field
+            names to values instead of models
+
+    Returns:
+        Page of doc models
+
+    Raises:
+        UnauthorizedOrganizationAccessException: If user is not a member of the organization
+    """
+    # Verify user has access to this organization
+    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+
+    return await paginate(_docs_query(org_id), KDoc, db, page, fields=fields)
+
+
+async def list_doc_summaries(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    excerpt_length: int | None = None,
+) -> Page[dict[str, Any]]:
+    """List docs in the given organization without their content.
+
+    The content column is not selected; its stored length and hash describe it
+    instead. An excerpt is cut from the content by the database, so only the
+    excerpt is transferred.
+
+    Args:
+        org_id: Organization ID to filter docs by
+        user_id: ID of the user making the request
+        db: Database session
+        page: Page size and cursor
+        excerpt_length: Number of leading content characters to include as
+            ``excerpt`` (no excerpt when None)
+
+    Returns:
+        Page of doc summaries (every field but content, plus the excerpt)
+
+    Raises:
+        UnauthorizedOrganizationAccessException: If user is not a member of the organization
+    """
+    # Verify user has access to this organization
+    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+
+    return await paginate(
+        _docs_query(org_id),
+        KDoc,
+        db,
+        page,
+        fields=DOC_SUMMARY_FIELDS,
+        expressions=_excerpt(excerpt_length),
+    )
+
+
+async def stream_docs(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str] | None = None,
+) -> AsyncIterator[list[KDoc]] | AsyncIterator[list[dict[str, Any]]]:
+    """Stream all docs in the given organization in batches.
+
+    Args:
+        org_id: Organization ID to filter docs by
+        user_id: ID of the user making the request
+        db: Database session, kept open until the stream is consumed
+        fields: Fields to return; when given, batches hold mappings of field
+            names to values instead of models
+
+    Returns:
+        Batches of doc models
+
+    Raises:
+        UnauthorizedOrganizationAccessException: If user is not a member of the organization
+    """
+    # Verify user has access to this organization
+    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+
+    return await stream_batches(_docs_query(org_id), KDoc, db, fields=fields)
+
+
+async def stream_doc_summaries(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    excerpt_length: int | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Stream all docs in the given organization in batches, without their content.
+
+    Args:
+        org_id: Organization ID to filter docs by
+        user_id: ID of the user making the request
+        db: Database session, kept open until the stream is consumed
+        excerpt_length: Number of leading content characters to include as
+            ``excerpt`` (no excerpt when None)
 
     Returns:
-        List of doc models
+        Batches of doc summaries (every field but content, plus the excerpt)
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
@@ -91,13 +240,54 @@ async def list_docs(org_id: UUID, user_id: UUID, db: AsyncSession) -> list[KDoc]
     # Verify user has access to this organization
     await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
 
-    stmt = select(KDoc).where(KDoc.org_id == org_id, KDoc.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    docs = result.scalars().all()
-    return list(docs)
+    return await stream_batches(
+        _docs_query(org_id),
+        KDoc,
+        db,
+        fields=DOC_SUMMARY_FIELDS,
+        expressions=_excerpt(excerpt_length),
+    )
+
+
+def _docs_query(org_id: UUID) -> Select[tuple[KDoc]]:
+    """Build the SELECT of an organization's docs."""
+    return select(KDoc).where(KDoc.org_id == org_id, KDoc.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
+
 
+def _excerpt(excerpt_length: int | None) -> list[Label[Any]]:
+    """Get the expression cutting a content excerpt in SQL, if one is requested."""
+    if excerpt_length is None:
+        return []
+    return [func.substr(KDoc.content, 1, excerpt_length).label("excerpt")]
 
-async def get_doc(doc_id: UUID, org_id: UUID, user_id: UUID, db: AsyncSession) -> KDoc:
+
+@overload
+async def get_doc(
+    doc_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: None = None,
+) -> KDoc: ...
+
+
+@overload
+async def get_doc(
+    doc_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str],
+) -> dict[str, Any]: ...
+
+
+async def get_doc(
+    doc_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str] | None = None,
+) -> KDoc | dict[str, Any]:
     """Get a single doc by ID.
 
     Args:
@@ -105,20 +295,25 @@ async def get_doc(doc_id: UUID, org_id: UUID, user_id: UUID, db: AsyncSession) -
         org_id: Organization ID to filter by
         user_id: ID of the user making the request
         db: Database session
+        fields: Fields to return; when given, only these columns are selected
+            and a mapping of field names to values is returned
 
     Returns:
-        The doc model
+        The doc model, or its requested fields
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
         DocNotFoundException: If the doc is not found in the given organization
+        InvalidFieldsException: If a requested field is not a column of the doc
     """
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
     stmt = select(KDoc).where(KDoc.id == doc_id, KDoc.org_id == org_id, KDoc.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    doc = result.scalar_one_or_none()
+    doc: KDoc | dict[str, Any] | None
+    if fields is None:
+        doc = await get_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
+    else:
+        doc = await get_org_entity_fields(
+            select_fields(stmt, KDoc, fields), org_id=org_id, user_id=user_id, db=db
+        )
 
     if not doc:
         raise DocNotFoundException(doc_id=doc_id, scope=str(org_id))
@@ -126,6 +321,67 @@ async def get_doc(doc_id: UUID, org_id: UUID, user_id: UUID, db: AsyncSession) -
     return doc
 
 
+async def get_doc_content(
+    doc_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    start: int = 0,
+    end: int | None = None,
+) -> DocContent:
+    """Get a doc's content, or a slice of it.
+
+    The slice is cut by the database, so only the requested characters are
+    transferred.
+
+    Args:
+        doc_id: ID of the doc
+        org_id: Organization ID to filter by
+        user_id: ID of the user making the request
+        db: Database session
+        start: Position of the first character to return
+        end: Position after the last character to return (the end of the
+            content when None)
+
+    Returns:
+        The content slice with its position and the full content length
+
+    Raises:
+        UnauthorizedOrganizationAccessException: If user is not a member of the organization
+        DocNotFoundException: If the doc is not found in the given organization
+        DocContentRangeNotSatisfiableException: If start is beyond the end of the content
+    """
+    # SQL substr() positions are 1-based
+    if end is None:
+        content = func.substr(KDoc.content, start + 1)
+    else:
+        content = func.substr(KDoc.content, start + 1, max(end - start, 0))
+    stmt = select(
+        content.label("content"), func.length(KDoc.content).label("content_length")
+    ).where(
+        col(KDoc.id) == doc_id,
+        col(KDoc.org_id) == org_id,
+        col(KDoc.deleted_at).is_(None),
+    )
+    row = await get_org_entity_fields(stmt, org_id=org_id, user_id=user_id, db=db)
+
+    if row is None:
+        raise DocNotFoundException(doc_id=doc_id, scope=str(org_id))
+
+    content_length = row["content_length"]
+    if start > 0 and start >= content_length:
+        raise DocContentRangeNotSatisfiableException(
+            doc_id=doc_id, start=start, content_length=content_length
+        )
+
+    return DocContent(
+        content=row["content"],
+        start=start,
+        end=start + len(row["content"]),
+        content_length=content_length,
+    )
+
+
 async def update_doc(
     doc_id: UUID,
     doc_data: DocUpdate,
@@ -152,47 +408,28 @@ async def update_doc(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
-    stmt = select(KDoc).where(KDoc.id == doc_id, KDoc.org_id == org_id, KDoc.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    doc = result.scalar_one_or_none()
-
-    if not doc:
-        raise DocNotFoundException(doc_id=doc_id, scope=str(org_id))
-
-    # Update only provided fields
-    if doc_data.name is not None:
-        doc.name = doc_data.name
-    if doc_data.description is not None:
-        doc.description = doc_data.description
+    stmt = update_returning(KDoc, doc_data, user_id, KDoc.id == doc_id, KDoc.org_id == org_id, KDoc.deleted_at.is_(None))  # type: ignore[union-attr]
     if doc_data.content is not None:
-        doc.content = doc_data.content
-    if doc_data.meta is not None:
-        doc.meta = doc_data.meta
-
-    # Update audit fields
-    doc.last_modified = datetime.now()
-    doc.last_modified_by = user_id
+        stmt = stmt.values(_content_digest(doc_data.content))
 
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:  # pragma: no cover - hard to test due to autobegin
-            # No active transaction, commit our changes
-            await db.commit()  # pragma: no cover
-        await db.refresh(doc)
+        doc = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
     except IntegrityError as e:  # pragma: no cover
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
         raise DocUpdateConflictException(  # pragma: no cover
             doc_id=doc_id,
-            name=doc_data.name or doc.name,
+            name=doc_data.name or "",
             scope=str(org_id),
         ) from e
 
+    if not doc:
+        raise DocNotFoundException(doc_id=doc_id, scope=str(org_id))
+
+    if not in_transaction:  # pragma: no cover - hard to test due to autobegin
+        # No active transaction, commit our changes
+        await db.commit()  # pragma: no cover
+
     return doc
 
 
@@ -219,22 +456,12 @@ async def delete_doc(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+    stmt = delete_returning(KDoc, user_id, KDoc.id == doc_id, KDoc.org_id == org_id, KDoc.deleted_at.is_(None), hard_delete=hard_delete)  # type: ignore[union-attr]
+    deleted_id = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
 
-    stmt = select(KDoc).where(KDoc.id == doc_id, KDoc.org_id == org_id, KDoc.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    doc = result.scalar_one_or_none()
-
-    if not doc:
+    if not deleted_id:
         raise DocNotFoundException(doc_id=doc_id, scope=str(org_id))
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(doc)  # pragma: no cover
-    else:
-        doc.deleted_at = datetime.now()
-        doc.last_modified = datetime.now()
-        doc.last_modified_by = user_id
     if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No active transaction, commit our changes
         await db.commit()  # pragma: no cover
@@ -1,6 +1,5 @@
 """Business logic for feature doc relationship management operations."""
 
-from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
@@ -15,6 +14,14 @@ from ...core.exceptions.domain_exceptions import (
 )
 from ...models import KDoc, KFeature, KFeatureDoc
 from ...schemas.feature_doc import FeatureDocCreate, FeatureDocUpdate
+from ...schemas.pagination import PageParams
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_feature_doc(
@@ -73,11 +80,9 @@ async def add_feature_doc(
         last_modified_by=user_id,
     )
 
-    db.add(new_feature_doc)
-
     try:
+        new_feature_doc = await insert_returning(new_feature_doc, db)
         await db.commit()
-        await db.refresh(new_feature_doc)
     except IntegrityError as e:
         await db.rollback()
         raise FeatureDocAlreadyExistsException(
@@ -87,15 +92,18 @@ async def add_feature_doc(
     return new_feature_doc
 
 
-async def list_feature_docs(feature_id: UUID, db: AsyncSession) -> list[KFeatureDoc]:
+async def list_feature_docs(
+    feature_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KFeatureDoc]:
     """List all docs for a feature.
 
     Args:
         feature_id: ID of the feature
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of feature doc models
+        Page of feature doc models
 
     Raises:
         FeatureNotFoundException: If the feature is not found
@@ -109,12 +117,10 @@ async def list_feature_docs(feature_id: UUID, db: AsyncSession) -> list[KFeature
         raise FeatureNotFoundException(feature_id=feature_id, scope=None)
 
     # Get all docs for this feature
-    stmt = select(KFeatureDoc).where(  # type: ignore[assignment]
+    list_stmt = select(KFeatureDoc).where(
         KFeatureDoc.feature_id == feature_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    docs = result.scalars().all()
-    return list(docs)  # type: ignore[arg-type]
+    return await paginate(list_stmt, KFeatureDoc, db, page)
 
 
 async def get_feature_doc(
@@ -171,30 +177,21 @@ async def update_feature_doc(
     Raises:
         FeatureDocNotFoundException: If the feature doc relationship is not found
     """
-    stmt = select(KFeatureDoc).where(
-        KFeatureDoc.feature_id == feature_id,  # type: ignore[arg-type]
-        KFeatureDoc.doc_id == doc_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KFeatureDoc,
+        doc_data,
+        user_id,
+        KFeatureDoc.feature_id == feature_id,
+        KFeatureDoc.doc_id == doc_id,
     )
-    result = await db.execute(stmt)
-    feature_doc = result.scalar_one_or_none()
+    feature_doc = await execute_returning(stmt, db)
 
     if not feature_doc:
         raise FeatureDocNotFoundException(
             feature_id=feature_id, doc_id=doc_id, scope=None
         )
 
-    # Update only provided fields
-    if doc_data.role is not None:
-        feature_doc.role = doc_data.role
-    if doc_data.meta is not None:
-        feature_doc.meta = doc_data.meta
-
-    # Update audit fields
-    feature_doc.last_modified = datetime.now()
-    feature_doc.last_modified_by = user_id
-
     await db.commit()
-    await db.refresh(feature_doc)
 
     return feature_doc
 
@@ -218,23 +215,19 @@ async def remove_feature_doc(
     Raises:
         FeatureDocNotFoundException: If the feature doc relationship is not found
     """
-    stmt = select(KFeatureDoc).where(
-        KFeatureDoc.feature_id == feature_id,  # type: ignore[arg-type]
-        KFeatureDoc.doc_id == doc_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KFeatureDoc,
+        user_id,
+        KFeatureDoc.feature_id == feature_id,
+        KFeatureDoc.doc_id == doc_id,
         KFeatureDoc.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
     )
-    result = await db.execute(stmt)
-    feature_doc = result.scalar_one_or_none()
+    deleted_id = await execute_returning(stmt, db)
 
-    if not feature_doc:
+    if not deleted_id:
         raise FeatureDocNotFoundException(
             feature_id=feature_id, doc_id=doc_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(feature_doc)  # pragma: no cover
-    else:
-        feature_doc.deleted_at = datetime.now()
-        feature_doc.last_modified = datetime.now()
-        feature_doc.last_modified_by = user_id
     await db.commit()
@@ -1,11 +1,13 @@
 """Business logic for feature management operations."""
 
-from datetime import datetime
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, overload
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Select, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
 
 from ...core.exceptions.domain_exceptions import (
     FeatureAlreadyExistsException,
@@ -13,36 +15,21 @@ from ...core.exceptions.domain_exceptions import (
     FeatureNotFoundException,
     FeatureUpdateConflictException,
 )
-from ...core.feature_id import extract_feature_number, generate_feature_id
+from ...core.feature_id import generate_feature_id
 from ...models import KFeature
-from ...schemas.feature import FeatureCreate, FeatureUpdate
-from ..deps import verify_organization_membership
-
-MAX_RETRIES = 10
-
-
-async def get_next_feature_number(org_id: UUID, db: AsyncSession) -> int:
-    """Get next feature number by finding max existing number + 1.
-
-    Args:
-        org_id: Organization ID to find features for
-        db: Database session
-
-    Returns:
-        The next available feature number (1 if no features exist)
-    """
-    stmt = select(KFeature.id).where(  # type: ignore[call-overload]
-        KFeature.org_id == org_id,
-        KFeature.deleted_at.is_(None),  # type: ignore[union-attr]
-    )
-    result = await db.execute(stmt)
-    feature_ids = result.scalars().all()
-
-    if not feature_ids:
-        return 1
-
-    max_number = max(extract_feature_number(fid) for fid in feature_ids)
-    return max_number + 1
+from ...schemas.feature import FeatureCreate, FeatureFilters, FeatureUpdate
+from ...schemas.pagination import PageParams
+from ..deps import (
+    get_org_entity,
+    get_org_entity_fields,
+    verify_organization_membership,
+    write_org_entity,
+)
+from ..pagination import DEFAULT_SORT, Page, SortKey, paginate
+from ..projection import select_fields
+from ..sequences import SequenceKind, allocate_next_number
+from ..streaming import stream_batches
+from ..writes import delete_returning, insert_returning, update_returning
 
 
 async def create_feature(
@@ -65,7 +52,7 @@ async def create_feature(
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
         FeatureAlreadyExistsException: If a feature with the same name already exists in the organization
-        FeatureCreationFailedException: If feature creation fails after retries
+        FeatureCreationFailedException: If the allocated feature ID collides with an existing feature
     """
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
@@ -73,75 +60,97 @@ async def create_feature(
     # Verify user has access to this organization
     await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            next_number = await get_next_feature_number(org_id, db) + attempt
-            feature_id = generate_feature_id(org_id, next_number)
-
-            # Create new feature with audit fields
-            new_feature = KFeature(
-                id=feature_id,
-                name=feature_data.name,
-                org_id=org_id,
-                parent=feature_data.parent,
-                parent_path=feature_data.parent_path,
-                feature_type=feature_data.feature_type,
-                summary=feature_data.summary,
-                details=feature_data.details,
-                guestimate=feature_data.guestimate,
-                derived_guestimate=feature_data.derived_guestimate,
-                review_result=feature_data.review_result,
-                meta=feature_data.meta,
-                created_by=user_id,
-                last_modified_by=user_id,
-            )
-
-            db.add(new_feature)
-
-            if in_transaction:  # pragma: no cover - tested via txs integration
-                # Already in a transaction (managed by txs), just flush
-                await db.flush()  # pragma: no cover
-            else:
-                # No active transaction, commit our changes
-                await db.commit()
-            await db.refresh(new_feature)
-
-            return new_feature
-        except IntegrityError as e:
-            if not in_transaction:  # pragma: no cover
-                await db.rollback()  # pragma: no cover
-            # Check if it's a name uniqueness violation vs ID collision
-            error_str = str(e).lower()
-            if "name" in error_str or "unique" in error_str:
-                raise FeatureAlreadyExistsException(
-                    name=feature_data.name, scope=str(org_id)
-                ) from e
-            # ID collision - retry with next number
-            if attempt == MAX_RETRIES - 1:  # pragma: no cover
-                raise FeatureCreationFailedException(  # pragma: no cover
-                    message=f"Failed to create feature after {MAX_RETRIES} retries due to ID collisions",
-                    org_id=org_id,
-                ) from None
-            continue  # pragma: no cover
-
-    # This should never be reached, but type checker needs it
-    raise FeatureCreationFailedException(  # pragma: no cover
-        message="Failed to create feature", org_id=org_id
-    )
+    try:
+        next_number = await allocate_next_number(org_id, SequenceKind.FEATURE, db)
+        feature_id = generate_feature_id(org_id, next_number)
+
+        # Create new feature with audit fields
+        new_feature = KFeature(
+            id=feature_id,
+            name=feature_data.name,
+            org_id=org_id,
+            parent=feature_data.parent,
+            parent_path=feature_data.parent_path,
+            feature_type=feature_data.feature_type,
+            summary=feature_data.summary,
+            details=feature_data.details,
+            guestimate=feature_data.guestimate,
+            derived_guestimate=feature_data.derived_guestimate,
+            review_result=feature_data.review_result,
+            meta=feature_data.meta,
+            created_by=user_id,
+            last_modified_by=user_id,
+        )
+
+        new_feature = await insert_returning(new_feature, db)
+        if not in_transaction:
+            # No active transaction, commit our changes
+            await db.commit()
+    except IntegrityError as e:
+        if not in_transaction:  # pragma: no cover
+            await db.rollback()  # pragma: no cover
+        # Check if it's a name uniqueness violation vs ID collision
+        error_str = str(e).lower()
+        if "name" in error_str or "unique" in error_str:
+            raise FeatureAlreadyExistsException(
+                name=feature_data.name, scope=str(org_id)
+            ) from e
+        raise FeatureCreationFailedException(  # pragma: no cover
+            message="Failed to create feature due to an ID collision",
+            org_id=org_id,
+        ) from None
+
+    return new_feature
+
+
+@overload
+async def list_features(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: None = None,
+    filters: FeatureFilters | None = None,
+    sort: SortKey = DEFAULT_SORT,
+) -> Page[KFeature]: ...
+
+
+@overload
+async def list_features(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    *,
+    fields: Sequence[str],
+    filters: FeatureFilters | None = None,
+    sort: SortKey = DEFAULT_SORT,
+) -> Page[dict[str, Any]]: ...
 
 
 async def list_features(
-    org_id: UUID, user_id: UUID, db: AsyncSession
-) -> list[KFeature]:
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: Sequence[str] | None = None,
+    filters: FeatureFilters | None = None,
+    sort: SortKey = DEFAULT_SORT,
+) -> Page[KFeature] | Page[dict[str, Any]]:
     """List all features in the given organization.
 
     Args:
         org_id: Organization ID to filter features by
         user_id: ID of the user making the request
         db: Database session
+        page: Page size and cursor
+        fields: Fields to return; when given, the page holds mappings of field
+            names to values instead of models
+        filters: Optional filters on feature attributes
+        sort: Column to order by
 
     Returns:
-        List of feature models
+        Page of feature models
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
@@ -149,15 +158,93 @@ async def list_features(
     # Verify user has access to this organization
     await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
 
+    return await paginate(
+        _features_query(org_id, filters), KFeature, db, page, sort, fields
+    )
+
+
+async def stream_features(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str] | None = None,
+    filters: FeatureFilters | None = None,
+    sort: SortKey = DEFAULT_SORT,
+) -> AsyncIterator[list[KFeature]] | AsyncIterator[list[dict[str, Any]]]:
+    """Stream all features in the given organization in batches.
+
+    Args:
+        org_id: Organization ID to filter features by
+        user_id: ID of the user making the request
+        db: Database session, kept open until the stream is consumed
+        fields: Fields to return; when given, batches hold mappings of field
+            names to values instead of models
+        filters: Optional filters on feature attributes
+        sort: Column to order by
+
+    Returns:
+        Batches of feature models
+
+    Raises:
+        UnauthorizedOrganizationAccessException: If user is not a member of the organization
+    """
+    # Verify user has access to this organization
+    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+
+    return await stream_batches(
+        _features_query(org_id, filters), KFeature, db, sort, fields
+    )
+
+
+def _features_query(
+    org_id: UUID, filters: FeatureFilters | None
+) -> Select[tuple[KFeature]]:
+    """Build the SELECT of an organization's features, with optional filters."""
     stmt = select(KFeature).where(KFeature.org_id == org_id, KFeature.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    features = result.scalars().all()
-    return list(features)
+    if filters is not None:
+        stmt = stmt.where(*_feature_conditions(filters))
+    return stmt
 
 
+def _feature_conditions(filters: FeatureFilters) -> list[ColumnElement[bool]]:
+    """Translate feature list filters into WHERE conditions."""
+    conditions: list[ColumnElement[bool]] = []
+    if filters.feature_type:
+        conditions.append(col(KFeature.feature_type).in_(filters.feature_type))
+    if filters.parent is not None:
+        conditions.append(col(KFeature.parent) == filters.parent)
+    if filters.review_result:
+        conditions.append(col(KFeature.review_result).in_(filters.review_result))
+    return conditions
+
+
+@overload
 async def get_feature(
-    feature_id: UUID, org_id: UUID, user_id: UUID, db: AsyncSession
-) -> KFeature:
+    feature_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: None = None,
+) -> KFeature: ...
+
+
+@overload
+async def get_feature(
+    feature_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str],
+) -> dict[str, Any]: ...
+
+
+async def get_feature(
+    feature_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str] | None = None,
+) -> KFeature | dict[str, Any]:
     """Get a single feature by ID.
 
     Args:
@@ -165,20 +252,25 @@ async def get_feature(
         org_id: Organization ID to filter by
         user_id: ID of the user making the request
         db: Database session
+        fields: Fields to return; when given, only these columns are selected
+            and a mapping of field names to values is returned
 
     Returns:
-        The feature model
+        The feature model, or its requested fields
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
         FeatureNotFoundException: If the feature is not found in the given organization
+        InvalidFieldsException: If a requested field is not a column of the feature
     """
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
     stmt = select(KFeature).where(KFeature.id == feature_id, KFeature.org_id == org_id, KFeature.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    feature = result.scalar_one_or_none()
+    feature: KFeature | dict[str, Any] | None
+    if fields is None:
+        feature = await get_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
+    else:
+        feature = await get_org_entity_fields(
+            select_fields(stmt, KFeature, fields), org_id=org_id, user_id=user_id, db=db
+        )
 
     if not feature:
         raise FeatureNotFoundException(feature_id=feature_id, scope=str(org_id))
@@ -213,59 +305,26 @@ async def update_feature(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
-    stmt = select(KFeature).where(KFeature.id == feature_id, KFeature.org_id == org_id, KFeature.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    feature = result.scalar_one_or_none()
-
-    if not feature:
-        raise FeatureNotFoundException(feature_id=feature_id, scope=str(org_id))
-
-    # Update only provided fields
-    if feature_data.name is not None:
-        feature.name = feature_data.name
-    if feature_data.parent is not None:
-        feature.parent = feature_data.parent
-    if feature_data.parent_path is not None:
-        feature.parent_path = feature_data.parent_path
-    if feature_data.feature_type is not None:
-        feature.feature_type = feature_data.feature_type
-    if feature_data.summary is not None:
-        feature.summary = feature_data.summary
-    if feature_data.details is not None:
-        feature.details = feature_data.details
-    if feature_data.guestimate is not None:
-        feature.guestimate = feature_data.guestimate
-    if feature_data.derived_guestimate is not None:
-        feature.derived_guestimate = feature_data.derived_guestimate
-    if feature_data.review_result is not None:
-        feature.review_result = feature_data.review_result
-    if feature_data.meta is not None:
-        feature.meta = feature_data.meta
-
-    # Update audit fields
-    feature.last_modified = datetime.now()
-    feature.last_modified_by = user_id
+    stmt = update_returning(KFeature, feature_data, user_id, KFeature.id == feature_id, KFeature.org_id == org_id, KFeature.deleted_at.is_(None))  # type: ignore[union-attr]
 
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:  # pragma: no cover - hard to test due to autobegin
-            # No active transaction, commit our changes
-            await db.commit()  # pragma: no cover
-        await db.refresh(feature)
+        feature = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
     except IntegrityError as e:  # pragma: no cover
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
         raise FeatureUpdateConflictException(  # pragma: no cover
             feature_id=feature_id,
-            name=feature_data.name or feature.name,
+            name=feature_data.name or "",
             scope=str(org_id),
         ) from e
 
+    if not feature:
+        raise FeatureNotFoundException(feature_id=feature_id, scope=str(org_id))
+
+    if not in_transaction:  # pragma: no cover - hard to test due to autobegin
+        # No active transaction, commit our changes
+        await db.commit()  # pragma: no cover
+
     return feature
 
 
@@ -292,22 +351,12 @@ async def delete_feature(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
-    stmt = select(KFeature).where(KFeature.id == feature_id, KFeature.org_id == org_id, KFeature.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    feature = result.scalar_one_or_none()
+    stmt = delete_returning(KFeature, user_id, KFeature.id == feature_id, KFeature.org_id == org_id, KFeature.deleted_at.is_(None), hard_delete=hard_delete)  # type: ignore[union-attr]
+    deleted_id = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
 
-    if not feature:
+    if not deleted_id:
         raise FeatureNotFoundException(feature_id=feature_id, scope=str(org_id))
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(feature)  # pragma: no cover
-    else:
-        feature.deleted_at = datetime.now()
-        feature.last_modified = datetime.now()
-        feature.last_modified_by = user_id
     if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No active transaction, commit our changes
         await db.commit()  # pragma: no cover
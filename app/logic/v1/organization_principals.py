@@ -1,9 +1,9 @@
 """Business logic for organization principal management operations."""
 
-from datetime import datetime
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,7 +19,20 @@ from ...schemas.organization_principal import (
     OrganizationPrincipalCreate,
     OrganizationPrincipalUpdate,
 )
-from ..deps import verify_organization_membership
+from ...schemas.pagination import PageParams
+from ..deps import (
+    get_org_entity,
+    invalidate_organization_membership,
+    verify_organization_membership,
+)
+from ..pagination import Page, paginate
+from ..streaming import stream_batches
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_organization_principal(
@@ -75,37 +88,67 @@ async def add_organization_principal(
         last_modified_by=user_id,
     )
 
-    db.add(new_principal)
-
     try:
+        new_principal = await insert_returning(new_principal, db)
         await db.commit()
-        await db.refresh(new_principal)
     except IntegrityError as e:
         await db.rollback()
         raise OrganizationPrincipalAlreadyExistsException(
             org_id=org_id, principal_id=principal_data.principal_id, scope=str(org_id)
         ) from e
 
+    invalidate_organization_membership(org_id, principal_data.principal_id)
+
     return new_principal
 
 
 async def list_organization_principals(
-    org_id: UUID, user_id: UUID, db: AsyncSession
-) -> list[KOrganizationPrincipal]:
+    org_id: UUID, user_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KOrganizationPrincipal]:
     """List all principals of an organization.
 
     Args:
         org_id: ID of the organization
         user_id: ID of the user making the request
         db: Database session
+        page: Page size and cursor
+
+    Returns:
+        Page of organization principal models
+
+    Raises:
+        OrganizationNotFoundException: If the organization is not found
+        UnauthorizedOrganizationAccessException: If user is not a member of the organization
+    """
+    stmt = await _organization_principals_query(org_id, user_id, db)
+    return await paginate(stmt, KOrganizationPrincipal, db, page)
+
+
+async def stream_organization_principals(
+    org_id: UUID, user_id: UUID, db: AsyncSession
+) -> AsyncIterator[list[KOrganizationPrincipal]]:
+    """Stream all principals of an organization in batches.
+
+    Args:
+        org_id: ID of the organization
+        user_id: ID of the user making the request
+        db: Database session, kept open until the stream is consumed
 
     Returns:
-        List of organization principal models
+        Batches of organization principal models
 
     Raises:
         OrganizationNotFoundException: If the organization is not found
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
     """
+    stmt = await _organization_principals_query(org_id, user_id, db)
+    return await stream_batches(stmt, KOrganizationPrincipal, db)
+
+
+async def _organization_principals_query(
+    org_id: UUID, user_id: UUID, db: AsyncSession
+) -> Select[tuple[KOrganizationPrincipal]]:
+    """Verify access to an organization and build the SELECT of its principals."""
     # Verify user has access to this organization
     await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
 
@@ -118,12 +161,9 @@ async def list_organization_principals(
         raise OrganizationNotFoundException(org_id=org_id, scope=None)
 
     # Get all principals for this organization
-    stmt = select(KOrganizationPrincipal).where(  # type: ignore[assignment]
+    return select(KOrganizationPrincipal).where(
         KOrganizationPrincipal.org_id == org_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    principals = result.scalars().all()
-    return list(principals)  # type: ignore[arg-type]
 
 
 async def get_organization_principal(
@@ -144,16 +184,12 @@ async def get_organization_principal(
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
         OrganizationPrincipalNotFoundException: If the organization principal is not found
     """
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
     stmt = select(KOrganizationPrincipal).where(
         KOrganizationPrincipal.org_id == org_id,  # type: ignore[arg-type]
         KOrganizationPrincipal.principal_id == principal_id,  # type: ignore[arg-type]
         KOrganizationPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
     )
-    result = await db.execute(stmt)
-    principal = result.scalar_one_or_none()
+    principal = await get_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
 
     if not principal:
         raise OrganizationPrincipalNotFoundException(
@@ -199,30 +235,22 @@ async def update_organization_principal(
             user_id=user_id,
         )
 
-    stmt = select(KOrganizationPrincipal).where(
-        KOrganizationPrincipal.org_id == org_id,  # type: ignore[arg-type]
-        KOrganizationPrincipal.principal_id == principal_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KOrganizationPrincipal,
+        principal_data,
+        user_id,
+        KOrganizationPrincipal.org_id == org_id,
+        KOrganizationPrincipal.principal_id == principal_id,
     )
-    result = await db.execute(stmt)
-    principal = result.scalar_one_or_none()
+    principal = await execute_returning(stmt, db)
 
     if not principal:
         raise OrganizationPrincipalNotFoundException(
             org_id=org_id, principal_id=principal_id, scope=None
         )
 
-    # Update only provided fields
-    if principal_data.role is not None:
-        principal.role = principal_data.role
-    if principal_data.meta is not None:
-        principal.meta = principal_data.meta
-
-    # Update audit fields
-    principal.last_modified = datetime.now()
-    principal.last_modified_by = user_id
-
     await db.commit()
-    await db.refresh(principal)
+    invalidate_organization_membership(org_id, principal_id)
 
     return principal
 
@@ -260,23 +288,20 @@ async def remove_organization_principal(
             user_id=user_id,
         )
 
-    stmt = select(KOrganizationPrincipal).where(
-        KOrganizationPrincipal.org_id == org_id,  # type: ignore[arg-type]
-        KOrganizationPrincipal.principal_id == principal_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KOrganizationPrincipal,
+        user_id,
+        KOrganizationPrincipal.org_id == org_id,
+        KOrganizationPrincipal.principal_id == principal_id,
         KOrganizationPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
     )
-    result = await db.execute(stmt)
-    principal = result.scalar_one_or_none()
+    deleted_id = await execute_returning(stmt, db)
 
-    if not principal:
+    if not deleted_id:
         raise OrganizationPrincipalNotFoundException(
             org_id=org_id, principal_id=principal_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(principal)  # pragma: no cover
-    else:
-        principal.deleted_at = datetime.now()
-        principal.last_modified = datetime.now()
-        principal.last_modified_by = user_id
     await db.commit()
+    invalidate_organization_membership(org_id, principal_id)
@@ -1,6 +1,5 @@
 """Business logic for organization management operations."""
 
-from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
@@ -18,7 +17,18 @@ from ...core.org_id import extract_org_prefix, generate_org_id
 from ...models import KOrganization
 from ...models.k_principal import SystemRole
 from ...schemas.organization import OrganizationCreate, OrganizationUpdate
-from ..deps import verify_organization_membership
+from ...schemas.pagination import PageParams
+from ..deps import (
+    get_org_entity,
+    invalidate_organization_memberships,
+)
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 MAX_RETRIES = 10
 
@@ -96,11 +106,9 @@ async def create_organization(
             last_modified_by=user_id,
         )
 
-        db.add(new_org)
-
         try:
+            new_org = await insert_returning(new_org, db)
             await db.commit()
-            await db.refresh(new_org)
             return new_org
         except IntegrityError as e:
             await db.rollback()
@@ -127,20 +135,21 @@ async def create_organization(
     )
 
 
-async def list_organizations(scope: str, db: AsyncSession) -> list[KOrganization]:
+async def list_organizations(
+    scope: str, db: AsyncSession, page: PageParams | None = None
+) -> Page[KOrganization]:
     """List all organizations.
 
     Args:
         scope: Scope for multi-tenancy (currently unused for organizations)
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of organization models
+        Page of organization models
     """
     stmt = select(KOrganization).where(KOrganization.deleted_at.is_(None))  # type: ignore[union-attr]
-    result = await db.execute(stmt)
-    organizations = result.scalars().all()
-    return list(organizations)
+    return await paginate(stmt, KOrganization, db, page)
 
 
 async def get_organization(
@@ -161,12 +170,8 @@ async def get_organization(
         OrganizationNotFoundException: If the organization is not found
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
     """
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
     stmt = select(KOrganization).where(KOrganization.id == org_id, KOrganization.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    org = result.scalar_one_or_none()
+    org = await get_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
 
     if not org:
         raise OrganizationNotFoundException(org_id=org_id)
@@ -211,28 +216,10 @@ async def update_organization(
             user_id=user_id,
         )
 
-    stmt = select(KOrganization).where(KOrganization.id == org_id, KOrganization.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    org = result.scalar_one_or_none()
-
-    if not org:
-        raise OrganizationNotFoundException(org_id=org_id)
-
-    # Update only provided fields
-    if org_data.name is not None:
-        org.name = org_data.name
-    if org_data.alias is not None:
-        org.alias = org_data.alias
-    if org_data.meta is not None:
-        org.meta = org_data.meta
-
-    # Update audit fields
-    org.last_modified = datetime.now()
-    org.last_modified_by = user_id
+    stmt = update_returning(KOrganization, org_data, user_id, KOrganization.id == org_id, KOrganization.deleted_at.is_(None))  # type: ignore[union-attr]
 
     try:
-        await db.commit()
-        await db.refresh(org)
+        org = await execute_returning(stmt, db)
     except IntegrityError as e:
         await db.rollback()
         # Determine which constraint failed based on error message
@@ -240,17 +227,21 @@ async def update_organization(
         if "alias" in error_msg:
             raise OrganizationUpdateConflictException(
                 org_id=org_id,
-                identifier=org_data.alias or org.alias,
+                identifier=org_data.alias or "",
                 identifier_type="alias",
             ) from e
         else:
             # Default to name constraint
             raise OrganizationUpdateConflictException(
                 org_id=org_id,
-                identifier=org_data.name or org.name,
+                identifier=org_data.name or "",
                 identifier_type="name",
             ) from e
 
+    if not org:
+        raise OrganizationNotFoundException(org_id=org_id)
+
+    await db.commit()
     return org
 
 
@@ -287,17 +278,11 @@ async def delete_organization(
             user_id=user_id,
         )
 
-    stmt = select(KOrganization).where(KOrganization.id == org_id, KOrganization.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    org = result.scalar_one_or_none()
+    stmt = delete_returning(KOrganization, user_id, KOrganization.id == org_id, KOrganization.deleted_at.is_(None), hard_delete=hard_delete)  # type: ignore[union-attr]
+    deleted_id = await execute_returning(stmt, db)
 
-    if not org:
+    if not deleted_id:
         raise OrganizationNotFoundException(org_id=org_id)
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(org)  # pragma: no cover
-    else:
-        org.deleted_at = datetime.now()
-        org.last_modified = datetime.now()
-        org.last_modified_by = user_id
     await db.commit()
+    invalidate_organization_memberships(org_id)
@@ -1,11 +1,11 @@
 """Business logic for project team management operations."""
 
-from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
 
 from ...core.exceptions.domain_exceptions import (
     ProjectNotFoundException,
@@ -13,7 +13,16 @@ from ...core.exceptions.domain_exceptions import (
     ProjectTeamNotFoundException,
 )
 from ...models import KProject, KProjectTeam
+from ...schemas.pagination import PageParams
 from ...schemas.project_team import ProjectTeamCreate, ProjectTeamUpdate
+from ..authz import invalidate_project_team
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_project_team(
@@ -59,11 +68,10 @@ async def add_project_team(
         last_modified_by=user_id,
     )
 
-    db.add(new_team)
-
     try:
+        new_team = await insert_returning(new_team, db)
+        invalidate_project_team(org_id, new_team.team_id, db)
         await db.commit()
-        await db.refresh(new_team)
     except IntegrityError as e:
         await db.rollback()
         raise ProjectTeamAlreadyExistsException(
@@ -73,15 +81,18 @@ async def add_project_team(
     return new_team
 
 
-async def list_project_teams(project_id: UUID, db: AsyncSession) -> list[KProjectTeam]:
+async def list_project_teams(
+    project_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KProjectTeam]:
     """List all teams of a project.
 
     Args:
         project_id: ID of the project
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of project team models
+        Page of project team models
 
     Raises:
         ProjectNotFoundException: If the project is not found
@@ -95,12 +106,10 @@ async def list_project_teams(project_id: UUID, db: AsyncSession) -> list[KProjec
         raise ProjectNotFoundException(project_id=project_id, scope=None)
 
     # Get all teams for this project
-    stmt = select(KProjectTeam).where(  # type: ignore[assignment]
+    list_stmt = select(KProjectTeam).where(
         KProjectTeam.project_id == project_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    teams = result.scalars().all()
-    return list(teams)  # type: ignore[arg-type]
+    return await paginate(list_stmt, KProjectTeam, db, page)
 
 
 async def get_project_team(
@@ -157,30 +166,21 @@ async def update_project_team(
     Raises:
         ProjectTeamNotFoundException: If the project team is not found
     """
-    stmt = select(KProjectTeam).where(
-        KProjectTeam.project_id == project_id,  # type: ignore[arg-type]
-        KProjectTeam.team_id == team_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KProjectTeam,
+        team_data,
+        user_id,
+        KProjectTeam.project_id == project_id,
+        KProjectTeam.team_id == team_id,
     )
-    result = await db.execute(stmt)
-    team = result.scalar_one_or_none()
+    team = await execute_returning(stmt, db)
 
     if not team:
         raise ProjectTeamNotFoundException(
             project_id=project_id, team_id=team_id, scope=None
         )
 
-    # Update only provided fields
-    if team_data.role is not None:
-        team.role = team_data.role
-    if team_data.meta is not None:
-        team.meta = team_data.meta
-
-    # Update audit fields
-    team.last_modified = datetime.now()
-    team.last_modified_by = user_id
-
     await db.commit()
-    await db.refresh(team)
 
     return team
 
@@ -204,23 +204,21 @@ async def remove_project_team(
     Raises:
         ProjectTeamNotFoundException: If the project team is not found
     """
-    stmt = select(KProjectTeam).where(
-        KProjectTeam.project_id == project_id,  # type: ignore[arg-type]
-        KProjectTeam.team_id == team_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KProjectTeam,
+        user_id,
+        KProjectTeam.project_id == project_id,
+        KProjectTeam.team_id == team_id,
         KProjectTeam.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
+        returning=col(KProjectTeam.org_id),
     )
-    result = await db.execute(stmt)
-    team = result.scalar_one_or_none()
+    org_id = await execute_returning(stmt, db)
 
-    if not team:
+    if not org_id:
         raise ProjectTeamNotFoundException(
             project_id=project_id, team_id=team_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(team)  # pragma: no cover
-    else:
-        team.deleted_at = datetime.now()
-        team.last_modified = datetime.now()
-        team.last_modified_by = user_id
+    invalidate_project_team(org_id, team_id, db)
     await db.commit()
@@ -1,6 +1,7 @@
 """Business logic for project management operations."""
 
-from datetime import datetime
+from collections.abc import Sequence
+from typing import Any, overload
 from uuid import UUID
 
 from sqlalchemy import select
@@ -13,8 +14,17 @@ from ...core.exceptions.domain_exceptions import (
     ProjectUpdateConflictException,
 )
 from ...models import KProject
+from ...schemas.pagination import PageParams
 from ...schemas.project import ProjectCreate, ProjectUpdate
-from ..deps import verify_organization_membership
+from ..deps import (
+    get_org_entity,
+    get_org_entity_fields,
+    verify_organization_membership,
+    write_org_entity,
+)
+from ..pagination import Page, paginate
+from ..projection import select_fields
+from ..writes import delete_returning, insert_returning, update_returning
 
 
 async def create_project(
@@ -54,16 +64,11 @@ async def create_project(
         last_modified_by=user_id,
     )
 
-    db.add(new_project)
-
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:
+        new_project = await insert_returning(new_project, db)
+        if not in_transaction:
             # No active transaction, commit our changes
             await db.commit()
-        await db.refresh(new_project)
     except IntegrityError as e:  # pragma: no cover
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
@@ -74,18 +79,46 @@ async def create_project(
     return new_project
 
 
+@overload
+async def list_projects(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: None = None,
+) -> Page[KProject]: ...
+
+
+@overload
 async def list_projects(
-    org_id: UUID, user_id: UUID, db: AsyncSession
-) -> list[KProject]:
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    *,
+    fields: Sequence[str],
+) -> Page[dict[str, Any]]: ...
+
+
+async def list_projects(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: Sequence[str] | None = None,
+) -> Page[KProject] | Page[dict[str, Any]]:
     """List all projects in the given organization.
 
     Args:
         org_id: Organization ID to filter projects by
         user_id: ID of the user making the request
         db: Database session
+        page: Page size and cursor
+        fields: Fields to return; when given, the page holds mappings of field
+            names to values instead of models
 
     Returns:
-        List of project models
+        Page of project models
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
@@ -94,14 +127,36 @@ async def list_projects(
     await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
 
     stmt = select(KProject).where(KProject.org_id == org_id, KProject.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    projects = result.scalars().all()
-    return list(projects)
+    return await paginate(stmt, KProject, db, page, fields=fields)
 
 
+@overload
 async def get_project(
-    project_id: UUID, org_id: UUID, user_id: UUID, db: AsyncSession
-) -> KProject:
+    project_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: None = None,
+) -> KProject: ...
+
+
+@overload
+async def get_project(
+    project_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str],
+) -> dict[str, Any]: ...
+
+
+async def get_project(
+    project_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str] | None = None,
+) -> KProject | dict[str, Any]:
     """Get a single project by ID.
 
     Args:
@@ -109,20 +164,25 @@ async def get_project(
         org_id: Organization ID to filter by
         user_id: ID of the user making the request
         db: Database session
+        fields: Fields to return; when given, only these columns are selected
+            and a mapping of field names to values is returned
 
     Returns:
-        The project model
+        The project model, or its requested fields
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
         ProjectNotFoundException: If the project is not found in the given organization
+        InvalidFieldsException: If a requested field is not a column of the project
     """
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
     stmt = select(KProject).where(KProject.id == project_id, KProject.org_id == org_id, KProject.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    project = result.scalar_one_or_none()
+    project: KProject | dict[str, Any] | None
+    if fields is None:
+        project = await get_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
+    else:
+        project = await get_org_entity_fields(
+            select_fields(stmt, KProject, fields), org_id=org_id, user_id=user_id, db=db
+        )
 
     if not project:
         raise ProjectNotFoundException(project_id=project_id, scope=str(org_id))
@@ -157,45 +217,26 @@ async def update_project(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
-    stmt = select(KProject).where(KProject.id == project_id, KProject.org_id == org_id, KProject.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    project = result.scalar_one_or_none()
-
-    if not project:
-        raise ProjectNotFoundException(project_id=project_id, scope=str(org_id))
-
-    # Update only provided fields
-    if project_data.name is not None:
-        project.name = project_data.name
-    if project_data.description is not None:
-        project.description = project_data.description
-    if project_data.meta is not None:
-        project.meta = project_data.meta
-
-    # Update audit fields
-    project.last_modified = datetime.now()
-    project.last_modified_by = user_id
+    stmt = update_returning(KProject, project_data, user_id, KProject.id == project_id, KProject.org_id == org_id, KProject.deleted_at.is_(None))  # type: ignore[union-attr]
 
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:  # pragma: no cover - hard to test due to autobegin
-            # No active transaction, commit our changes
-            await db.commit()  # pragma: no cover
-        await db.refresh(project)
+        project = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
     except IntegrityError as e:  # pragma: no cover
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
         raise ProjectUpdateConflictException(  # pragma: no cover
             project_id=project_id,
-            name=project_data.name or project.name,
+            name=project_data.name or "",
             scope=str(org_id),
         ) from e
 
+    if not project:
+        raise ProjectNotFoundException(project_id=project_id, scope=str(org_id))
+
+    if not in_transaction:  # pragma: no cover - hard to test due to autobegin
+        # No active transaction, commit our changes
+        await db.commit()  # pragma: no cover
+
     return project
 
 
@@ -222,22 +263,12 @@ async def delete_project(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+    stmt = delete_returning(KProject, user_id, KProject.id == project_id, KProject.org_id == org_id, KProject.deleted_at.is_(None), hard_delete=hard_delete)  # type: ignore[union-attr]
+    deleted_id = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
 
-    stmt = select(KProject).where(KProject.id == project_id, KProject.org_id == org_id, KProject.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    project = result.scalar_one_or_none()
-
-    if not project:
+    if not deleted_id:
         raise ProjectNotFoundException(project_id=project_id, scope=str(org_id))
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(project)  # pragma: no cover
-    else:
-        project.deleted_at = datetime.now()
-        project.last_modified = datetime.now()
-        project.last_modified_by = user_id
     if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No active transaction, commit our changes
         await db.commit()  # pragma: no cover
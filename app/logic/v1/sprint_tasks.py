@@ -1,9 +1,9 @@
 """Business logic for sprint task management operations."""
 
-from datetime import datetime
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,7 +14,16 @@ from ...core.exceptions.domain_exceptions import (
     TaskNotFoundException,
 )
 from ...models import KSprint, KSprintTask, KTask
+from ...schemas.pagination import PageParams
 from ...schemas.sprint_task import SprintTaskCreate, SprintTaskUpdate
+from ..pagination import Page, paginate
+from ..streaming import stream_batches
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_sprint_task(
@@ -73,11 +82,9 @@ async def add_sprint_task(
         last_modified_by=user_id,
     )
 
-    db.add(new_sprint_task)
-
     try:
+        new_sprint_task = await insert_returning(new_sprint_task, db)
         await db.commit()
-        await db.refresh(new_sprint_task)
     except IntegrityError as e:
         await db.rollback()
         raise SprintTaskAlreadyExistsException(
@@ -87,19 +94,49 @@ async def add_sprint_task(
     return new_sprint_task
 
 
-async def list_sprint_tasks(sprint_id: UUID, db: AsyncSession) -> list[KSprintTask]:
+async def list_sprint_tasks(
+    sprint_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KSprintTask]:
     """List all tasks of a sprint.
 
     Args:
         sprint_id: ID of the sprint
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of sprint task models
+        Page of sprint task models
 
     Raises:
         SprintNotFoundException: If the sprint is not found
     """
+    stmt = await _sprint_tasks_query(sprint_id, db)
+    return await paginate(stmt, KSprintTask, db, page)
+
+
+async def stream_sprint_tasks(
+    sprint_id: UUID, db: AsyncSession
+) -> AsyncIterator[list[KSprintTask]]:
+    """Stream all tasks of a sprint in batches.
+
+    Args:
+        sprint_id: ID of the sprint
+        db: Database session, kept open until the stream is consumed
+
+    Returns:
+        Batches of sprint task models
+
+    Raises:
+        SprintNotFoundException: If the sprint is not found
+    """
+    stmt = await _sprint_tasks_query(sprint_id, db)
+    return await stream_batches(stmt, KSprintTask, db)
+
+
+async def _sprint_tasks_query(
+    sprint_id: UUID, db: AsyncSession
+) -> Select[tuple[KSprintTask]]:
+    """Verify a sprint exists and build the SELECT of its tasks."""
     # Verify sprint exists
     stmt = select(KSprint).where(KSprint.id == sprint_id, KSprint.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
     result = await db.execute(stmt)
@@ -109,12 +146,9 @@ async def list_sprint_tasks(sprint_id: UUID, db: AsyncSession) -> list[KSprintTa
         raise SprintNotFoundException(sprint_id=sprint_id, scope=None)
 
     # Get all tasks for this sprint
-    stmt = select(KSprintTask).where(  # type: ignore[assignment]
+    return select(KSprintTask).where(
         KSprintTask.sprint_id == sprint_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    tasks = result.scalars().all()
-    return list(tasks)  # type: ignore[arg-type]
 
 
 async def get_sprint_task(
@@ -171,30 +205,21 @@ async def update_sprint_task(
     Raises:
         SprintTaskNotFoundException: If the sprint task is not found
     """
-    stmt = select(KSprintTask).where(
-        KSprintTask.sprint_id == sprint_id,  # type: ignore[arg-type]
-        KSprintTask.task_id == task_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KSprintTask,
+        task_data,
+        user_id,
+        KSprintTask.sprint_id == sprint_id,
+        KSprintTask.task_id == task_id,
     )
-    result = await db.execute(stmt)
-    sprint_task = result.scalar_one_or_none()
+    sprint_task = await execute_returning(stmt, db)
 
     if not sprint_task:
         raise SprintTaskNotFoundException(
             sprint_id=sprint_id, task_id=task_id, scope=None
         )
 
-    # Update only provided fields
-    if task_data.role is not None:
-        sprint_task.role = task_data.role
-    if task_data.meta is not None:
-        sprint_task.meta = task_data.meta
-
-    # Update audit fields
-    sprint_task.last_modified = datetime.now()
-    sprint_task.last_modified_by = user_id
-
     await db.commit()
-    await db.refresh(sprint_task)
 
     return sprint_task
 
@@ -218,23 +243,19 @@ async def remove_sprint_task(
     Raises:
         SprintTaskNotFoundException: If the sprint task is not found
     """
-    stmt = select(KSprintTask).where(
-        KSprintTask.sprint_id == sprint_id,  # type: ignore[arg-type]
-        KSprintTask.task_id == task_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KSprintTask,
+        user_id,
+        KSprintTask.sprint_id == sprint_id,
+        KSprintTask.task_id == task_id,
         KSprintTask.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
     )
-    result = await db.execute(stmt)
-    sprint_task = result.scalar_one_or_none()
+    deleted_id = await execute_returning(stmt, db)
 
-    if not sprint_task:
+    if not deleted_id:
         raise SprintTaskNotFoundException(
             sprint_id=sprint_id, task_id=task_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(sprint_task)  # pragma: no cover
-    else:
-        sprint_task.deleted_at = datetime.now()
-        sprint_task.last_modified = datetime.now()
-        sprint_task.last_modified_by = user_id
     await db.commit()
@@ -1,6 +1,5 @@
 """Business logic for sprint team management operations."""
 
-from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
@@ -14,7 +13,15 @@ from ...core.exceptions.domain_exceptions import (
     TeamNotFoundException,
 )
 from ...models import KSprint, KSprintTeam, KTeam
+from ...schemas.pagination import PageParams
 from ...schemas.sprint_team import SprintTeamCreate, SprintTeamUpdate
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_sprint_team(
@@ -73,11 +80,9 @@ async def add_sprint_team(
         last_modified_by=user_id,
     )
 
-    db.add(new_sprint_team)
-
     try:
+        new_sprint_team = await insert_returning(new_sprint_team, db)
         await db.commit()
-        await db.refresh(new_sprint_team)
     except IntegrityError as e:
         await db.rollback()
         raise SprintTeamAlreadyExistsException(
@@ -87,15 +92,18 @@ async def add_sprint_team(
     return new_sprint_team
 
 
-async def list_sprint_teams(sprint_id: UUID, db: AsyncSession) -> list[KSprintTeam]:
+async def list_sprint_teams(
+    sprint_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KSprintTeam]:
     """List all teams of a sprint.
 
     Args:
         sprint_id: ID of the sprint
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of sprint team models
+        Page of sprint team models
 
     Raises:
         SprintNotFoundException: If the sprint is not found
@@ -109,12 +117,10 @@ async def list_sprint_teams(sprint_id: UUID, db: AsyncSession) -> list[KSprintTe
         raise SprintNotFoundException(sprint_id=sprint_id, scope=None)
 
     # Get all teams for this sprint
-    stmt = select(KSprintTeam).where(  # type: ignore[assignment]
+    list_stmt = select(KSprintTeam).where(
         KSprintTeam.sprint_id == sprint_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    teams = result.scalars().all()
-    return list(teams)  # type: ignore[arg-type]
+    return await paginate(list_stmt, KSprintTeam, db, page)
 
 
 async def get_sprint_team(
@@ -171,30 +177,21 @@ async def update_sprint_team(
     Raises:
         SprintTeamNotFoundException: If the sprint team is not found
     """
-    stmt = select(KSprintTeam).where(
-        KSprintTeam.sprint_id == sprint_id,  # type: ignore[arg-type]
-        KSprintTeam.team_id == team_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KSprintTeam,
+        team_data,
+        user_id,
+        KSprintTeam.sprint_id == sprint_id,
+        KSprintTeam.team_id == team_id,
     )
-    result = await db.execute(stmt)
-    sprint_team = result.scalar_one_or_none()
+    sprint_team = await execute_returning(stmt, db)
 
     if not sprint_team:
         raise SprintTeamNotFoundException(
             sprint_id=sprint_id, team_id=team_id, scope=None
         )
 
-    # Update only provided fields
-    if team_data.role is not None:
-        sprint_team.role = team_data.role
-    if team_data.meta is not None:
-        sprint_team.meta = team_data.meta
-
-    # Update audit fields
-    sprint_team.last_modified = datetime.now()
-    sprint_team.last_modified_by = user_id
-
     await db.commit()
-    await db.refresh(sprint_team)
 
     return sprint_team
 
@@ -218,23 +215,19 @@ async def remove_sprint_team(
     Raises:
         SprintTeamNotFoundException: If the sprint team is not found
     """
-    stmt = select(KSprintTeam).where(
-        KSprintTeam.sprint_id == sprint_id,  # type: ignore[arg-type]
-        KSprintTeam.team_id == team_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KSprintTeam,
+        user_id,
+        KSprintTeam.sprint_id == sprint_id,
+        KSprintTeam.team_id == team_id,
         KSprintTeam.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
     )
-    result = await db.execute(stmt)
-    sprint_team = result.scalar_one_or_none()
+    deleted_id = await execute_returning(stmt, db)
 
-    if not sprint_team:
+    if not deleted_id:
         raise SprintTeamNotFoundException(
             sprint_id=sprint_id, team_id=team_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(sprint_team)  # pragma: no cover
-    else:
-        sprint_team.deleted_at = datetime.now()
-        sprint_team.last_modified = datetime.now()
-        sprint_team.last_modified_by = user_id
     await db.commit()
@@ -1,6 +1,7 @@
 """Business logic for sprint management operations."""
 
-from datetime import datetime
+from collections.abc import Sequence
+from typing import Any, overload
 from uuid import UUID
 
 from sqlalchemy import select
@@ -12,8 +13,17 @@ from ...core.exceptions.domain_exceptions import (
     SprintUpdateConflictException,
 )
 from ...models import KSprint
+from ...schemas.pagination import PageParams
 from ...schemas.sprint import SprintCreate, SprintUpdate
-from ..deps import verify_organization_membership
+from ..deps import (
+    get_org_entity,
+    get_org_entity_fields,
+    verify_organization_membership,
+    write_org_entity,
+)
+from ..pagination import Page, paginate
+from ..projection import select_fields
+from ..writes import delete_returning, insert_returning, update_returning
 
 
 async def create_sprint(
@@ -53,36 +63,64 @@ async def create_sprint(
         last_modified_by=user_id,
     )
 
-    db.add(new_sprint)
+    # The returned row is expired by a rollback, so keep the ID for error reporting
+    sprint_id = new_sprint.id
 
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:
+        new_sprint = await insert_returning(new_sprint, db)
+        if not in_transaction:
             # No active transaction, commit our changes
             await db.commit()
-        await db.refresh(new_sprint)
     except IntegrityError as e:  # pragma: no cover
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
         raise SprintUpdateConflictException(  # pragma: no cover
-            sprint_id=new_sprint.id, scope=str(org_id)
+            sprint_id=sprint_id, scope=str(org_id)
         ) from e
 
     return new_sprint
 
 
-async def list_sprints(org_id: UUID, user_id: UUID, db: AsyncSession) -> list[KSprint]:
+@overload
+async def list_sprints(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: None = None,
+) -> Page[KSprint]: ...
+
+
+@overload
+async def list_sprints(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    *,
+    fields: Sequence[str],
+) -> Page[dict[str, Any]]: ...
+
+
+async def list_sprints(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: Sequence[str] | None = None,
+) -> Page[KSprint] | Page[dict[str, Any]]:
     """List all sprints in the given organization.
 
     Args:
         org_id: Organization ID to filter sprints by
         user_id: ID of the user making the request
         db: Database session
+        page: Page size and cursor
+        fields: Fields to return; when given, the page holds mappings of field
+            names to values instead of models
 
     Returns:
-        List of sprint models
+        Page of sprint models
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
@@ -91,14 +129,36 @@ async def list_sprints(org_id: UUID, user_id: UUID, db: AsyncSession) -> list[KS
     await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
 
     stmt = select(KSprint).where(KSprint.org_id == org_id, KSprint.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    sprints = result.scalars().all()
-    return list(sprints)
+    return await paginate(stmt, KSprint, db, page, fields=fields)
 
 
+@overload
 async def get_sprint(
-    sprint_id: UUID, org_id: UUID, user_id: UUID, db: AsyncSession
-) -> KSprint:
+    sprint_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: None = None,
+) -> KSprint: ...
+
+
+@overload
+async def get_sprint(
+    sprint_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str],
+) -> dict[str, Any]: ...
+
+
+async def get_sprint(
+    sprint_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str] | None = None,
+) -> KSprint | dict[str, Any]:
     """Get a single sprint by ID.
 
     Args:
@@ -106,20 +166,25 @@ async def get_sprint(
         org_id: Organization ID to filter by
         user_id: ID of the user making the request
         db: Database session
+        fields: Fields to return; when given, only these columns are selected
+            and a mapping of field names to values is returned
 
     Returns:
-        The sprint model
+        The sprint model, or its requested fields
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
         SprintNotFoundException: If the sprint is not found in the given organization
+        InvalidFieldsException: If a requested field is not a column of the sprint
     """
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
     stmt = select(KSprint).where(KSprint.id == sprint_id, KSprint.org_id == org_id, KSprint.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    sprint = result.scalar_one_or_none()
+    sprint: KSprint | dict[str, Any] | None
+    if fields is None:
+        sprint = await get_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
+    else:
+        sprint = await get_org_entity_fields(
+            select_fields(stmt, KSprint, fields), org_id=org_id, user_id=user_id, db=db
+        )
 
     if not sprint:
         raise SprintNotFoundException(sprint_id=sprint_id, scope=str(org_id))
@@ -156,38 +221,10 @@ async def update_sprint(
     # If False, it's a normal API call (autobegin will start later, but we commit)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
-    stmt = select(KSprint).where(KSprint.id == sprint_id, KSprint.org_id == org_id, KSprint.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    sprint = result.scalar_one_or_none()
-
-    if not sprint:
-        raise SprintNotFoundException(sprint_id=sprint_id, scope=str(org_id))
-
-    # Update only provided fields
-    if sprint_data.title is not None:
-        sprint.title = sprint_data.title
-    if sprint_data.status is not None:
-        sprint.status = sprint_data.status
-    if sprint_data.end_ts is not None:
-        sprint.end_ts = sprint_data.end_ts
-    if sprint_data.meta is not None:
-        sprint.meta = sprint_data.meta
-
-    # Update audit fields
-    sprint.last_modified = datetime.now()
-    sprint.last_modified_by = user_id
+    stmt = update_returning(KSprint, sprint_data, user_id, KSprint.id == sprint_id, KSprint.org_id == org_id, KSprint.deleted_at.is_(None))  # type: ignore[union-attr]
 
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:  # pragma: no cover - hard to test due to autobegin
-            # No explicit transaction at start (normal API call), commit our changes
-            await db.commit()  # pragma: no cover
-        await db.refresh(sprint)
+        sprint = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
     except IntegrityError as e:  # pragma: no cover
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
@@ -196,6 +233,13 @@ async def update_sprint(
             scope=str(org_id),
         ) from e
 
+    if not sprint:
+        raise SprintNotFoundException(sprint_id=sprint_id, scope=str(org_id))
+
+    if not in_transaction:  # pragma: no cover - hard to test due to autobegin
+        # No active transaction, commit our changes
+        await db.commit()  # pragma: no cover
+
     return sprint
 
 
@@ -222,22 +266,12 @@ async def delete_sprint(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+    stmt = delete_returning(KSprint, user_id, KSprint.id == sprint_id, KSprint.org_id == org_id, KSprint.deleted_at.is_(None), hard_delete=hard_delete)  # type: ignore[union-attr]
+    deleted_id = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
 
-    stmt = select(KSprint).where(KSprint.id == sprint_id, KSprint.org_id == org_id, KSprint.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    sprint = result.scalar_one_or_none()
-
-    if not sprint:
+    if not deleted_id:
         raise SprintNotFoundException(sprint_id=sprint_id, scope=str(org_id))
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(sprint)  # pragma: no cover
-    else:
-        sprint.deleted_at = datetime.now()
-        sprint.last_modified = datetime.now()
-        sprint.last_modified_by = user_id
     if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No active transaction, commit our changes
         await db.commit()  # pragma: no cover
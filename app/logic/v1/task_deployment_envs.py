@@ -1,6 +1,5 @@
 """Business logic for task deployment environment management operations."""
 
-from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
@@ -14,10 +13,18 @@ from ...core.exceptions.domain_exceptions import (
     TaskNotFoundException,
 )
 from ...models import KDeploymentEnv, KTask, KTaskDeploymentEnv
+from ...schemas.pagination import PageParams
 from ...schemas.task_deployment_env import (
     TaskDeploymentEnvCreate,
     TaskDeploymentEnvUpdate,
 )
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_task_deployment_env(
@@ -78,11 +85,9 @@ async def add_task_deployment_env(
         last_modified_by=user_id,
     )
 
-    db.add(new_task_deployment_env)
-
     try:
+        new_task_deployment_env = await insert_returning(new_task_deployment_env, db)
         await db.commit()
-        await db.refresh(new_task_deployment_env)
     except IntegrityError as e:
         await db.rollback()
         raise TaskDeploymentEnvAlreadyExistsException(
@@ -95,16 +100,17 @@ async def add_task_deployment_env(
 
 
 async def list_task_deployment_envs(
-    task_id: UUID, db: AsyncSession
-) -> list[KTaskDeploymentEnv]:
+    task_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KTaskDeploymentEnv]:
     """List all deployment environments for a task.
 
     Args:
         task_id: ID of the task
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of task deployment environment models
+        Page of task deployment environment models
 
     Raises:
         TaskNotFoundException: If the task is not found
@@ -118,12 +124,10 @@ async def list_task_deployment_envs(
         raise TaskNotFoundException(task_id=task_id, scope=None)
 
     # Get all deployment environments for this task
-    stmt = select(KTaskDeploymentEnv).where(  # type: ignore[assignment]
+    list_stmt = select(KTaskDeploymentEnv).where(
         KTaskDeploymentEnv.task_id == task_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    deployment_envs = result.scalars().all()
-    return list(deployment_envs)  # type: ignore[arg-type]
+    return await paginate(list_stmt, KTaskDeploymentEnv, db, page)
 
 
 async def get_task_deployment_env(
@@ -180,30 +184,21 @@ async def update_task_deployment_env(
     Raises:
         TaskDeploymentEnvNotFoundException: If the task deployment environment relationship is not found
     """
-    stmt = select(KTaskDeploymentEnv).where(
-        KTaskDeploymentEnv.task_id == task_id,  # type: ignore[arg-type]
-        KTaskDeploymentEnv.deployment_env_id == deployment_env_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KTaskDeploymentEnv,
+        deployment_env_data,
+        user_id,
+        KTaskDeploymentEnv.task_id == task_id,
+        KTaskDeploymentEnv.deployment_env_id == deployment_env_id,
     )
-    result = await db.execute(stmt)
-    task_deployment_env = result.scalar_one_or_none()
+    task_deployment_env = await execute_returning(stmt, db)
 
     if not task_deployment_env:
         raise TaskDeploymentEnvNotFoundException(
             task_id=task_id, deployment_env_id=deployment_env_id, scope=None
         )
 
-    # Update only provided fields
-    if deployment_env_data.role is not None:
-        task_deployment_env.role = deployment_env_data.role
-    if deployment_env_data.meta is not None:
-        task_deployment_env.meta = deployment_env_data.meta
-
-    # Update audit fields
-    task_deployment_env.last_modified = datetime.now()
-    task_deployment_env.last_modified_by = user_id
-
     await db.commit()
-    await db.refresh(task_deployment_env)
 
     return task_deployment_env
 
@@ -227,23 +222,19 @@ async def remove_task_deployment_env(
     Raises:
         TaskDeploymentEnvNotFoundException: If the task deployment environment relationship is not found
     """
-    stmt = select(KTaskDeploymentEnv).where(
-        KTaskDeploymentEnv.task_id == task_id,  # type: ignore[arg-type]
-        KTaskDeploymentEnv.deployment_env_id == deployment_env_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KTaskDeploymentEnv,
+        user_id,
+        KTaskDeploymentEnv.task_id == task_id,
+        KTaskDeploymentEnv.deployment_env_id == deployment_env_id,
         KTaskDeploymentEnv.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
     )
-    result = await db.execute(stmt)
-    task_deployment_env = result.scalar_one_or_none()
+    deleted_id = await execute_returning(stmt, db)
 
-    if not task_deployment_env:
+    if not deleted_id:
         raise TaskDeploymentEnvNotFoundException(
             task_id=task_id, deployment_env_id=deployment_env_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(task_deployment_env)  # pragma: no cover
-    else:
-        task_deployment_env.deleted_at = datetime.now()
-        task_deployment_env.last_modified = datetime.now()
-        task_deployment_env.last_modified_by = user_id
     await db.commit()
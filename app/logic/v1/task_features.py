@@ -1,6 +1,5 @@
 """Business logic for task feature management operations."""
 
-from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
@@ -14,7 +13,15 @@ from ...core.exceptions.domain_exceptions import (
     TaskNotFoundException,
 )
 from ...models import KFeature, KTask, KTaskFeature
+from ...schemas.pagination import PageParams
 from ...schemas.task_feature import TaskFeatureCreate, TaskFeatureUpdate
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_task_feature(
@@ -77,16 +84,11 @@ async def add_task_feature(
         last_modified_by=user_id,
     )
 
-    db.add(new_task_feature)
-
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:  # pragma: no cover - hard to test due to autobegin
+        new_task_feature = await insert_returning(new_task_feature, db)
+        if not in_transaction:  # pragma: no cover - hard to test due to autobegin
             # No active transaction, commit our changes
             await db.commit()  # pragma: no cover
-        await db.refresh(new_task_feature)
     except IntegrityError as e:
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
@@ -99,15 +101,18 @@ async def add_task_feature(
     return new_task_feature
 
 
-async def list_task_features(task_id: UUID, db: AsyncSession) -> list[KTaskFeature]:
+async def list_task_features(
+    task_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KTaskFeature]:
     """List all features for a task.
 
     Args:
         task_id: ID of the task
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of task feature models
+        Page of task feature models
 
     Raises:
         TaskNotFoundException: If the task is not found
@@ -121,12 +126,10 @@ async def list_task_features(task_id: UUID, db: AsyncSession) -> list[KTaskFeatu
         raise TaskNotFoundException(task_id=task_id, scope=None)
 
     # Get all features for this task
-    stmt = select(KTaskFeature).where(  # type: ignore[assignment]
+    list_stmt = select(KTaskFeature).where(
         KTaskFeature.task_id == task_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    features = result.scalars().all()
-    return list(features)  # type: ignore[arg-type]
+    return await paginate(list_stmt, KTaskFeature, db, page)
 
 
 async def get_task_feature(
@@ -185,50 +188,39 @@ async def update_task_feature(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    stmt = select(KTaskFeature).where(
-        KTaskFeature.task_id == task_id,  # type: ignore[arg-type]
-        KTaskFeature.feature_id == feature_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KTaskFeature,
+        feature_data,
+        user_id,
+        KTaskFeature.task_id == task_id,
+        KTaskFeature.feature_id == feature_id,
     )
-    result = await db.execute(stmt)
-    task_feature = result.scalar_one_or_none()
+    task_feature = await execute_returning(stmt, db)
 
     if not task_feature:
         raise TaskFeatureNotFoundException(
             task_id=task_id, feature_id=feature_id, scope=None
         )
 
-    # Update only provided fields
-    if feature_data.role is not None:
-        task_feature.role = feature_data.role
-    if feature_data.meta is not None:
-        task_feature.meta = feature_data.meta
-
-    # Update audit fields
-    task_feature.last_modified = datetime.now()
-    task_feature.last_modified_by = user_id
-
-    if in_transaction:  # pragma: no cover - tested via txs integration
-        # Already in a transaction (managed by txs), just flush
-        await db.flush()  # pragma: no cover
-    else:  # pragma: no cover - hard to test due to autobegin
+    if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No active transaction, commit our changes
         await db.commit()  # pragma: no cover
-    await db.refresh(task_feature)
 
     return task_feature
 
 
 async def list_tasks_by_feature(
-    feature_id: UUID, db: AsyncSession
-) -> list[KTaskFeature]:
+    feature_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KTaskFeature]:
     """List all tasks associated with a feature.
 
     Args:
         feature_id: ID of the feature
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of task feature models
+        Page of task feature models
 
     Raises:
         FeatureNotFoundException: If the feature is not found
@@ -242,25 +234,24 @@ async def list_tasks_by_feature(
         raise FeatureNotFoundException(feature_id=feature_id, scope=None)
 
     # Get all task-feature records for this feature
-    stmt = select(KTaskFeature).where(  # type: ignore[assignment]
+    list_stmt = select(KTaskFeature).where(
         KTaskFeature.feature_id == feature_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    task_features = result.scalars().all()
-    return list(task_features)  # type: ignore[arg-type]
+    return await paginate(list_stmt, KTaskFeature, db, page)
 
 
 async def list_tasks_by_feature_detailed(
-    feature_id: UUID, db: AsyncSession
-) -> list[KTask]:
+    feature_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KTask]:
     """List all tasks associated with a feature, returning full task objects.
 
     Args:
         feature_id: ID of the feature
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of task models
+        Page of task models
 
     Raises:
         FeatureNotFoundException: If the feature is not found
@@ -283,9 +274,7 @@ async def list_tasks_by_feature_detailed(
             KTask.deleted_at.is_(None),  # type: ignore[union-attr]
         )
     )
-    result = await db.execute(task_stmt)
-    tasks = result.scalars().all()
-    return list(tasks)  # type: ignore[arg-type]
+    return await paginate(task_stmt, KTask, db, page)
 
 
 async def remove_task_feature(
@@ -310,25 +299,21 @@ async def remove_task_feature(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    stmt = select(KTaskFeature).where(
-        KTaskFeature.task_id == task_id,  # type: ignore[arg-type]
-        KTaskFeature.feature_id == feature_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KTaskFeature,
+        user_id,
+        KTaskFeature.task_id == task_id,
+        KTaskFeature.feature_id == feature_id,
         KTaskFeature.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
     )
-    result = await db.execute(stmt)
-    task_feature = result.scalar_one_or_none()
+    deleted_id = await execute_returning(stmt, db)
 
-    if not task_feature:
+    if not deleted_id:
         raise TaskFeatureNotFoundException(
             task_id=task_id, feature_id=feature_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(task_feature)  # pragma: no cover
-    else:
-        task_feature.deleted_at = datetime.now()
-        task_feature.last_modified = datetime.now()
-        task_feature.last_modified_by = user_id
     if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No active transaction, commit our changes
         await db.commit()  # pragma: no cover
@@ -1,6 +1,5 @@
 """Business logic for task owner management operations."""
 
-from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
@@ -14,7 +13,15 @@ from ...core.exceptions.domain_exceptions import (
     TaskOwnerNotFoundException,
 )
 from ...models import KOrganizationPrincipal, KTask, KTaskOwner
+from ...schemas.pagination import PageParams
 from ...schemas.task_owner import TaskOwnerCreate, TaskOwnerUpdate
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_task_owner(
@@ -74,11 +81,9 @@ async def add_task_owner(
         last_modified_by=user_id,
     )
 
-    db.add(new_task_owner)
-
     try:
+        new_task_owner = await insert_returning(new_task_owner, db)
         await db.commit()
-        await db.refresh(new_task_owner)
     except IntegrityError as e:
         await db.rollback()
         raise TaskOwnerAlreadyExistsException(
@@ -90,15 +95,18 @@ async def add_task_owner(
     return new_task_owner
 
 
-async def list_task_owners(task_id: UUID, db: AsyncSession) -> list[KTaskOwner]:
+async def list_task_owners(
+    task_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KTaskOwner]:
     """List all owners for a task.
 
     Args:
         task_id: ID of the task
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of task owner models
+        Page of task owner models
 
     Raises:
         TaskNotFoundException: If the task is not found
@@ -112,12 +120,10 @@ async def list_task_owners(task_id: UUID, db: AsyncSession) -> list[KTaskOwner]:
         raise TaskNotFoundException(task_id=task_id, scope=None)
 
     # Get all owners for this task
-    stmt = select(KTaskOwner).where(  # type: ignore[assignment]
+    list_stmt = select(KTaskOwner).where(
         KTaskOwner.task_id == task_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    owners = result.scalars().all()
-    return list(owners)  # type: ignore[arg-type]
+    return await paginate(list_stmt, KTaskOwner, db, page)
 
 
 async def get_task_owner(
@@ -174,30 +180,21 @@ async def update_task_owner(
     Raises:
         TaskOwnerNotFoundException: If the task owner relationship is not found
     """
-    stmt = select(KTaskOwner).where(
-        KTaskOwner.task_id == task_id,  # type: ignore[arg-type]
-        KTaskOwner.principal_id == principal_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KTaskOwner,
+        owner_data,
+        user_id,
+        KTaskOwner.task_id == task_id,
+        KTaskOwner.principal_id == principal_id,
     )
-    result = await db.execute(stmt)
-    task_owner = result.scalar_one_or_none()
+    task_owner = await execute_returning(stmt, db)
 
     if not task_owner:
         raise TaskOwnerNotFoundException(
             task_id=task_id, principal_id=principal_id, scope=None
         )
 
-    # Update only provided fields
-    if owner_data.role is not None:
-        task_owner.role = owner_data.role
-    if owner_data.meta is not None:
-        task_owner.meta = owner_data.meta
-
-    # Update audit fields
-    task_owner.last_modified = datetime.now()
-    task_owner.last_modified_by = user_id
-
     await db.commit()
-    await db.refresh(task_owner)
 
     return task_owner
 
@@ -221,23 +218,19 @@ async def remove_task_owner(
     Raises:
         TaskOwnerNotFoundException: If the task owner relationship is not found
     """
-    stmt = select(KTaskOwner).where(
-        KTaskOwner.task_id == task_id,  # type: ignore[arg-type]
-        KTaskOwner.principal_id == principal_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KTaskOwner,
+        user_id,
+        KTaskOwner.task_id == task_id,
+        KTaskOwner.principal_id == principal_id,
         KTaskOwner.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
     )
-    result = await db.execute(stmt)
-    task_owner = result.scalar_one_or_none()
+    deleted_id = await execute_returning(stmt, db)
 
-    if not task_owner:
+    if not deleted_id:
         raise TaskOwnerNotFoundException(
             task_id=task_id, principal_id=principal_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(task_owner)  # pragma: no cover
-    else:
-        task_owner.deleted_at = datetime.now()
-        task_owner.last_modified = datetime.now()
-        task_owner.last_modified_by = user_id
     await db.commit()
@@ -1,6 +1,5 @@
 """Business logic for task reviewer management operations."""
 
-from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
@@ -14,7 +13,15 @@ from ...core.exceptions.domain_exceptions import (
     TaskReviewerNotFoundException,
 )
 from ...models import KOrganizationPrincipal, KTask, KTaskReviewer
+from ...schemas.pagination import PageParams
 from ...schemas.task_reviewer import TaskReviewerCreate, TaskReviewerUpdate
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_task_reviewer(
@@ -74,11 +81,9 @@ async def add_task_reviewer(
         last_modified_by=user_id,
     )
 
-    db.add(new_task_reviewer)
-
     try:
+        new_task_reviewer = await insert_returning(new_task_reviewer, db)
         await db.commit()
-        await db.refresh(new_task_reviewer)
     except IntegrityError as e:
         await db.rollback()
         raise TaskReviewerAlreadyExistsException(
@@ -90,15 +95,18 @@ async def add_task_reviewer(
     return new_task_reviewer
 
 
-async def list_task_reviewers(task_id: UUID, db: AsyncSession) -> list[KTaskReviewer]:
+async def list_task_reviewers(
+    task_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KTaskReviewer]:
     """List all reviewers for a task.
 
     Args:
         task_id: ID of the task
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of task reviewer models
+        Page of task reviewer models
 
     Raises:
         TaskNotFoundException: If the task is not found
@@ -112,13 +120,11 @@ async def list_task_reviewers(task_id: UUID, db: AsyncSession) -> list[KTaskRevi
         raise TaskNotFoundException(task_id=task_id, scope=None)
 
     # Get all reviewers for this task
-    stmt = select(KTaskReviewer).where(  # type: ignore[assignment]
+    list_stmt = select(KTaskReviewer).where(
         KTaskReviewer.task_id == task_id,  # type: ignore[arg-type]
         KTaskReviewer.deleted_at.is_(None),  # type: ignore[union-attr]
     )
-    result = await db.execute(stmt)
-    reviewers = result.scalars().all()
-    return list(reviewers)  # type: ignore[arg-type]
+    return await paginate(list_stmt, KTaskReviewer, db, page)
 
 
 async def get_task_reviewer(
@@ -175,30 +181,21 @@ async def update_task_reviewer(
     Raises:
         TaskReviewerNotFoundException: If the task reviewer relationship is not found
     """
-    stmt = select(KTaskReviewer).where(
-        KTaskReviewer.task_id == task_id,  # type: ignore[arg-type]
-        KTaskReviewer.principal_id == principal_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KTaskReviewer,
+        reviewer_data,
+        user_id,
+        KTaskReviewer.task_id == task_id,
+        KTaskReviewer.principal_id == principal_id,
     )
-    result = await db.execute(stmt)
-    task_reviewer = result.scalar_one_or_none()
+    task_reviewer = await execute_returning(stmt, db)
 
     if not task_reviewer:
         raise TaskReviewerNotFoundException(
             task_id=task_id, principal_id=principal_id, scope=None
         )
 
-    # Update only provided fields
-    if reviewer_data.role is not None:
-        task_reviewer.role = reviewer_data.role
-    if reviewer_data.meta is not None:
-        task_reviewer.meta = reviewer_data.meta
-
-    # Update audit fields
-    task_reviewer.last_modified = datetime.now()
-    task_reviewer.last_modified_by = user_id
-
     await db.commit()
-    await db.refresh(task_reviewer)
 
     return task_reviewer
 
@@ -222,23 +219,19 @@ async def remove_task_reviewer(
     Raises:
         TaskReviewerNotFoundException: If the task reviewer relationship is not found
     """
-    stmt = select(KTaskReviewer).where(
-        KTaskReviewer.task_id == task_id,  # type: ignore[arg-type]
-        KTaskReviewer.principal_id == principal_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KTaskReviewer,
+        user_id,
+        KTaskReviewer.task_id == task_id,
+        KTaskReviewer.principal_id == principal_id,
         KTaskReviewer.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
     )
-    result = await db.execute(stmt)
-    task_reviewer = result.scalar_one_or_none()
+    deleted_id = await execute_returning(stmt, db)
 
-    if not task_reviewer:
+    if not deleted_id:
         raise TaskReviewerNotFoundException(
             task_id=task_id, principal_id=principal_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(task_reviewer)  # pragma: no cover
-    else:
-        task_reviewer.deleted_at = datetime.now()
-        task_reviewer.last_modified = datetime.now()
-        task_reviewer.last_modified_by = user_id
     await db.commit()
@@ -1,46 +1,33 @@
 """Business logic for task management operations."""
 
-from datetime import datetime
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, overload
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Select, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
 
 from ...core.exceptions.domain_exceptions import (
     TaskCreationFailedException,
     TaskNotFoundException,
 )
-from ...core.task_id import extract_task_number, generate_task_id
+from ...core.task_id import generate_task_id
 from ...models import KTask
-from ...schemas.task import TaskCreate, TaskUpdate
-from ..deps import verify_organization_membership
-
-MAX_RETRIES = 10
-
-
-async def get_next_task_number(org_id: UUID, db: AsyncSession) -> int:
-    """Get next task number by finding max existing number + 1.
-
-    Args:
-        org_id: Organization ID to find tasks for
-        db: Database session
-
-    Returns:
-        The next available task number (1 if no tasks exist)
-    """
-    stmt = select(KTask.id).where(  # type: ignore[call-overload]
-        KTask.org_id == org_id,
-        KTask.deleted_at.is_(None),  # type: ignore[union-attr]
-    )
-    result = await db.execute(stmt)
-    task_ids = result.scalars().all()
-
-    if not task_ids:
-        return 1
-
-    max_number = max(extract_task_number(tid) for tid in task_ids)
-    return max_number + 1
+from ...schemas.pagination import PageParams
+from ...schemas.task import TaskCreate, TaskFilters, TaskUpdate
+from ..deps import (
+    get_org_entity,
+    get_org_entity_fields,
+    verify_organization_membership,
+    write_org_entity,
+)
+from ..pagination import DEFAULT_SORT, Page, SortKey, paginate
+from ..projection import select_fields
+from ..sequences import SequenceKind, allocate_next_number
+from ..streaming import stream_batches
+from ..writes import delete_returning, insert_returning, update_returning
 
 
 async def create_task(
@@ -62,7 +49,7 @@ async def create_task(
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
-        TaskCreationFailedException: If task creation fails after retries
+        TaskCreationFailedException: If the allocated task ID collides with an existing task
     """
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
@@ -70,61 +57,88 @@ async def create_task(
     # Verify user has access to this organization
     await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            next_number = await get_next_task_number(org_id, db) + attempt
-            task_id = generate_task_id(org_id, next_number)
-
-            # Create new task with audit fields
-            new_task = KTask(
-                id=task_id,
-                org_id=org_id,
-                summary=task_data.summary,
-                description=task_data.description,
-                team_id=task_data.team_id,
-                guestimate=task_data.guestimate,
-                status=task_data.status,
-                review_result=task_data.review_result,
-                meta=task_data.meta,
-                created_by=user_id,
-                last_modified_by=user_id,
-            )
-
-            db.add(new_task)
-            if in_transaction:  # pragma: no cover - tested via txs integration
-                # Already in a transaction (managed by txs), just flush
-                await db.flush()  # pragma: no cover
-            else:  # pragma: no cover - hard to test due to autobegin
-                # No active transaction, commit our changes
-                await db.commit()  # pragma: no cover
-            await db.refresh(new_task)
-
-            return new_task
-        except IntegrityError:  # pragma: no cover - race condition handling
+    try:
+        next_number = await allocate_next_number(org_id, SequenceKind.TASK, db)
+        task_id = generate_task_id(org_id, next_number)
+
+        # Create new task with audit fields
+        new_task = KTask(
+            id=task_id,
+            org_id=org_id,
+            summary=task_data.summary,
+            description=task_data.description,
+            team_id=task_data.team_id,
+            guestimate=task_data.guestimate,
+            status=task_data.status,
+            review_result=task_data.review_result,
+            meta=task_data.meta,
+            created_by=user_id,
+            last_modified_by=user_id,
+        )
+
+        new_task = await insert_returning(new_task, db)
+        if not in_transaction:  # pragma: no cover - hard to test due to autobegin
+            # No active transaction, commit our changes
+            await db.commit()  # pragma: no cover
+    except IntegrityError:  # pragma: no cover - only if IDs were inserted out of band
+        if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
-            if attempt == MAX_RETRIES - 1:  # pragma: no cover
-                raise TaskCreationFailedException(  # pragma: no cover
-                    message=f"Failed to create task after {MAX_RETRIES} retries due to ID collisions",
-                    org_id=org_id,
-                ) from None
-            continue  # pragma: no cover
+        raise TaskCreationFailedException(  # pragma: no cover
+            message="Failed to create task due to an ID collision",
+            org_id=org_id,
+        ) from None
+
+    return new_task
 
-    # This should never be reached, but type checker needs it
-    raise TaskCreationFailedException(  # pragma: no cover
-        message="Failed to create task", org_id=org_id
-    )
+
+@overload
+async def list_tasks(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: None = None,
+    filters: TaskFilters | None = None,
+    sort: SortKey = DEFAULT_SORT,
+) -> Page[KTask]: ...
 
 
-async def list_tasks(org_id: UUID, user_id: UUID, db: AsyncSession) -> list[KTask]:
+@overload
+async def list_tasks(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    *,
+    fields: Sequence[str],
+    filters: TaskFilters | None = None,
+    sort: SortKey = DEFAULT_SORT,
+) -> Page[dict[str, Any]]: ...
+
+
+async def list_tasks(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: Sequence[str] | None = None,
+    filters: TaskFilters | None = None,
+    sort: SortKey = DEFAULT_SORT,
+) -> Page[KTask] | Page[dict[str, Any]]:
     """List all tasks in the given organization.
 
     Args:
         org_id: Organization ID to filter tasks by
         user_id: ID of the user making the request
         db: Database session
+        page: Page size and cursor
+        fields: Fields to return; when given, the page holds mappings of field
+            names to values instead of models
+        filters: Optional filters on task attributes
+        sort: Column to order by
 
     Returns:
-        List of task models
+        Page of task models
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
@@ -132,15 +146,93 @@ async def list_tasks(org_id: UUID, user_id: UUID, db: AsyncSession) -> list[KTas
     # Verify user has access to this organization
     await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
 
+    return await paginate(_tasks_query(org_id, filters), KTask, db, page, sort, fields)
+
+
+async def stream_tasks(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str] | None = None,
+    filters: TaskFilters | None = None,
+    sort: SortKey = DEFAULT_SORT,
+) -> AsyncIterator[list[KTask]] | AsyncIterator[list[dict[str, Any]]]:
+    """Stream all tasks in the given organization in batches.
+
+    Args:
+        org_id: Organization ID to filter tasks by
+        user_id: ID of the user making the request
+        db: Database session, kept open until the stream is consumed
+        fields: Fields to return; when given, batches hold mappings of field
+            names to values instead of models
+        filters: Optional filters on task attributes
+        sort: Column to order by
+
+    Returns:
+        Batches of task models
+
+    Raises:
+        UnauthorizedOrganizationAccessException: If user is not a member of the organization
+    """
+    # Verify user has access to this organization
+    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+
+    return await stream_batches(_tasks_query(org_id, filters), KTask, db, sort, fields)
+
+
+def _tasks_query(org_id: UUID, filters: TaskFilters | None) -> Select[tuple[KTask]]:
+    """Build the SELECT of an organization's tasks, with optional filters."""
     stmt = select(KTask).where(KTask.org_id == org_id, KTask.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    tasks = result.scalars().all()
-    return list(tasks)
+    if filters is not None:
+        stmt = stmt.where(*_task_conditions(filters))
+    return stmt
+
+
+def _task_conditions(filters: TaskFilters) -> list[ColumnElement[bool]]:
+    """Translate task list filters into WHERE conditions."""
+    conditions: list[ColumnElement[bool]] = []
+    if filters.status:
+        conditions.append(col(KTask.status).in_(filters.status))
+    if filters.team_id is not None:
+        conditions.append(col(KTask.team_id) == filters.team_id)
+    if filters.review_result:
+        conditions.append(col(KTask.review_result).in_(filters.review_result))
+    if filters.guestimate_min is not None:
+        conditions.append(col(KTask.guestimate) >= filters.guestimate_min)
+    if filters.guestimate_max is not None:
+        conditions.append(col(KTask.guestimate) <= filters.guestimate_max)
+    if filters.modified_since is not None:
+        conditions.append(col(KTask.last_modified) >= filters.modified_since)
+    return conditions
+
+
+@overload
+async def get_task(
+    task_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: None = None,
+) -> KTask: ...
 
 
+@overload
 async def get_task(
-    task_id: UUID, org_id: UUID, user_id: UUID, db: AsyncSession
-) -> KTask:
+    task_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str],
+) -> dict[str, Any]: ...
+
+
+async def get_task(
+    task_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str] | None = None,
+) -> KTask | dict[str, Any]:
     """Get a single task by ID.
 
     Args:
@@ -148,20 +240,25 @@ async def get_task(
         org_id: Organization ID to filter by
         user_id: ID of the user making the request
         db: Database session
+        fields: Fields to return; when given, only these columns are selected
+            and a mapping of field names to values is returned
 
     Returns:
-        The task model
+        The task model, or its requested fields
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
         TaskNotFoundException: If the task is not found in the given organization
+        InvalidFieldsException: If a requested field is not a column of the task
     """
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
     stmt = select(KTask).where(KTask.id == task_id, KTask.org_id == org_id, KTask.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    task = result.scalar_one_or_none()
+    task: KTask | dict[str, Any] | None
+    if fields is None:
+        task = await get_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
+    else:
+        task = await get_org_entity_fields(
+            select_fields(stmt, KTask, fields), org_id=org_id, user_id=user_id, db=db
+        )
 
     if not task:
         raise TaskNotFoundException(task_id=task_id, scope=str(org_id))
@@ -195,43 +292,15 @@ async def update_task(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
-    stmt = select(KTask).where(KTask.id == task_id, KTask.org_id == org_id, KTask.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    task = result.scalar_one_or_none()
+    stmt = update_returning(KTask, task_data, user_id, KTask.id == task_id, KTask.org_id == org_id, KTask.deleted_at.is_(None))  # type: ignore[union-attr]
+    task = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
 
     if not task:
         raise TaskNotFoundException(task_id=task_id, scope=str(org_id))
 
-    # Update only provided fields
-    if task_data.summary is not None:
-        task.summary = task_data.summary
-    if task_data.description is not None:
-        task.description = task_data.description
-    if task_data.team_id is not None:
-        task.team_id = task_data.team_id
-    if task_data.guestimate is not None:
-        task.guestimate = task_data.guestimate
-    if task_data.status is not None:
-        task.status = task_data.status
-    if task_data.review_result is not None:
-        task.review_result = task_data.review_result
-    if task_data.meta is not None:
-        task.meta = task_data.meta
-
-    # Update audit fields
-    task.last_modified = datetime.now()
-    task.last_modified_by = user_id
-
-    if in_transaction:  # pragma: no cover - tested via txs integration
-        # Already in a transaction (managed by txs), just flush
-        await db.flush()  # pragma: no cover
-    else:  # pragma: no cover - hard to test due to autobegin
+    if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No active transaction, commit our changes
         await db.commit()  # pragma: no cover
-    await db.refresh(task)
 
     return task
 
@@ -259,22 +328,12 @@ async def delete_task(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
+    stmt = delete_returning(KTask, user_id, KTask.id == task_id, KTask.org_id == org_id, KTask.deleted_at.is_(None), hard_delete=hard_delete)  # type: ignore[union-attr]
+    deleted_id = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
 
-    stmt = select(KTask).where(KTask.id == task_id, KTask.org_id == org_id, KTask.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    task = result.scalar_one_or_none()
-
-    if not task:
+    if not deleted_id:
         raise TaskNotFoundException(task_id=task_id, scope=str(org_id))
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(task)  # pragma: no cover
-    else:
-        task.deleted_at = datetime.now()
-        task.last_modified = datetime.now()
-        task.last_modified_by = user_id
     if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No active transaction, commit our changes
         await db.commit()  # pragma: no cover
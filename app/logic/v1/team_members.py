@@ -1,11 +1,11 @@
 """Business logic for team member management operations."""
 
-from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
 
 from ...core.exceptions.domain_exceptions import (
     TeamMemberAlreadyExistsException,
@@ -13,7 +13,16 @@ from ...core.exceptions.domain_exceptions import (
     TeamNotFoundException,
 )
 from ...models import KTeam, KTeamMember
+from ...schemas.pagination import PageParams
 from ...schemas.team_member import TeamMemberCreate, TeamMemberUpdate
+from ..authz import invalidate_team_member
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_team_member(
@@ -61,16 +70,12 @@ async def add_team_member(
         last_modified_by=user_id,
     )
 
-    db.add(new_member)
-
     try:
-        if in_transaction:
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()
-        else:
+        new_member = await insert_returning(new_member, db)
+        invalidate_team_member(org_id, new_member.principal_id, db)
+        if not in_transaction:
             # No active transaction, commit our changes
             await db.commit()
-        await db.refresh(new_member)
     except IntegrityError as e:
         if not in_transaction:
             await db.rollback()
@@ -81,15 +86,18 @@ async def add_team_member(
     return new_member
 
 
-async def list_team_members(team_id: UUID, db: AsyncSession) -> list[KTeamMember]:
+async def list_team_members(
+    team_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KTeamMember]:
     """List all members of a team.
 
     Args:
         team_id: ID of the team
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of team member models
+        Page of team member models
 
     Raises:
         TeamNotFoundException: If the team is not found
@@ -103,12 +111,10 @@ async def list_team_members(team_id: UUID, db: AsyncSession) -> list[KTeamMember
         raise TeamNotFoundException(team_id=team_id, scope=None)
 
     # Get all members for this team
-    stmt = select(KTeamMember).where(  # type: ignore[assignment]
+    list_stmt = select(KTeamMember).where(
         KTeamMember.team_id == team_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    members = result.scalars().all()
-    return list(members)  # type: ignore[arg-type]
+    return await paginate(list_stmt, KTeamMember, db, page)
 
 
 async def get_team_member(
@@ -167,35 +173,23 @@ async def update_team_member(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    stmt = select(KTeamMember).where(
-        KTeamMember.team_id == team_id,  # type: ignore[arg-type]
-        KTeamMember.principal_id == principal_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KTeamMember,
+        member_data,
+        user_id,
+        KTeamMember.team_id == team_id,
+        KTeamMember.principal_id == principal_id,
     )
-    result = await db.execute(stmt)
-    member = result.scalar_one_or_none()
+    member = await execute_returning(stmt, db)
 
     if not member:
         raise TeamMemberNotFoundException(
             team_id=team_id, principal_id=principal_id, scope=None
         )
 
-    # Update only provided fields
-    if member_data.role is not None:
-        member.role = member_data.role
-    if member_data.meta is not None:
-        member.meta = member_data.meta
-
-    # Update audit fields
-    member.last_modified = datetime.now()
-    member.last_modified_by = user_id
-
-    if in_transaction:  # pragma: no cover - tested via txs integration
-        # Already in a transaction (managed by txs), just flush
-        await db.flush()  # pragma: no cover
-    else:
+    if not in_transaction:
         # No active transaction, commit our changes
         await db.commit()
-    await db.refresh(member)
 
     return member
 
@@ -222,25 +216,23 @@ async def remove_team_member(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    stmt = select(KTeamMember).where(
-        KTeamMember.team_id == team_id,  # type: ignore[arg-type]
-        KTeamMember.principal_id == principal_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KTeamMember,
+        user_id,
+        KTeamMember.team_id == team_id,
+        KTeamMember.principal_id == principal_id,
         KTeamMember.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
+        returning=col(KTeamMember.org_id),
     )
-    result = await db.execute(stmt)
-    member = result.scalar_one_or_none()
+    org_id = await execute_returning(stmt, db)
 
-    if not member:
+    if not org_id:
         raise TeamMemberNotFoundException(
             team_id=team_id, principal_id=principal_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(member)  # pragma: no cover
-    else:
-        member.deleted_at = datetime.now()
-        member.last_modified = datetime.now()
-        member.last_modified_by = user_id
+    invalidate_team_member(org_id, principal_id, db)
     if not in_transaction:
         # No active transaction, commit our changes
         await db.commit()
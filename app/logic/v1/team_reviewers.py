@@ -1,11 +1,11 @@
 """Business logic for team reviewer management operations."""
 
-from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
 
 from ...core.exceptions.domain_exceptions import (
     TeamNotFoundException,
@@ -13,7 +13,16 @@ from ...core.exceptions.domain_exceptions import (
     TeamReviewerNotFoundException,
 )
 from ...models import KTeam, KTeamReviewer
+from ...schemas.pagination import PageParams
 from ...schemas.team_reviewer import TeamReviewerCreate, TeamReviewerUpdate
+from ..authz import invalidate_team_reviewer
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def add_team_reviewer(
@@ -59,11 +68,10 @@ async def add_team_reviewer(
         last_modified_by=user_id,
     )
 
-    db.add(new_reviewer)
-
     try:
+        new_reviewer = await insert_returning(new_reviewer, db)
+        invalidate_team_reviewer(org_id, new_reviewer.principal_id, db)
         await db.commit()
-        await db.refresh(new_reviewer)
     except IntegrityError as e:
         await db.rollback()
         raise TeamReviewerAlreadyExistsException(
@@ -73,15 +81,18 @@ async def add_team_reviewer(
     return new_reviewer
 
 
-async def list_team_reviewers(team_id: UUID, db: AsyncSession) -> list[KTeamReviewer]:
+async def list_team_reviewers(
+    team_id: UUID, db: AsyncSession, page: PageParams | None = None
+) -> Page[KTeamReviewer]:
     """List all reviewers of a team.
 
     Args:
         team_id: ID of the team
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of team reviewer models
+        Page of team reviewer models
 
     Raises:
         TeamNotFoundException: If the team is not found
@@ -95,12 +106,10 @@ async def list_team_reviewers(team_id: UUID, db: AsyncSession) -> list[KTeamRevi
         raise TeamNotFoundException(team_id=team_id, scope=None)
 
     # Get all reviewers for this team
-    stmt = select(KTeamReviewer).where(  # type: ignore[assignment]
+    list_stmt = select(KTeamReviewer).where(
         KTeamReviewer.team_id == team_id  # type: ignore[arg-type]
     )
-    result = await db.execute(stmt)
-    reviewers = result.scalars().all()
-    return list(reviewers)  # type: ignore[arg-type]
+    return await paginate(list_stmt, KTeamReviewer, db, page)
 
 
 async def get_team_reviewer(
@@ -157,30 +166,21 @@ async def update_team_reviewer(
     Raises:
         TeamReviewerNotFoundException: If the team reviewer is not found
     """
-    stmt = select(KTeamReviewer).where(
-        KTeamReviewer.team_id == team_id,  # type: ignore[arg-type]
-        KTeamReviewer.principal_id == principal_id,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KTeamReviewer,
+        reviewer_data,
+        user_id,
+        KTeamReviewer.team_id == team_id,
+        KTeamReviewer.principal_id == principal_id,
     )
-    result = await db.execute(stmt)
-    reviewer = result.scalar_one_or_none()
+    reviewer = await execute_returning(stmt, db)
 
     if not reviewer:
         raise TeamReviewerNotFoundException(
             team_id=team_id, principal_id=principal_id, scope=None
         )
 
-    # Update only provided fields
-    if reviewer_data.role is not None:
-        reviewer.role = reviewer_data.role
-    if reviewer_data.meta is not None:
-        reviewer.meta = reviewer_data.meta
-
-    # Update audit fields
-    reviewer.last_modified = datetime.now()
-    reviewer.last_modified_by = user_id
-
     await db.commit()
-    await db.refresh(reviewer)
 
     return reviewer
 
@@ -204,23 +204,21 @@ async def remove_team_reviewer(
     Raises:
         TeamReviewerNotFoundException: If the team reviewer is not found
     """
-    stmt = select(KTeamReviewer).where(
-        KTeamReviewer.team_id == team_id,  # type: ignore[arg-type]
-        KTeamReviewer.principal_id == principal_id,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KTeamReviewer,
+        user_id,
+        KTeamReviewer.team_id == team_id,
+        KTeamReviewer.principal_id == principal_id,
         KTeamReviewer.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
+        returning=col(KTeamReviewer.org_id),
     )
-    result = await db.execute(stmt)
-    reviewer = result.scalar_one_or_none()
+    org_id = await execute_returning(stmt, db)
 
-    if not reviewer:
+    if not org_id:
         raise TeamReviewerNotFoundException(
             team_id=team_id, principal_id=principal_id, scope=None
         )
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(reviewer)  # pragma: no cover
-    else:
-        reviewer.deleted_at = datetime.now()
-        reviewer.last_modified = datetime.now()
-        reviewer.last_modified_by = user_id
+    invalidate_team_reviewer(org_id, principal_id, db)
     await db.commit()
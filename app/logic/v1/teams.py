@@ -1,6 +1,7 @@
 """Business logic for team management operations."""
 
-from datetime import datetime
+from collections.abc import Sequence
+from typing import Any, overload
 from uuid import UUID
 
 from sqlalchemy import select
@@ -13,8 +14,17 @@ from ...core.exceptions.domain_exceptions import (
     TeamUpdateConflictException,
 )
 from ...models import KTeam
+from ...schemas.pagination import PageParams
 from ...schemas.team import TeamCreate, TeamUpdate
-from ..deps import verify_organization_membership
+from ..deps import (
+    get_org_entity,
+    get_org_entity_fields,
+    verify_organization_membership,
+    write_org_entity,
+)
+from ..pagination import Page, paginate
+from ..projection import select_fields
+from ..writes import delete_returning, insert_returning, update_returning
 
 
 async def create_team(
@@ -53,16 +63,11 @@ async def create_team(
         last_modified_by=user_id,
     )
 
-    db.add(new_team)
-
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:
+        new_team = await insert_returning(new_team, db)
+        if not in_transaction:
             # No active transaction, commit our changes
             await db.commit()
-        await db.refresh(new_team)
     except IntegrityError as e:
         if not in_transaction:
             await db.rollback()
@@ -71,16 +76,46 @@ async def create_team(
     return new_team
 
 
-async def list_teams(org_id: UUID, user_id: UUID, db: AsyncSession) -> list[KTeam]:
+@overload
+async def list_teams(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: None = None,
+) -> Page[KTeam]: ...
+
+
+@overload
+async def list_teams(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    *,
+    fields: Sequence[str],
+) -> Page[dict[str, Any]]: ...
+
+
+async def list_teams(
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    page: PageParams | None = None,
+    fields: Sequence[str] | None = None,
+) -> Page[KTeam] | Page[dict[str, Any]]:
     """List all teams in the given organization.
 
     Args:
         org_id: Organization ID to filter teams by
         user_id: ID of the user making the request
         db: Database session
+        page: Page size and cursor
+        fields: Fields to return; when given, the page holds mappings of field
+            names to values instead of models
 
     Returns:
-        List of team models
+        Page of team models
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
@@ -89,14 +124,36 @@ async def list_teams(org_id: UUID, user_id: UUID, db: AsyncSession) -> list[KTea
     await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
 
     stmt = select(KTeam).where(KTeam.org_id == org_id, KTeam.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    teams = result.scalars().all()
-    return list(teams)
+    return await paginate(stmt, KTeam, db, page, fields=fields)
 
 
+@overload
 async def get_team(
-    team_id: UUID, org_id: UUID, user_id: UUID, db: AsyncSession
-) -> KTeam:
+    team_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: None = None,
+) -> KTeam: ...
+
+
+@overload
+async def get_team(
+    team_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str],
+) -> dict[str, Any]: ...
+
+
+async def get_team(
+    team_id: UUID,
+    org_id: UUID,
+    user_id: UUID,
+    db: AsyncSession,
+    fields: Sequence[str] | None = None,
+) -> KTeam | dict[str, Any]:
     """Get a single team by ID.
 
     Args:
@@ -104,20 +161,25 @@ async def get_team(
         org_id: Organization ID to filter by
         user_id: ID of the user making the request
         db: Database session
+        fields: Fields to return; when given, only these columns are selected
+            and a mapping of field names to values is returned
 
     Returns:
-        The team model
+        The team model, or its requested fields
 
     Raises:
         UnauthorizedOrganizationAccessException: If user is not a member of the organization
         TeamNotFoundException: If the team is not found in the given organization
+        InvalidFieldsException: If a requested field is not a column of the team
     """
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
     stmt = select(KTeam).where(KTeam.id == team_id, KTeam.org_id == org_id, KTeam.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    team = result.scalar_one_or_none()
+    team: KTeam | dict[str, Any] | None
+    if fields is None:
+        team = await get_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
+    else:
+        team = await get_org_entity_fields(
+            select_fields(stmt, KTeam, fields), org_id=org_id, user_id=user_id, db=db
+        )
 
     if not team:
         raise TeamNotFoundException(team_id=team_id, scope=str(org_id))
@@ -151,43 +213,26 @@ async def update_team(
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
-    stmt = select(KTeam).where(KTeam.id == team_id, KTeam.org_id == org_id, KTeam.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    team = result.scalar_one_or_none()
-
-    if not team:
-        raise TeamNotFoundException(team_id=team_id, scope=str(org_id))
-
-    # Update only provided fields
-    if team_data.name is not None:
-        team.name = team_data.name
-    if team_data.meta is not None:
-        team.meta = team_data.meta
-
-    # Update audit fields
-    team.last_modified = datetime.now()
-    team.last_modified_by = user_id
+    stmt = update_returning(KTeam, team_data, user_id, KTeam.id == team_id, KTeam.org_id == org_id, KTeam.deleted_at.is_(None))  # type: ignore[union-attr]
 
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:  # pragma: no cover - hard to test due to autobegin
-            # No active transaction, commit our changes
-            await db.commit()  # pragma: no cover
-        await db.refresh(team)
+        team = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
     except IntegrityError as e:
         if not in_transaction:  # pragma: no cover
             await db.rollback()  # pragma: no cover
         raise TeamUpdateConflictException(
             team_id=team_id,
-            name=team_data.name or team.name,
+            name=team_data.name or "",
             scope=str(org_id),
         ) from e
 
+    if not team:
+        raise TeamNotFoundException(team_id=team_id, scope=str(org_id))
+
+    if not in_transaction:  # pragma: no cover - hard to test due to autobegin
+        # No active transaction, commit our changes
+        await db.commit()  # pragma: no cover
+
     return team
 
 
@@ -216,23 +261,12 @@ async def delete_team(
     # If False, it's a normal API call (autobegin will start later, but we commit)
     in_transaction = db.in_transaction()
 
-    # Verify user has access to this organization
-    await verify_organization_membership(org_id=org_id, user_id=user_id, db=db)
-
-    stmt = select(KTeam).where(KTeam.id == team_id, KTeam.org_id == org_id, KTeam.deleted_at.is_(None))  # type: ignore[arg-type,union-attr]
-    result = await db.execute(stmt)
-    team = result.scalar_one_or_none()
+    stmt = delete_returning(KTeam, user_id, KTeam.id == team_id, KTeam.org_id == org_id, KTeam.deleted_at.is_(None), hard_delete=hard_delete)  # type: ignore[union-attr]
+    deleted_id = await write_org_entity(stmt, org_id=org_id, user_id=user_id, db=db)
 
-    if not team:
+    if not deleted_id:
         raise TeamNotFoundException(team_id=team_id, scope=str(org_id))
 
-    if hard_delete:  # pragma: no cover
-        await db.delete(team)  # pragma: no cover
-    else:
-        team.deleted_at = datetime.now()
-        team.last_modified = datetime.now()
-        team.last_modified_by = user_id
-
     if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No explicit transaction at start (normal API call), commit our changes
         await db.commit()  # pragma: no cover
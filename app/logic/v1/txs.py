@@ -3,7 +3,7 @@
 import asyncio
 import re
 from collections.abc import Callable
-from typing import Any, Literal
+from typing import Any, Literal, get_args
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,6 +13,8 @@ from ...core.exceptions.domain_exceptions import (
     DocNotFoundException,
     FeatureDocNotFoundException,
     FeatureNotFoundException,
+    InvalidCursorException,
+    InvalidFieldsException,
     ProjectNotFoundException,
     ProjectTeamAlreadyExistsException,
     ProjectTeamNotFoundException,
@@ -50,14 +52,20 @@ from ...logic.v1 import (
 )
 from ...schemas.deployment_env import DeploymentEnvCreate, DeploymentEnvUpdate
 from ...schemas.doc import DocCreate, DocUpdate
-from ...schemas.feature import FeatureCreate, FeatureUpdate
+from ...schemas.feature import (
+    FeatureCreate,
+    FeatureFilters,
+    FeatureSortField,
+    FeatureUpdate,
+)
 from ...schemas.feature_doc import FeatureDocCreate, FeatureDocUpdate
+from ...schemas.pagination import PageParams
 from ...schemas.project import ProjectCreate, ProjectUpdate
 from ...schemas.project_team import ProjectTeamCreate, ProjectTeamUpdate
 from ...schemas.sprint import SprintCreate, SprintUpdate
 from ...schemas.sprint_task import SprintTaskCreate, SprintTaskUpdate
 from ...schemas.sprint_team import SprintTeamCreate, SprintTeamUpdate
-from ...schemas.task import TaskCreate, TaskUpdate
+from ...schemas.task import TaskCreate, TaskFilters, TaskSortField, TaskUpdate
 from ...schemas.task_deployment_env import (
     TaskDeploymentEnvCreate,
     TaskDeploymentEnvUpdate,
@@ -76,6 +84,7 @@ from ...schemas.txs import (
     TransactionsRequest,
     TransactionsResponse,
 )
+from ..pagination import Page, SortKey
 
 # ============================================================================
 # Type Definitions
@@ -355,6 +364,17 @@ class ParameterBuilder:
         "deployment_env",
     }
 
+    # Filter schemas and sortable fields for lists that support filtering and
+    # sorting, using the same vocabulary as the REST list endpoints
+    LIST_FILTERS: dict[str, type[TaskFilters] | type[FeatureFilters]] = {
+        "task": TaskFilters,
+        "feature": FeatureFilters,
+    }
+    LIST_SORT_FIELDS = {
+        "task": set(get_args(TaskSortField)),
+        "feature": set(get_args(FeatureSortField)),
+    }
+
     # Mapping of domain objects to their ID parameter names
     ID_PARAM_NAMES = {
         "task": "task_id",
@@ -461,6 +481,8 @@ class ParameterBuilder:
             params[id_param_name] = obj_id
             params["org_id"] = UUID(resolved_params.get("org_id"))
             params["user_id"] = user_id
+            if resolved_params.get("fields") is not None:
+                params["fields"] = resolved_params["fields"]
         else:  # pragma: no cover
             params["id"] = obj_id
             params["org_id"] = UUID(resolved_params.get("org_id"))
@@ -475,10 +497,35 @@ class ParameterBuilder:
         filters: dict[str, Any],
         user_id: UUID,
         db: AsyncSession,
+        pagination: dict[str, Any] | None = None,
+        sort: list[dict[str, Any]] | None = None,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
         """Build parameters for list operation."""
         params: dict[str, Any] = {"db": db}
 
+        if pagination is not None:
+            params["page"] = PageParams(
+                limit=pagination["page_size"], cursor=pagination.get("cursor")
+            )
+
+        filter_schema = cls.LIST_FILTERS.get(domain_object)
+        if filter_schema is not None:
+            params["filters"] = filter_schema.model_validate(
+                {k: v for k, v in filters.items() if k in filter_schema.model_fields}
+            )
+
+        if sort:
+            sort_fields = cls.LIST_SORT_FIELDS.get(domain_object, set())
+            if len(sort) > 1 or sort[0]["field"] not in sort_fields:
+                raise ValueError(
+                    f"'{domain_object}' lists can be sorted by one of: "
+                    f"{', '.join(sorted(sort_fields)) or 'none'}"
+                )
+            params["sort"] = SortKey(
+                sort[0]["field"], descending=sort[0]["direction"] == "desc"
+            )
+
         # Handle different domain object types
         if domain_object in cls.TEAM_CHILDREN:  # pragma: no cover
             params["team_id"] = UUID(filters.get("team_id"))
@@ -493,6 +540,8 @@ class ParameterBuilder:
         elif domain_object in cls.STANDARD_DOMAINS:
             params["org_id"] = UUID(filters.get("org_id"))
             params["user_id"] = user_id
+            if fields is not None:
+                params["fields"] = fields
 
         return params
 
@@ -840,6 +889,9 @@ async def execute_operation(
                 filters,
                 user_id,
                 db,
+                resolved_params.get("pagination"),
+                resolved_params.get("sort"),
+                resolved_params.get("fields"),
             )
             result = await op_func(**params)
 
@@ -881,25 +933,31 @@ async def execute_operation(
         if result is not None:  # pragma: no cover
             if hasattr(result, "model_dump"):
                 result_dict = result.model_dump()
-            elif hasattr(result, "__dict__"):
-                result_dict = {
-                    k: v for k, v in result.__dict__.items() if not k.startswith("_")
-                }
             elif isinstance(result, list):
                 result_dict = {
                     "items": [
                         (
-                            item.model_dump()
-                            if hasattr(item, "model_dump")
-                            else {
-                                k: v
-                                for k, v in item.__dict__.items()
-                                if not k.startswith("_")
-                            }
+                            item
+                            if isinstance(item, dict)
+                            else (
+                                item.model_dump()
+                                if hasattr(item, "model_dump")
+                                else {
+                                    k: v
+                                    for k, v in item.__dict__.items()
+                                    if not k.startswith("_")
+                                }
+                            )
                         )
                         for item in result
                     ]
                 }
+                if isinstance(result, Page):
+                    result_dict["next_cursor"] = result.next_cursor
+            elif hasattr(result, "__dict__"):
+                result_dict = {
+                    k: v for k, v in result.__dict__.items() if not k.startswith("_")
+                }
             elif isinstance(result, dict):
                 result_dict = result
             else:
@@ -958,6 +1016,24 @@ async def execute_operation(
             error=str(e.message),
             error_type="AlreadyExists",
         )
+    except InvalidCursorException as e:
+        return OperationResult(
+            id=operation.id,
+            operation=operation.operation,
+            domain_object=operation.domain_object,
+            status="failure",
+            error=str(e.message),
+            error_type="InvalidCursor",
+        )
+    except InvalidFieldsException as e:
+        return OperationResult(
+            id=operation.id,
+            operation=operation.operation,
+            domain_object=operation.domain_object,
+            status="failure",
+            error=str(e.message),
+            error_type="InvalidFields",
+        )
     except Exception as e:
         return OperationResult(
             id=operation.id,
@@ -1060,6 +1136,25 @@ async def execute_transaction_group(
         )
 
 
+READ_ONLY_OPERATIONS = frozenset({"get", "list"})
+
+
+def is_read_only_request(request: TransactionsRequest) -> bool:
+    """Check whether a transaction batch only reads data.
+
+    Args:
+        request: Transaction batch request
+
+    Returns:
+        True if every operation is a get or list
+    """
+    return all(
+        operation.operation in READ_ONLY_OPERATIONS
+        for tx in request.txs
+        for operation in tx.operations
+    )
+
+
 async def execute_transactions(
     request: TransactionsRequest,
     user_id: UUID,
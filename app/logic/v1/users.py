@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,6 +16,7 @@ from ...core.exceptions.domain_exceptions import (
 )
 from ...models import KPrincipal, KPrincipalIdentity
 from ...models.k_principal import SystemRole
+from ...schemas.pagination import PageParams
 from ...schemas.user import (
     UserCreate,
     UserDetail,
@@ -24,6 +25,14 @@ from ...schemas.user import (
     UserUpdatePrimaryPhone,
     UserUpdateUsername,
 )
+from ..deps import invalidate_principal
+from ..pagination import Page, paginate
+from ..writes import (
+    delete_returning,
+    execute_returning,
+    insert_returning,
+    update_returning,
+)
 
 
 async def get_current_user_info(user: UserDetail, db: AsyncSession) -> UserDetail:
@@ -60,6 +69,7 @@ async def create_user(
     Raises:
         InsufficientPrivilegesException: If user does not have SYSTEM or SYSTEM_ROOT role
         UserAlreadyExistsException: If a user with the same username already exists in the scope
+        PasswordHashingUnavailableException: If too many password hashes are queued
     """
     # Check if we're already in a transaction (e.g., from txs module)
     in_transaction = db.in_transaction()
@@ -71,6 +81,9 @@ async def create_user(
             user_id=created_by_user_id,
         )
 
+    # Hash before touching the session so no transaction is held while it runs
+    password_hash = await get_password_hash(user_data.password)
+
     # Create new user principal with audit fields
     new_user = KPrincipal(
         scope=scope,
@@ -94,28 +107,21 @@ async def create_user(
         last_modified_by=created_by_user_id,
     )
 
-    db.add(new_user)
-
     try:
-        await db.flush()  # Flush to get the user ID without committing
+        new_user = await insert_returning(new_user, db)
 
         # Create password identity
-        password_hash = get_password_hash(user_data.password)
         identity = KPrincipalIdentity(
             principal_id=new_user.id,
             password=password_hash,
             created_by=created_by_user_id,
             last_modified_by=created_by_user_id,
         )
-        db.add(identity)
+        await insert_returning(identity, db)
 
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:
+        if not in_transaction:
             # No active transaction, commit our changes
             await db.commit()
-        await db.refresh(new_user)
     except IntegrityError as e:
         if not in_transaction:
             await db.rollback()
@@ -127,23 +133,24 @@ async def create_user(
     return new_user
 
 
-async def list_users(scope: str, db: AsyncSession) -> list[KPrincipal]:
+async def list_users(
+    scope: str, db: AsyncSession, page: PageParams | None = None
+) -> Page[KPrincipal]:
     """List all users in a scope.
 
     Args:
         scope: Scope for multi-tenancy
         db: Database session
+        page: Page size and cursor
 
     Returns:
-        List of user models
+        Page of user models
     """
     stmt = select(KPrincipal).where(
         KPrincipal.scope == scope,  # type: ignore[arg-type]
         KPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
     )
-    result = await db.execute(stmt)
-    users = result.scalars().all()
-    return list(users)
+    return await paginate(stmt, KPrincipal, db, page)
 
 
 async def get_user(user_id: UUID, scope: str, db: AsyncSession) -> KPrincipal:
@@ -211,50 +218,23 @@ async def update_user(
             user_id=requesting_user_id,
         )
 
-    stmt = select(KPrincipal).where(
-        KPrincipal.id == user_id,  # type: ignore[arg-type]
-        KPrincipal.scope == scope,  # type: ignore[arg-type]
+    stmt = update_returning(
+        KPrincipal,
+        user_data,
+        requesting_user_id,
+        KPrincipal.id == user_id,
+        KPrincipal.scope == scope,
         KPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
     )
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await execute_returning(stmt, db)
 
     if not user:
         raise UserNotFoundException(user_id=user_id)
 
-    # Update only provided fields
-    if user_data.time_zone is not None:
-        user.time_zone = user_data.time_zone
-    if user_data.name_prefix is not None:
-        user.name_prefix = user_data.name_prefix
-    if user_data.first_name is not None:
-        user.first_name = user_data.first_name
-    if user_data.middle_name is not None:
-        user.middle_name = user_data.middle_name
-    if user_data.last_name is not None:
-        user.last_name = user_data.last_name
-    if user_data.name_suffix is not None:
-        user.name_suffix = user_data.name_suffix
-    if user_data.display_name is not None:
-        user.display_name = user_data.display_name
-    if user_data.default_locale is not None:
-        user.default_locale = user_data.default_locale
-    if user_data.system_role is not None:
-        user.system_role = user_data.system_role
-    if user_data.meta is not None:
-        user.meta = user_data.meta
-
-    # Update audit fields
-    user.last_modified = datetime.now()
-    user.last_modified_by = requesting_user_id
-
-    if in_transaction:  # pragma: no cover - tested via txs integration
-        # Already in a transaction (managed by txs), just flush
-        await db.flush()  # pragma: no cover
-    else:
+    if not in_transaction:
         # No active transaction, commit our changes
         await db.commit()
-    await db.refresh(user)
+    invalidate_principal(user_id)
 
     return user
 
@@ -297,32 +277,23 @@ async def update_user_username(
             user_id=requesting_user_id,
         )
 
-    stmt = select(KPrincipal).where(
-        KPrincipal.id == user_id,  # type: ignore[arg-type]
-        KPrincipal.scope == scope,  # type: ignore[arg-type]
-        KPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
+    stmt = (
+        update(KPrincipal)
+        .where(
+            KPrincipal.id == user_id,  # type: ignore[arg-type]
+            KPrincipal.scope == scope,  # type: ignore[arg-type]
+            KPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
+        )
+        .values(
+            username=user_data.username,
+            last_modified=datetime.now(),
+            last_modified_by=requesting_user_id,
+        )
+        .returning(KPrincipal)
     )
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-
-    if not user:
-        raise UserNotFoundException(user_id=user_id)
-
-    # Update username
-    user.username = user_data.username
-
-    # Update audit fields
-    user.last_modified = datetime.now()
-    user.last_modified_by = requesting_user_id
 
     try:
-        if in_transaction:  # pragma: no cover - tested via txs integration
-            # Already in a transaction (managed by txs), just flush
-            await db.flush()  # pragma: no cover
-        else:
-            # No active transaction, commit our changes
-            await db.commit()
-        await db.refresh(user)
+        user = await execute_returning(stmt, db)
     except IntegrityError as e:
         if not in_transaction:
             await db.rollback()
@@ -330,6 +301,14 @@ async def update_user_username(
             user_id=user_id, username=user_data.username, scope=scope
         ) from e
 
+    if not user:
+        raise UserNotFoundException(user_id=user_id)
+
+    if not in_transaction:
+        # No active transaction, commit our changes
+        await db.commit()
+    invalidate_principal(user_id)
+
     return user
 
 
@@ -370,32 +349,30 @@ async def update_user_email(
             user_id=requesting_user_id,
         )
 
-    stmt = select(KPrincipal).where(
-        KPrincipal.id == user_id,  # type: ignore[arg-type]
-        KPrincipal.scope == scope,  # type: ignore[arg-type]
-        KPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
+    stmt = (
+        update(KPrincipal)
+        .where(
+            KPrincipal.id == user_id,  # type: ignore[arg-type]
+            KPrincipal.scope == scope,  # type: ignore[arg-type]
+            KPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
+        )
+        .values(
+            primary_email=user_data.email,
+            primary_email_verified=False,
+            last_modified=datetime.now(),
+            last_modified_by=requesting_user_id,
+        )
+        .returning(KPrincipal)
     )
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await execute_returning(stmt, db)
 
     if not user:
         raise UserNotFoundException(user_id=user_id)
 
-    # Update email and mark as unverified
-    user.primary_email = user_data.email
-    user.primary_email_verified = False
-
-    # Update audit fields
-    user.last_modified = datetime.now()
-    user.last_modified_by = requesting_user_id
-
-    if in_transaction:  # pragma: no cover - tested via txs integration
-        # Already in a transaction (managed by txs), just flush
-        await db.flush()  # pragma: no cover
-    else:
+    if not in_transaction:
         # No active transaction, commit our changes
         await db.commit()
-    await db.refresh(user)
+    invalidate_principal(user_id)
 
     return user
 
@@ -438,32 +415,30 @@ async def update_user_primary_phone(
             user_id=requesting_user_id,
         )
 
-    stmt = select(KPrincipal).where(
-        KPrincipal.id == user_id,  # type: ignore[arg-type]
-        KPrincipal.scope == scope,  # type: ignore[arg-type]
-        KPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
+    stmt = (
+        update(KPrincipal)
+        .where(
+            KPrincipal.id == user_id,  # type: ignore[arg-type]
+            KPrincipal.scope == scope,  # type: ignore[arg-type]
+            KPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
+        )
+        .values(
+            primary_phone=user_data.primary_phone,
+            primary_phone_verified=False,
+            last_modified=datetime.now(),
+            last_modified_by=requesting_user_id,
+        )
+        .returning(KPrincipal)
     )
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await execute_returning(stmt, db)
 
     if not user:
         raise UserNotFoundException(user_id=user_id)
 
-    # Update phone and mark as unverified
-    user.primary_phone = user_data.primary_phone
-    user.primary_phone_verified = False
-
-    # Update audit fields
-    user.last_modified = datetime.now()
-    user.last_modified_by = requesting_user_id
-
-    if in_transaction:  # pragma: no cover - tested via txs integration
-        # Already in a transaction (managed by txs), just flush
-        await db.flush()  # pragma: no cover
-    else:
+    if not in_transaction:
         # No active transaction, commit our changes
         await db.commit()
-    await db.refresh(user)
+    invalidate_principal(user_id)
 
     return user
 
@@ -500,22 +475,20 @@ async def delete_user(
             user_id=requesting_user_id,
         )
 
-    stmt = select(KPrincipal).where(
-        KPrincipal.id == user_id,  # type: ignore[arg-type]
-        KPrincipal.scope == scope,  # type: ignore[arg-type]
+    stmt = delete_returning(
+        KPrincipal,
+        requesting_user_id,
+        KPrincipal.id == user_id,
+        KPrincipal.scope == scope,
         KPrincipal.deleted_at.is_(None),  # type: ignore[union-attr]
+        hard_delete=hard_delete,
     )
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    deleted_id = await execute_returning(stmt, db)
 
-    if not user:
+    if not deleted_id:
         raise UserNotFoundException(user_id=user_id)
 
-    if hard_delete:
-        await db.delete(user)
-    else:
-        user.deleted_at = datetime.now()
-        user.last_modified = datetime.now()
     if not in_transaction:  # pragma: no cover - hard to test due to autobegin
         # No active transaction, commit our changes
         await db.commit()  # pragma: no cover
+    invalidate_principal(user_id)
@@ -0,0 +1,157 @@
+"""Business logic helpers for single-statement writes.
+
+Writing through the ORM unit of work costs a flush followed by ``db.refresh``,
+and updates and deletes first SELECT the row they change. These helpers build
+``INSERT/UPDATE/DELETE ... RETURNING`` statements instead, so each write is one
+round trip that also hands back the written row. They execute inside the
+caller's transaction, so they behave the same whether the logic function
+commits or the txs engine does.
+"""
+
+from datetime import datetime
+from typing import Any, overload
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped
+from sqlalchemy.sql.dml import ReturningDelete, ReturningUpdate
+from sqlmodel import SQLModel
+
+# Single-row write built by update_returning or delete_returning
+type WriteReturning[T] = ReturningUpdate[tuple[T]] | ReturningDelete[tuple[T]]
+
+
+async def insert_returning[M: SQLModel](entity: M, db: AsyncSession) -> M:
+    """Insert an entity with ``INSERT ... RETURNING`` and get the persisted row.
+
+    Defaults are applied by the model when it is constructed, so every column is
+    sent explicitly.
+
+    Args:
+        entity: Unsaved entity (not added to the session)
+        db: Database session
+
+    Returns:
+        The inserted entity, attached to the session
+
+    Raises:
+        IntegrityError: If the row violates a constraint
+    """
+    model = type(entity)
+    values = {column.key: getattr(entity, column.key) for column in model.__table__.columns}  # type: ignore[attr-defined]
+    result = await db.execute(insert(model).values(values).returning(model))
+    return result.scalar_one()
+
+
+def update_values(data: BaseModel, user_id: UUID) -> dict[str, Any]:
+    """Get the column values for a partial update, including audit fields.
+
+    Fields left as None in the update schema are not changed.
+
+    Args:
+        data: Update schema (e.g. ``TaskUpdate``)
+        user_id: ID of the user performing the update
+
+    Returns:
+        Values for ``update(...).values()``
+    """
+    return {
+        **data.model_dump(exclude_none=True),
+        "last_modified": datetime.now(),
+        "last_modified_by": user_id,
+    }
+
+
+def update_returning[M: SQLModel](
+    model: type[M], data: BaseModel, user_id: UUID, *where: Any
+) -> ReturningUpdate[tuple[M]]:
+    """Build an ``UPDATE ... RETURNING`` applying a partial update to one row.
+
+    Args:
+        model: Model class of the row
+        data: Update schema (e.g. ``TaskUpdate``)
+        user_id: ID of the user performing the update
+        *where: Conditions selecting the row
+
+    Returns:
+        Statement returning the updated entity (no row if nothing matched)
+    """
+    return (
+        update(model)
+        .where(*where)
+        .values(update_values(data, user_id))
+        .returning(model)
+    )
+
+
+@overload
+def delete_returning[M: SQLModel](
+    model: type[M],
+    user_id: UUID,
+    *where: Any,
+    hard_delete: bool = False,
+    returning: None = None,
+) -> WriteReturning[Any]: ...
+
+
+@overload
+def delete_returning[M: SQLModel, T](
+    model: type[M],
+    user_id: UUID,
+    *where: Any,
+    hard_delete: bool = False,
+    returning: Mapped[T],
+) -> WriteReturning[T]: ...
+
+
+def delete_returning[M: SQLModel](
+    model: type[M],
+    user_id: UUID,
+    *where: Any,
+    hard_delete: bool = False,
+    returning: Mapped[Any] | None = None,
+) -> WriteReturning[Any]:
+    """Build a soft (``UPDATE ... SET deleted_at``) or hard delete of one row.
+
+    Args:
+        model: Model class of the row
+        user_id: ID of the user making the request
+        *where: Conditions selecting the row
+        hard_delete: If True, DELETE the row. If False, soft delete it.
+        returning: Column to return instead of the row's primary key
+
+    Returns:
+        Statement returning the primary key or ``returning`` column (no row if nothing matched)
+    """
+    columns = (
+        model.__table__.primary_key.columns  # type: ignore[attr-defined]
+        if returning is None
+        else (returning,)
+    )
+
+    if hard_delete:
+        return delete(model).where(*where).returning(*columns)
+
+    now = datetime.now()
+    return (
+        update(model)
+        .where(*where)
+        .values(deleted_at=now, last_modified=now, last_modified_by=user_id)
+        .returning(*columns)
+    )
+
+
+async def execute_returning[T](stmt: WriteReturning[T], db: AsyncSession) -> T | None:
+    """Run a single-row ``UPDATE``/``DELETE ... RETURNING``.
+
+    Args:
+        stmt: Statement built by ``update_returning`` or ``delete_returning``
+        db: Database session
+
+    Returns:
+        The first returned column (the entity or its key), or None if no row matched
+    """
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
@@ -6,10 +6,15 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
 from .core.db.database import cleanup_database, initialize_database
+from .core.fido2_server import challenge_store
+from .core.invalidation import PostgresNotifyTransport, invalidation_bus
 from .core.logging import get_logger, setup_logging
+from .core.metrics import metrics_registry
 from .core.middleware import RequestContextMiddleware
+from .core.password_hasher import password_hasher
+from .core.revocation import token_revocations
 from .core.yjs import yjs_manager
-from .routes import auth, health, v1
+from .routes import admin, auth, health, v1
 
 # Setup logging first
 setup_logging()
@@ -35,6 +40,26 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None]:
         logger.error("Failed to initialize database", error=str(e))
         raise
 
+    # Start cross-worker cache invalidation
+    if settings.cache_invalidation_enabled:
+        try:
+            logger.debug("Starting cache invalidation bus")
+            await invalidation_bus.start(
+                PostgresNotifyTransport(channel=settings.cache_invalidation_channel)
+            )
+        except Exception as e:  # pragma: no cover
+            logger.error("Failed to start cache invalidation bus", error=str(e))
+            raise
+
+    # Periodically log metrics snapshots
+    await metrics_registry.start_reporting(settings.metrics_log_interval_seconds)
+
+    # Sweep abandoned FIDO2 ceremonies
+    await challenge_store.start()
+
+    # Load revoked tokens and keep them in sync with other workers
+    await token_revocations.start()
+
     # Start Y.js WebSocket server
     try:
         logger.debug("Starting Y.js WebSocket server")
@@ -55,6 +80,18 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None]:
     except Exception as e:  # pragma: no cover
         logger.error("Error stopping Y.js WebSocket server", error=str(e))
 
+    await metrics_registry.stop_reporting()
+    await challenge_store.stop()
+    await token_revocations.stop()
+    password_hasher.shutdown()
+
+    # Stop cross-worker cache invalidation
+    try:
+        logger.debug("Stopping cache invalidation bus")
+        await invalidation_bus.stop()
+    except Exception as e:  # pragma: no cover
+        logger.error("Error stopping cache invalidation bus", error=str(e))
+
     # Cleanup database connections
     try:
         logger.debug("Cleaning up database connections")
@@ -88,6 +125,7 @@ app.add_middleware(RequestContextMiddleware)
 # Include routers
 app.include_router(health.router)
 app.include_router(auth.router, prefix="/api")
+app.include_router(admin.router, prefix="/api")
 app.include_router(v1.router, prefix="/api/v1")
 
 
@@ -5,7 +5,9 @@ from .k_doc import KDoc
 from .k_doc_yupdate import KDocYupdate
 from .k_feature import FeatureType, KFeature, ReviewResult
 from .k_feature_doc import KFeatureDoc
+from .k_fido2_challenge import KFido2Challenge
 from .k_fido2_credential import KFido2Credential
+from .k_org_sequence import KOrgSequence
 from .k_organization import KOrganization
 from .k_organization_principal import KOrganizationPrincipal
 from .k_principal import KPrincipal
@@ -24,6 +26,7 @@ from .k_task_reviewer import KTaskReviewer
 from .k_team import KTeam
 from .k_team_member import KTeamMember
 from .k_team_reviewer import KTeamReviewer
+from .k_token_revocation import KTokenRevocation
 
 __all__ = [
     "FeatureType",
@@ -32,7 +35,9 @@ __all__ = [
     "KDocYupdate",
     "KFeature",
     "KFeatureDoc",
+    "KFido2Challenge",
     "KFido2Credential",
+    "KOrgSequence",
     "KOrganization",
     "KOrganizationPrincipal",
     "KPrincipal",
@@ -51,6 +56,7 @@ __all__ = [
     "KTeam",
     "KTeamMember",
     "KTeamReviewer",
+    "KTokenRevocation",
     "ReviewResult",
     "SprintStatus",
     "TaskStatus",
@@ -22,6 +22,9 @@ class KDoc(SecureReprMixin, SQLModel, table=True):
     name: str = Field(..., max_length=255)
     description: str | None = Field(default=None, max_length=255)
     content: str = Field(..., sa_type=Text)
+    # Maintained on every write so listings can describe content without loading it
+    content_length: int | None = Field(default=None)
+    content_hash: str | None = Field(default=None, max_length=64)
     meta: dict = Field(default_factory=dict, sa_type=JSON)
     deleted_at: datetime | None = Field(default=None)
     created: datetime = Field(default_factory=datetime.now)
@@ -3,7 +3,7 @@ from enum import StrEnum
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import JSON, Text, UniqueConstraint
+from sqlalchemy import JSON, Index, Text, UniqueConstraint, text
 from sqlmodel import Column, Field, Relationship, SQLModel, String
 
 from app.core.repr_mixin import SecureReprMixin
@@ -34,7 +34,41 @@ class ReviewResult(StrEnum):
 
 class KFeature(SecureReprMixin, SQLModel, table=True):
     __tablename__ = "k_feature"
-    __table_args__ = (UniqueConstraint("org_id", "name"),)
+    __table_args__ = (
+        UniqueConstraint("org_id", "name"),
+        # Partial indexes for filtered and keyset-paginated feature lists
+        Index(
+            "ix_k_feature_org_created",
+            "org_id",
+            "created",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_k_feature_org_type",
+            "org_id",
+            "feature_type",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_k_feature_org_parent",
+            "org_id",
+            "parent",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_k_feature_org_review_result",
+            "org_id",
+            "review_result",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_k_feature_org_last_modified",
+            "org_id",
+            "last_modified",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     id: UUID = Field(primary_key=True)
     org_id: UUID = Field(foreign_key="k_organization.id", index=True)
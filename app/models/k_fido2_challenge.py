@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import LargeBinary
+from sqlmodel import Field, SQLModel
+
+from app.core.repr_mixin import SecureReprMixin
+
+
+class KFido2Challenge(SecureReprMixin, SQLModel, table=True):
+    """Pending FIDO2 challenge shared by all workers.
+
+    A row is written when a registration or authentication ceremony begins and
+    deleted when it completes, so ``begin`` and ``complete`` may be served by
+    different workers. Abandoned ceremonies are swept once ``expires_at`` passes.
+    """
+
+    __tablename__ = "k_fido2_challenge"
+
+    session_id: str = Field(primary_key=True, max_length=64)
+    challenge: bytes = Field(sa_type=LargeBinary)
+    expires_at: datetime = Field(index=True)  # Naive UTC
+
+
+__all__ = ["KFido2Challenge"]
@@ -0,0 +1,28 @@
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Column, ForeignKey
+from sqlmodel import Field, SQLModel
+
+from app.core.repr_mixin import SecureReprMixin
+
+
+class KOrgSequence(SecureReprMixin, SQLModel, table=True):
+    """Per-organization counters used to allocate sequential entity numbers.
+
+    Each row holds the last number handed out for one kind of entity (e.g. tasks
+    or features) in one organization. Numbers are allocated by bumping
+    ``last_value`` atomically with ``UPDATE ... RETURNING``.
+    """
+
+    __tablename__ = "k_org_sequence"
+
+    org_id: UUID = Field(
+        sa_column=Column(
+            ForeignKey("k_organization.id", ondelete="CASCADE"), primary_key=True
+        )
+    )
+    kind: str = Field(primary_key=True, max_length=64)
+    last_value: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))
+
+
+__all__ = ["KOrgSequence"]
@@ -3,7 +3,7 @@ from enum import StrEnum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import JSON, Text
+from sqlalchemy import JSON, Index, Text, text
 from sqlmodel import Column, Field, Relationship, SQLModel, String
 
 from app.core.repr_mixin import SecureReprMixin
@@ -35,6 +35,40 @@ class TaskStatus(StrEnum):
 
 class KTask(SecureReprMixin, SQLModel, table=True):
     __tablename__ = "k_task"
+    # Partial indexes for filtered and keyset-paginated task lists
+    __table_args__ = (
+        Index(
+            "ix_k_task_org_created",
+            "org_id",
+            "created",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_k_task_org_status",
+            "org_id",
+            "status",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_k_task_org_team",
+            "org_id",
+            "team_id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_k_task_org_review_result",
+            "org_id",
+            "review_result",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_k_task_org_last_modified",
+            "org_id",
+            "last_modified",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     id: UUID = Field(primary_key=True)
     org_id: UUID = Field(foreign_key="k_organization.id", index=True)
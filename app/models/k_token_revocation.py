@@ -0,0 +1,27 @@
+from datetime import datetime
+from uuid import UUID, uuid7
+
+from sqlmodel import Field, SQLModel
+
+from app.core.repr_mixin import SecureReprMixin
+
+
+class KTokenRevocation(SecureReprMixin, SQLModel, table=True):
+    """Revoked JWT or principal.
+
+    A row with a ``jti`` revokes that one token. A row without one revokes every
+    token of ``principal_id`` issued at or before ``revoked_at``. Rows are only
+    needed until ``expires_at``, after which every token they cover has expired
+    anyway.
+    """
+
+    __tablename__ = "k_token_revocation"
+
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    jti: str | None = Field(default=None, max_length=64, index=True)
+    principal_id: UUID = Field(index=True)
+    revoked_at: datetime = Field(index=True)  # Naive UTC
+    expires_at: datetime = Field(index=True)  # Naive UTC
+
+
+__all__ = ["KTokenRevocation"]
@@ -0,0 +1,31 @@
+"""Operational endpoints for system administrators."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from ..core.db.slow_query import slow_query_log
+from ..schemas.user import UserDetail
+from .deps import get_system_admin
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/slow-queries")
+async def list_slow_queries(
+    _: Annotated[UserDetail, Depends(get_system_admin)],
+) -> JSONResponse:
+    """Sampled slow queries with their EXPLAIN (ANALYZE, BUFFERS) plans, newest first.
+
+    Plans are kept in memory per worker process, so consecutive calls may be
+    served by different workers.
+
+    Requires systemAdmin role or higher.
+    """
+    return JSONResponse(
+        content={
+            **slow_query_log.metrics(),
+            "queries": [query.to_dict() for query in slow_query_log.plans()],
+        }
+    )
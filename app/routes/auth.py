@@ -17,10 +17,12 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
+from ..core.auth import oauth2_scheme
 from ..core.db.database import get_db
 from ..core.exceptions.domain_exceptions import (
     InvalidCredentialsException,
     InvalidTokenException,
+    PasswordHashingUnavailableException,
 )
 from ..logic import auth as auth_logic
 from ..schemas.fido2 import (
@@ -124,7 +126,7 @@ async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     request: Request,
     response: Response,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> Token:
     """Authenticate user and return access token.
 
@@ -149,6 +151,12 @@ async def login(
             detail=e.message,
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
+    except PasswordHashingUnavailableException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": "1"},
+        ) from e
 
 
 @router.post("/refresh", response_model=Token)
@@ -212,22 +220,49 @@ async def refresh_token(
 @router.post("/logout")
 async def logout(
     _current_user: Annotated[UserDetail, Depends(get_current_user)],
+    token: Annotated[str, Depends(oauth2_scheme)],
     request: Request,
     response: Response,
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+    refresh_token: Annotated[str | None, Body(embed=True)] = None,
+    all_sessions: Annotated[
+        bool, Query(description="Revoke every session of the user, on all devices")
+    ] = False,
 ) -> dict[str, str]:
-    """Logout user by clearing refresh token cookie.
+    """Logout user by revoking their tokens and clearing the refresh token cookie.
 
-    For web clients: Clears HTTP-only refresh token cookie.
-    For mobile clients: No-op (client should discard refresh token).
+    The access token and the refresh token (from the cookie for web clients, or
+    the request body for mobile clients) are revoked until they expire. With
+    ``all_sessions``, every token issued to the user so far is revoked instead.
 
     Args:
-        request: FastAPI request object (for client detection)
+        token: Access token of the current request
+        request: FastAPI request object (for client detection and cookies)
         response: FastAPI response object (for clearing cookies)
+        db: Database session
+        refresh_token: Optional refresh token from request body (for mobile clients)
+        all_sessions: Whether to log out of every session
 
     Returns:
         Logout confirmation message
     """
     is_mobile = _is_mobile_client(request)
+    if not is_mobile:
+        refresh_token = request.cookies.get("refresh_token")
+
+    try:
+        await auth_logic.perform_logout(
+            access_token=token,
+            db=db,
+            refresh_token=refresh_token,
+            all_sessions=all_sessions,
+        )
+    except InvalidTokenException as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.message,
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from e
 
     if not is_mobile:
         # Clear refresh token cookie for web clients
@@ -246,7 +281,7 @@ async def logout(
 @router.post("/fido2/register/begin", response_model=Fido2RegistrationBeginResponse)
 async def fido2_register_begin(
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> Fido2RegistrationBeginResponse:
     """Begin FIDO2 credential registration for authenticated user.
 
@@ -280,7 +315,7 @@ async def fido2_register_begin(
 async def fido2_register_complete(
     request: Fido2RegistrationCompleteRequest,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> Fido2RegistrationCompleteResponse:
     """Complete FIDO2 credential registration.
 
@@ -322,7 +357,7 @@ async def fido2_register_complete(
 )
 async def fido2_authenticate_begin(
     request: Fido2AuthenticationBeginRequest,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> Fido2AuthenticationBeginResponse:
     """Begin FIDO2 authentication.
 
@@ -357,7 +392,7 @@ async def fido2_authenticate_complete(
     request_body: Fido2AuthenticationCompleteRequest,
     request: Request,
     response: Response,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> Token:
     """Complete FIDO2 passwordless authentication.
 
@@ -397,7 +432,7 @@ async def login_2fa(
     credential: Annotated[dict, Body()],
     request: Request,
     response: Response,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> Token:
     """Perform two-factor authentication with password + FIDO2.
 
@@ -418,7 +453,8 @@ async def login_2fa(
         JWT access and refresh tokens (refresh token in cookie for web, body for mobile)
 
     Raises:
-        HTTPException: If either password or FIDO2 verification fails
+        HTTPException: If either password or FIDO2 verification fails, or password
+            hashing is saturated
     """
     try:
         token = await auth_logic.perform_2fa_login(
@@ -436,6 +472,12 @@ async def login_2fa(
             detail=e.message,
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
+    except PasswordHashingUnavailableException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": "1"},
+        ) from e
 
 
 # FIDO2 Credential Management Endpoints
@@ -444,7 +486,7 @@ async def login_2fa(
 @router.get("/fido2/credentials", response_model=Fido2CredentialList)
 async def list_credentials(
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> Fido2CredentialList:
     """List all FIDO2 credentials for the authenticated user.
 
@@ -468,7 +510,7 @@ async def update_credential(
     credential_id: UUID,
     request: Fido2CredentialUpdateRequest,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> Fido2CredentialDetail:
     """Update a FIDO2 credential's nickname.
 
@@ -514,7 +556,7 @@ async def update_credential(
 async def delete_credential(
     credential_id: UUID,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the credential")
     ] = False,
@@ -1,8 +1,9 @@
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import settings
 from ..core.auth import oauth2_scheme
 from ..core.db.database import get_db
 from ..core.exceptions.domain_exceptions import (
@@ -13,6 +14,7 @@ from ..core.exceptions.domain_exceptions import (
 )
 from ..core.exceptions.http_exceptions import UnauthorizedException
 from ..logic import deps as deps_logic
+from ..schemas.pagination import PageParams
 from ..schemas.user import TokenData, UserDetail
 
 
@@ -65,7 +67,7 @@ async def get_current_token(
 async def get_current_user(
     request: Request,
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> UserDetail:
     """Get current authenticated user from token.
 
@@ -96,7 +98,7 @@ async def get_current_user(
 
 
 async def get_optional_user(
-    request: Request, db: AsyncSession = Depends(get_db)
+    request: Request, db: AsyncSession = Depends(get_db, scope="function")
 ) -> UserDetail | None:
     """Get optional user from Authorization header.
 
@@ -166,6 +168,29 @@ async def get_system_user(
         raise HTTPException(status_code=403, detail=e.message) from e
 
 
+async def get_system_admin(
+    current_user: Annotated[UserDetail, Depends(get_current_user)],
+) -> UserDetail:
+    """Get current user with system admin role or higher.
+
+    This dependency ensures the user has one of the following roles:
+    - SYSTEM
+    - SYSTEM_ROOT
+    - SYSTEM_ADMIN
+
+    Returns:
+        The current user if they have the required role
+
+    Raises:
+        HTTPException: 403 if user does not have system admin role or higher
+    """
+    try:
+        deps_logic.check_system_admin_role(current_user)
+        return current_user
+    except InsufficientPrivilegesException as e:
+        raise HTTPException(status_code=403, detail=e.message) from e
+
+
 async def check_hard_delete_authorization(
     current_user: Annotated[UserDetail, Depends(get_current_user)],
 ) -> UserDetail:
@@ -184,3 +209,44 @@ async def check_hard_delete_authorization(
         return current_user
     except InsufficientPrivilegesException as e:
         raise HTTPException(status_code=403, detail=e.message) from e
+
+
+def get_page_params(
+    limit: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=settings.list_page_max_size,
+            description="Maximum number of items to return",
+        ),
+    ] = settings.list_page_default_size,
+    cursor: Annotated[
+        str | None,
+        Query(description="Cursor returned as next_cursor by the previous page"),
+    ] = None,
+) -> PageParams:
+    """Get keyset pagination parameters from the query string of a list request.
+
+    Returns:
+        Page size and cursor of the requested page
+    """
+    return PageParams(limit=limit, cursor=cursor)
+
+
+def get_fields(
+    fields: Annotated[
+        str | None,
+        Query(
+            description="Comma-separated fields to return; all fields when omitted",
+            examples=["id,summary,status"],
+        ),
+    ] = None,
+) -> list[str] | None:
+    """Get the fields requested by a read from the query string.
+
+    Returns:
+        Names of the fields to return, or None to return all fields
+    """
+    if fields is None:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
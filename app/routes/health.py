@@ -1,6 +1,12 @@
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 
+from ..core.metrics import metrics_registry
+from ..schemas.user import UserDetail
+from .deps import get_system_admin
+
 router = APIRouter(tags=["health"])
 
 
@@ -8,3 +14,15 @@ router = APIRouter(tags=["health"])
 async def health_check() -> JSONResponse:
     """Health check endpoint."""
     return JSONResponse(content={"status": "healthy"})
+
+
+@router.get("/metrics")
+async def metrics(
+    _: Annotated[UserDetail, Depends(get_system_admin)],
+) -> JSONResponse:
+    """Metrics snapshot for this worker process (pool, caches, etc.).
+
+    Requires systemAdmin role or higher, since it exposes pool sizing and
+    per-route query patterns.
+    """
+    return JSONResponse(content=metrics_registry.snapshot())
@@ -0,0 +1,86 @@
+"""Fast JSON serialization of route responses.
+
+A route that returns a schema instance while declaring ``response_model`` has its
+result validated twice: once by the route building the schema from the ORM row,
+and again by FastAPI checking it against the response model before encoding it
+with ``jsonable_encoder``. ``json_response`` validates ORM rows against the
+response schema once, reading their attributes, and encodes the result straight
+to JSON bytes with pydantic-core's compiled serializer. FastAPI sends a returned
+``Response`` as is, while ``response_model`` keeps documenting it in OpenAPI.
+
+List schemas declare their items as a union of entities and field mappings, which
+the serializer resolves item by item; ``page_response`` serializes a page through
+the concrete item type instead.
+"""
+
+from functools import cache
+from typing import Any, TypedDict
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+from ..logic.pagination import Page
+
+
+@cache
+def _adapter(schema: Any) -> TypeAdapter[Any]:
+    """Get the validator and serializer of a response schema, built once per schema."""
+    return TypeAdapter(schema)
+
+
+def json_bytes(schema: Any, content: Any) -> bytes:
+    """Validate content against a response schema and encode it as JSON.
+
+    Args:
+        schema: Response schema or type, e.g. ``TaskDetail`` or ``TaskList``
+        content: ORM rows, mappings or schema instances, nested as the schema expects
+
+    Returns:
+        JSON encoding of the validated content
+    """
+    adapter = _adapter(schema)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def json_response(
+    schema: Any, content: Any, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Build a JSON response validated once against a response schema.
+
+    Args:
+        schema: Response schema or type; should match the route's ``response_model``
+        content: ORM rows, mappings or schema instances, nested as the schema expects
+        status_code: HTTP status of the response
+
+    Returns:
+        Response whose body is the JSON encoding of the validated content
+    """
+    return Response(
+        json_bytes(schema, content),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+@cache
+def _page_schema(key: str, item_schema: Any) -> Any:
+    """Get the concrete shape of a list response, built once per key and item type."""
+    return TypedDict(  # type: ignore[operator]
+        f"{key.title()}Page", {key: list[item_schema], "next_cursor": str | None}
+    )
+
+
+def page_response(key: str, item_schema: Any, page: Page[Any]) -> Response:
+    """Build the JSON response of a page of list results.
+
+    Args:
+        key: Name of the items field of the list schema, e.g. ``"tasks"``
+        item_schema: Schema of the items, e.g. ``TaskDetail`` or ``dict[str, Any]``
+        page: Page of ORM rows or field mappings
+
+    Returns:
+        Response whose body is the JSON encoding of the items and next cursor
+    """
+    return json_response(
+        _page_schema(key, item_schema), {key: page, "next_cursor": page.next_cursor}
+    )
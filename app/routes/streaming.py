@@ -0,0 +1,95 @@
+"""NDJSON streaming of list responses.
+
+List routes that support it send every matching item, one JSON object per line,
+when the request's ``Accept`` header asks for ``application/x-ndjson``. Items are
+written in the batches they are fetched in, so memory use stays bounded however
+large the list is.
+"""
+
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AsyncExitStack
+from typing import Annotated, Any
+
+from fastapi import Depends, Header
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.db.database import get_db_session
+from .serialization import json_bytes
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# OpenAPI ``responses`` entry for list routes that can stream
+NDJSON_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "content": {
+            NDJSON_MEDIA_TYPE: {
+                "schema": {"type": "string"},
+                "example": '{"id": "..."}\n{"id": "..."}\n',
+            }
+        },
+        "description": f"With Accept: {NDJSON_MEDIA_TYPE}, every item, one per line",
+    }
+}
+
+
+def wants_ndjson(accept: Annotated[str | None, Header()] = None) -> bool:
+    """Get whether the request asks for an NDJSON stream instead of a JSON page."""
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+async def _request_exit_stack() -> AsyncGenerator[AsyncExitStack]:
+    """Get an exit stack that is closed once the response has been sent."""
+    async with AsyncExitStack() as stack:
+        yield stack
+
+
+async def get_list_db(
+    ndjson: Annotated[bool, Depends(wants_ndjson)],
+    request_stack: Annotated[AsyncExitStack, Depends(_request_exit_stack)],
+) -> AsyncGenerator[AsyncSession]:
+    """Dependency for FastAPI to get the read session of a list route that can stream.
+
+    Declare it with ``scope="function"``. A JSON page is read and encoded by the
+    route function, so its session is closed when the function returns, as with
+    ``get_read_db``. An NDJSON stream is read while the response is sent, so its
+    session is only closed once the request is done.
+    """
+    if ndjson:
+        yield await request_stack.enter_async_context(get_db_session(read_only=True))
+        return
+
+    async with get_db_session(read_only=True) as session:
+        yield session
+
+
+async def _ndjson_chunks(
+    batches: AsyncIterator[list[Any]], schema: type[BaseModel] | None
+) -> AsyncIterator[bytes]:
+    """Encode each batch of items as one chunk of NDJSON lines."""
+    async for batch in batches:
+        if schema is None:
+            lines = [to_json(item) for item in batch]
+        else:
+            lines = [json_bytes(schema, item) for item in batch]
+        yield b"".join(line + b"\n" for line in lines)
+
+
+def ndjson_response(
+    batches: AsyncIterator[list[Any]], schema: type[BaseModel] | None = None
+) -> StreamingResponse:
+    """Stream batches of list items as NDJSON.
+
+    Args:
+        batches: Batches of items, e.g. from a logic ``stream_*`` function
+        schema: Response schema to serialize each item with; None to send items
+            that are already mappings of field names to values as they are
+
+    Returns:
+        Streaming response with one JSON object per line
+    """
+    return StreamingResponse(
+        _ndjson_chunks(batches, schema), media_type=NDJSON_MEDIA_TYPE
+    )
@@ -1,17 +1,19 @@
 """Deployment environment management endpoints for creating, listing, updating, and deleting deployment environments."""
 
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     DeploymentEnvAlreadyExistsException,
     DeploymentEnvNotFoundException,
     DeploymentEnvUpdateConflictException,
     InsufficientPrivilegesException,
+    InvalidCursorException,
+    InvalidFieldsException,
     UnauthorizedOrganizationAccessException,
 )
 from ...logic.v1 import deployment_envs as deployment_envs_logic
@@ -21,8 +23,9 @@ from ...schemas.deployment_env import (
     DeploymentEnvList,
     DeploymentEnvUpdate,
 )
+from ...schemas.pagination import PageParams
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_fields, get_page_params
 
 router = APIRouter(prefix="/deployment-envs", tags=["deployment-envs"])
 
@@ -34,7 +37,7 @@ async def create_deployment_env(
     deployment_env_data: DeploymentEnvCreate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> DeploymentEnvDetail:
     """Create a new deployment environment."""
     user_id = UUID(token_data.sub)
@@ -63,21 +66,35 @@ async def create_deployment_env(
 async def list_deployment_envs(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
 ) -> DeploymentEnvList:
     """List all deployment environments in the given organization."""
     user_id = UUID(token_data.sub)
 
     try:
+        if fields is not None:
+            rows = await deployment_envs_logic.list_deployment_envs(
+                org_id=org_id, user_id=user_id, db=db, page=page, fields=fields
+            )
+            return DeploymentEnvList(deployment_envs=rows, next_cursor=rows.next_cursor)
+
         deployment_envs = await deployment_envs_logic.list_deployment_envs(
-            org_id=org_id, user_id=user_id, db=db
+            org_id=org_id, user_id=user_id, db=db, page=page
         )
         return DeploymentEnvList(
             deployment_envs=[
                 DeploymentEnvDetail.model_validate(deployment_env)
                 for deployment_env in deployment_envs
-            ]
+            ],
+            next_cursor=deployment_envs.next_cursor,
         )
+    except (InvalidCursorException, InvalidFieldsException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except UnauthorizedOrganizationAccessException as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -85,13 +102,14 @@ async def list_deployment_envs(
         ) from e
 
 
-@router.get("/{deployment_env_id}", response_model=DeploymentEnvDetail)
+@router.get("/{deployment_env_id}", response_model=DeploymentEnvDetail | dict[str, Any])
 async def get_deployment_env(
     deployment_env_id: UUID,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> DeploymentEnvDetail:
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
+) -> DeploymentEnvDetail | dict[str, Any]:
     """Get a single deployment environment by ID."""
     user_id = UUID(token_data.sub)
 
@@ -101,8 +119,16 @@ async def get_deployment_env(
             org_id=org_id,
             user_id=user_id,
             db=db,
+            fields=fields,
         )
+        if isinstance(deployment_env, dict):
+            return deployment_env
         return DeploymentEnvDetail.model_validate(deployment_env)
+    except InvalidFieldsException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except DeploymentEnvNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -121,7 +147,7 @@ async def update_deployment_env(
     deployment_env_data: DeploymentEnvUpdate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> DeploymentEnvDetail:
     """Update a deployment environment."""
     user_id = UUID(token_data.sub)
@@ -158,7 +184,7 @@ async def delete_deployment_env(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the deployment environment")
     ] = False,
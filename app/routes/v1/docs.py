@@ -1,33 +1,60 @@
 """Doc management endpoints for creating, listing, updating, and deleting docs."""
 
-from typing import Annotated
+import re
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...config import settings
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     DocAlreadyExistsException,
+    DocContentRangeNotSatisfiableException,
     DocNotFoundException,
     DocUpdateConflictException,
     InsufficientPrivilegesException,
+    InvalidCursorException,
+    InvalidFieldsException,
     UnauthorizedOrganizationAccessException,
 )
 from ...logic.v1 import docs as docs_logic
-from ...schemas.doc import DocCreate, DocDetail, DocList, DocUpdate
+from ...schemas.doc import DocCreate, DocDetail, DocList, DocSummary, DocUpdate
+from ...schemas.pagination import PageParams
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_fields, get_page_params
+from ..streaming import NDJSON_RESPONSES, get_list_db, ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+_CHAR_RANGE = re.compile(r"chars=(?P<first>\d+)-(?P<last>\d*)")
+
+
+def _parse_char_range(value: str | None) -> tuple[int, int | None] | None:
+    """Parse a ``chars=first-last`` Range header into a start and exclusive end.
+
+    Returns:
+        Start and end positions, or None if the header is absent or not a single
+        chars range (such headers are ignored, as HTTP allows)
+    """
+    match = _CHAR_RANGE.fullmatch(value.strip()) if value else None
+    if match is None:
+        return None
+    first = int(match["first"])
+    last = int(match["last"]) if match["last"] else None
+    if last is not None and last < first:
+        return None
+    return first, None if last is None else last + 1
+
 
 @router.post("", response_model=DocDetail, status_code=status.HTTP_201_CREATED)
 async def create_doc(
     doc_data: DocCreate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> DocDetail:
     """Create a new doc."""
     user_id = UUID(token_data.sub)
@@ -52,18 +79,80 @@ async def create_doc(
         ) from e
 
 
-@router.get("", response_model=DocList)
+@router.get("", response_model=DocList, responses=NDJSON_RESPONSES)
 async def list_docs(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> DocList:
-    """List all docs in the given organization."""
+    db: Annotated[AsyncSession, Depends(get_list_db, scope="function")],
+    ndjson: Annotated[bool, Depends(wants_ndjson)],
+    page: Annotated[PageParams, Depends(get_page_params)],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
+    view: Annotated[
+        Literal["summary", "full"],
+        Query(description="summary omits content; full includes it"),
+    ] = "summary",
+    excerpt: Annotated[
+        int | None,
+        Query(
+            ge=1,
+            le=settings.doc_excerpt_max_length,
+            description="Include this many leading content characters in summaries",
+        ),
+    ] = None,
+) -> DocList | StreamingResponse:
+    """List docs in the given organization.
+
+    By default docs are listed without their content, described by its length
+    and hash instead; fetch content from ``/documents/{doc_id}/content``.
+    """
     user_id = UUID(token_data.sub)
 
     try:
-        docs = await docs_logic.list_docs(org_id=org_id, user_id=user_id, db=db)
-        return DocList(docs=[DocDetail.model_validate(doc) for doc in docs])
+        if ndjson:
+            if fields is None and view == "summary":
+                summary_batches = await docs_logic.stream_doc_summaries(
+                    org_id=org_id,
+                    user_id=user_id,
+                    db=db,
+                    excerpt_length=excerpt,
+                )
+                return ndjson_response(summary_batches, DocSummary)
+            batches = await docs_logic.stream_docs(
+                org_id=org_id, user_id=user_id, db=db, fields=fields
+            )
+            return ndjson_response(batches, None if fields else DocDetail)
+
+        if fields is None and view == "summary":
+            summaries = await docs_logic.list_doc_summaries(
+                org_id=org_id,
+                user_id=user_id,
+                db=db,
+                page=page,
+                excerpt_length=excerpt,
+            )
+            return DocList(
+                docs=[DocSummary.model_validate(summary) for summary in summaries],
+                next_cursor=summaries.next_cursor,
+            )
+
+        if fields is not None:
+            rows = await docs_logic.list_docs(
+                org_id=org_id, user_id=user_id, db=db, page=page, fields=fields
+            )
+            return DocList(docs=rows, next_cursor=rows.next_cursor)
+
+        docs = await docs_logic.list_docs(
+            org_id=org_id, user_id=user_id, db=db, page=page
+        )
+        return DocList(
+            docs=[DocDetail.model_validate(doc) for doc in docs],
+            next_cursor=docs.next_cursor,
+        )
+    except (InvalidCursorException, InvalidFieldsException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except UnauthorizedOrganizationAccessException as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -71,13 +160,14 @@ async def list_docs(
         ) from e
 
 
-@router.get("/{doc_id}", response_model=DocDetail)
+@router.get("/{doc_id}", response_model=DocDetail | dict[str, Any])
 async def get_doc(
     doc_id: UUID,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> DocDetail:
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
+) -> DocDetail | dict[str, Any]:
     """Get a single doc by ID."""
     user_id = UUID(token_data.sub)
 
@@ -87,8 +177,16 @@ async def get_doc(
             org_id=org_id,
             user_id=user_id,
             db=db,
+            fields=fields,
         )
+        if isinstance(doc, dict):
+            return doc
         return DocDetail.model_validate(doc)
+    except InvalidFieldsException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except DocNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -101,13 +199,87 @@ async def get_doc(
         ) from e
 
 
+@router.get(
+    "/{doc_id}/content",
+    response_class=PlainTextResponse,
+    responses={
+        status.HTTP_206_PARTIAL_CONTENT: {"description": "The requested range"},
+        status.HTTP_416_RANGE_NOT_SATISFIABLE: {
+            "description": "The range starts beyond the end of the content"
+        },
+    },
+)
+async def get_doc_content(
+    doc_id: UUID,
+    org_id: Annotated[UUID, Query(description="Organization ID")],
+    token_data: Annotated[TokenData, Depends(get_current_token)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    range_header: Annotated[
+        str | None,
+        Header(
+            alias="Range",
+            description="Character range to return, e.g. chars=0-999",
+        ),
+    ] = None,
+) -> PlainTextResponse:
+    """Get a doc's content, or a character range of it.
+
+    Ranges use the ``chars`` unit with zero-based, inclusive positions, as in
+    ``Range: chars=0-999`` or ``Range: chars=1000-``. Ranges in other units,
+    suffix ranges and multiple ranges are ignored and the full content is sent.
+    """
+    user_id = UUID(token_data.sub)
+    char_range = _parse_char_range(range_header)
+    start, end = char_range or (0, None)
+
+    try:
+        content = await docs_logic.get_doc_content(
+            doc_id=doc_id,
+            org_id=org_id,
+            user_id=user_id,
+            db=db,
+            start=start,
+            end=end,
+        )
+    except DocContentRangeNotSatisfiableException as e:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail=e.message,
+            headers={"Content-Range": f"chars */{e.content_length}"},
+        ) from e
+    except DocNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message,
+        ) from e
+    except UnauthorizedOrganizationAccessException as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=e.message,
+        ) from e
+
+    headers = {"Accept-Ranges": "chars"}
+    if char_range is None or content.start == content.end:
+        # An empty doc has no range to send, only its (empty) content
+        return PlainTextResponse(content.content, headers=headers)
+
+    headers["Content-Range"] = (
+        f"chars {content.start}-{content.end - 1}/{content.content_length}"
+    )
+    return PlainTextResponse(
+        content.content,
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        headers=headers,
+    )
+
+
 @router.patch("/{doc_id}", response_model=DocDetail)
 async def update_doc(
     doc_id: UUID,
     doc_data: DocUpdate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> DocDetail:
     """Update a doc."""
     user_id = UUID(token_data.sub)
@@ -144,7 +316,7 @@ async def delete_doc(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[bool, Query(description="Hard delete the doc")] = False,
 ) -> None:
     """Delete a doc."""
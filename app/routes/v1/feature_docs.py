@@ -6,13 +6,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     DocNotFoundException,
     FeatureDocAlreadyExistsException,
     FeatureDocNotFoundException,
     FeatureNotFoundException,
     InsufficientPrivilegesException,
+    InvalidCursorException,
 )
 from ...logic.v1 import feature_docs as feature_docs_logic
 from ...schemas.feature_doc import (
@@ -21,8 +22,9 @@ from ...schemas.feature_doc import (
     FeatureDocList,
     FeatureDocUpdate,
 )
+from ...schemas.pagination import PageParams
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
 
 router = APIRouter(prefix="/features/{feature_id}/docs", tags=["feature-docs"])
 
@@ -32,7 +34,7 @@ async def add_feature_doc(
     feature_id: UUID,
     doc_data: FeatureDocCreate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> FeatureDocDetail:
     """Add a new doc to a feature."""
     user_id = UUID(token_data.sub)
@@ -66,14 +68,23 @@ async def add_feature_doc(
 async def list_feature_docs(
     feature_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> FeatureDocList:
     """List all docs for a feature."""
     try:
-        docs = await feature_docs_logic.list_feature_docs(feature_id=feature_id, db=db)
+        docs = await feature_docs_logic.list_feature_docs(
+            feature_id=feature_id, db=db, page=page
+        )
         return FeatureDocList(
-            docs=[FeatureDocDetail.model_validate(doc) for doc in docs]
+            docs=[FeatureDocDetail.model_validate(doc) for doc in docs],
+            next_cursor=docs.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except FeatureNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -86,7 +97,7 @@ async def get_feature_doc(
     feature_id: UUID,
     doc_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> FeatureDocDetail:
     """Get a single feature doc relationship."""
     try:
@@ -109,7 +120,7 @@ async def update_feature_doc(
     doc_id: UUID,
     doc_data: FeatureDocUpdate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> FeatureDocDetail:
     """Update a feature doc relationship."""
     user_id = UUID(token_data.sub)
@@ -136,7 +147,7 @@ async def remove_feature_doc(
     doc_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
@@ -1,34 +1,67 @@
 """Feature management endpoints for creating, listing, updating, and deleting features."""
 
-from typing import Annotated
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db, logger
+from ...core.db.database import get_db, get_read_db, logger
 from ...core.exceptions.domain_exceptions import (
     FeatureAlreadyExistsException,
     FeatureNotFoundException,
     FeatureUpdateConflictException,
     InsufficientPrivilegesException,
+    InvalidCursorException,
+    InvalidFieldsException,
     UnauthorizedOrganizationAccessException,
 )
+from ...logic.pagination import SortKey
 from ...logic.v1 import features as features_logic
-from ...schemas.feature import FeatureCreate, FeatureDetail, FeatureList, FeatureUpdate
+from ...models.k_feature import FeatureType, ReviewResult
+from ...schemas.feature import (
+    FeatureCreate,
+    FeatureDetail,
+    FeatureFilters,
+    FeatureList,
+    FeatureSortField,
+    FeatureUpdate,
+)
+from ...schemas.pagination import PageParams
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_fields, get_page_params
+from ..serialization import json_response, page_response
+from ..streaming import NDJSON_RESPONSES, get_list_db, ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/features", tags=["features"])
 
 
+def get_feature_filters(
+    feature_type: Annotated[
+        list[FeatureType] | None, Query(description="Only features of these types")
+    ] = None,
+    parent: Annotated[
+        UUID | None, Query(description="Only direct children of this feature")
+    ] = None,
+    review_result: Annotated[
+        list[ReviewResult] | None,
+        Query(description="Only features with these review results"),
+    ] = None,
+) -> FeatureFilters:
+    """Get feature list filters from the query string."""
+    return FeatureFilters(
+        feature_type=feature_type, parent=parent, review_result=review_result
+    )
+
+
 @router.post("", response_model=FeatureDetail, status_code=status.HTTP_201_CREATED)
 async def create_feature(
     feature_data: FeatureCreate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> FeatureDetail:
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+) -> Response:
     """Create a new feature."""
     user_id = UUID(token_data.sub)
 
@@ -39,7 +72,7 @@ async def create_feature(
             org_id=org_id,
             db=db,
         )
-        return FeatureDetail.model_validate(feature)
+        return json_response(FeatureDetail, feature, status.HTTP_201_CREATED)
     except FeatureAlreadyExistsException as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -52,25 +85,57 @@ async def create_feature(
         ) from e
 
 
-@router.get("", response_model=FeatureList)
+@router.get("", response_model=FeatureList, responses=NDJSON_RESPONSES)
 async def list_features(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> FeatureList:
-    """List all features in the given organization."""
+    db: Annotated[AsyncSession, Depends(get_list_db, scope="function")],
+    ndjson: Annotated[bool, Depends(wants_ndjson)],
+    page: Annotated[PageParams, Depends(get_page_params)],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
+    filters: Annotated[FeatureFilters, Depends(get_feature_filters)],
+    sort: Annotated[
+        FeatureSortField, Query(description="Field to sort by")
+    ] = "created",
+    direction: Annotated[
+        Literal["asc", "desc"], Query(description="Sort direction")
+    ] = "asc",
+) -> Response:
+    """List features in the given organization, optionally filtered and sorted."""
     logger.info(f"Listing features for organization {org_id}")
     user_id = UUID(token_data.sub)
     logger.info(f"User ID: {user_id}")
 
     try:
+        if ndjson:
+            batches = await features_logic.stream_features(
+                org_id=org_id,
+                user_id=user_id,
+                db=db,
+                fields=fields,
+                filters=filters,
+                sort=SortKey(sort, descending=direction == "desc"),
+            )
+            return ndjson_response(batches, None if fields else FeatureDetail)
+
         features = await features_logic.list_features(
-            org_id=org_id, user_id=user_id, db=db
+            org_id=org_id,
+            user_id=user_id,
+            db=db,
+            page=page,
+            fields=fields,
+            filters=filters,
+            sort=SortKey(sort, descending=direction == "desc"),
         )
         logger.info(f"Features: {features}")
-        return FeatureList(
-            features=[FeatureDetail.model_validate(feature) for feature in features]
+        return page_response(
+            "features", dict[str, Any] if fields else FeatureDetail, features
         )
+    except (InvalidCursorException, InvalidFieldsException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except UnauthorizedOrganizationAccessException as e:
         logger.error(f"Unauthorized organization access: {e}")
         raise HTTPException(
@@ -79,13 +144,14 @@ async def list_features(
         ) from e
 
 
-@router.get("/{feature_id}", response_model=FeatureDetail)
+@router.get("/{feature_id}", response_model=FeatureDetail | dict[str, Any])
 async def get_feature(
     feature_id: UUID,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> FeatureDetail:
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
+) -> Response:
     """Get a single feature by ID."""
     user_id = UUID(token_data.sub)
 
@@ -95,8 +161,14 @@ async def get_feature(
             org_id=org_id,
             user_id=user_id,
             db=db,
+            fields=fields,
         )
-        return FeatureDetail.model_validate(feature)
+        return json_response(dict[str, Any] if fields else FeatureDetail, feature)
+    except InvalidFieldsException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except FeatureNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -115,8 +187,8 @@ async def update_feature(
     feature_data: FeatureUpdate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> FeatureDetail:
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+) -> Response:
     """Update a feature."""
     user_id = UUID(token_data.sub)
 
@@ -128,7 +200,7 @@ async def update_feature(
             org_id=org_id,
             db=db,
         )
-        return FeatureDetail.model_validate(feature)
+        return json_response(FeatureDetail, feature)
     except FeatureNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -152,7 +224,7 @@ async def delete_feature(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[bool, Query(description="Hard delete the feature")] = False,
 ) -> None:
     """Delete a feature."""
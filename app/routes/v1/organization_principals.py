@@ -4,11 +4,13 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
     OrganizationNotFoundException,
     OrganizationPrincipalAlreadyExistsException,
     OrganizationPrincipalNotFoundException,
@@ -21,8 +23,10 @@ from ...schemas.organization_principal import (
     OrganizationPrincipalList,
     OrganizationPrincipalUpdate,
 )
+from ...schemas.pagination import PageParams
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
+from ..streaming import NDJSON_RESPONSES, get_list_db, ndjson_response, wants_ndjson
 
 router = APIRouter(
     prefix="/organizations/{org_id}/principals", tags=["organization-principals"]
@@ -36,7 +40,7 @@ async def add_organization_principal(
     org_id: UUID,
     principal_data: OrganizationPrincipalCreate,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> OrganizationPrincipalDetail:
     """Add a new principal to an organization.
 
@@ -75,25 +79,41 @@ async def add_organization_principal(
         ) from e
 
 
-@router.get("", response_model=OrganizationPrincipalList)
+@router.get("", response_model=OrganizationPrincipalList, responses=NDJSON_RESPONSES)
 async def list_organization_principals(
     org_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> OrganizationPrincipalList:
+    db: Annotated[AsyncSession, Depends(get_list_db, scope="function")],
+    ndjson: Annotated[bool, Depends(wants_ndjson)],
+    page: Annotated[PageParams, Depends(get_page_params)],
+) -> OrganizationPrincipalList | StreamingResponse:
     """List all principals of an organization."""
     user_id = UUID(token_data.sub)
 
     try:
+        if ndjson:
+            batches = (
+                await organization_principals_logic.stream_organization_principals(
+                    org_id=org_id, user_id=user_id, db=db
+                )
+            )
+            return ndjson_response(batches, OrganizationPrincipalDetail)
+
         principals = await organization_principals_logic.list_organization_principals(
-            org_id=org_id, user_id=user_id, db=db
+            org_id=org_id, user_id=user_id, db=db, page=page
         )
         return OrganizationPrincipalList(
             principals=[
                 OrganizationPrincipalDetail.model_validate(principal)
                 for principal in principals
-            ]
+            ],
+            next_cursor=principals.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except OrganizationNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -111,7 +131,7 @@ async def get_organization_principal(
     org_id: UUID,
     principal_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> OrganizationPrincipalDetail:
     """Get a single organization principal."""
     user_id = UUID(token_data.sub)
@@ -142,7 +162,7 @@ async def update_organization_principal(
     principal_id: UUID,
     principal_data: OrganizationPrincipalUpdate,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> OrganizationPrincipalDetail:
     """Update an organization principal.
 
@@ -177,7 +197,7 @@ async def remove_organization_principal(
     org_id: UUID,
     principal_id: UUID,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
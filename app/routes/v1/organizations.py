@@ -6,9 +6,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
     OrganizationAlreadyExistsException,
     OrganizationNotFoundException,
     OrganizationUpdateConflictException,
@@ -21,8 +22,9 @@ from ...schemas.organization import (
     OrganizationList,
     OrganizationUpdate,
 )
+from ...schemas.pagination import PageParams
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
 
 router = APIRouter(prefix="/organizations", tags=["organizations"])
 
@@ -31,7 +33,7 @@ router = APIRouter(prefix="/organizations", tags=["organizations"])
 async def create_organization(
     org_data: OrganizationCreate,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> OrganizationDetail:
     """Create a new organization.
 
@@ -63,22 +65,32 @@ async def create_organization(
 @router.get("", response_model=OrganizationList)
 async def list_organizations(
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> OrganizationList:
     """List all organizations in the current user's scope."""
-    organizations = await organizations_logic.list_organizations(
-        scope=token_data.scope, db=db
-    )
-    return OrganizationList(
-        organizations=[OrganizationDetail.model_validate(org) for org in organizations]
-    )
+    try:
+        organizations = await organizations_logic.list_organizations(
+            scope=token_data.scope, db=db, page=page
+        )
+        return OrganizationList(
+            organizations=[
+                OrganizationDetail.model_validate(org) for org in organizations
+            ],
+            next_cursor=organizations.next_cursor,
+        )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
 
 
 @router.get("/{org_id}", response_model=OrganizationDetail)
 async def get_organization(
     org_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> OrganizationDetail:
     """Get a single organization by ID."""
     user_id = UUID(token_data.sub)
@@ -108,7 +120,7 @@ async def update_organization(
     org_id: UUID,
     org_data: OrganizationUpdate,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> OrganizationDetail:
     """Update an organization.
 
@@ -147,7 +159,7 @@ async def update_organization(
 async def delete_organization(
     org_id: UUID,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the organization")
     ] = False,
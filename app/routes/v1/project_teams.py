@@ -6,14 +6,16 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
     ProjectNotFoundException,
     ProjectTeamAlreadyExistsException,
     ProjectTeamNotFoundException,
 )
 from ...logic.v1 import project_teams as project_teams_logic
+from ...schemas.pagination import PageParams
 from ...schemas.project_team import (
     ProjectTeamCreate,
     ProjectTeamDetail,
@@ -21,7 +23,7 @@ from ...schemas.project_team import (
     ProjectTeamUpdate,
 )
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
 
 router = APIRouter(prefix="/projects/{project_id}/teams", tags=["project-teams"])
 
@@ -31,7 +33,7 @@ async def add_project_team(
     project_id: UUID,
     team_data: ProjectTeamCreate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> ProjectTeamDetail:
     """Add a new team to a project."""
     user_id = UUID(token_data.sub)
@@ -60,16 +62,23 @@ async def add_project_team(
 async def list_project_teams(
     project_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> ProjectTeamList:
     """List all teams of a project."""
     try:
         teams = await project_teams_logic.list_project_teams(
-            project_id=project_id, db=db
+            project_id=project_id, db=db, page=page
         )
         return ProjectTeamList(
-            teams=[ProjectTeamDetail.model_validate(team) for team in teams]
+            teams=[ProjectTeamDetail.model_validate(team) for team in teams],
+            next_cursor=teams.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except ProjectNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -82,7 +91,7 @@ async def get_project_team(
     project_id: UUID,
     team_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> ProjectTeamDetail:
     """Get a single project team."""
     try:
@@ -105,7 +114,7 @@ async def update_project_team(
     team_id: UUID,
     team_data: ProjectTeamUpdate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> ProjectTeamDetail:
     """Update a project team."""
     user_id = UUID(token_data.sub)
@@ -132,7 +141,7 @@ async def remove_project_team(
     team_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
@@ -1,23 +1,26 @@
 """Project management endpoints for creating, listing, updating, and deleting projects."""
 
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
+    InvalidFieldsException,
     ProjectAlreadyExistsException,
     ProjectNotFoundException,
     ProjectUpdateConflictException,
     UnauthorizedOrganizationAccessException,
 )
 from ...logic.v1 import projects as projects_logic
+from ...schemas.pagination import PageParams
 from ...schemas.project import ProjectCreate, ProjectDetail, ProjectList, ProjectUpdate
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_fields, get_page_params
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -27,7 +30,7 @@ async def create_project(
     project_data: ProjectCreate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> ProjectDetail:
     """Create a new project."""
     user_id = UUID(token_data.sub)
@@ -56,18 +59,32 @@ async def create_project(
 async def list_projects(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
 ) -> ProjectList:
     """List all projects in the given organization."""
     user_id = UUID(token_data.sub)
 
     try:
+        if fields is not None:
+            rows = await projects_logic.list_projects(
+                org_id=org_id, user_id=user_id, db=db, page=page, fields=fields
+            )
+            return ProjectList(projects=rows, next_cursor=rows.next_cursor)
+
         projects = await projects_logic.list_projects(
-            org_id=org_id, user_id=user_id, db=db
+            org_id=org_id, user_id=user_id, db=db, page=page
         )
         return ProjectList(
-            projects=[ProjectDetail.model_validate(project) for project in projects]
+            projects=[ProjectDetail.model_validate(project) for project in projects],
+            next_cursor=projects.next_cursor,
         )
+    except (InvalidCursorException, InvalidFieldsException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except UnauthorizedOrganizationAccessException as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -75,13 +92,14 @@ async def list_projects(
         ) from e
 
 
-@router.get("/{project_id}", response_model=ProjectDetail)
+@router.get("/{project_id}", response_model=ProjectDetail | dict[str, Any])
 async def get_project(
     project_id: UUID,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> ProjectDetail:
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
+) -> ProjectDetail | dict[str, Any]:
     """Get a single project by ID."""
     user_id = UUID(token_data.sub)
 
@@ -91,8 +109,16 @@ async def get_project(
             org_id=org_id,
             user_id=user_id,
             db=db,
+            fields=fields,
         )
+        if isinstance(project, dict):
+            return project
         return ProjectDetail.model_validate(project)
+    except InvalidFieldsException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except ProjectNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -111,7 +137,7 @@ async def update_project(
     project_data: ProjectUpdate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> ProjectDetail:
     """Update a project."""
     user_id = UUID(token_data.sub)
@@ -148,7 +174,7 @@ async def delete_project(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[bool, Query(description="Hard delete the project")] = False,
 ) -> None:
     """Delete a project (cascades to project teams)."""
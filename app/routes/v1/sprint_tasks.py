@@ -4,17 +4,20 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
     SprintNotFoundException,
     SprintTaskAlreadyExistsException,
     SprintTaskNotFoundException,
     TaskNotFoundException,
 )
 from ...logic.v1 import sprint_tasks as sprint_tasks_logic
+from ...schemas.pagination import PageParams
 from ...schemas.sprint_task import (
     SprintTaskCreate,
     SprintTaskDetail,
@@ -22,7 +25,8 @@ from ...schemas.sprint_task import (
     SprintTaskUpdate,
 )
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
+from ..streaming import NDJSON_RESPONSES, get_list_db, ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/sprints/{sprint_id}/tasks", tags=["sprint-tasks"])
 
@@ -32,7 +36,7 @@ async def add_sprint_task(
     sprint_id: UUID,
     task_data: SprintTaskCreate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> SprintTaskDetail:
     """Add a task to a sprint."""
     user_id = UUID(token_data.sub)
@@ -62,18 +66,34 @@ async def add_sprint_task(
         ) from e
 
 
-@router.get("", response_model=SprintTaskList)
+@router.get("", response_model=SprintTaskList, responses=NDJSON_RESPONSES)
 async def list_sprint_tasks(
     sprint_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> SprintTaskList:
+    db: Annotated[AsyncSession, Depends(get_list_db, scope="function")],
+    ndjson: Annotated[bool, Depends(wants_ndjson)],
+    page: Annotated[PageParams, Depends(get_page_params)],
+) -> SprintTaskList | StreamingResponse:
     """List all tasks in a sprint."""
     try:
-        tasks = await sprint_tasks_logic.list_sprint_tasks(sprint_id=sprint_id, db=db)
+        if ndjson:
+            batches = await sprint_tasks_logic.stream_sprint_tasks(
+                sprint_id=sprint_id, db=db
+            )
+            return ndjson_response(batches, SprintTaskDetail)
+
+        tasks = await sprint_tasks_logic.list_sprint_tasks(
+            sprint_id=sprint_id, db=db, page=page
+        )
         return SprintTaskList(
-            tasks=[SprintTaskDetail.model_validate(task) for task in tasks]
+            tasks=[SprintTaskDetail.model_validate(task) for task in tasks],
+            next_cursor=tasks.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except SprintNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -86,7 +106,7 @@ async def get_sprint_task(
     sprint_id: UUID,
     task_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> SprintTaskDetail:
     """Get a single sprint task."""
     try:
@@ -109,7 +129,7 @@ async def update_sprint_task(
     task_id: UUID,
     task_data: SprintTaskUpdate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> SprintTaskDetail:
     """Update a sprint task."""
     user_id = UUID(token_data.sub)
@@ -136,7 +156,7 @@ async def remove_sprint_task(
     task_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
@@ -6,15 +6,17 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
     SprintNotFoundException,
     SprintTeamAlreadyExistsException,
     SprintTeamNotFoundException,
     TeamNotFoundException,
 )
 from ...logic.v1 import sprint_teams as sprint_teams_logic
+from ...schemas.pagination import PageParams
 from ...schemas.sprint_team import (
     SprintTeamCreate,
     SprintTeamDetail,
@@ -22,7 +24,7 @@ from ...schemas.sprint_team import (
     SprintTeamUpdate,
 )
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
 
 router = APIRouter(prefix="/sprints/{sprint_id}/teams", tags=["sprint-teams"])
 
@@ -32,7 +34,7 @@ async def add_sprint_team(
     sprint_id: UUID,
     team_data: SprintTeamCreate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> SprintTeamDetail:
     """Add a team to a sprint."""
     user_id = UUID(token_data.sub)
@@ -66,14 +68,23 @@ async def add_sprint_team(
 async def list_sprint_teams(
     sprint_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> SprintTeamList:
     """List all teams in a sprint."""
     try:
-        teams = await sprint_teams_logic.list_sprint_teams(sprint_id=sprint_id, db=db)
+        teams = await sprint_teams_logic.list_sprint_teams(
+            sprint_id=sprint_id, db=db, page=page
+        )
         return SprintTeamList(
-            teams=[SprintTeamDetail.model_validate(team) for team in teams]
+            teams=[SprintTeamDetail.model_validate(team) for team in teams],
+            next_cursor=teams.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except SprintNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -86,7 +97,7 @@ async def get_sprint_team(
     sprint_id: UUID,
     team_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> SprintTeamDetail:
     """Get a single sprint team."""
     try:
@@ -109,7 +120,7 @@ async def update_sprint_team(
     team_id: UUID,
     team_data: SprintTeamUpdate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> SprintTeamDetail:
     """Update a sprint team."""
     user_id = UUID(token_data.sub)
@@ -136,7 +147,7 @@ async def remove_sprint_team(
     team_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
@@ -1,22 +1,25 @@
 """Sprint management endpoints for creating, listing, updating, and deleting sprints."""
 
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
+    InvalidFieldsException,
     SprintNotFoundException,
     SprintUpdateConflictException,
     UnauthorizedOrganizationAccessException,
 )
 from ...logic.v1 import sprints as sprints_logic
+from ...schemas.pagination import PageParams
 from ...schemas.sprint import SprintCreate, SprintDetail, SprintList, SprintUpdate
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_fields, get_page_params
 
 router = APIRouter(prefix="/sprints", tags=["sprints"])
 
@@ -26,7 +29,7 @@ async def create_sprint(
     sprint_data: SprintCreate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> SprintDetail:
     """Create a new sprint."""
     user_id = UUID(token_data.sub)
@@ -50,18 +53,32 @@ async def create_sprint(
 async def list_sprints(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
 ) -> SprintList:
     """List all sprints in the given organization."""
     user_id = UUID(token_data.sub)
 
     try:
+        if fields is not None:
+            rows = await sprints_logic.list_sprints(
+                org_id=org_id, user_id=user_id, db=db, page=page, fields=fields
+            )
+            return SprintList(sprints=rows, next_cursor=rows.next_cursor)
+
         sprints = await sprints_logic.list_sprints(
-            org_id=org_id, user_id=user_id, db=db
+            org_id=org_id, user_id=user_id, db=db, page=page
         )
         return SprintList(
-            sprints=[SprintDetail.model_validate(sprint) for sprint in sprints]
+            sprints=[SprintDetail.model_validate(sprint) for sprint in sprints],
+            next_cursor=sprints.next_cursor,
         )
+    except (InvalidCursorException, InvalidFieldsException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except UnauthorizedOrganizationAccessException as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -69,13 +86,14 @@ async def list_sprints(
         ) from e
 
 
-@router.get("/{sprint_id}", response_model=SprintDetail)
+@router.get("/{sprint_id}", response_model=SprintDetail | dict[str, Any])
 async def get_sprint(
     sprint_id: UUID,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> SprintDetail:
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
+) -> SprintDetail | dict[str, Any]:
     """Get a single sprint by ID."""
     user_id = UUID(token_data.sub)
 
@@ -85,8 +103,16 @@ async def get_sprint(
             org_id=org_id,
             user_id=user_id,
             db=db,
+            fields=fields,
         )
+        if isinstance(sprint, dict):
+            return sprint
         return SprintDetail.model_validate(sprint)
+    except InvalidFieldsException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except SprintNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -105,7 +131,7 @@ async def update_sprint(
     sprint_data: SprintUpdate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> SprintDetail:
     """Update a sprint."""
     user_id = UUID(token_data.sub)
@@ -142,7 +168,7 @@ async def delete_sprint(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[bool, Query(description="Hard delete the sprint")] = False,
 ) -> None:
     """Delete a sprint (cascades to sprint tasks and teams)."""
@@ -6,15 +6,17 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     DeploymentEnvNotFoundException,
     InsufficientPrivilegesException,
+    InvalidCursorException,
     TaskDeploymentEnvAlreadyExistsException,
     TaskDeploymentEnvNotFoundException,
     TaskNotFoundException,
 )
 from ...logic.v1 import task_deployment_envs as task_deployment_envs_logic
+from ...schemas.pagination import PageParams
 from ...schemas.task_deployment_env import (
     TaskDeploymentEnvCreate,
     TaskDeploymentEnvDetail,
@@ -22,7 +24,7 @@ from ...schemas.task_deployment_env import (
     TaskDeploymentEnvUpdate,
 )
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
 
 router = APIRouter(
     prefix="/tasks/{task_id}/deployment_envs", tags=["task-deployment-envs"]
@@ -36,7 +38,7 @@ async def add_task_deployment_env(
     task_id: UUID,
     deployment_env_data: TaskDeploymentEnvCreate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TaskDeploymentEnvDetail:
     """Add a new deployment environment to a task."""
     user_id = UUID(token_data.sub)
@@ -70,18 +72,25 @@ async def add_task_deployment_env(
 async def list_task_deployment_envs(
     task_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> TaskDeploymentEnvList:
     """List all deployment environments for a task."""
     try:
         deployment_envs = await task_deployment_envs_logic.list_task_deployment_envs(
-            task_id=task_id, db=db
+            task_id=task_id, db=db, page=page
         )
         return TaskDeploymentEnvList(
             deployment_envs=[
                 TaskDeploymentEnvDetail.model_validate(env) for env in deployment_envs
-            ]
+            ],
+            next_cursor=deployment_envs.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except TaskNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -94,7 +103,7 @@ async def get_task_deployment_env(
     task_id: UUID,
     deployment_env_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> TaskDeploymentEnvDetail:
     """Get a single task deployment environment relationship."""
     try:
@@ -117,7 +126,7 @@ async def update_task_deployment_env(
     deployment_env_id: UUID,
     deployment_env_data: TaskDeploymentEnvUpdate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TaskDeploymentEnvDetail:
     """Update a task deployment environment relationship."""
     user_id = UUID(token_data.sub)
@@ -146,7 +155,7 @@ async def remove_task_deployment_env(
     deployment_env_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
@@ -6,15 +6,17 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     FeatureNotFoundException,
     InsufficientPrivilegesException,
+    InvalidCursorException,
     TaskFeatureAlreadyExistsException,
     TaskFeatureNotFoundException,
     TaskNotFoundException,
 )
 from ...logic.v1 import task_features as task_features_logic
+from ...schemas.pagination import PageParams
 from ...schemas.task import TaskDetail, TaskList
 from ...schemas.task_feature import (
     TaskFeatureCreate,
@@ -23,7 +25,7 @@ from ...schemas.task_feature import (
     TaskFeatureUpdate,
 )
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
 
 router = APIRouter(prefix="/tasks/{task_id}/features", tags=["task-features"])
 feature_tasks_router = APIRouter(prefix="/tasks/feature", tags=["task-features"])
@@ -34,7 +36,7 @@ async def add_task_feature(
     task_id: UUID,
     feature_data: TaskFeatureCreate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TaskFeatureDetail:
     """Add a new feature to a task."""
     user_id = UUID(token_data.sub)
@@ -68,14 +70,25 @@ async def add_task_feature(
 async def list_task_features(
     task_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> TaskFeatureList:
     """List all features for a task."""
     try:
-        features = await task_features_logic.list_task_features(task_id=task_id, db=db)
+        features = await task_features_logic.list_task_features(
+            task_id=task_id, db=db, page=page
+        )
         return TaskFeatureList(
-            features=[TaskFeatureDetail.model_validate(feature) for feature in features]
+            features=[
+                TaskFeatureDetail.model_validate(feature) for feature in features
+            ],
+            next_cursor=features.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except TaskNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -88,7 +101,7 @@ async def get_task_feature(
     task_id: UUID,
     feature_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> TaskFeatureDetail:
     """Get a single task feature relationship."""
     try:
@@ -111,7 +124,7 @@ async def update_task_feature(
     feature_id: UUID,
     feature_data: TaskFeatureUpdate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TaskFeatureDetail:
     """Update a task feature relationship."""
     user_id = UUID(token_data.sub)
@@ -138,7 +151,7 @@ async def remove_task_feature(
     feature_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
@@ -177,7 +190,8 @@ async def remove_task_feature(
 async def list_tasks_by_feature(
     feature_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
     detail: Annotated[
         bool,
         Query(
@@ -189,16 +203,25 @@ async def list_tasks_by_feature(
     try:
         if detail:
             tasks = await task_features_logic.list_tasks_by_feature_detailed(
-                feature_id=feature_id, db=db
+                feature_id=feature_id, db=db, page=page
+            )
+            return TaskList(
+                tasks=[TaskDetail.model_validate(t) for t in tasks],
+                next_cursor=tasks.next_cursor,
             )
-            return TaskList(tasks=[TaskDetail.model_validate(t) for t in tasks])
         else:
             task_features = await task_features_logic.list_tasks_by_feature(
-                feature_id=feature_id, db=db
+                feature_id=feature_id, db=db, page=page
             )
             return TaskFeatureList(
-                features=[TaskFeatureDetail.model_validate(tf) for tf in task_features]
+                features=[TaskFeatureDetail.model_validate(tf) for tf in task_features],
+                next_cursor=task_features.next_cursor,
             )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except FeatureNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -6,15 +6,17 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
     PrincipalNotFoundException,
     TaskNotFoundException,
     TaskOwnerAlreadyExistsException,
     TaskOwnerNotFoundException,
 )
 from ...logic.v1 import task_owners as task_owners_logic
+from ...schemas.pagination import PageParams
 from ...schemas.task_owner import (
     TaskOwnerCreate,
     TaskOwnerDetail,
@@ -22,7 +24,7 @@ from ...schemas.task_owner import (
     TaskOwnerUpdate,
 )
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
 
 router = APIRouter(prefix="/tasks/{task_id}/owners", tags=["task-owners"])
 
@@ -32,7 +34,7 @@ async def add_task_owner(
     task_id: UUID,
     owner_data: TaskOwnerCreate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TaskOwnerDetail:
     """Add a new owner to a task."""
     user_id = UUID(token_data.sub)
@@ -66,14 +68,23 @@ async def add_task_owner(
 async def list_task_owners(
     task_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> TaskOwnerList:
     """List all owners for a task."""
     try:
-        owners = await task_owners_logic.list_task_owners(task_id=task_id, db=db)
+        owners = await task_owners_logic.list_task_owners(
+            task_id=task_id, db=db, page=page
+        )
         return TaskOwnerList(
-            owners=[TaskOwnerDetail.model_validate(owner) for owner in owners]
+            owners=[TaskOwnerDetail.model_validate(owner) for owner in owners],
+            next_cursor=owners.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except TaskNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -86,7 +97,7 @@ async def get_task_owner(
     task_id: UUID,
     principal_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> TaskOwnerDetail:
     """Get a single task owner relationship."""
     try:
@@ -109,7 +120,7 @@ async def update_task_owner(
     principal_id: UUID,
     owner_data: TaskOwnerUpdate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TaskOwnerDetail:
     """Update a task owner relationship."""
     user_id = UUID(token_data.sub)
@@ -136,7 +147,7 @@ async def remove_task_owner(
     principal_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
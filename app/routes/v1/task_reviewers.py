@@ -6,15 +6,17 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
     PrincipalNotFoundException,
     TaskNotFoundException,
     TaskReviewerAlreadyExistsException,
     TaskReviewerNotFoundException,
 )
 from ...logic.v1 import task_reviewers as task_reviewers_logic
+from ...schemas.pagination import PageParams
 from ...schemas.task_reviewer import (
     TaskReviewerCreate,
     TaskReviewerDetail,
@@ -22,7 +24,7 @@ from ...schemas.task_reviewer import (
     TaskReviewerUpdate,
 )
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
 
 router = APIRouter(prefix="/tasks/{task_id}/reviewers", tags=["task-reviewers"])
 
@@ -32,7 +34,7 @@ async def add_task_reviewer(
     task_id: UUID,
     reviewer_data: TaskReviewerCreate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TaskReviewerDetail:
     """Add a new reviewer to a task."""
     user_id = UUID(token_data.sub)
@@ -66,18 +68,25 @@ async def add_task_reviewer(
 async def list_task_reviewers(
     task_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> TaskReviewerList:
     """List all reviewers for a task."""
     try:
         reviewers = await task_reviewers_logic.list_task_reviewers(
-            task_id=task_id, db=db
+            task_id=task_id, db=db, page=page
         )
         return TaskReviewerList(
             reviewers=[
                 TaskReviewerDetail.model_validate(reviewer) for reviewer in reviewers
-            ]
+            ],
+            next_cursor=reviewers.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except TaskNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -90,7 +99,7 @@ async def get_task_reviewer(
     task_id: UUID,
     principal_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> TaskReviewerDetail:
     """Get a single task reviewer relationship."""
     try:
@@ -113,7 +122,7 @@ async def update_task_reviewer(
     principal_id: UUID,
     reviewer_data: TaskReviewerUpdate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TaskReviewerDetail:
     """Update a task reviewer relationship."""
     user_id = UUID(token_data.sub)
@@ -140,7 +149,7 @@ async def remove_task_reviewer(
     principal_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
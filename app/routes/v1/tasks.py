@@ -1,32 +1,81 @@
 """Task management endpoints for creating, listing, updating, and deleting tasks."""
 
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
+    InvalidFieldsException,
     TaskNotFoundException,
     UnauthorizedOrganizationAccessException,
 )
+from ...logic.pagination import SortKey
 from ...logic.v1 import tasks as tasks_logic
-from ...schemas.task import TaskCreate, TaskDetail, TaskList, TaskUpdate
+from ...models.k_feature import ReviewResult
+from ...models.k_task import TaskStatus
+from ...schemas.pagination import PageParams
+from ...schemas.task import (
+    TaskCreate,
+    TaskDetail,
+    TaskFilters,
+    TaskList,
+    TaskSortField,
+    TaskUpdate,
+)
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_fields, get_page_params
+from ..serialization import json_response, page_response
+from ..streaming import NDJSON_RESPONSES, get_list_db, ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
+def get_task_filters(
+    status: Annotated[
+        list[TaskStatus] | None, Query(description="Only tasks in these statuses")
+    ] = None,
+    team_id: Annotated[
+        UUID | None, Query(description="Only tasks of this team")
+    ] = None,
+    review_result: Annotated[
+        list[ReviewResult] | None,
+        Query(description="Only tasks with these review results"),
+    ] = None,
+    guestimate_min: Annotated[
+        float | None, Query(ge=0, description="Minimum guestimate")
+    ] = None,
+    guestimate_max: Annotated[
+        float | None, Query(ge=0, description="Maximum guestimate")
+    ] = None,
+    modified_since: Annotated[
+        datetime | None, Query(description="Only tasks modified at or after this time")
+    ] = None,
+) -> TaskFilters:
+    """Get task list filters from the query string."""
+    return TaskFilters(
+        status=status,
+        team_id=team_id,
+        review_result=review_result,
+        guestimate_min=guestimate_min,
+        guestimate_max=guestimate_max,
+        modified_since=modified_since,
+    )
+
+
 @router.post("", response_model=TaskDetail, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_data: TaskCreate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> TaskDetail:
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+) -> Response:
     """Create a new task."""
     user_id = UUID(token_data.sub)
 
@@ -37,7 +86,7 @@ async def create_task(
             org_id=org_id,
             db=db,
         )
-        return TaskDetail.model_validate(task)
+        return json_response(TaskDetail, task, status.HTTP_201_CREATED)
     except UnauthorizedOrganizationAccessException as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -45,18 +94,50 @@ async def create_task(
         ) from e
 
 
-@router.get("", response_model=TaskList)
+@router.get("", response_model=TaskList, responses=NDJSON_RESPONSES)
 async def list_tasks(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> TaskList:
-    """List all tasks in the given organization."""
+    db: Annotated[AsyncSession, Depends(get_list_db, scope="function")],
+    ndjson: Annotated[bool, Depends(wants_ndjson)],
+    page: Annotated[PageParams, Depends(get_page_params)],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
+    filters: Annotated[TaskFilters, Depends(get_task_filters)],
+    sort: Annotated[TaskSortField, Query(description="Field to sort by")] = "created",
+    direction: Annotated[
+        Literal["asc", "desc"], Query(description="Sort direction")
+    ] = "asc",
+) -> Response:
+    """List tasks in the given organization, optionally filtered and sorted."""
     user_id = UUID(token_data.sub)
 
     try:
-        tasks = await tasks_logic.list_tasks(org_id=org_id, user_id=user_id, db=db)
-        return TaskList(tasks=[TaskDetail.model_validate(task) for task in tasks])
+        if ndjson:
+            batches = await tasks_logic.stream_tasks(
+                org_id=org_id,
+                user_id=user_id,
+                db=db,
+                fields=fields,
+                filters=filters,
+                sort=SortKey(sort, descending=direction == "desc"),
+            )
+            return ndjson_response(batches, None if fields else TaskDetail)
+
+        tasks = await tasks_logic.list_tasks(
+            org_id=org_id,
+            user_id=user_id,
+            db=db,
+            page=page,
+            fields=fields,
+            filters=filters,
+            sort=SortKey(sort, descending=direction == "desc"),
+        )
+        return page_response("tasks", dict[str, Any] if fields else TaskDetail, tasks)
+    except (InvalidCursorException, InvalidFieldsException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except UnauthorizedOrganizationAccessException as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -64,13 +145,14 @@ async def list_tasks(
         ) from e
 
 
-@router.get("/{task_id}", response_model=TaskDetail)
+@router.get("/{task_id}", response_model=TaskDetail | dict[str, Any])
 async def get_task(
     task_id: UUID,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> TaskDetail:
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
+) -> Response:
     """Get a single task by ID."""
     user_id = UUID(token_data.sub)
 
@@ -80,8 +162,14 @@ async def get_task(
             org_id=org_id,
             user_id=user_id,
             db=db,
+            fields=fields,
         )
-        return TaskDetail.model_validate(task)
+        return json_response(dict[str, Any] if fields else TaskDetail, task)
+    except InvalidFieldsException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except TaskNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -100,8 +188,8 @@ async def update_task(
     task_data: TaskUpdate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> TaskDetail:
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+) -> Response:
     """Update a task."""
     user_id = UUID(token_data.sub)
 
@@ -113,7 +201,7 @@ async def update_task(
             org_id=org_id,
             db=db,
         )
-        return TaskDetail.model_validate(task)
+        return json_response(TaskDetail, task)
     except TaskNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -132,7 +220,7 @@ async def delete_task(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[bool, Query(description="Hard delete the task")] = False,
 ) -> None:
     """Delete a task."""
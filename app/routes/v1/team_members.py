@@ -6,14 +6,16 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
     TeamMemberAlreadyExistsException,
     TeamMemberNotFoundException,
     TeamNotFoundException,
 )
 from ...logic.v1 import team_members as team_members_logic
+from ...schemas.pagination import PageParams
 from ...schemas.team_member import (
     TeamMemberCreate,
     TeamMemberDetail,
@@ -21,7 +23,7 @@ from ...schemas.team_member import (
     TeamMemberUpdate,
 )
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
 
 router = APIRouter(prefix="/teams/{team_id}/members", tags=["team-members"])
 
@@ -31,7 +33,7 @@ async def add_team_member(
     team_id: UUID,
     member_data: TeamMemberCreate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TeamMemberDetail:
     """Add a new member to a team."""
     user_id = UUID(token_data.sub)
@@ -60,14 +62,23 @@ async def add_team_member(
 async def list_team_members(
     team_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> TeamMemberList:
     """List all members of a team."""
     try:
-        members = await team_members_logic.list_team_members(team_id=team_id, db=db)
+        members = await team_members_logic.list_team_members(
+            team_id=team_id, db=db, page=page
+        )
         return TeamMemberList(
-            members=[TeamMemberDetail.model_validate(member) for member in members]
+            members=[TeamMemberDetail.model_validate(member) for member in members],
+            next_cursor=members.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except TeamNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -80,7 +91,7 @@ async def get_team_member(
     team_id: UUID,
     principal_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> TeamMemberDetail:
     """Get a single team member."""
     try:
@@ -103,7 +114,7 @@ async def update_team_member(
     principal_id: UUID,
     member_data: TeamMemberUpdate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TeamMemberDetail:
     """Update a team member."""
     user_id = UUID(token_data.sub)
@@ -130,7 +141,7 @@ async def remove_team_member(
     principal_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
@@ -6,14 +6,16 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
     TeamNotFoundException,
     TeamReviewerAlreadyExistsException,
     TeamReviewerNotFoundException,
 )
 from ...logic.v1 import team_reviewers as team_reviewers_logic
+from ...schemas.pagination import PageParams
 from ...schemas.team_reviewer import (
     TeamReviewerCreate,
     TeamReviewerDetail,
@@ -21,7 +23,7 @@ from ...schemas.team_reviewer import (
     TeamReviewerUpdate,
 )
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_page_params
 
 router = APIRouter(prefix="/teams/{team_id}/reviewers", tags=["team-reviewers"])
 
@@ -31,7 +33,7 @@ async def add_team_reviewer(
     team_id: UUID,
     reviewer_data: TeamReviewerCreate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TeamReviewerDetail:
     """Add a new reviewer to a team."""
     user_id = UUID(token_data.sub)
@@ -60,18 +62,25 @@ async def add_team_reviewer(
 async def list_team_reviewers(
     team_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> TeamReviewerList:
     """List all reviewers of a team."""
     try:
         reviewers = await team_reviewers_logic.list_team_reviewers(
-            team_id=team_id, db=db
+            team_id=team_id, db=db, page=page
         )
         return TeamReviewerList(
             reviewers=[
                 TeamReviewerDetail.model_validate(reviewer) for reviewer in reviewers
-            ]
+            ],
+            next_cursor=reviewers.next_cursor,
         )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except TeamNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -84,7 +93,7 @@ async def get_team_reviewer(
     team_id: UUID,
     principal_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> TeamReviewerDetail:
     """Get a single team reviewer."""
     try:
@@ -107,7 +116,7 @@ async def update_team_reviewer(
     principal_id: UUID,
     reviewer_data: TeamReviewerUpdate,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TeamReviewerDetail:
     """Update a team reviewer."""
     user_id = UUID(token_data.sub)
@@ -134,7 +143,7 @@ async def remove_team_reviewer(
     principal_id: UUID,
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[
         bool, Query(description="Hard delete the relationship")
     ] = False,
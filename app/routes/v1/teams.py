@@ -1,23 +1,26 @@
 """Team management endpoints for creating, listing, updating, and deleting teams."""
 
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
+    InvalidFieldsException,
     TeamAlreadyExistsException,
     TeamNotFoundException,
     TeamUpdateConflictException,
     UnauthorizedOrganizationAccessException,
 )
 from ...logic.v1 import teams as teams_logic
+from ...schemas.pagination import PageParams
 from ...schemas.team import TeamCreate, TeamDetail, TeamList, TeamUpdate
 from ...schemas.user import TokenData, UserDetail
-from ..deps import get_current_token, get_current_user
+from ..deps import get_current_token, get_current_user, get_fields, get_page_params
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
@@ -27,7 +30,7 @@ async def create_team(
     team_data: TeamCreate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TeamDetail:
     """Create a new team."""
     user_id = UUID(token_data.sub)
@@ -56,14 +59,32 @@ async def create_team(
 async def list_teams(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
 ) -> TeamList:
     """List all teams in the given organization."""
     user_id = UUID(token_data.sub)
 
     try:
-        teams = await teams_logic.list_teams(org_id=org_id, user_id=user_id, db=db)
-        return TeamList(teams=[TeamDetail.model_validate(team) for team in teams])
+        if fields is not None:
+            rows = await teams_logic.list_teams(
+                org_id=org_id, user_id=user_id, db=db, page=page, fields=fields
+            )
+            return TeamList(teams=rows, next_cursor=rows.next_cursor)
+
+        teams = await teams_logic.list_teams(
+            org_id=org_id, user_id=user_id, db=db, page=page
+        )
+        return TeamList(
+            teams=[TeamDetail.model_validate(team) for team in teams],
+            next_cursor=teams.next_cursor,
+        )
+    except (InvalidCursorException, InvalidFieldsException) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except UnauthorizedOrganizationAccessException as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -71,13 +92,14 @@ async def list_teams(
         ) from e
 
 
-@router.get("/{team_id}", response_model=TeamDetail)
+@router.get("/{team_id}", response_model=TeamDetail | dict[str, Any])
 async def get_team(
     team_id: UUID,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> TeamDetail:
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    fields: Annotated[list[str] | None, Depends(get_fields)],
+) -> TeamDetail | dict[str, Any]:
     """Get a single team by ID."""
     user_id = UUID(token_data.sub)
 
@@ -87,8 +109,16 @@ async def get_team(
             org_id=org_id,
             user_id=user_id,
             db=db,
+            fields=fields,
         )
+        if isinstance(team, dict):
+            return team
         return TeamDetail.model_validate(team)
+    except InvalidFieldsException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
     except TeamNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -107,7 +137,7 @@ async def update_team(
     team_data: TeamUpdate,
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> TeamDetail:
     """Update a team."""
     user_id = UUID(token_data.sub)
@@ -144,7 +174,7 @@ async def delete_team(
     org_id: Annotated[UUID, Query(description="Organization ID")],
     token_data: Annotated[TokenData, Depends(get_current_token)],
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[bool, Query(description="Hard delete the team")] = False,
 ) -> None:
     """Delete a team (cascades to team members)."""
@@ -1,12 +1,13 @@
 """Transaction batch API endpoint for executing multiple CRUD operations."""
 
+from collections.abc import AsyncGenerator
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db_session
 from ...logic.v1 import txs as txs_logic
 from ...schemas.txs import TransactionsRequest, TransactionsResponse
 from ...schemas.user import TokenData
@@ -15,11 +16,23 @@ from ..deps import get_current_token
 router = APIRouter(prefix="/txs", tags=["transactions"])
 
 
+async def get_txs_db(request: TransactionsRequest) -> AsyncGenerator[AsyncSession]:
+    """Dependency yielding a single session for a transaction batch.
+
+    Batches made only of get and list operations use a read session (the replica,
+    when one is configured); anything else uses the primary. Declare it with
+    ``scope="function"``, as for ``get_db``.
+    """
+    read_only = txs_logic.is_read_only_request(request)
+    async with get_db_session(read_only=read_only) as session:
+        yield session
+
+
 @router.post("", response_model=TransactionsResponse, status_code=status.HTTP_200_OK)
 async def execute_transactions(
     request: TransactionsRequest,
     token_data: Annotated[TokenData, Depends(get_current_token)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_txs_db, scope="function")],
 ) -> TransactionsResponse:
     """Execute a batch of transactions containing CRUD operations.
 
@@ -37,7 +50,7 @@ async def execute_transactions(
     Args:
         request: Transaction batch request containing transactions and operations
         token_data: Authenticated user token data
-        db: Database session
+        db: Database session (a read session when every operation is a get or list)
 
     Returns:
         TransactionsResponse with overall status and detailed results for each transaction/operation
@@ -6,14 +6,17 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.db.database import get_db
+from ...core.db.database import get_db, get_read_db
 from ...core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
+    InvalidCursorException,
+    PasswordHashingUnavailableException,
     UserAlreadyExistsException,
     UserNotFoundException,
     UserUpdateConflictException,
 )
 from ...logic.v1 import users as users_logic
+from ...schemas.pagination import PageParams
 from ...schemas.user import (
     User,
     UserCreate,
@@ -24,7 +27,7 @@ from ...schemas.user import (
     UserUpdatePrimaryPhone,
     UserUpdateUsername,
 )
-from ..deps import get_current_user
+from ..deps import get_current_user, get_page_params
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -33,7 +36,7 @@ router = APIRouter(prefix="/users", tags=["users"])
 async def create_user(
     user_data: UserCreate,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> UserDetail:
     """Create a new user.
 
@@ -58,22 +61,38 @@ async def create_user(
             status_code=status.HTTP_409_CONFLICT,
             detail=e.message,
         ) from e
+    except PasswordHashingUnavailableException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": "1"},
+        ) from e
 
 
 @router.get("", response_model=UserList)
 async def list_users(
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
+    page: Annotated[PageParams, Depends(get_page_params)],
 ) -> UserList:
     """List all users in the current user's scope."""
-    users = await users_logic.list_users(scope=current_user.scope, db=db)
-    return UserList(users=[User.model_validate(user) for user in users])
+    try:
+        users = await users_logic.list_users(scope=current_user.scope, db=db, page=page)
+        return UserList(
+            users=[User.model_validate(user) for user in users],
+            next_cursor=users.next_cursor,
+        )
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
 
 
 @router.get("/me", response_model=UserDetail)
 async def get_current_user_info(
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> UserDetail:
     """Get current authenticated user information."""
     return await users_logic.get_current_user_info(current_user, db)
@@ -83,7 +102,7 @@ async def get_current_user_info(
 async def get_user(
     user_id: UUID,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db, scope="function")],
 ) -> User:
     """Get a single user by ID."""
     try:
@@ -105,7 +124,7 @@ async def update_user(
     user_id: UUID,
     user_data: UserUpdate,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> UserDetail:
     """Update a user.
 
@@ -138,7 +157,7 @@ async def update_user_username(
     user_id: UUID,
     user_data: UserUpdateUsername,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> UserDetail:
     """Update a user's username.
 
@@ -176,7 +195,7 @@ async def update_user_email(
     user_id: UUID,
     user_data: UserUpdateEmail,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> UserDetail:
     """Update a user's primary email.
 
@@ -209,7 +228,7 @@ async def update_user_primary_phone(
     user_id: UUID,
     user_data: UserUpdatePrimaryPhone,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> UserDetail:
     """Update a user's primary phone.
 
@@ -241,7 +260,7 @@ async def update_user_primary_phone(
 async def delete_user(
     user_id: UUID,
     current_user: Annotated[UserDetail, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
     hard_delete: Annotated[bool, Query(description="Hard delete the user")] = False,
 ) -> None:
     """Delete a user.
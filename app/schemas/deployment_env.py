@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -44,7 +45,8 @@ class DeploymentEnvDetail(DeploymentEnv):
 class DeploymentEnvList(SecureReprMixin, BaseModel):
     """Schema for deployment environment list response."""
 
-    deployment_envs: list[DeploymentEnvDetail]
+    deployment_envs: list[DeploymentEnvDetail] | list[dict[str, Any]]
+    next_cursor: str | None = None
 
 
 __all__ = [
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -32,6 +33,8 @@ class Doc(SecureReprMixin, BaseModel):
     name: str
     description: str | None
     content: str
+    content_length: int | None = None
+    content_hash: str | None = None
     meta: dict
 
     model_config = ConfigDict(from_attributes=True)
@@ -47,10 +50,51 @@ class DocDetail(Doc):
     last_modified_by: UUID
 
 
+class DocSummary(SecureReprMixin, BaseModel):
+    """Schema for doc listing response: metadata without the content."""
+
+    id: UUID
+    org_id: UUID
+    name: str
+    description: str | None
+    content_length: int | None
+    content_hash: str | None
+    excerpt: str | None = None
+    meta: dict
+    deleted_at: datetime | None
+    created: datetime
+    created_by: UUID
+    last_modified: datetime
+    last_modified_by: UUID
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class DocList(SecureReprMixin, BaseModel):
     """Schema for doc list response."""
 
-    docs: list[DocDetail]
+    docs: list[DocSummary] | list[DocDetail] | list[dict[str, Any]]
+    next_cursor: str | None = None
+
 
+class DocContent(SecureReprMixin, BaseModel):
+    """Schema for a slice of doc content.
 
-__all__ = ["DocCreate", "DocUpdate", "Doc", "DocDetail", "DocList"]
+    Positions count characters; ``end`` is exclusive.
+    """
+
+    content: str
+    start: int
+    end: int
+    content_length: int
+
+
+__all__ = [
+    "DocCreate",
+    "DocUpdate",
+    "Doc",
+    "DocDetail",
+    "DocSummary",
+    "DocList",
+    "DocContent",
+]
@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.core.repr_mixin import SecureReprMixin
 
@@ -70,7 +71,26 @@ class FeatureDetail(Feature):
 class FeatureList(SecureReprMixin, BaseModel):
     """Schema for feature list response."""
 
-    features: list[FeatureDetail]
+    features: list[FeatureDetail] | list[dict[str, Any]]
+    next_cursor: str | None = None
+
+
+class FeatureFilters(SecureReprMixin, BaseModel):
+    """Schema for feature list filters."""
+
+    feature_type: list[FeatureType] | None = None
+    parent: UUID | None = None
+    review_result: list[ReviewResult] | None = None
+
+    @field_validator("feature_type", "review_result", mode="before")
+    @classmethod
+    def wrap_single_value(cls, v: Any) -> Any:
+        """Accept a single value where a list of values is expected."""
+        return [v] if isinstance(v, str) else v
+
+
+# Columns a feature list can be sorted by (keyset pagination needs non-null columns)
+FeatureSortField = Literal["created", "last_modified", "name"]
 
 
 __all__ = [
@@ -79,4 +99,6 @@ __all__ = [
     "Feature",
     "FeatureDetail",
     "FeatureList",
+    "FeatureFilters",
+    "FeatureSortField",
 ]
@@ -47,6 +47,7 @@ class FeatureDocList(SecureReprMixin, BaseModel):
     """Schema for feature doc relationship list response."""
 
     docs: list[FeatureDocDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
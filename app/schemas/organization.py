@@ -81,6 +81,7 @@ class OrganizationList(SecureReprMixin, BaseModel):
     """Schema for organization list response."""
 
     organizations: list[OrganizationDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
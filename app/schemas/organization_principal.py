@@ -46,6 +46,7 @@ class OrganizationPrincipalList(SecureReprMixin, BaseModel):
     """Schema for organization principal list response."""
 
     principals: list[OrganizationPrincipalDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
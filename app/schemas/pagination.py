@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+
+from app.config import settings
+from app.core.repr_mixin import SecureReprMixin
+
+
+class PageParams(SecureReprMixin, BaseModel):
+    """Keyset pagination parameters for list requests."""
+
+    limit: int = Field(
+        default=settings.list_page_default_size,
+        ge=1,
+        le=settings.list_page_max_size,
+        description="Maximum number of items to return",
+    )
+    cursor: str | None = Field(
+        default=None, description="Cursor returned as next_cursor by the previous page"
+    )
+
+
+__all__ = [
+    "PageParams",
+]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -47,7 +48,8 @@ class ProjectDetail(Project):
 class ProjectList(SecureReprMixin, BaseModel):
     """Schema for project list response."""
 
-    projects: list[ProjectDetail]
+    projects: list[ProjectDetail] | list[dict[str, Any]]
+    next_cursor: str | None = None
 
 
 __all__ = ["ProjectCreate", "ProjectUpdate", "Project", "ProjectDetail", "ProjectList"]
@@ -47,6 +47,7 @@ class ProjectTeamList(SecureReprMixin, BaseModel):
     """Schema for project team list response."""
 
     teams: list[ProjectTeamDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
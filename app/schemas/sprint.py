@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -52,7 +53,8 @@ class SprintDetail(Sprint):
 class SprintList(SecureReprMixin, BaseModel):
     """Schema for sprint list response."""
 
-    sprints: list[SprintDetail]
+    sprints: list[SprintDetail] | list[dict[str, Any]]
+    next_cursor: str | None = None
 
 
 __all__ = ["SprintCreate", "SprintUpdate", "Sprint", "SprintDetail", "SprintList"]
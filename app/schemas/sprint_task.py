@@ -47,6 +47,7 @@ class SprintTaskList(SecureReprMixin, BaseModel):
     """Schema for sprint task list response."""
 
     tasks: list[SprintTaskDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
@@ -47,6 +47,7 @@ class SprintTeamList(SecureReprMixin, BaseModel):
     """Schema for sprint team list response."""
 
     teams: list[SprintTeamDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.core.repr_mixin import SecureReprMixin
 
@@ -62,7 +63,29 @@ class TaskDetail(Task):
 class TaskList(SecureReprMixin, BaseModel):
     """Schema for task list response."""
 
-    tasks: list[TaskDetail]
+    tasks: list[TaskDetail] | list[dict[str, Any]]
+    next_cursor: str | None = None
+
+
+class TaskFilters(SecureReprMixin, BaseModel):
+    """Schema for task list filters."""
+
+    status: list[TaskStatus] | None = None
+    team_id: UUID | None = None
+    review_result: list[ReviewResult] | None = None
+    guestimate_min: float | None = Field(None, ge=0)
+    guestimate_max: float | None = Field(None, ge=0)
+    modified_since: datetime | None = None
+
+    @field_validator("status", "review_result", mode="before")
+    @classmethod
+    def wrap_single_value(cls, v: Any) -> Any:
+        """Accept a single value where a list of values is expected."""
+        return [v] if isinstance(v, str) else v
+
+
+# Columns a task list can be sorted by (keyset pagination needs non-null columns)
+TaskSortField = Literal["created", "last_modified", "status"]
 
 
 __all__ = [
@@ -71,4 +94,6 @@ __all__ = [
     "Task",
     "TaskDetail",
     "TaskList",
+    "TaskFilters",
+    "TaskSortField",
 ]
@@ -47,6 +47,7 @@ class TaskDeploymentEnvList(SecureReprMixin, BaseModel):
     """Schema for task deployment environment relationship list response."""
 
     deployment_envs: list[TaskDeploymentEnvDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
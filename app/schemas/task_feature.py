@@ -47,6 +47,7 @@ class TaskFeatureList(SecureReprMixin, BaseModel):
     """Schema for task feature relationship list response."""
 
     features: list[TaskFeatureDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
@@ -47,6 +47,7 @@ class TaskOwnerList(SecureReprMixin, BaseModel):
     """Schema for task owner relationship list response."""
 
     owners: list[TaskOwnerDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
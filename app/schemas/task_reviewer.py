@@ -47,6 +47,7 @@ class TaskReviewerList(SecureReprMixin, BaseModel):
     """Schema for task reviewer relationship list response."""
 
     reviewers: list[TaskReviewerDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
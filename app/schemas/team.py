@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -44,7 +45,8 @@ class TeamDetail(Team):
 class TeamList(SecureReprMixin, BaseModel):
     """Schema for team list response."""
 
-    teams: list[TeamDetail]
+    teams: list[TeamDetail] | list[dict[str, Any]]
+    next_cursor: str | None = None
 
 
 __all__ = ["TeamCreate", "TeamUpdate", "Team", "TeamDetail", "TeamList"]
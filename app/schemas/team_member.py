@@ -47,6 +47,7 @@ class TeamMemberList(SecureReprMixin, BaseModel):
     """Schema for team member list response."""
 
     members: list[TeamMemberDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
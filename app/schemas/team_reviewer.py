@@ -47,6 +47,7 @@ class TeamReviewerList(SecureReprMixin, BaseModel):
     """Schema for team reviewer list response."""
 
     reviewers: list[TeamReviewerDetail]
+    next_cursor: str | None = None
 
 
 __all__ = [
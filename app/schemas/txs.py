@@ -5,6 +5,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.config import settings
 from app.core.repr_mixin import SecureReprMixin
 
 # ============================================================================
@@ -53,10 +54,17 @@ class SortCriteria(SecureReprMixin, BaseModel):
 
 
 class PaginationParams(SecureReprMixin, BaseModel):
-    """Pagination parameters for list operations."""
+    """Keyset pagination parameters for list operations."""
 
-    page: int = Field(1, ge=1, description="Page number")
-    page_size: int = Field(100, ge=1, le=1000, description="Number of items per page")
+    cursor: str | None = Field(
+        None, description="Cursor returned as next_cursor by the previous page"
+    )
+    page_size: int = Field(
+        settings.list_page_default_size,
+        ge=1,
+        le=settings.list_page_max_size,
+        description="Number of items per page",
+    )
 
 
 class ListParams(SecureReprMixin, BaseModel):
@@ -94,10 +94,17 @@ class UserDetail(User):
     last_modified_by: UUID
 
 
+class FrozenUserDetail(UserDetail):
+    """User detail that cannot be modified, so one instance can serve many requests."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
 class UserList(SecureReprMixin, BaseModel):
     """Schema for user list response."""
 
     users: list[User]
+    next_cursor: str | None = None
 
 
 class Token(SecureReprMixin, BaseModel):
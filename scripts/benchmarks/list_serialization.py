@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Benchmark of response serialization for the task and feature list endpoints.
+
+Drives minimal FastAPI apps directly through ASGI (no server, no database) whose
+routes return in-memory ``KTask``/``KFeature`` rows, isolating the cost of turning
+a page of rows into a JSON body. Two paths are compared for each list:
+
+- ``model``: the route builds ``TaskDetail`` instances from the rows and FastAPI
+  validates the result against ``response_model`` again before encoding it, as the
+  list routes did before ``page_response``
+- ``fast``: the route returns ``page_response``, validating the rows once and
+  encoding them with pydantic-core's compiled serializer
+
+Usage:
+    python scripts/benchmarks/list_serialization.py [--rows 1000 10000] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid7
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from fastapi import FastAPI, Response  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+from starlette.types import ASGIApp, Message  # noqa: E402
+
+from app.logic.pagination import Page  # noqa: E402
+from app.models import KFeature, KTask  # noqa: E402
+from app.models.k_feature import FeatureType  # noqa: E402
+from app.routes.serialization import page_response  # noqa: E402
+from app.schemas.feature import FeatureDetail, FeatureList  # noqa: E402
+from app.schemas.task import TaskDetail, TaskList  # noqa: E402
+
+
+def make_tasks(count: int) -> list[KTask]:
+    """Build task rows with every column populated."""
+    org_id, team_id, user_id = uuid7(), uuid7(), uuid7()
+    created = datetime(2025, 1, 1)
+    return [
+        KTask(
+            id=uuid7(),
+            org_id=org_id,
+            summary=f"Task {i}",
+            description="Description " * 10,
+            team_id=team_id,
+            guestimate=float(i % 13 + 1),
+            meta={"index": i, "labels": ["a", "b"]},
+            created=created + timedelta(seconds=i),
+            created_by=user_id,
+            last_modified=created + timedelta(seconds=i),
+            last_modified_by=user_id,
+        )
+        for i in range(count)
+    ]
+
+
+def make_features(count: int) -> list[KFeature]:
+    """Build feature rows with every column populated."""
+    org_id, user_id = uuid7(), uuid7()
+    feature_type = next(iter(FeatureType))
+    created = datetime(2025, 1, 1)
+    return [
+        KFeature(
+            id=uuid7(),
+            org_id=org_id,
+            name=f"Feature {i}",
+            parent_path="/root",
+            feature_type=feature_type,
+            summary=f"Feature summary {i}",
+            details="Details " * 10,
+            guestimate=float(i % 13 + 1),
+            meta={"index": i, "labels": ["a", "b"]},
+            created=created + timedelta(seconds=i),
+            created_by=user_id,
+            last_modified=created + timedelta(seconds=i),
+            last_modified_by=user_id,
+        )
+        for i in range(count)
+    ]
+
+
+def build_app(
+    path: str,
+    rows: list[SQLModel],
+    list_schema: type[BaseModel],
+    detail_schema: type[BaseModel],
+    key: str,
+) -> FastAPI:
+    """Build an app serving the rows through the ``model`` and ``fast`` paths."""
+    app = FastAPI()
+
+    @app.get(f"/model{path}", response_model=list_schema)
+    async def model_path() -> Any:
+        items = [detail_schema.model_validate(row) for row in rows]
+        return list_schema(**{key: items, "next_cursor": None})
+
+    @app.get(f"/fast{path}", response_model=list_schema)
+    async def fast_path() -> Response:
+        return page_response(key, detail_schema, Page(rows))
+
+    return app
+
+
+def scope(path: str) -> dict[str, Any]:
+    """Build the ASGI scope of a GET request."""
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "server": ("bench", 80),
+    }
+
+
+async def run_round(app: ASGIApp, path: str, requests: int) -> float:
+    """Send ``requests`` sequential requests and return milliseconds per request."""
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        return None
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(scope(path), receive, send)
+    return (time.perf_counter() - started) / requests * 1000
+
+
+async def benchmark(
+    row_counts: list[int], requests: int, rounds: int
+) -> dict[tuple[str, int, str], float]:
+    """Run both paths of every endpoint and return the median ms per request."""
+    endpoints: dict[str, tuple[Callable[[int], list[Any]], type, type, str]] = {
+        "/tasks": (make_tasks, TaskList, TaskDetail, "tasks"),
+        "/features": (make_features, FeatureList, FeatureDetail, "features"),
+    }
+    results: dict[tuple[str, int, str], float] = {}
+    for path, (make_rows, list_schema, detail_schema, key) in endpoints.items():
+        for count in row_counts:
+            app = build_app(path, make_rows(count), list_schema, detail_schema, key)
+            for name in ("model", "fast"):
+                await run_round(app, f"/{name}{path}", 1)  # warm up
+                samples = [
+                    await run_round(app, f"/{name}{path}", requests)
+                    for _ in range(rounds)
+                ]
+                results[path, count, name] = statistics.median(samples)
+    return results
+
+
+def main() -> int:
+    """Run the benchmark and print per-request timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--requests", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    results = asyncio.run(benchmark(args.rows, args.requests, args.rounds))
+    for path in ("/tasks", "/features"):
+        for count in args.rows:
+            model = results[path, count, "model"]
+            fast = results[path, count, "fast"]
+            print(
+                f"{path:>10} {count:>6} rows: model {model:8.1f} ms  "
+                f"fast {fast:8.1f} ms  ({model / fast:4.1f}x)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
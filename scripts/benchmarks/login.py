@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Throughput benchmark of the password login pipeline.
+
+Seeds a set of users, then runs ``perform_login`` - the logic behind
+``POST /api/auth/login`` - for them with a fixed number of logins in flight. Each
+login is split into stages by wrapping the functions it calls:
+
+- ``lookup``: the principal and password hash query
+- ``bcrypt``: the password check, including time queued for a hasher thread
+- ``tokens``: encoding the access and refresh tokens
+- ``total``: the whole login
+
+and the benchmark reports logins/sec and p50/p99 latency per stage.
+
+Without ``--database-url`` the users live in a temporary SQLite database as a
+stand-in for Postgres. With it, the tables must already exist (run the Alembic
+migrations); the seeded users are deleted again afterwards.
+
+Usage:
+    python scripts/benchmarks/login.py [--logins 200] [--concurrency 16]
+        [--bcrypt-rounds 12] [--workers 4] [--database-url URL]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+from uuid import uuid7
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import bcrypt  # noqa: E402
+from sqlalchemy import delete, select  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlmodel import SQLModel  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.core import auth as core_auth  # noqa: E402
+from app.core.password_hasher import PasswordHasher  # noqa: E402
+from app.logic import auth as auth_logic  # noqa: E402
+from app.models import KPrincipal, KPrincipalIdentity  # noqa: E402
+
+PASSWORD = "benchmark-password"
+USERNAME_PREFIX = "login-bench-"
+STAGES = ("lookup", "bcrypt", "tokens", "total")
+
+# Seconds spent in each stage by the login running in the current task
+_stages: ContextVar[dict[str, float]] = ContextVar("stages")
+
+
+def timed(stage: str, func: Callable[..., Awaitable[Any]]) -> Callable[..., Any]:
+    """Wrap an async function to add its duration to a stage of the current login."""
+
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            stages = _stages.get()
+            stages[stage] = stages.get(stage, 0.0) + time.perf_counter() - started
+
+    return wrapper
+
+
+def instrument() -> None:
+    """Wrap the functions ``perform_login`` calls so each login records its stages."""
+    core_auth.verify_password = timed("bcrypt", core_auth.verify_password)  # type: ignore[assignment]
+    auth_logic.authenticate_user = timed("authenticate", core_auth.authenticate_user)  # type: ignore[assignment]
+    auth_logic.create_access_token = timed("tokens", core_auth.create_access_token)  # type: ignore[assignment]
+    auth_logic.create_refresh_token = timed("tokens", core_auth.create_refresh_token)  # type: ignore[assignment]
+
+
+async def seed_users(engine: AsyncEngine, users: int, rounds: int) -> list[str]:
+    """Create human principals sharing one bcrypt hash and return their usernames."""
+    password_hash = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds)).decode()
+    usernames = []
+    async with async_sessionmaker(bind=engine)() as session:
+        for i in range(users):
+            principal_id = uuid7()
+            username = f"{USERNAME_PREFIX}{i}"
+            session.add(
+                KPrincipal(
+                    id=principal_id,
+                    scope="global",
+                    username=username,
+                    primary_email=f"{username}@example.com",
+                    human=True,
+                    enabled=True,
+                    first_name="Login",
+                    last_name="Bench",
+                    display_name=username,
+                    created_by=principal_id,
+                    last_modified_by=principal_id,
+                )
+            )
+            session.add(
+                KPrincipalIdentity(
+                    principal_id=principal_id,
+                    password=password_hash,
+                    created_by=principal_id,
+                    last_modified_by=principal_id,
+                )
+            )
+            usernames.append(username)
+        await session.commit()
+    return usernames
+
+
+async def delete_users(engine: AsyncEngine, usernames: list[str]) -> None:
+    """Delete the seeded principals and their identities."""
+    async with async_sessionmaker(bind=engine)() as session:
+        principal_ids = (
+            await session.scalars(
+                select(KPrincipal.id).where(KPrincipal.username.in_(usernames))  # type: ignore[attr-defined]
+            )
+        ).all()
+        await session.execute(
+            delete(KPrincipalIdentity).where(
+                KPrincipalIdentity.principal_id.in_(principal_ids)  # type: ignore[union-attr]
+            )
+        )
+        await session.execute(
+            delete(KPrincipal).where(KPrincipal.id.in_(principal_ids))  # type: ignore[attr-defined]
+        )
+        await session.commit()
+
+
+async def run_logins(
+    engine: AsyncEngine, usernames: list[str], logins: int, concurrency: int
+) -> tuple[list[dict[str, float]], float]:
+    """Run logins with ``concurrency`` in flight.
+
+    Returns:
+        The stage timings of every login, and the wall time of the whole run
+    """
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login(i: int) -> dict[str, float]:
+        stages: dict[str, float] = {}
+        _stages.set(stages)
+        async with semaphore, session_factory() as session:
+            started = time.perf_counter()
+            await auth_logic.perform_login(
+                usernames[i % len(usernames)], PASSWORD, session
+            )
+            stages["total"] = time.perf_counter() - started
+        # The lookup is what authenticate_user spends outside the password check
+        stages["lookup"] = stages.pop("authenticate") - stages["bcrypt"]
+        return stages
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(login(i) for i in range(logins)))
+    return results, time.perf_counter() - started
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Get a percentile of a list of samples (nearest rank)."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def benchmark(args: argparse.Namespace) -> None:
+    """Seed users, run the logins and print the report."""
+    temp_dir = None
+    database_url = args.database_url
+    if database_url is None:
+        temp_dir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite+aiosqlite:///{temp_dir.name}/login-bench.db"
+
+    engine = create_async_engine(database_url)
+    if temp_dir is not None:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    # Admit every login so the run measures queueing rather than 503s
+    hasher = PasswordHasher(max_workers=args.workers, max_queue=args.logins)
+    core_auth.password_hasher = hasher  # type: ignore[attr-defined]
+    instrument()
+
+    usernames = await seed_users(engine, args.users, args.bcrypt_rounds)
+    try:
+        # Warm up connections and the hasher threads
+        await run_logins(engine, usernames, args.concurrency, args.concurrency)
+        results, elapsed = await run_logins(
+            engine, usernames, args.logins, args.concurrency
+        )
+    finally:
+        if temp_dir is None:
+            await delete_users(engine, usernames)
+        await engine.dispose()
+        hasher.shutdown()
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    print(
+        f"{args.logins} logins, {args.concurrency} in flight, "
+        f"bcrypt rounds={args.bcrypt_rounds}, hasher threads={args.workers}, "
+        f"database={'SQLite stand-in' if temp_dir is not None else 'Postgres'}"
+    )
+    print(f"throughput: {args.logins / elapsed:8.1f} logins/sec")
+    for stage in STAGES:
+        samples = [result[stage] for result in results]
+        print(
+            f"{stage:>10}: p50 {statistics.median(samples) * 1000:8.2f} ms"
+            f"   p99 {percentile(samples, 0.99) * 1000:8.2f} ms"
+        )
+
+
+def main() -> int:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument(
+        "--bcrypt-rounds", type=int, default=settings.password_hash_rounds
+    )
+    parser.add_argument(
+        "--workers", type=int, default=settings.password_hash_max_workers
+    )
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
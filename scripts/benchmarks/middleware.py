@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of per-request overhead added by RequestContextMiddleware.
+
+Drives a minimal FastAPI app directly through ASGI (no server, no HTTP client) and
+compares three stacks:
+
+- ``none``: the app without the middleware
+- ``base-http``: the same context handling on Starlette's ``BaseHTTPMiddleware``,
+  as the middleware was implemented before it became a plain ASGI middleware
+- ``asgi``: the current ``RequestContextMiddleware``
+
+Usage:
+    python scripts/benchmarks/middleware.py [--requests 20000] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import uuid7
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from fastapi import FastAPI, Request  # noqa: E402
+from starlette.middleware.base import (  # noqa: E402
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+from starlette.responses import Response  # noqa: E402
+from starlette.types import ASGIApp, Message  # noqa: E402
+
+from app.core.context import (  # noqa: E402
+    principal_id_var,
+    request_id_var,
+    request_time_var,
+)
+from app.core.db.instrumentation import sql_instrumentation  # noqa: E402
+from app.core.middleware import RequestContextMiddleware  # noqa: E402
+
+
+class BaseHTTPRequestContextMiddleware(BaseHTTPMiddleware):
+    """Reference implementation on BaseHTTPMiddleware (unauthenticated path)."""
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        request_id = uuid7()
+        request_id_var.set(request_id)
+        principal_id_var.set(None)
+        request_time_var.set(datetime.now(UTC).replace(tzinfo=None))
+        sql_instrumentation.begin(request_id)
+        try:
+            return await call_next(request)
+        finally:
+            sql_instrumentation.end(request_id)
+            request_id_var.set(None)
+            principal_id_var.set(None)
+            request_time_var.set(None)
+
+
+def build_app(middleware: type | None) -> ASGIApp:
+    """Build a one-route app, optionally wrapped in a middleware class."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, bool]:
+        return {"ok": True}
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/ping",
+    "raw_path": b"/ping",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [(b"host", b"bench")],
+    "server": ("bench", 80),
+}
+
+
+async def run_round(app: ASGIApp, requests: int) -> float:
+    """Send ``requests`` sequential requests and return microseconds per request."""
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        return None
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), receive, send)
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+async def benchmark(requests: int, rounds: int) -> dict[str, float]:
+    """Run every stack and return the median microseconds per request."""
+    stacks: dict[str, Callable[[], ASGIApp]] = {
+        "none": lambda: build_app(None),
+        "base-http": lambda: build_app(BaseHTTPRequestContextMiddleware),
+        "asgi": lambda: build_app(RequestContextMiddleware),
+    }
+    results: dict[str, float] = {}
+    for name, factory in stacks.items():
+        app = factory()
+        await run_round(app, min(requests, 1000))  # warm up
+        samples = [await run_round(app, requests) for _ in range(rounds)]
+        results[name] = statistics.median(samples)
+    return results
+
+
+def main() -> int:
+    """Run the benchmark and print per-request timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    results = asyncio.run(benchmark(args.requests, args.rounds))
+    baseline = results["none"]
+    for name, micros in results.items():
+        overhead = micros - baseline
+        print(f"{name:>10}: {micros:8.1f} us/request  (+{overhead:6.1f} us overhead)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -223,6 +223,56 @@ def reset_id_counters():
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Clear in-process caches so cached state never leaks between tests."""
+    from app.core.auth import verified_token_cache
+    from app.core.db.replica import read_your_writes
+    from app.core.revocation import token_revocations
+    from app.logic import authz
+    from app.logic.auth import credential_descriptor_cache
+    from app.logic.deps import _recently_changed_orgs, membership_cache, principal_cache
+
+    caches = (
+        membership_cache,
+        _recently_changed_orgs,
+        read_your_writes,
+        verified_token_cache,
+        credential_descriptor_cache,
+        token_revocations,
+        principal_cache,
+        authz.authorization_cache,
+        authz._recently_changed_orgs,
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def memory_challenge_store(monkeypatch):
+    """Keep FIDO2 challenges in memory instead of the Postgres table."""
+    from app.core import fido2_server
+    from app.core.challenges import InMemoryChallengeStore
+
+    store = InMemoryChallengeStore()
+    monkeypatch.setattr(fido2_server, "challenge_store", store)
+    return store
+
+
+@pytest.fixture(autouse=True)
+def disable_cache_invalidation(monkeypatch):
+    """Keep lifespan tests from connecting to Postgres for LISTEN/NOTIFY.
+
+    Tests that exercise the bus enable it explicitly and patch the transport.
+    """
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "cache_invalidation_enabled", False)
+
+
 @pytest.fixture
 def mock_token_data(test_user_id: UUID, test_scope: str) -> TokenData:
     """Create mock token data for authentication testing."""
@@ -422,8 +472,9 @@ def app_with_overrides(
     from fastapi import FastAPI
 
     from app.core.auth import oauth2_scheme
-    from app.core.db.database import get_db
+    from app.core.db.database import get_db, get_read_db
     from app.routes.deps import get_current_token, get_current_user
+    from app.routes.streaming import get_list_db
 
     app = FastAPI()
 
@@ -441,6 +492,8 @@ def app_with_overrides(
         return mock_user
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_list_db] = override_get_db
     app.dependency_overrides[oauth2_scheme] = override_oauth2_scheme
     app.dependency_overrides[get_current_token] = override_get_current_token
     app.dependency_overrides[get_current_user] = override_get_current_user
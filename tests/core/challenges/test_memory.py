@@ -0,0 +1,91 @@
+"""Unit tests for the in-memory challenge store."""
+
+import pytest
+
+from app.core.challenges import InMemoryChallengeStore
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def store(clock: FakeClock) -> InMemoryChallengeStore:
+    """Create a store driven by the fake clock."""
+    return InMemoryChallengeStore(clock=clock)
+
+
+class TestInMemoryChallengeStore:
+    """Test suite for InMemoryChallengeStore class."""
+
+    @pytest.mark.asyncio
+    async def test_pop_returns_challenge_once(self, store):
+        """Test that a challenge can be taken exactly once."""
+        await store.put("a", b"challenge", ttl=60)
+
+        assert await store.pop("a") == b"challenge"
+        assert await store.pop("a") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_challenge_not_returned(self, store, clock):
+        """Test that a challenge is not returned after its deadline."""
+        await store.put("a", b"challenge", ttl=60)
+        clock.now += 60
+
+        assert await store.pop("a") is None
+
+    @pytest.mark.asyncio
+    async def test_expiry_drops_only_due_entries(self, store, clock):
+        """Test that each call drops expired entries and keeps live ones."""
+        await store.put("old", b"1", ttl=10)
+        await store.put("new", b"2", ttl=100)
+        clock.now += 50
+
+        assert await store.sweep() == 1
+        assert len(store) == 1
+        assert await store.pop("new") == b"2"
+
+    @pytest.mark.asyncio
+    async def test_stored_again_keeps_new_deadline(self, store, clock):
+        """Test that a stale heap entry does not expire a re-stored challenge."""
+        await store.put("a", b"first", ttl=10)
+        clock.now += 5
+        await store.put("a", b"second", ttl=60)
+        clock.now += 10
+
+        assert await store.sweep() == 0
+        assert await store.pop("a") == b"second"
+
+    @pytest.mark.asyncio
+    async def test_taken_challenge_not_counted_as_expired(self, store, clock):
+        """Test that heap entries of taken challenges are discarded silently."""
+        await store.put("a", b"challenge", ttl=10)
+        await store.pop("a")
+        clock.now += 20
+
+        assert await store.sweep() == 0
+        assert store._deadlines == []
+
+    @pytest.mark.asyncio
+    async def test_clear(self, store):
+        """Test that clear removes every challenge."""
+        await store.put("a", b"challenge", ttl=60)
+        await store.start()
+        await store.stop()
+
+        store.clear()
+
+        assert len(store) == 0
+        assert await store.pop("a") is None
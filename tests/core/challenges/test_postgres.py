@@ -0,0 +1,119 @@
+"""Unit tests for the Postgres-backed challenge store."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.challenges import PostgresChallengeStore
+
+
+class FakeClock:
+    """Manually advanced UTC clock."""
+
+    def __init__(self) -> None:
+        self.now = datetime(2026, 1, 1, 12, 0, 0)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def store(async_engine, clock: FakeClock) -> PostgresChallengeStore:
+    """Create a store on the test database, driven by the fake clock."""
+    return PostgresChallengeStore(
+        sweep_interval=0,
+        db_session_factory=async_sessionmaker(bind=async_engine),
+        clock=clock,
+    )
+
+
+class TestPostgresChallengeStore:
+    """Test suite for PostgresChallengeStore class."""
+
+    @pytest.mark.asyncio
+    async def test_pop_returns_challenge_once(self, store):
+        """Test that a challenge can be taken exactly once."""
+        await store.put("a", b"challenge", ttl=60)
+
+        assert await store.pop("a") == b"challenge"
+        assert await store.pop("a") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_between_store_instances(self, store, async_engine, clock):
+        """Test that a challenge stored by one worker is taken by another."""
+        other_worker = PostgresChallengeStore(
+            sweep_interval=0,
+            db_session_factory=async_sessionmaker(bind=async_engine),
+            clock=clock,
+        )
+
+        await store.put("a", b"challenge", ttl=60)
+
+        assert await other_worker.pop("a") == b"challenge"
+        assert await store.pop("a") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_challenge_not_returned(self, store, clock):
+        """Test that a challenge is not returned after its deadline."""
+        await store.put("a", b"challenge", ttl=60)
+        clock.now += timedelta(seconds=60)
+
+        assert await store.pop("a") is None
+
+    @pytest.mark.asyncio
+    async def test_sweep_deletes_expired_rows(self, store, clock):
+        """Test that the sweep removes only expired challenges."""
+        await store.put("old", b"1", ttl=10)
+        await store.put("new", b"2", ttl=100)
+        clock.now += timedelta(seconds=50)
+
+        assert await store.sweep() == 1
+        assert await store.pop("new") == b"2"
+
+    @pytest.mark.asyncio
+    async def test_background_sweep(self, store):
+        """Test that start runs the sweep periodically and stop cancels it."""
+        store.sweep_interval = 0.01
+
+        with patch.object(store, "sweep", AsyncMock(return_value=1)) as mock_sweep:
+            await store.start()
+            await asyncio.sleep(0.05)
+            await store.stop()
+
+        assert mock_sweep.await_count >= 1
+        assert store._sweep_task is None
+
+    @pytest.mark.asyncio
+    async def test_background_sweep_survives_errors(self, store):
+        """Test that a failing sweep is logged and retried."""
+        store.sweep_interval = 0.01
+
+        with (
+            patch.object(
+                store, "sweep", AsyncMock(side_effect=ConnectionError("down"))
+            ) as mock_sweep,
+            patch("app.core.challenges.postgres.logger") as mock_logger,
+        ):
+            await store.start()
+            await asyncio.sleep(0.05)
+            await store.stop()
+
+        assert mock_sweep.await_count >= 2
+        mock_logger.warning.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_sweep_disabled(self, store):
+        """Test that a sweep interval of 0 starts no task."""
+        await store.start()
+
+        assert store._sweep_task is None
+        await store.stop()
@@ -0,0 +1,31 @@
+"""Unit tests for challenge store selection."""
+
+from unittest.mock import patch
+
+from app.core.challenges import (
+    InMemoryChallengeStore,
+    PostgresChallengeStore,
+    create_challenge_store,
+)
+
+
+class TestCreateChallengeStore:
+    """Test suite for create_challenge_store function."""
+
+    def test_memory(self):
+        """Test that the in-memory store can be selected."""
+        with patch("app.core.challenges.settings") as mock_settings:
+            mock_settings.fido2_challenge_store = "memory"
+
+            assert isinstance(create_challenge_store(), InMemoryChallengeStore)
+
+    def test_postgres(self):
+        """Test that the Postgres store uses the configured sweep interval."""
+        with patch("app.core.challenges.settings") as mock_settings:
+            mock_settings.fido2_challenge_store = "postgres"
+            mock_settings.fido2_challenge_sweep_interval_seconds = 30
+
+            store = create_challenge_store()
+
+        assert isinstance(store, PostgresChallengeStore)
+        assert store.sweep_interval == 30
@@ -1,8 +1,13 @@
 """Unit tests for database configuration and session management."""
 
+from contextlib import asynccontextmanager
+from typing import Annotated
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fastapi import Depends, FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from app.core.db.database import (
@@ -16,6 +21,16 @@ from app.core.db.database import (
 )
 
 
+@pytest.fixture(autouse=True)
+def mock_sql_instrumentation():
+    """Keep mocked engines from being registered with the SQL instrumentation."""
+    with (
+        patch("app.core.db.database.sql_instrumentation") as mock_instrumentation,
+        patch("app.core.db.database.slow_query_log"),
+    ):
+        yield mock_instrumentation
+
+
 class TestDatabaseConfig:
     """Test suite for DatabaseConfig class."""
 
@@ -41,6 +56,7 @@ class TestDatabaseConfig:
         mock_settings.db_user = "test_user"
         mock_settings.db_password = "test_pass"
         mock_settings.db_name = "test_db"
+        mock_settings.db_replica_host = None
 
         mock_engine = MagicMock(spec=AsyncEngine)
         mock_create_engine.return_value = mock_engine
@@ -54,6 +70,49 @@ class TestDatabaseConfig:
         mock_create_engine.assert_called_once()
         mock_sessionmaker.assert_called_once()
 
+    @patch("app.core.db.database.create_async_engine")
+    @patch("app.core.db.database.settings")
+    def test_database_config_initialize_pool_settings(
+        self, mock_settings, mock_create_engine
+    ):
+        """Test that pool settings are passed to the engine."""
+        mock_settings.database_url = "postgresql+asyncpg://test"
+        mock_settings.debug = False
+        mock_settings.db_pool_size = 7
+        mock_settings.db_max_overflow = 3
+        mock_settings.db_pool_timeout = 2.5
+        mock_settings.db_pool_recycle = 600
+        mock_settings.db_pool_pre_ping = False
+        mock_settings.db_statement_cache_size = 0
+        mock_settings.db_replica_host = None
+
+        config = DatabaseConfig()
+        config.initialize()
+
+        kwargs = mock_create_engine.call_args.kwargs
+        assert kwargs["pool_size"] == 7
+        assert kwargs["max_overflow"] == 3
+        assert kwargs["pool_timeout"] == 2.5
+        assert kwargs["pool_recycle"] == 600
+        assert kwargs["pool_pre_ping"] is False
+        assert kwargs["connect_args"]["statement_cache_size"] == 0
+        assert kwargs["connect_args"]["prepared_statement_cache_size"] == 0
+
+    @patch("app.core.db.database.create_async_engine")
+    @patch("app.core.db.database.settings")
+    def test_database_config_initialize_attaches_instrumentation(
+        self, mock_settings, mock_create_engine, mock_sql_instrumentation
+    ):
+        """Test that SQL instrumentation is attached to the created engine."""
+        mock_settings.db_replica_host = None
+
+        config = DatabaseConfig()
+        config.initialize()
+
+        mock_sql_instrumentation.attach.assert_called_once_with(
+            mock_create_engine.return_value
+        )
+
     @patch("app.core.db.database.create_async_engine")
     @patch("app.core.db.database.settings")
     def test_database_config_initialize_only_once(
@@ -67,6 +126,7 @@ class TestDatabaseConfig:
         mock_settings.db_user = "test_user"
         mock_settings.db_password = "test_pass"
         mock_settings.db_name = "test_db"
+        mock_settings.db_replica_host = None
 
         mock_engine = MagicMock(spec=AsyncEngine)
         mock_create_engine.return_value = mock_engine
@@ -101,6 +161,7 @@ class TestDatabaseConfig:
         mock_settings.db_user = "test_user"
         mock_settings.db_password = "test_pass"
         mock_settings.db_name = "test_db"
+        mock_settings.db_replica_host = None
 
         # Setup mock engine with begin context manager
         mock_conn = MagicMock()
@@ -134,6 +195,7 @@ class TestDatabaseConfig:
         mock_settings.db_user = "test_user"
         mock_settings.db_password = "test_pass"
         mock_settings.db_name = "test_db"
+        mock_settings.db_replica_host = None
 
         mock_engine = MagicMock(spec=AsyncEngine)
         mock_engine.dispose = AsyncMock()
@@ -263,6 +325,37 @@ class TestGetDb:
 
         mock_get_db_session.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_db_function_scope_releases_before_response(self):
+        """Test that a function-scoped session is closed before the response is sent."""
+        events: list[str] = []
+
+        @asynccontextmanager
+        async def fake_get_db_session(read_only: bool = False):
+            yield MagicMock(spec=AsyncSession)
+            events.append("session closed")
+
+        app = FastAPI()
+
+        @app.get("/")
+        async def endpoint(
+            db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+        ) -> StreamingResponse:
+            async def body():
+                events.append("response sent")
+                yield b"ok"
+
+            return StreamingResponse(body())
+
+        with patch("app.core.db.database.get_db_session", fake_get_db_session):
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.get("/")
+
+        assert response.status_code == 200
+        assert events == ["session closed", "response sent"]
+
 
 class TestCreateAllTables:
     """Test suite for create_all_tables function (deprecated, but kept for backward compatibility)."""
@@ -318,12 +411,34 @@ class TestCleanupDatabase:
 
         mock_db_config._initialized = True
         mock_db_config.engine = mock_engine
+        mock_db_config.replica_engine = None
 
         await cleanup_database()
 
         mock_engine.dispose.assert_called_once()
         assert mock_db_config._initialized is False
 
+    @pytest.mark.asyncio
+    @patch("app.core.db.database.db_config")
+    @patch("app.core.db.database.logger")
+    async def test_cleanup_database_disposes_replica_engine(
+        self, mock_logger, mock_db_config
+    ):
+        """Test that cleanup_database also disposes the replica engine."""
+        mock_engine = MagicMock(spec=AsyncEngine)
+        mock_engine.dispose = AsyncMock()
+        mock_replica_engine = MagicMock(spec=AsyncEngine)
+        mock_replica_engine.dispose = AsyncMock()
+
+        mock_db_config._initialized = True
+        mock_db_config.engine = mock_engine
+        mock_db_config.replica_engine = mock_replica_engine
+
+        await cleanup_database()
+
+        mock_replica_engine.dispose.assert_called_once()
+        mock_engine.dispose.assert_called_once()
+
     @pytest.mark.asyncio
     @patch("app.core.db.database.db_config")
     async def test_cleanup_database_not_initialized(self, mock_db_config):
@@ -424,6 +539,7 @@ class TestDatabaseIntegration:
         mock_settings.db_user = "test_user"
         mock_settings.db_password = "test_pass"
         mock_settings.db_name = "test_db"
+        mock_settings.db_replica_host = None
 
         mock_engine = MagicMock(spec=AsyncEngine)
         mock_engine.dispose = AsyncMock()
@@ -0,0 +1,234 @@
+"""Unit tests for per-request SQL instrumentation."""
+
+from types import SimpleNamespace
+from uuid import uuid7
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.context import request_id_var
+from app.core.db.instrumentation import (
+    QueryStats,
+    SQLInstrumentation,
+    _row_count,
+    statement_shape,
+)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Create an instrumented SQLite engine with a small table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO item (id) VALUES (1), (2), (3)"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def request_id():
+    """Set a request ID in the context for the duration of a test."""
+    request_id = uuid7()
+    token = request_id_var.set(request_id)
+    yield request_id
+    request_id_var.reset(token)
+
+
+class TestStatementShape:
+    """Test suite for statement_shape function."""
+
+    def test_asyncpg_placeholders(self):
+        """Test that numbered placeholders are normalized."""
+        assert statement_shape("SELECT * FROM t WHERE a = $1 AND b = $2") == (
+            "SELECT * FROM t WHERE a = ? AND b = ?"
+        )
+
+    def test_in_lists_collapse(self):
+        """Test that IN lists of different lengths share a shape."""
+        short = statement_shape("SELECT * FROM t WHERE id IN ($1, $2)")
+        long = statement_shape("SELECT * FROM t WHERE id IN ($1, $2, $3, $4)")
+
+        assert short == long == "SELECT * FROM t WHERE id IN (?, ...)"
+
+    def test_whitespace_squeezed(self):
+        """Test that line breaks and indentation are normalized."""
+        assert statement_shape("SELECT a\n  FROM t\n WHERE a = ?") == (
+            "SELECT a FROM t WHERE a = ?"
+        )
+
+
+class TestRowCount:
+    """Test suite for _row_count function."""
+
+    def test_uses_rowcount(self):
+        """Test that a reported row count is used."""
+        assert _row_count(SimpleNamespace(rowcount=4, _rows=[1])) == 4
+
+    def test_falls_back_to_buffered_rows(self):
+        """Test that buffered rows are counted when rowcount is -1."""
+        assert _row_count(SimpleNamespace(rowcount=-1, _rows=[1, 2])) == 2
+
+    def test_unknown(self):
+        """Test that an unknown count is 0."""
+        assert _row_count(SimpleNamespace(rowcount=-1)) == 0
+
+
+class TestQueryStats:
+    """Test suite for QueryStats class."""
+
+    def test_record(self):
+        """Test that statements accumulate count, time and rows."""
+        stats = QueryStats()
+
+        stats.record("SELECT 1", 0.002, 1)
+        stats.record("SELECT 1", 0.003, 1)
+
+        assert stats.statements == 2
+        assert stats.duration_ms == 5.0
+        assert stats.rows == 2
+        assert stats.log_context() == {
+            "db_statements": 2,
+            "db_time_ms": 5.0,
+            "db_rows": 2,
+        }
+
+    def test_repeated_statements(self):
+        """Test that only shapes above the threshold are reported."""
+        stats = QueryStats()
+        for value in range(4):
+            stats.record(f"SELECT * FROM t WHERE id = ${value + 1}", 0.0, 1)
+        stats.record("SELECT * FROM u", 0.0, 1)
+
+        assert stats.repeated_statements(3) == [("SELECT * FROM t WHERE id = ?", 4)]
+        assert stats.repeated_statements(4) == []
+
+    def test_server_timing(self):
+        """Test the Server-Timing header format."""
+        stats = QueryStats()
+        stats.record("SELECT 1", 0.0125, 1)
+
+        assert stats.server_timing() == 'db;dur=12.5;desc="1 queries"'
+
+
+class TestSQLInstrumentation:
+    """Test suite for SQLInstrumentation class."""
+
+    @pytest.mark.asyncio
+    async def test_counts_statements_for_current_request(self, engine, request_id):
+        """Test that statements on an attached engine are added to the request."""
+        instrumentation = SQLInstrumentation()
+        instrumentation.attach(engine)
+        stats = instrumentation.begin(request_id)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM item"))
+            await conn.execute(text("SELECT id FROM item WHERE id = :id"), {"id": 1})
+
+        assert instrumentation.current() is stats
+        assert stats.statements == 2
+        assert stats.rows == 4
+        assert stats.duration > 0
+
+    @pytest.mark.asyncio
+    async def test_ignores_statements_outside_requests(self, engine):
+        """Test that statements without a tracked request are not recorded."""
+        instrumentation = SQLInstrumentation()
+        instrumentation.attach(engine)
+        other = instrumentation.begin(uuid7())
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM item"))
+
+        assert instrumentation.current() is None
+        assert other.statements == 0
+
+    @pytest.mark.asyncio
+    async def test_attach_is_idempotent(self, engine, request_id):
+        """Test that attaching twice does not double count."""
+        instrumentation = SQLInstrumentation()
+        instrumentation.attach(engine)
+        instrumentation.attach(engine)
+        stats = instrumentation.begin(request_id)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        assert stats.statements == 1
+
+    @pytest.mark.asyncio
+    async def test_observers_receive_timed_statements(self, engine):
+        """Test that observers get every statement, inside a request or not."""
+        instrumentation = SQLInstrumentation()
+        instrumentation.attach(engine)
+        observed = []
+
+        def observer(conn, statement, parameters, duration, executemany):
+            observed.append((statement, parameters, duration, executemany))
+
+        instrumentation.observe(observer)
+        instrumentation.observe(observer)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM item WHERE id = :id"), {"id": 1})
+
+        [(statement, parameters, duration, executemany)] = observed
+        assert statement == "SELECT id FROM item WHERE id = ?"
+        assert parameters == (1,)
+        assert duration > 0
+        assert executemany is False
+
+    def test_end_updates_metrics(self, request_id):
+        """Test that ending a request folds its stats into the metrics."""
+        instrumentation = SQLInstrumentation()
+        stats = instrumentation.begin(request_id)
+        for _ in range(3):
+            stats.record("SELECT * FROM t WHERE id = $1", 0.0, 1)
+
+        ended = instrumentation.end(
+            request_id, route="GET /items", n_plus_one_threshold=2
+        )
+
+        assert ended is stats
+        assert instrumentation.current() is None
+        assert instrumentation.metrics() == {
+            "active_requests": 0,
+            "requests": 1,
+            "statements": 3,
+            "max_statements_per_request": 3,
+            "n_plus_one_requests": 1,
+            "n_plus_one_routes": {"GET /items": 1},
+        }
+
+    def test_end_without_threshold(self, request_id):
+        """Test that a threshold of 0 disables N+1 counting."""
+        instrumentation = SQLInstrumentation()
+        stats = instrumentation.begin(request_id)
+        for _ in range(3):
+            stats.record("SELECT 1", 0.0, 1)
+
+        instrumentation.end(request_id, route="GET /items")
+
+        assert instrumentation.n_plus_one_requests == 0
+
+    def test_end_unknown_request(self):
+        """Test that ending an untracked request returns None."""
+        instrumentation = SQLInstrumentation()
+
+        assert instrumentation.end(uuid7()) is None
+        assert instrumentation.requests == 0
+
+    def test_reset(self, request_id):
+        """Test that reset drops active stats and counters."""
+        instrumentation = SQLInstrumentation()
+        instrumentation.begin(request_id).record("SELECT 1", 0.0, 1)
+        finished = uuid7()
+        instrumentation.begin(finished)
+        instrumentation.end(finished)
+
+        instrumentation.reset()
+
+        assert instrumentation.current() is None
+        assert instrumentation.metrics()["active_requests"] == 0
+        assert instrumentation.requests == 0
@@ -0,0 +1,66 @@
+"""Unit tests for connection pool telemetry."""
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db.pool_metrics import PoolMetrics, instrumented_pool_class
+
+
+@pytest.fixture
+async def engine_and_metrics(tmp_path):
+    """Create a single-connection engine with an instrumented pool."""
+    metrics = PoolMetrics()
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool_class(metrics),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine, metrics
+    await engine.dispose()
+
+
+class TestPoolMetrics:
+    """Test suite for PoolMetrics class."""
+
+    def test_snapshot_without_pool(self):
+        """Test that a snapshot works before the pool is created."""
+        snapshot = PoolMetrics().snapshot()
+
+        assert snapshot["checkout_timeouts"] == 0
+        assert snapshot["checkout_wait_seconds"]["count"] == 0
+        assert "checked_out" not in snapshot
+
+    @pytest.mark.asyncio
+    async def test_checkouts_are_recorded(self, engine_and_metrics):
+        """Test that checkouts are timed and occupancy is reported."""
+        engine, metrics = engine_and_metrics
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            snapshot = metrics.snapshot()
+            assert snapshot["checked_out"] == 1
+            assert snapshot["size"] == 1
+            assert snapshot["max_overflow"] == 0
+
+        snapshot = metrics.snapshot()
+        assert snapshot["checked_out"] == 0
+        assert snapshot["checkout_wait_seconds"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_checkout_timeouts_are_counted(self, engine_and_metrics):
+        """Test that a checkout timing out on an exhausted pool is counted."""
+        engine, metrics = engine_and_metrics
+
+        async with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass  # pragma: no cover
+
+        assert metrics.checkout_timeouts == 1
+
+        metrics.reset()
+        assert metrics.checkout_timeouts == 0
+        assert metrics.snapshot()["checkout_wait_seconds"]["count"] == 0
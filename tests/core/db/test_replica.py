@@ -0,0 +1,231 @@
+"""Unit tests for read-replica routing and read-your-writes stickiness."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid7
+
+import pytest
+from sqlalchemy import column, insert, table, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.context import principal_id_var
+from app.core.db.database import get_db_session
+from app.core.db.replica import (
+    PrimarySession,
+    ReadYourWritesTracker,
+    read_your_writes,
+)
+from app.core.invalidation import InMemoryInvalidationHub, InvalidationBus
+
+ITEM = table("item", column("id"))
+
+
+@pytest.fixture
+def tracking_enabled():
+    """Enable read-your-writes tracking for the duration of a test."""
+    read_your_writes.enabled = True
+    read_your_writes.clear()
+    yield read_your_writes
+    read_your_writes.enabled = False
+    read_your_writes.clear()
+
+
+@pytest.fixture
+async def primary_session_factory(tmp_path):
+    """Create a session factory using the primary session class."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY)"))
+    yield async_sessionmaker(
+        bind=engine, class_=AsyncSession, sync_session_class=PrimarySession
+    )
+    await engine.dispose()
+
+
+def make_session() -> MagicMock:
+    """Create a mock async session."""
+    session = MagicMock(spec=AsyncSession)
+    session.close = AsyncMock()
+    return session
+
+
+def make_factory(session: MagicMock) -> MagicMock:
+    """Create a mock session factory yielding the given session."""
+    context = AsyncMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=context)
+
+
+class TestReadYourWritesTracker:
+    """Test suite for ReadYourWritesTracker class."""
+
+    def test_pin_and_expiry(self):
+        """Test that pins are per principal and expire after the window."""
+        tracker = ReadYourWritesTracker(window=0)
+        tracker.pin("a")
+
+        assert tracker.is_pinned("a") is False
+        assert tracker.is_pinned(None) is False
+
+        tracker = ReadYourWritesTracker(window=60)
+        tracker.pin("a")
+
+        assert tracker.is_pinned("a") is True
+        assert tracker.is_pinned("b") is False
+
+    def test_record_write_disabled(self):
+        """Test that writes are not tracked without a replica."""
+        tracker = ReadYourWritesTracker(window=60)
+
+        tracker.record_write("a")
+
+        assert tracker.is_pinned("a") is False
+
+    def test_record_write_broadcasts_pin(self, tracking_enabled):
+        """Test that a recorded write pins the principal via the invalidation bus."""
+        principal_id = str(uuid7())
+
+        tracking_enabled.record_write(principal_id)
+
+        assert tracking_enabled.is_pinned(principal_id) is True
+
+    def test_record_write_pins_locally_without_bus(self):
+        """Test that the writing worker is pinned even if the bus is not running."""
+        tracker = ReadYourWritesTracker(window=60, bus=InvalidationBus())
+        tracker.enabled = True
+        principal_id = str(uuid7())
+
+        tracker.record_write(principal_id)
+
+        assert tracker.is_pinned(principal_id) is True
+
+    @pytest.mark.asyncio
+    async def test_record_write_pins_other_workers(self):
+        """Test that a write pins the principal in another worker via the bus."""
+        hub = InMemoryInvalidationHub()
+        buses = [
+            InvalidationBus(flush_interval=0.001, retry_interval=0.01) for _ in range(2)
+        ]
+        trackers = [ReadYourWritesTracker(window=60, bus=bus) for bus in buses]
+        for bus, tracker in zip(buses, trackers, strict=True):
+            tracker.enabled = True
+            await bus.start(hub.transport())
+        await asyncio.sleep(0)
+        principal_id = str(uuid7())
+        try:
+            trackers[0].record_write(principal_id)
+
+            assert trackers[0].is_pinned(principal_id) is True
+            assert trackers[1].is_pinned(principal_id) is False
+
+            await asyncio.sleep(0.05)
+
+            assert trackers[1].is_pinned(principal_id) is True
+        finally:
+            for bus in buses:
+                await bus.stop()
+
+
+class TestPrimarySession:
+    """Test suite for write detection on primary sessions."""
+
+    @pytest.mark.asyncio
+    async def test_committed_write_pins_principal(
+        self, tracking_enabled, primary_session_factory
+    ):
+        """Test that committing a write pins the current principal."""
+        principal_id = str(uuid7())
+        token = principal_id_var.set(principal_id)
+        try:
+            async with primary_session_factory() as session:
+                await session.execute(insert(ITEM).values(id=1))
+                await session.commit()
+        finally:
+            principal_id_var.reset(token)
+
+        assert tracking_enabled.is_pinned(principal_id) is True
+
+    @pytest.mark.asyncio
+    async def test_read_does_not_pin_principal(
+        self, tracking_enabled, primary_session_factory
+    ):
+        """Test that committing a read-only session does not pin the principal."""
+        principal_id = str(uuid7())
+        token = principal_id_var.set(principal_id)
+        try:
+            async with primary_session_factory() as session:
+                await session.execute(text("SELECT 1"))
+                await session.commit()
+        finally:
+            principal_id_var.reset(token)
+
+        assert tracking_enabled.is_pinned(principal_id) is False
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_write_does_not_pin_principal(
+        self, tracking_enabled, primary_session_factory
+    ):
+        """Test that a rolled back write does not pin the principal."""
+        principal_id = str(uuid7())
+        token = principal_id_var.set(principal_id)
+        try:
+            async with primary_session_factory() as session:
+                await session.execute(insert(ITEM).values(id=1))
+                await session.rollback()
+                await session.commit()
+        finally:
+            principal_id_var.reset(token)
+
+        assert tracking_enabled.is_pinned(principal_id) is False
+
+
+class TestReadRouting:
+    """Test suite for read-only session routing."""
+
+    @pytest.mark.asyncio
+    @patch("app.core.db.database.db_config")
+    async def test_read_only_uses_replica(self, mock_db_config, tracking_enabled):
+        """Test that read-only sessions come from the replica."""
+        primary, replica = make_session(), make_session()
+        mock_db_config._initialized = True
+        mock_db_config.session_factory = make_factory(primary)
+        mock_db_config.replica_session_factory = make_factory(replica)
+
+        async with get_db_session(read_only=True) as session:
+            assert session is replica
+
+        async with get_db_session() as session:
+            assert session is primary
+
+    @pytest.mark.asyncio
+    @patch("app.core.db.database.db_config")
+    async def test_pinned_principal_reads_from_primary(
+        self, mock_db_config, tracking_enabled
+    ):
+        """Test that a principal who wrote recently reads from the primary."""
+        primary, replica = make_session(), make_session()
+        mock_db_config._initialized = True
+        mock_db_config.session_factory = make_factory(primary)
+        mock_db_config.replica_session_factory = make_factory(replica)
+        principal_id = str(uuid7())
+        tracking_enabled.pin(principal_id)
+
+        token = principal_id_var.set(principal_id)
+        try:
+            async with get_db_session(read_only=True) as session:
+                assert session is primary
+        finally:
+            principal_id_var.reset(token)
+
+    @pytest.mark.asyncio
+    @patch("app.core.db.database.db_config")
+    async def test_read_only_without_replica_uses_primary(self, mock_db_config):
+        """Test that read-only sessions fall back to the primary."""
+        primary = make_session()
+        mock_db_config._initialized = True
+        mock_db_config.session_factory = make_factory(primary)
+        mock_db_config.replica_session_factory = None
+
+        async with get_db_session(read_only=True) as session:
+            assert session is primary
@@ -0,0 +1,344 @@
+"""Unit tests for the slow-query log."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid7
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.context import request_id_var
+from app.core.db.instrumentation import SQLInstrumentation
+from app.core.db.slow_query import (
+    SlowQuery,
+    SlowQueryLog,
+    calling_function,
+    parameter_shape,
+)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Create a SQLite engine with a small table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'slow.db'}")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY)"))
+    yield engine
+    await engine.dispose()
+
+
+def postgres_engine(plan_rows: list[tuple[str]]) -> MagicMock:
+    """Create a mock Postgres engine whose connections return an EXPLAIN plan."""
+    conn = AsyncMock()
+    conn.exec_driver_sql.side_effect = [MagicMock(), MagicMock(), iter(plan_rows)]
+    engine = MagicMock()
+    engine.dialect.name = "postgresql"
+    engine.connect.return_value.__aenter__.return_value = conn
+    return engine
+
+
+class TestParameterShape:
+    """Test suite for parameter_shape function."""
+
+    def test_positional(self):
+        """Test that positional parameters are described by type."""
+        assert parameter_shape((uuid7(), "a", 1)) == ["UUID", "str", "int"]
+
+    def test_named(self):
+        """Test that named parameters keep their names."""
+        assert parameter_shape({"id": 1, "name": None}) == {
+            "id": "int",
+            "name": "NoneType",
+        }
+
+    def test_no_parameters(self):
+        """Test that missing parameters are an empty list."""
+        assert parameter_shape(None) == []
+
+
+class TestCallingFunction:
+    """Test suite for calling_function function."""
+
+    def test_finds_application_frame(self):
+        """Test that the nearest application function outside app.core is found."""
+        namespace = {"__name__": "app.logic.v1.items", "calling_function": None}
+        namespace["calling_function"] = calling_function
+        exec(
+            "def list_items():\n    return calling_function()\n",
+            namespace,
+        )
+
+        assert namespace["list_items"]() == "app.logic.v1.items.list_items"
+
+    def test_no_application_frame(self):
+        """Test that None is returned when no application code is on the stack."""
+        assert calling_function() is None
+
+
+class TestSlowQueryLog:
+    """Test suite for SlowQueryLog class."""
+
+    @pytest.mark.asyncio
+    async def test_logs_statements_over_threshold(self, engine):
+        """Test that statements over the threshold are logged."""
+        slow_log = SlowQueryLog(
+            threshold_ms=0.000001,
+            explain_sample_rate=0,
+            max_plans=5,
+            instrumentation=SQLInstrumentation(),
+        )
+        slow_log.attach(engine)
+
+        with patch("app.core.db.slow_query.logger") as mock_logger:
+            async with engine.connect() as conn:
+                await conn.execute(
+                    text("SELECT id FROM item WHERE id = :id"), {"id": 1}
+                )
+
+        assert slow_log.slow_queries == 1
+        kwargs = mock_logger.warning.call_args.kwargs
+        assert kwargs["statement"] == "SELECT id FROM item WHERE id = ?"
+        assert kwargs["parameters"] == ["int"]
+
+    @pytest.mark.asyncio
+    async def test_ignores_fast_statements(self, engine):
+        """Test that statements under the threshold are not logged."""
+        slow_log = SlowQueryLog(
+            threshold_ms=60000,
+            explain_sample_rate=1,
+            max_plans=5,
+            instrumentation=SQLInstrumentation(),
+        )
+        slow_log.attach(engine)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM item"))
+
+        assert slow_log.slow_queries == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, engine):
+        """Test that a threshold of 0 disables the log."""
+        slow_log = SlowQueryLog(
+            threshold_ms=0,
+            explain_sample_rate=1,
+            max_plans=5,
+            instrumentation=SQLInstrumentation(),
+        )
+        slow_log.attach(engine)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM item"))
+
+        assert slow_log.slow_queries == 0
+
+    @pytest.mark.asyncio
+    async def test_non_postgres_not_explained(self, engine):
+        """Test that plans are only captured on Postgres."""
+        slow_log = SlowQueryLog(
+            threshold_ms=0.000001,
+            explain_sample_rate=1,
+            max_plans=5,
+            instrumentation=SQLInstrumentation(),
+        )
+        slow_log.attach(engine)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM item"))
+
+        assert slow_log.plans() == []
+
+    @pytest.mark.asyncio
+    async def test_sampled_select_explained(self):
+        """Test that a sampled SELECT is explained on a side connection."""
+        slow_log = SlowQueryLog(
+            threshold_ms=1, explain_sample_rate=0.5, max_plans=5, sampler=lambda: 0.1
+        )
+        engine = postgres_engine([("Seq Scan on item",), ("Buffers: shared hit=1",)])
+        request_id = uuid7()
+        token = request_id_var.set(request_id)
+        try:
+            slow_log.record(engine, "SELECT id FROM item WHERE id = $1", (1,), 25.0)
+        finally:
+            request_id_var.reset(token)
+        await slow_log._explain_task
+
+        conn = engine.connect.return_value.__aenter__.return_value
+        read_only_call, _, explain_call = conn.exec_driver_sql.call_args_list
+        assert read_only_call.args == ("SET TRANSACTION READ ONLY",)
+        assert explain_call.args == (
+            "EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM item WHERE id = $1",
+            (1,),
+        )
+        conn.rollback.assert_awaited_once()
+
+        [query] = slow_log.plans()
+        assert query.plan == "Seq Scan on item\nBuffers: shared hit=1"
+        assert query.request_id == request_id
+        assert query.duration_ms == 25.0
+        assert slow_log.explains == 1
+
+    @pytest.mark.asyncio
+    async def test_unsampled_select_not_explained(self):
+        """Test that statements outside the sample are only logged."""
+        slow_log = SlowQueryLog(
+            threshold_ms=1, explain_sample_rate=0.5, max_plans=5, sampler=lambda: 0.9
+        )
+        engine = postgres_engine([])
+
+        slow_log.record(engine, "SELECT 1", (), 25.0)
+
+        assert slow_log._explain_task is None
+        engine.connect.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_writes_not_explained(self):
+        """Test that writes are never explained, since ANALYZE runs them again."""
+        slow_log = SlowQueryLog(threshold_ms=1, explain_sample_rate=1, max_plans=5)
+        engine = postgres_engine([])
+
+        slow_log.record(engine, "UPDATE item SET id = $1", (1,), 25.0)
+        slow_log.record(engine, "SELECT 1", [(1,), (2,)], 25.0, executemany=True)
+
+        assert slow_log._explain_task is None
+        assert slow_log.slow_queries == 2
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "SELECT id FROM item WHERE id = $1 FOR UPDATE",
+            "SELECT id FROM item FOR NO KEY UPDATE SKIP LOCKED",
+            "SELECT id FROM item FOR SHARE",
+            "SELECT id INTO item_copy FROM item",
+            "WITH moved AS (DELETE FROM item RETURNING id) SELECT id FROM moved",
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_locking_and_writing_selects_not_explained(self, statement):
+        """Test that SELECTs which lock rows or write are never explained."""
+        slow_log = SlowQueryLog(threshold_ms=1, explain_sample_rate=1, max_plans=5)
+        engine = postgres_engine([])
+
+        slow_log.record(engine, statement, (1,), 25.0)
+
+        assert slow_log._explain_task is None
+
+    @pytest.mark.asyncio
+    async def test_explain_not_counted_in_request_stats(self):
+        """Test that the EXPLAIN runs outside the request that triggered it."""
+        slow_log = SlowQueryLog(threshold_ms=1, explain_sample_rate=1, max_plans=5)
+        engine = postgres_engine([])
+        seen_request_ids = []
+
+        async def exec_driver_sql(statement, parameters=None):
+            seen_request_ids.append(request_id_var.get())
+            return iter([("plan",)])
+
+        conn = engine.connect.return_value.__aenter__.return_value
+        conn.exec_driver_sql.side_effect = exec_driver_sql
+        request_id = uuid7()
+        token = request_id_var.set(request_id)
+        try:
+            slow_log.record(engine, "SELECT 1", (), 25.0)
+        finally:
+            request_id_var.reset(token)
+        await slow_log._explain_task
+
+        assert seen_request_ids == [None, None, None]
+        [query] = slow_log.plans()
+        assert query.request_id == request_id
+
+    @pytest.mark.asyncio
+    async def test_uses_instrumentation_timing(self, engine):
+        """Test that the log registers no listeners of its own."""
+        instrumentation = SQLInstrumentation()
+        slow_log = SlowQueryLog(
+            threshold_ms=1,
+            explain_sample_rate=0,
+            max_plans=5,
+            instrumentation=instrumentation,
+        )
+
+        slow_log.attach(engine)
+        slow_log.attach(engine)
+
+        assert instrumentation._observers == [slow_log._on_statement]
+        with patch("app.core.db.slow_query.logger"):
+            slow_log._on_statement(
+                MagicMock(engine=engine.sync_engine), "SELECT 1", (), 0.5, False
+            )
+        assert slow_log.slow_queries == 1
+
+    @pytest.mark.asyncio
+    async def test_one_explain_at_a_time(self):
+        """Test that a new plan is not captured while one is in flight."""
+        slow_log = SlowQueryLog(threshold_ms=1, explain_sample_rate=1, max_plans=5)
+        engine = postgres_engine([("plan",)])
+
+        slow_log.record(engine, "SELECT 1", (), 25.0)
+        first = slow_log._explain_task
+        slow_log.record(engine, "SELECT 2", (), 25.0)
+
+        assert slow_log._explain_task is first
+        await first
+        assert len(slow_log.plans()) == 1
+
+    @pytest.mark.asyncio
+    async def test_explain_failure_counted(self):
+        """Test that a failing EXPLAIN is logged and counted, not raised."""
+        slow_log = SlowQueryLog(threshold_ms=1, explain_sample_rate=1, max_plans=5)
+        engine = postgres_engine([])
+        conn = engine.connect.return_value.__aenter__.return_value
+        conn.exec_driver_sql.side_effect = RuntimeError("canceling statement")
+
+        with patch("app.core.db.slow_query.logger"):
+            slow_log.record(engine, "SELECT 1", (), 25.0)
+            await slow_log._explain_task
+
+        assert slow_log.explain_failures == 1
+        assert slow_log.plans() == []
+
+    @pytest.mark.asyncio
+    async def test_ring_buffer_bounded(self):
+        """Test that only the newest plans are kept."""
+        slow_log = SlowQueryLog(threshold_ms=1, explain_sample_rate=1, max_plans=2)
+
+        for index in range(3):
+            slow_log.record(postgres_engine([("plan",)]), f"SELECT {index}", (), 25.0)
+            await asyncio.wait_for(slow_log._explain_task, 1)
+
+        assert [query.statement for query in slow_log.plans()] == [
+            "SELECT 2",
+            "SELECT 1",
+        ]
+        assert slow_log.metrics()["plans"] == 2
+
+        slow_log.clear()
+
+        assert slow_log.plans() == []
+        assert slow_log.metrics()["slow_queries"] == 0
+
+
+class TestSlowQuery:
+    """Test suite for SlowQuery class."""
+
+    def test_to_dict(self):
+        """Test that entries serialize to JSON-compatible values."""
+        request_id = uuid7()
+        query = SlowQuery(
+            captured_at=datetime(2025, 1, 2, 3, 4, 5),
+            statement="SELECT 1",
+            parameters=[],
+            duration_ms=12.5,
+            caller="app.logic.v1.tasks.list_tasks",
+            request_id=request_id,
+            plan="Result",
+        )
+
+        data = query.to_dict()
+
+        assert data["captured_at"] == "2025-01-02T03:04:05"
+        assert data["request_id"] == str(request_id)
+        assert data["plan"] == "Result"
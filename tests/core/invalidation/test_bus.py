@@ -0,0 +1,171 @@
+"""Unit tests for the cache invalidation bus."""
+
+import asyncio
+from uuid import uuid7
+
+import pytest
+
+from app.core.invalidation import (
+    InMemoryInvalidationHub,
+    InvalidationBus,
+    InvalidationMessage,
+)
+from app.core.invalidation.bus import MAX_MESSAGES_PER_PAYLOAD
+
+
+async def wait_for_broadcast() -> None:
+    """Let the flush loop pick up and send pending messages."""
+    await asyncio.sleep(0.05)
+
+
+@pytest.fixture
+def hub() -> InMemoryInvalidationHub:
+    """Create a hub shared by simulated workers."""
+    return InMemoryInvalidationHub()
+
+
+@pytest.fixture
+async def workers(hub: InMemoryInvalidationHub):
+    """Start two buses connected through the same hub."""
+    buses = [
+        InvalidationBus(flush_interval=0.001, retry_interval=0.01) for _ in range(2)
+    ]
+    for bus in buses:
+        await bus.start(hub.transport())
+    await asyncio.sleep(0)
+    yield buses
+    for bus in buses:
+        await bus.stop()
+
+
+class TestInvalidationMessage:
+    """Test suite for InvalidationMessage class."""
+
+    def test_round_trip(self):
+        """Test that a message survives encoding and decoding."""
+        message = InvalidationMessage("organization_principal", uuid7(), uuid7())
+
+        assert InvalidationMessage.decode(message.encode()) == message
+
+    def test_round_trip_without_ids(self):
+        """Test that optional IDs are encoded as empty fields."""
+        message = InvalidationMessage("organization")
+
+        assert message.encode() == "organization||"
+        assert InvalidationMessage.decode(message.encode()) == message
+
+    def test_decode_malformed(self):
+        """Test that malformed lines raise ValueError."""
+        with pytest.raises(ValueError):
+            InvalidationMessage.decode("organization|not-a-uuid|")
+
+
+class TestInvalidationBus:
+    """Test suite for InvalidationBus class."""
+
+    def test_publish_dispatches_locally_when_stopped(self):
+        """Test that publishing without a transport still evicts local entries."""
+        bus = InvalidationBus()
+        received: list[InvalidationMessage] = []
+        bus.subscribe("organization", received.append)
+        org_id = uuid7()
+
+        bus.publish("organization", org_id=org_id)
+
+        assert received == [InvalidationMessage("organization", org_id)]
+        assert not bus.running
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_other_workers(self, workers: list[InvalidationBus]):
+        """Test that other workers apply a published invalidation exactly once."""
+        publisher, subscriber = workers
+        published: list[InvalidationMessage] = []
+        received: list[InvalidationMessage] = []
+        publisher.subscribe("organization", published.append)
+        subscriber.subscribe("organization", received.append)
+        org_id = uuid7()
+
+        publisher.publish("organization", org_id=org_id)
+        await wait_for_broadcast()
+
+        assert published == [InvalidationMessage("organization", org_id)]
+        assert received == [InvalidationMessage("organization", org_id)]
+
+    @pytest.mark.asyncio
+    async def test_messages_are_batched_and_deduplicated(
+        self, hub: InMemoryInvalidationHub, workers: list[InvalidationBus]
+    ):
+        """Test that queued messages are deduplicated and split into payloads."""
+        publisher, subscriber = workers
+        received: list[InvalidationMessage] = []
+        subscriber.subscribe("organization", received.append)
+        org_ids = [uuid7() for _ in range(MAX_MESSAGES_PER_PAYLOAD + 1)]
+
+        for org_id in org_ids:
+            publisher.publish("organization", org_id=org_id)
+            publisher.publish("organization", org_id=org_id)
+        await wait_for_broadcast()
+
+        assert len(hub.sent) == 2
+        assert [m.org_id for m in received] == org_ids
+
+    @pytest.mark.asyncio
+    async def test_unsent_messages_are_retried(
+        self, hub: InMemoryInvalidationHub, workers: list[InvalidationBus]
+    ):
+        """Test that messages queued during an outage are sent after reconnecting."""
+        publisher, subscriber = workers
+        received: list[InvalidationMessage] = []
+        subscriber.subscribe("organization", received.append)
+        await hub.disconnect()
+
+        publisher.publish("organization", org_id=uuid7())
+        await wait_for_broadcast()
+        assert received == []
+
+        await hub.reconnect()
+        await wait_for_broadcast()
+
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_reconnect_resets_caches(
+        self, hub: InMemoryInvalidationHub, workers: list[InvalidationBus]
+    ):
+        """Test that reset handlers run when the transport reconnects."""
+        _, subscriber = workers
+        resets: list[bool] = []
+        subscriber.on_reset(lambda: resets.append(True))
+
+        await hub.disconnect()
+        await hub.reconnect()
+        await asyncio.sleep(0)
+
+        assert resets == [True]
+
+    @pytest.mark.asyncio
+    async def test_malformed_payload_is_ignored(
+        self, hub: InMemoryInvalidationHub, workers: list[InvalidationBus]
+    ):
+        """Test that malformed lines are skipped without dropping the rest."""
+        _, subscriber = workers
+        received: list[InvalidationMessage] = []
+        subscriber.subscribe("organization", received.append)
+        org_id = uuid7()
+
+        hub.deliver(f"other-sender\ngarbage\norganization|{org_id.hex}|")
+
+        assert received == [InvalidationMessage("organization", org_id)]
+
+    @pytest.mark.asyncio
+    async def test_start_twice_is_ignored(self, hub: InMemoryInvalidationHub):
+        """Test that starting a running bus keeps the original transport."""
+        bus = InvalidationBus()
+        transport = hub.transport()
+        await bus.start(transport)
+
+        await bus.start(hub.transport())
+
+        assert bus._transport is transport
+        await bus.stop()
+        assert not bus.running
@@ -0,0 +1,123 @@
+"""Unit tests for the Postgres LISTEN/NOTIFY invalidation transport."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.invalidation import PostgresNotifyTransport
+
+
+def make_connection() -> MagicMock:
+    """Create a mock asyncpg connection."""
+    connection = MagicMock()
+    connection.is_closed.return_value = False
+    connection.add_listener = AsyncMock()
+    connection.execute = AsyncMock()
+    connection.fetchval = AsyncMock(return_value=1)
+    connection.close = AsyncMock()
+    return connection
+
+
+class TestPostgresNotifyTransport:
+    """Test suite for PostgresNotifyTransport class."""
+
+    @pytest.mark.asyncio
+    async def test_listens_and_notifies(self):
+        """Test that the transport listens on its channel and sends with pg_notify."""
+        connection = make_connection()
+        transport = PostgresNotifyTransport(
+            "test_channel", connect=AsyncMock(return_value=connection)
+        )
+        payloads: list[str] = []
+        connected = MagicMock()
+
+        task = asyncio.create_task(transport.run(payloads.append, connected))
+        await asyncio.sleep(0)
+
+        channel, listener = connection.add_listener.call_args.args
+        assert channel == "test_channel"
+        connected.assert_called_once()
+
+        listener(connection, 1, "test_channel", "payload")
+        assert payloads == ["payload"]
+
+        await transport.send("hello")
+        connection.execute.assert_awaited_once_with(
+            "SELECT pg_notify($1, $2)", "test_channel", "hello"
+        )
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_send_without_connection_raises(self):
+        """Test that sending before connecting raises ConnectionError."""
+        transport = PostgresNotifyTransport("test_channel")
+
+        with pytest.raises(ConnectionError):
+            await transport.send("hello")
+
+    @pytest.mark.asyncio
+    async def test_reconnects_with_backoff(self):
+        """Test that connection failures and lost connections are retried."""
+        first, second = make_connection(), make_connection()
+        connect = AsyncMock(side_effect=[OSError("refused"), first, second])
+        transport = PostgresNotifyTransport(
+            "test_channel", connect=connect, initial_backoff=0.001
+        )
+        connected = MagicMock()
+
+        task = asyncio.create_task(transport.run(MagicMock(), connected))
+        await asyncio.sleep(0.05)
+        assert connected.call_count == 1
+
+        # Simulate the server dropping the first connection
+        (on_terminated,) = first.add_termination_listener.call_args.args
+        on_terminated(first)
+        await asyncio.sleep(0.05)
+
+        assert connect.await_count == 3
+        assert connected.call_count == 2
+        first.terminate.assert_called_once()
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_failed_health_check_reconnects(self):
+        """Test that an unresponsive connection is replaced."""
+        first, second = make_connection(), make_connection()
+        first.fetchval.side_effect = OSError("broken pipe")
+        connect = AsyncMock(side_effect=[first, second])
+        transport = PostgresNotifyTransport(
+            "test_channel", connect=connect, health_check_interval=0.01
+        )
+
+        task = asyncio.create_task(transport.run(MagicMock(), MagicMock()))
+        await asyncio.sleep(0.05)
+
+        assert connect.await_count == 2
+        first.terminate.assert_called_once()
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_send_failure_raises_connection_error(self):
+        """Test that NOTIFY failures are reported as ConnectionError."""
+        connection = make_connection()
+        connection.execute.side_effect = OSError("broken pipe")
+        transport = PostgresNotifyTransport(
+            "test_channel", connect=AsyncMock(return_value=connection)
+        )
+
+        task = asyncio.create_task(transport.run(MagicMock(), MagicMock()))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ConnectionError):
+            await transport.send("hello")
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,34 @@
+"""Unit tests for the Bloom filter."""
+
+from app.core.revocation import BloomFilter
+
+
+class TestBloomFilter:
+    """Test suite for BloomFilter class."""
+
+    def test_added_items_are_present(self):
+        """Test that the filter never reports an added item as absent."""
+        bloom = BloomFilter(capacity=100)
+        items = [f"item-{i}" for i in range(100)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        assert bloom.count == 100
+
+    def test_false_positive_rate_near_target(self):
+        """Test that absent items are rarely reported as present at capacity."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"revoked-{i}")
+
+        false_positives = sum(f"valid-{i}" in bloom for i in range(10000))
+
+        assert false_positives < 300
+
+    def test_sizing(self):
+        """Test that the bit array and hash count follow the standard formulas."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+
+        assert bloom.size == 9586
+        assert bloom.hashes == 7
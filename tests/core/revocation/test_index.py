@@ -0,0 +1,81 @@
+"""Unit tests for the in-memory revocation index."""
+
+from app.core.revocation import RevocationIndex
+from app.core.revocation.index import MIN_BLOOM_CAPACITY
+
+
+class TestRevocationIndex:
+    """Test suite for RevocationIndex class."""
+
+    def test_revoked_token(self):
+        """Test that only the revoked token ID is reported as revoked."""
+        index = RevocationIndex()
+        index.add_token("jti-1", expires=1000)
+
+        assert index.is_revoked("jti-1", "user", issued_at=100)
+        assert not index.is_revoked("jti-2", "user", issued_at=100)
+
+    def test_revoked_principal_uses_cutoff(self):
+        """Test that a principal revocation covers tokens issued up to its cutoff."""
+        index = RevocationIndex()
+        index.add_principal("user", cutoff=500, expires=2000)
+
+        assert index.is_revoked("jti-1", "user", issued_at=500)
+        assert not index.is_revoked("jti-2", "user", issued_at=501)
+        assert not index.is_revoked("jti-3", "other", issued_at=100)
+
+    def test_principal_keeps_latest_cutoff(self):
+        """Test that an earlier revocation does not shorten a later one."""
+        index = RevocationIndex()
+        index.add_principal("user", cutoff=500, expires=2000)
+        index.add_principal("user", cutoff=300, expires=1800)
+
+        assert index.is_revoked("jti", "user", issued_at=400)
+        assert index.prune(now=1900) == 0
+
+    def test_prune_drops_expired_entries(self):
+        """Test that entries are dropped once their tokens have expired."""
+        index = RevocationIndex()
+        index.add_token("short", expires=100)
+        index.add_token("long", expires=300)
+        index.add_principal("user", cutoff=50, expires=200)
+
+        assert index.prune(now=250) == 2
+
+        assert not index.is_revoked("short", "user", issued_at=10)
+        assert index.is_revoked("long", "user", issued_at=10)
+        assert index.tokens == 1
+        assert index.principals == 0
+
+    def test_prune_respects_extended_expiry(self):
+        """Test that re-adding a token with a later expiry keeps it past the first."""
+        index = RevocationIndex()
+        index.add_token("jti", expires=100)
+        index.add_token("jti", expires=300)
+
+        assert index.prune(now=200) == 0
+        assert index.is_revoked("jti", "user", issued_at=10)
+
+    def test_bloom_grows_with_tokens(self):
+        """Test that the filter is rebuilt larger once it is over capacity."""
+        index = RevocationIndex()
+        initial_bits = index.metrics()["bloom_bits"]
+        count = MIN_BLOOM_CAPACITY + 1
+        for i in range(count):
+            index.add_token(f"jti-{i}", expires=1000)
+
+        assert index.metrics()["bloom_bits"] > initial_bits
+        assert all(
+            index.is_revoked(f"jti-{i}", "user", issued_at=0) for i in range(count)
+        )
+
+    def test_clear(self):
+        """Test that clear removes every entry."""
+        index = RevocationIndex()
+        index.add_token("jti", expires=1000)
+        index.add_principal("user", cutoff=500, expires=1000)
+
+        index.clear()
+
+        assert not index.is_revoked("jti", "user", issued_at=0)
+        assert index.metrics()["tokens"] == 0
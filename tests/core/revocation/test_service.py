@@ -0,0 +1,211 @@
+"""Unit tests for token revocation shared through the database."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid7
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.invalidation import InvalidationBus
+from app.core.revocation import TokenRevocations
+from app.models import KTokenRevocation
+
+
+class FakeClock:
+    """Manually advanced UTC clock."""
+
+    def __init__(self) -> None:
+        self.now = datetime(2026, 1, 1, 12, 0, 0)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _timestamp(value: datetime) -> int:
+    return int(value.replace(tzinfo=UTC).timestamp())
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def bus() -> InvalidationBus:
+    """Create a bus that only dispatches locally."""
+    return InvalidationBus()
+
+
+@pytest.fixture
+def make_worker(async_engine, bus, clock):
+    """Create revocations for one worker, sharing the test database and bus."""
+
+    def make(sync_interval: float = 0) -> TokenRevocations:
+        return TokenRevocations(
+            sync_interval=sync_interval,
+            sweep_interval=0,
+            max_token_lifetime=timedelta(days=7),
+            db_session_factory=async_sessionmaker(bind=async_engine),
+            bus=bus,
+            clock=clock,
+        )
+
+    return make
+
+
+@pytest.fixture
+async def db(async_engine):
+    """Create a session for the revoking request."""
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+def _payload(clock: FakeClock, sub: str, lifetime: timedelta) -> dict:
+    issued = _timestamp(clock.now)
+    return {
+        "sub": sub,
+        "jti": str(uuid7()),
+        "iat": issued,
+        "exp": issued + int(lifetime.total_seconds()),
+    }
+
+
+class TestTokenRevocations:
+    """Test suite for TokenRevocations class."""
+
+    @pytest.mark.asyncio
+    async def test_revoke_token_applies_locally_and_persists(
+        self, make_worker, db, clock
+    ):
+        """Test that a revoked token is rejected at once and stored."""
+        worker = make_worker()
+        payload = _payload(clock, str(uuid7()), timedelta(minutes=30))
+
+        await worker.revoke_token(db, payload)
+
+        assert worker.is_revoked(payload)
+        row = (await db.execute(select(KTokenRevocation))).scalar_one()
+        assert row.jti == payload["jti"]
+        assert row.expires_at == clock.now + timedelta(minutes=30)
+
+    @pytest.mark.asyncio
+    async def test_other_worker_sees_revocation_after_sync(
+        self, make_worker, db, clock
+    ):
+        """Test that a revocation made by one worker reaches another on sync."""
+        revoking, other = make_worker(), make_worker()
+        payload = _payload(clock, str(uuid7()), timedelta(minutes=30))
+
+        await revoking.revoke_token(db, payload)
+        assert not other.is_revoked(payload)
+
+        assert await other.sync() == 1
+        assert other.is_revoked(payload)
+
+    @pytest.mark.asyncio
+    async def test_revoke_principal(self, make_worker, db, clock):
+        """Test that revoking a principal rejects tokens issued before it."""
+        worker, other = make_worker(), make_worker()
+        principal_id = uuid7()
+        before = _payload(clock, str(principal_id), timedelta(days=7))
+
+        await worker.revoke_principal(db, principal_id)
+        await other.sync()
+        clock.now += timedelta(seconds=1)
+        after = _payload(clock, str(principal_id), timedelta(days=7))
+
+        for revocations in (worker, other):
+            assert revocations.is_revoked(before)
+            assert not revocations.is_revoked(after)
+
+    @pytest.mark.asyncio
+    async def test_sync_is_incremental(self, make_worker, db, clock):
+        """Test that a sync only reads rows revoked since the previous one."""
+        worker = make_worker()
+        await worker.revoke_token(
+            db, _payload(clock, str(uuid7()), timedelta(minutes=30))
+        )
+        await worker.sync()
+
+        # A row revoked long before the last one seen is not read again
+        await db.execute(
+            insert(KTokenRevocation).values(
+                jti="stale",
+                principal_id=uuid7(),
+                revoked_at=clock.now - timedelta(hours=1),
+                expires_at=clock.now + timedelta(hours=1),
+            )
+        )
+        await db.commit()
+
+        assert await worker.sync() == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_prunes_expired(self, make_worker, db, clock):
+        """Test that expired revocations are dropped from memory."""
+        worker = make_worker()
+        payload = _payload(clock, str(uuid7()), timedelta(minutes=30))
+        await worker.revoke_token(db, payload)
+
+        clock.now += timedelta(minutes=31)
+        assert await worker.sync() == 0
+
+        assert worker.index.tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_sweep_deletes_expired_rows(self, make_worker, db, clock):
+        """Test that the sweep deletes only rows whose tokens have expired."""
+        worker = make_worker()
+        await worker.revoke_token(
+            db, _payload(clock, str(uuid7()), timedelta(minutes=30))
+        )
+        await worker.revoke_principal(db, uuid7())
+
+        clock.now += timedelta(hours=1)
+
+        assert await worker.sweep() == 1
+        count = await db.scalar(select(func.count()).select_from(KTokenRevocation))
+        assert count == 1
+
+    @pytest.mark.asyncio
+    async def test_broadcast_wakes_other_workers(self, make_worker, db, clock):
+        """Test that a revocation broadcast makes other workers sync immediately."""
+        revoking, other = make_worker(), make_worker()
+        await other.start()
+        try:
+            payload = _payload(clock, str(uuid7()), timedelta(minutes=30))
+            await revoking.revoke_token(db, payload)
+            await asyncio.sleep(0.05)
+
+            assert other.is_revoked(payload)
+        finally:
+            await other.stop()
+
+    @pytest.mark.asyncio
+    async def test_start_loads_existing_revocations(self, make_worker, db, clock):
+        """Test that a starting worker loads revocations made earlier."""
+        payload = _payload(clock, str(uuid7()), timedelta(minutes=30))
+        await make_worker().revoke_token(db, payload)
+
+        worker = make_worker()
+        await worker.start()
+        await worker.stop()
+
+        assert worker.is_revoked(payload)
+
+    @pytest.mark.asyncio
+    async def test_clear_forces_full_reload(self, make_worker, db, clock):
+        """Test that clear empties the index and the next sync reloads everything."""
+        worker = make_worker()
+        payload = _payload(clock, str(uuid7()), timedelta(minutes=30))
+        await worker.revoke_token(db, payload)
+        await worker.sync()
+
+        worker.clear()
+        assert not worker.is_revoked(payload)
+
+        await worker.sync()
+        assert worker.is_revoked(payload)
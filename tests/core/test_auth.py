@@ -1,6 +1,7 @@
 """Unit tests for authentication and security utilities."""
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 from uuid import uuid7
 
 import pytest
@@ -11,9 +12,11 @@ from app.core.auth import (
     create_access_token,
     create_refresh_token,
     get_password_hash,
+    verified_token_cache,
     verify_password,
     verify_token,
 )
+from app.core.revocation import token_revocations
 from app.models import KPrincipal, KPrincipalIdentity
 from app.schemas.user import UserDetail
 
@@ -21,66 +24,84 @@ from app.schemas.user import UserDetail
 class TestPasswordHashing:
     """Test suite for password hashing functions."""
 
-    def test_get_password_hash_returns_string(self):
+    @pytest.mark.asyncio
+    async def test_get_password_hash_returns_string(self):
         """Test that get_password_hash returns a string."""
         password = "test_password_123"
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         assert isinstance(hashed, str)
         assert len(hashed) > 0
 
-    def test_get_password_hash_different_passwords_different_hashes(self):
+    @pytest.mark.asyncio
+    async def test_get_password_hash_different_passwords_different_hashes(self):
         """Test that different passwords produce different hashes."""
         password1 = "password1"
         password2 = "password2"
 
-        hash1 = get_password_hash(password1)
-        hash2 = get_password_hash(password2)
+        hash1 = await get_password_hash(password1)
+        hash2 = await get_password_hash(password2)
 
         assert hash1 != hash2
 
-    def test_get_password_hash_same_password_different_hashes(self):
+    @pytest.mark.asyncio
+    async def test_get_password_hash_same_password_different_hashes(self):
         """Test that same password produces different hashes (due to salt)."""
         password = "same_password"
 
-        hash1 = get_password_hash(password)
-        hash2 = get_password_hash(password)
+        hash1 = await get_password_hash(password)
+        hash2 = await get_password_hash(password)
 
         # Due to bcrypt salting, hashes should be different
         assert hash1 != hash2
 
-    def test_get_password_hash_empty_password(self):
+    @pytest.mark.asyncio
+    async def test_get_password_hash_empty_password(self):
         """Test hashing an empty password."""
         password = ""
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         assert isinstance(hashed, str)
         assert len(hashed) > 0
 
-    def test_get_password_hash_long_password(self):
+    @pytest.mark.asyncio
+    async def test_get_password_hash_long_password(self):
         """Test hashing a very long password."""
         password = "a" * 1000
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         assert isinstance(hashed, str)
         assert len(hashed) > 0
 
-    def test_get_password_hash_special_characters(self):
+    @pytest.mark.asyncio
+    async def test_get_password_hash_special_characters(self):
         """Test hashing password with special characters."""
         password = "p@ssw0rd!#$%^&*()_+-=[]{}|;:',.<>?/~`"
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         assert isinstance(hashed, str)
         assert len(hashed) > 0
 
-    def test_get_password_hash_unicode_characters(self):
+    @pytest.mark.asyncio
+    async def test_get_password_hash_unicode_characters(self):
         """Test hashing password with unicode characters."""
         password = "пароль密码🔒"
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         assert isinstance(hashed, str)
         assert len(hashed) > 0
 
+    @pytest.mark.asyncio
+    async def test_get_password_hash_uses_configured_rounds(self):
+        """Test that new hashes use the configured bcrypt cost factor."""
+        from app.config import settings
+
+        with patch.object(settings, "password_hash_rounds", 5):
+            hashed = await get_password_hash("password")
+
+        assert hashed.startswith("$2b$05$")
+        assert await verify_password("password", hashed)
+
 
 class TestPasswordVerification:
     """Test suite for password verification."""
@@ -89,7 +110,7 @@ class TestPasswordVerification:
     async def test_verify_password_correct_password(self):
         """Test verifying a correct password."""
         password = "correct_password"
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         is_valid = await verify_password(password, hashed)
 
@@ -100,7 +121,7 @@ class TestPasswordVerification:
         """Test verifying an incorrect password."""
         correct_password = "correct_password"
         wrong_password = "wrong_password"
-        hashed = get_password_hash(correct_password)
+        hashed = await get_password_hash(correct_password)
 
         is_valid = await verify_password(wrong_password, hashed)
 
@@ -110,7 +131,7 @@ class TestPasswordVerification:
     async def test_verify_password_empty_password(self):
         """Test verifying an empty password."""
         password = ""
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         is_valid = await verify_password(password, hashed)
 
@@ -120,7 +141,7 @@ class TestPasswordVerification:
     async def test_verify_password_case_sensitive(self):
         """Test that password verification is case-sensitive."""
         password = "Password123"
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         # Test with different case
         is_valid = await verify_password("password123", hashed)
@@ -131,7 +152,7 @@ class TestPasswordVerification:
     async def test_verify_password_special_characters(self):
         """Test verifying password with special characters."""
         password = "p@ssw0rd!#$%"
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         is_valid = await verify_password(password, hashed)
 
@@ -141,7 +162,7 @@ class TestPasswordVerification:
     async def test_verify_password_unicode_characters(self):
         """Test verifying password with unicode characters."""
         password = "пароль密码🔒"
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         is_valid = await verify_password(password, hashed)
 
@@ -151,7 +172,7 @@ class TestPasswordVerification:
     async def test_verify_password_long_password(self):
         """Test verifying a long password."""
         password = "a" * 500
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         is_valid = await verify_password(password, hashed)
 
@@ -515,6 +536,101 @@ class TestTokenVerification:
         assert payload["custom_claim"] == "custom_value"
 
 
+class TestVerifiedTokenCache:
+    """Test suite for the verified-token cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_verification_skips_decode(self):
+        """Test that a token verified once is served from the cache."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        token = await create_access_token({"sub": "user123", "scope": "test"}, now)
+
+        with patch("app.core.auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+            first = await verify_token(token)
+            second = await verify_token(token)
+
+        assert mock_decode.call_count == 1
+        assert first == second
+        assert verified_token_cache.hits == 1
+        assert verified_token_cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_payload_is_a_copy(self):
+        """Test that callers mutating a payload do not change the cached one."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        token = await create_access_token({"sub": "user123", "scope": "test"}, now)
+
+        payload = await verify_token(token)
+        payload["sub"] = "someone-else"
+
+        assert (await verify_token(token))["sub"] == "user123"
+
+    @pytest.mark.asyncio
+    async def test_invalid_tokens_not_cached(self):
+        """Test that rejected tokens are not cached."""
+        await verify_token("invalid.token.here")
+
+        assert len(verified_token_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_with_token(self):
+        """Test that an entry is cached only until the token's exp claim."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        token = await create_access_token(
+            {"sub": "user123", "scope": "test"}, now, expires_delta=timedelta(minutes=5)
+        )
+
+        with patch.object(verified_token_cache, "set") as mock_set:
+            await verify_token(token)
+
+        ttl = mock_set.call_args.kwargs["ttl"]
+        assert 290 < ttl <= 300
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        """Test that a max size of 0 disables caching."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        token = await create_access_token({"sub": "user123", "scope": "test"}, now)
+
+        with patch.object(verified_token_cache, "maxsize", 0):
+            assert await verify_token(token) is not None
+
+        assert len(verified_token_cache) == 0
+        assert verified_token_cache.evictions == 0
+
+
+class TestRevokedTokens:
+    """Test suite for revocation checks in verify_token."""
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_rejected(self):
+        """Test that a revoked token fails verification."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        token = await create_access_token({"sub": "user123", "scope": "test"}, now)
+        payload = await verify_token(token)
+
+        token_revocations.index.add_token(payload["jti"], payload["exp"])
+
+        assert await verify_token(token) is None
+
+    @pytest.mark.asyncio
+    async def test_revoked_principal_rejects_earlier_tokens(self):
+        """Test that revoking a principal rejects tokens issued up to the cutoff."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        old = await create_access_token(
+            {"sub": "user123", "scope": "test"}, now - timedelta(minutes=1)
+        )
+        new = await create_access_token(
+            {"sub": "user123", "scope": "test"}, now + timedelta(seconds=5)
+        )
+        cutoff = int(now.replace(tzinfo=UTC).timestamp())
+
+        token_revocations.index.add_principal("user123", cutoff, cutoff + 3600)
+
+        assert await verify_token(old) is None
+        assert await verify_token(new) is not None
+
+
 class TestTokenIntegration:
     """Integration tests for token creation and verification."""
 
@@ -574,7 +690,7 @@ class TestTokenIntegration:
         """Test complete password hashing and token creation workflow."""
         # Hash password
         password = "secure_password_123"
-        hashed = get_password_hash(password)
+        hashed = await get_password_hash(password)
 
         # Verify password
         is_valid = await verify_password(password, hashed)
@@ -619,7 +735,7 @@ class TestAuthenticateUser:
 
         # Create identity with password
         password = "test_password_123"
-        hashed_password = get_password_hash(password)
+        hashed_password = await get_password_hash(password)
         identity = KPrincipalIdentity(
             principal_id=user_id,
             password=hashed_password,
@@ -638,6 +754,45 @@ class TestAuthenticateUser:
         assert result.username == "testuser"
         assert result.id == user_id
 
+    @pytest.mark.asyncio
+    async def test_authenticate_user_single_query(self, async_session, creator_id):
+        """Test that the principal and password hash are fetched in one query."""
+        user_id = uuid7()
+        async_session.add(
+            KPrincipal(
+                id=user_id,
+                scope="global",
+                username="onequery",
+                primary_email="onequery@example.com",
+                human=True,
+                enabled=True,
+                first_name="One",
+                last_name="Query",
+                display_name="One Query",
+                created_by=creator_id,
+                last_modified_by=creator_id,
+            )
+        )
+        await async_session.commit()
+        async_session.add(
+            KPrincipalIdentity(
+                principal_id=user_id,
+                password=await get_password_hash("password"),
+                created_by=user_id,
+                last_modified_by=user_id,
+            )
+        )
+        await async_session.commit()
+
+        with patch.object(
+            async_session, "execute", wraps=async_session.execute
+        ) as mock_execute:
+            result = await authenticate_user("onequery", "password", async_session)
+
+        assert result is not None
+        assert result.id == user_id
+        assert mock_execute.call_count == 1
+
     @pytest.mark.asyncio
     async def test_authenticate_user_wrong_password(self, async_session, creator_id):
         """Test authentication fails with wrong password."""
@@ -661,7 +816,7 @@ class TestAuthenticateUser:
         await async_session.refresh(principal)
 
         password = "correct_password"
-        hashed_password = get_password_hash(password)
+        hashed_password = await get_password_hash(password)
         identity = KPrincipalIdentity(
             principal_id=user_id,
             password=hashed_password,
@@ -766,7 +921,7 @@ class TestAuthenticateUser:
         await async_session.commit()
 
         password = "password123"
-        hashed_password = get_password_hash(password)
+        hashed_password = await get_password_hash(password)
         identity = KPrincipalIdentity(
             principal_id=user_id,
             password=hashed_password,
@@ -803,7 +958,7 @@ class TestAuthenticateUser:
         await async_session.commit()
 
         password = "password123"
-        hashed_password = get_password_hash(password)
+        hashed_password = await get_password_hash(password)
         identity = KPrincipalIdentity(
             principal_id=user_id,
             password=hashed_password,
@@ -838,7 +993,7 @@ class TestAuthenticateUser:
         await async_session.commit()
 
         password = "password123"
-        hashed_password = get_password_hash(password)
+        hashed_password = await get_password_hash(password)
         identity = KPrincipalIdentity(
             principal_id=user_id,
             password=hashed_password,
@@ -0,0 +1,109 @@
+"""Unit tests for in-process caches."""
+
+from app.core.cache import CacheStats, TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock for expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test suite for TTLCache class."""
+
+    def test_get_and_set(self):
+        """Test that stored values are returned and lookups are counted."""
+        cache: TTLCache[str, int] = TTLCache("test", maxsize=10, ttl=30.0)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_get_returns_default(self):
+        """Test that a missing key returns the provided default."""
+        cache: TTLCache[str, int] = TTLCache("test", maxsize=10, ttl=30.0)
+
+        assert cache.get("missing", -1) == -1
+
+    def test_entries_expire(self):
+        """Test that entries are dropped once their TTL elapses."""
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache("test", maxsize=10, ttl=30.0, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60.0)
+
+        clock.now = 30.0
+
+        assert cache.get("a") is None
+        assert "a" not in cache
+        assert cache.get("b") == 2
+        assert len(cache) == 1
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache: TTLCache[str, int] = TTLCache("test", maxsize=2, ttl=30.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.evictions == 1
+
+    def test_invalidate(self):
+        """Test that single and predicate-based invalidation remove entries."""
+        cache: TTLCache[tuple[int, int], bool] = TTLCache("test", maxsize=10, ttl=30.0)
+        cache.set((1, 1), True)
+        cache.set((1, 2), True)
+        cache.set((2, 1), True)
+
+        assert cache.invalidate((2, 1)) is True
+        assert cache.invalidate((2, 1)) is False
+        assert cache.invalidate_where(lambda key: key[0] == 1) == 2
+        assert len(cache) == 0
+
+    def test_invalidate_items_where(self):
+        """Test that entries can be removed by looking at their values."""
+        cache: TTLCache[str, frozenset[int]] = TTLCache("test", maxsize=10, ttl=30.0)
+        cache.set("a", frozenset({1, 2}))
+        cache.set("b", frozenset({2, 3}))
+        cache.set("c", frozenset({4}))
+
+        assert cache.invalidate_items_where(lambda key, value: 2 in value) == 2
+        assert "a" not in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_stats_and_clear(self):
+        """Test that stats snapshot the counters and clear resets them."""
+        cache: TTLCache[str, int] = TTLCache("test", maxsize=10, ttl=30.0)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+
+        assert stats == CacheStats(
+            name="test", size=1, maxsize=10, hits=2, misses=1, evictions=0
+        )
+        assert stats.hit_ratio == 2 / 3
+
+        cache.clear()
+
+        assert cache.stats().hits == 0
+        assert cache.stats().hit_ratio == 0.0
+        assert len(cache) == 0
@@ -2,7 +2,9 @@
 
 import base64
 import secrets
-from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
 
 from app.core.fido2_server import (
     aaguid_to_hex,
@@ -37,49 +39,65 @@ class TestFido2ServerInstance:
         assert server1.rp.id == server2.rp.id
         assert server1.rp.name == server2.rp.name
 
+    def test_get_fido2_server_reuses_instance(self):
+        """Test that the server is built once per RP configuration."""
+        assert get_fido2_server() is get_fido2_server()
+
+    def test_get_fido2_server_follows_rp_settings(self):
+        """Test that changing the RP settings yields a matching server."""
+        from app.config import settings
+
+        original = get_fido2_server()
+        with patch.object(settings, "rp_id", "other.example.com"):
+            server = get_fido2_server()
+
+        assert server is not original
+        assert server.rp.id == "other.example.com"
+
 
 class TestChallengeStorage:
     """Test suite for challenge storage and retrieval."""
 
-    def test_store_and_retrieve_challenge(self):
+    @pytest.mark.asyncio
+    async def test_store_and_retrieve_challenge(self):
         """Test storing and retrieving a challenge."""
         session_id = "test_session_123"
         challenge = secrets.token_bytes(32)
 
-        store_challenge(session_id, challenge)
-        retrieved = retrieve_challenge(session_id)
+        await store_challenge(session_id, challenge)
+        retrieved = await retrieve_challenge(session_id)
 
         assert retrieved == challenge
 
-    def test_retrieve_removes_challenge(self):
+    @pytest.mark.asyncio
+    async def test_retrieve_removes_challenge(self):
         """Test that retrieving a challenge removes it from storage."""
         session_id = "test_session_456"
         challenge = secrets.token_bytes(32)
 
-        store_challenge(session_id, challenge)
-        retrieve_challenge(session_id)  # First retrieval
-        second_retrieval = retrieve_challenge(session_id)  # Second retrieval
+        await store_challenge(session_id, challenge)
+        await retrieve_challenge(session_id)  # First retrieval
+        second_retrieval = await retrieve_challenge(session_id)  # Second retrieval
 
         assert second_retrieval is None
 
-    def test_retrieve_nonexistent_challenge(self):
+    @pytest.mark.asyncio
+    async def test_retrieve_nonexistent_challenge(self):
         """Test retrieving a challenge that doesn't exist."""
-        result = retrieve_challenge("nonexistent_session")
+        result = await retrieve_challenge("nonexistent_session")
         assert result is None
 
-    def test_retrieve_expired_challenge(self):
-        """Test that expired challenges are not retrieved."""
-        from app.core import fido2_server as fs
-
-        session_id = "expired_session"
-        challenge = secrets.token_bytes(32)
+    @pytest.mark.asyncio
+    async def test_store_uses_configured_ttl(self, memory_challenge_store):
+        """Test that challenges are stored with the configured time-to-live."""
+        from app.config import settings
 
-        # Store with expired timestamp
-        expired_time = datetime.now() - timedelta(minutes=10)
-        fs._challenge_store[session_id] = (challenge, expired_time)
+        with patch.object(memory_challenge_store, "put") as mock_put:
+            await store_challenge("session", b"challenge")
 
-        result = retrieve_challenge(session_id)
-        assert result is None
+        mock_put.assert_called_once_with(
+            "session", b"challenge", ttl=settings.fido2_challenge_ttl_seconds
+        )
 
 
 class TestSessionIdGeneration:
@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 from uuid import uuid7
 
+from app.core.db.instrumentation import QueryStats
 from app.core.logging import (
     add_log_level,
     add_request_context,
@@ -253,6 +254,28 @@ class TestAddRequestContext:
         assert result["request_time"] == "2025-11-08T12:30:45.123456"
         assert isinstance(result["request_time"], str)
 
+    @patch("app.core.logging.sql_instrumentation")
+    def test_add_request_context_sql_stats(self, mock_instrumentation):
+        """Test that the current request's SQL stats are added when tracked."""
+        stats = QueryStats()
+        stats.record("SELECT 1", 0.004, 2)
+        mock_instrumentation.current.return_value = stats
+
+        result = add_request_context(None, "info", {})
+
+        assert result["db_statements"] == 1
+        assert result["db_time_ms"] == 4.0
+        assert result["db_rows"] == 2
+
+    @patch("app.core.logging.sql_instrumentation")
+    def test_add_request_context_no_sql_stats(self, mock_instrumentation):
+        """Test that no SQL stats are added outside a tracked request."""
+        mock_instrumentation.current.return_value = None
+
+        result = add_request_context(None, "info", {})
+
+        assert "db_statements" not in result
+
 
 class TestSetupLogging:
     """Test suite for setup_logging function."""
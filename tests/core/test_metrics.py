@@ -0,0 +1,91 @@
+"""Unit tests for in-process metrics."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.core.metrics import Histogram, MetricsRegistry
+
+
+class TestHistogram:
+    """Test suite for Histogram class."""
+
+    def test_observations_are_cumulative(self):
+        """Test that bucket counts include every smaller bucket."""
+        histogram = Histogram(buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["buckets"] == {"le_0.1": 2, "le_1": 3, "le_inf": 4}
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == pytest.approx(2.65)
+
+    def test_reset(self):
+        """Test that reset clears all observations."""
+        histogram = Histogram(buckets=(0.1,))
+        histogram.observe(0.05)
+
+        histogram.reset()
+
+        assert histogram.snapshot() == {
+            "buckets": {"le_0.1": 0, "le_inf": 0},
+            "count": 0,
+            "sum": 0.0,
+        }
+
+
+class TestMetricsRegistry:
+    """Test suite for MetricsRegistry class."""
+
+    def test_snapshot_collects_sources(self):
+        """Test that the snapshot contains every registered source."""
+        registry = MetricsRegistry()
+        registry.register("a", lambda: {"value": 1})
+        registry.register("b", lambda: {"value": 2})
+        registry.unregister("b")
+
+        assert registry.snapshot() == {"a": {"value": 1}}
+
+    def test_failing_source_is_reported(self):
+        """Test that a failing source does not break the snapshot."""
+        registry = MetricsRegistry()
+
+        def broken() -> dict:
+            raise RuntimeError("boom")
+
+        registry.register("broken", broken)
+        registry.register("ok", lambda: {"value": 1})
+
+        assert registry.snapshot() == {
+            "broken": {"error": "boom"},
+            "ok": {"value": 1},
+        }
+
+    @pytest.mark.asyncio
+    @patch("app.core.metrics.logger")
+    async def test_reporting_logs_snapshots(self, mock_logger):
+        """Test that reporting logs snapshots until stopped."""
+        registry = MetricsRegistry()
+        registry.register("a", lambda: {"value": 1})
+
+        await registry.start_reporting(0.01)
+        await asyncio.sleep(0.05)
+        await registry.stop_reporting()
+
+        mock_logger.info.assert_called_with(
+            "Metrics snapshot", metrics={"a": {"value": 1}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_reporting_disabled_with_zero_interval(self):
+        """Test that a non-positive interval disables reporting."""
+        registry = MetricsRegistry()
+
+        await registry.start_reporting(0)
+
+        assert registry._report_task is None
+        await registry.stop_reporting()
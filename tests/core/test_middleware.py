@@ -2,10 +2,12 @@
 
 import asyncio
 from datetime import UTC, datetime
+from unittest.mock import patch
 from uuid import UUID, uuid7
 
 import pytest
 from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
 from httpx import ASGITransport, AsyncClient
 
 from app.core.auth import create_access_token
@@ -15,6 +17,7 @@ from app.core.context import (
     get_request_id,
     get_request_time,
 )
+from app.core.db.instrumentation import sql_instrumentation
 from app.core.middleware import RequestContextMiddleware
 
 
@@ -473,6 +476,176 @@ class TestRequestContextMiddleware:
         assert data["has_jwt_payload"] is False
 
 
+class TestASGIPassthrough:
+    """Test suite for the middleware's raw ASGI behavior."""
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passed_through(self):
+        """Test that lifespan and websocket scopes reach the app unchanged."""
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.append((scope, get_request_id()))
+
+        middleware = RequestContextMiddleware(app)
+        scope = {"type": "lifespan"}
+
+        await middleware(scope, None, None)
+
+        assert seen == [({"type": "lifespan"}, None)]
+
+    @pytest.mark.asyncio
+    async def test_app_runs_in_caller_task(self, test_app):
+        """Test that the app runs in the server's task rather than a new one."""
+        tasks = []
+
+        @test_app.get("/task")
+        async def task():  # noqa: F841 (used as route handler)
+            tasks.append(asyncio.current_task())
+            return {}
+
+        async with AsyncClient(
+            transport=ASGITransport(app=test_app), base_url="http://test"
+        ) as client:
+            await client.get("/task")
+
+        assert tasks == [asyncio.current_task()]
+
+    @pytest.mark.asyncio
+    async def test_streaming_body_passed_through(self, test_app):
+        """Test that each streamed chunk is forwarded as its own message."""
+
+        @test_app.get("/stream")
+        async def stream():  # noqa: F841 (used as route handler)
+            async def chunks():
+                yield b"one\n"
+                yield b"two\n"
+
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        messages = []
+        requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            # Block like a connected client until the response is finished
+            await asyncio.Event().wait()
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/stream",
+            "raw_path": b"/stream",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [],
+            "server": ("test", 80),
+        }
+
+        await test_app(scope, receive, send)
+
+        bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+        assert bodies[:2] == [b"one\n", b"two\n"]
+
+
+class TestSQLInstrumentationMiddleware:
+    """Test suite for the middleware's SQL statistics handling."""
+
+    @pytest.fixture
+    def sql_app(self, test_app):
+        """Add a route that records repeated statements for the current request."""
+
+        @test_app.get("/items/{count}")
+        async def items(count: int):  # noqa: F841 (used as route handler)
+            stats = sql_instrumentation.current()
+            for _ in range(count):
+                stats.record("SELECT * FROM item WHERE id = $1", 0.001, 1)
+            return {"statements": stats.statements}
+
+        sql_instrumentation.reset()
+        yield test_app
+        sql_instrumentation.reset()
+
+    @pytest.mark.asyncio
+    async def test_stats_tracked_during_request(self, sql_app):
+        """Test that stats exist during the request and are released after it."""
+        async with AsyncClient(
+            transport=ASGITransport(app=sql_app), base_url="http://test"
+        ) as client:
+            response = await client.get("/items/2")
+
+        assert response.json() == {"statements": 2}
+        assert sql_instrumentation.metrics()["active_requests"] == 0
+        assert sql_instrumentation.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_server_timing_header(self, sql_app):
+        """Test that Server-Timing is added when enabled."""
+        with patch("app.core.middleware.settings") as mock_settings:
+            mock_settings.server_timing_enabled = True
+            mock_settings.sql_n_plus_one_threshold = 0
+            async with AsyncClient(
+                transport=ASGITransport(app=sql_app), base_url="http://test"
+            ) as client:
+                response = await client.get("/items/2")
+
+        assert response.headers["Server-Timing"] == 'db;dur=2.0;desc="2 queries"'
+
+    @pytest.mark.asyncio
+    async def test_no_server_timing_header_by_default(self, sql_app):
+        """Test that Server-Timing is omitted unless enabled."""
+        async with AsyncClient(
+            transport=ASGITransport(app=sql_app), base_url="http://test"
+        ) as client:
+            response = await client.get("/items/2")
+
+        assert "Server-Timing" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_repeated_statements_logged(self, sql_app):
+        """Test that a statement shape above the threshold is logged once."""
+        with (
+            patch("app.core.middleware.settings") as mock_settings,
+            patch("app.core.middleware.logger") as mock_logger,
+        ):
+            mock_settings.server_timing_enabled = False
+            mock_settings.sql_n_plus_one_threshold = 3
+            async with AsyncClient(
+                transport=ASGITransport(app=sql_app), base_url="http://test"
+            ) as client:
+                await client.get("/items/4")
+
+        mock_logger.warning.assert_called_once()
+        kwargs = mock_logger.warning.call_args.kwargs
+        assert kwargs["route"] == "GET /items/{count}"
+        assert kwargs["count"] == 4
+        assert kwargs["db_statements"] == 4
+        assert sql_instrumentation.n_plus_one_routes == {"GET /items/{count}": 1}
+
+    @pytest.mark.asyncio
+    async def test_statements_under_threshold_not_logged(self, sql_app):
+        """Test that requests within the threshold are not logged."""
+        with (
+            patch("app.core.middleware.settings") as mock_settings,
+            patch("app.core.middleware.logger") as mock_logger,
+        ):
+            mock_settings.server_timing_enabled = False
+            mock_settings.sql_n_plus_one_threshold = 3
+            async with AsyncClient(
+                transport=ASGITransport(app=sql_app), base_url="http://test"
+            ) as client:
+                await client.get("/items/3")
+
+        mock_logger.warning.assert_not_called()
+
+
 class TestRequestContextGetters:
     """Test suite for context getter functions."""
 
@@ -0,0 +1,86 @@
+"""Unit tests for the bounded password hasher."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.exceptions.domain_exceptions import PasswordHashingUnavailableException
+from app.core.password_hasher import PasswordHasher
+
+
+@pytest.fixture
+def hasher():
+    """Create a hasher with one worker and one queue slot."""
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    yield hasher
+    hasher.shutdown()
+
+
+class TestPasswordHasher:
+    """Test suite for PasswordHasher class."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self, hasher):
+        """Test that functions run on a worker thread and return their result."""
+        result = await hasher.run(lambda value: (value, threading.get_ident()), 42)
+
+        assert result[0] == 42
+        assert result[1] != threading.get_ident()
+        assert hasher.completed == 1
+        assert hasher.queue_wait.count == 1
+        assert hasher.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_pool_and_queue_are_full(self, hasher):
+        """Test that calls beyond the workers plus queue are rejected immediately."""
+        release = threading.Event()
+        running = [
+            asyncio.create_task(hasher.run(release.wait)),
+            asyncio.create_task(hasher.run(release.wait)),
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHashingUnavailableException):
+            await hasher.run(release.wait)
+
+        release.set()
+        await asyncio.gather(*running)
+        assert hasher.rejected == 1
+        assert hasher.completed == 2
+        assert hasher.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_exceptions_release_the_slot(self, hasher):
+        """Test that a failing function propagates and frees its slot."""
+
+        def fail() -> None:
+            raise ValueError("Invalid salt")
+
+        with pytest.raises(ValueError):
+            await hasher.run(fail)
+
+        assert hasher.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_metrics_and_reset(self, hasher):
+        """Test that metrics report occupancy and counters."""
+        await hasher.run(lambda: None)
+
+        metrics = hasher.metrics()
+
+        assert metrics["max_workers"] == 1
+        assert metrics["completed"] == 1
+        assert metrics["queue_wait"]["count"] == 1
+
+        hasher.reset()
+
+        assert hasher.metrics()["completed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shutdown_recreates_pool_on_demand(self, hasher):
+        """Test that the pool is recreated after a shutdown."""
+        await hasher.run(lambda: None)
+        hasher.shutdown()
+
+        assert await hasher.run(lambda: 1) == 1
@@ -6,11 +6,12 @@ from uuid import uuid7
 
 import pytest
 
+from app.core.auth import create_access_token, create_refresh_token, verify_token
 from app.core.exceptions.domain_exceptions import (
     InvalidCredentialsException,
     InvalidTokenException,
 )
-from app.logic.auth import perform_login, refresh_access_token
+from app.logic.auth import perform_login, perform_logout, refresh_access_token
 from app.models.k_principal import SystemRole
 from app.schemas.user import Token, UserDetail
 
@@ -506,3 +507,68 @@ class TestRefreshAccessToken:
                 await refresh_access_token("expired_session_token")
 
             assert "absolute expiration" in exc_info.value.message
+
+
+class TestPerformLogout:
+    """Test suite for perform_logout function."""
+
+    @staticmethod
+    async def _tokens(user_id: str) -> tuple[str, str]:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        data = {"sub": user_id, "scope": "global"}
+        return (
+            await create_access_token(data=data, now=now),
+            await create_refresh_token(data=data, now=now),
+        )
+
+    @pytest.mark.asyncio
+    async def test_logout_revokes_access_and_refresh_tokens(self, async_session):
+        """Test that both tokens of the session stop verifying."""
+        access_token, refresh_token = await self._tokens(str(uuid7()))
+
+        await perform_logout(access_token, async_session, refresh_token=refresh_token)
+
+        assert await verify_token(access_token) is None
+        assert await verify_token(refresh_token) is None
+        with pytest.raises(InvalidTokenException):
+            await refresh_access_token(refresh_token)
+
+    @pytest.mark.asyncio
+    async def test_logout_leaves_other_sessions(self, async_session):
+        """Test that logging out one session keeps the user's other sessions."""
+        user_id = str(uuid7())
+        access_token, _ = await self._tokens(user_id)
+        other_access, other_refresh = await self._tokens(user_id)
+
+        await perform_logout(access_token, async_session)
+
+        assert await verify_token(other_access) is not None
+        assert await verify_token(other_refresh) is not None
+
+    @pytest.mark.asyncio
+    async def test_logout_ignores_refresh_token_of_another_user(self, async_session):
+        """Test that a refresh token issued to someone else is not revoked."""
+        access_token, _ = await self._tokens(str(uuid7()))
+        _, foreign_refresh = await self._tokens(str(uuid7()))
+
+        await perform_logout(access_token, async_session, refresh_token=foreign_refresh)
+
+        assert await verify_token(foreign_refresh) is not None
+
+    @pytest.mark.asyncio
+    async def test_logout_all_sessions(self, async_session):
+        """Test that all_sessions revokes every token issued to the user."""
+        user_id = str(uuid7())
+        access_token, _ = await self._tokens(user_id)
+        other_access, other_refresh = await self._tokens(user_id)
+
+        await perform_logout(access_token, async_session, all_sessions=True)
+
+        for token in (access_token, other_access, other_refresh):
+            assert await verify_token(token) is None
+
+    @pytest.mark.asyncio
+    async def test_logout_with_invalid_token(self, async_session):
+        """Test that an access token that does not verify is rejected."""
+        with pytest.raises(InvalidTokenException):
+            await perform_logout("invalid.token.here", async_session)
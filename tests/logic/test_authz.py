@@ -0,0 +1,353 @@
+"""Unit tests for the authorization engine."""
+
+from uuid import UUID, uuid7
+
+import pytest
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions.domain_exceptions import (
+    InsufficientPrivilegesException,
+    UnauthorizedOrganizationAccessException,
+)
+from app.logic.authz import (
+    authorization_cache,
+    check_project_member,
+    check_project_member_or_reviewer,
+    check_team_member,
+    check_team_member_or_reviewer,
+    get_principal_grants,
+)
+from app.logic.deps import membership_cache, verify_organization_membership
+from app.logic.v1.project_teams import add_project_team, remove_project_team
+from app.logic.v1.team_members import add_team_member, remove_team_member
+from app.logic.v1.team_reviewers import add_team_reviewer
+from app.models import KOrganization, KOrganizationPrincipal, KProject, KTeam
+from app.schemas.project_team import ProjectTeamCreate
+from app.schemas.team_member import TeamMemberCreate
+from app.schemas.team_reviewer import TeamReviewerCreate
+
+
+@pytest.fixture
+def statements(async_engine) -> list[str]:
+    """Record every statement sent to the test database."""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+async def team(
+    async_session: AsyncSession, test_organization: KOrganization, test_user_id: UUID
+) -> KTeam:
+    """Create a team in the test organization."""
+    team = KTeam(
+        name="Authz Team",
+        org_id=test_organization.id,
+        created_by=test_user_id,
+        last_modified_by=test_user_id,
+    )
+    async_session.add(team)
+    await async_session.commit()
+    await async_session.refresh(team)
+    return team
+
+
+@pytest.fixture
+async def project(
+    async_session: AsyncSession, test_organization: KOrganization, test_user_id: UUID
+) -> KProject:
+    """Create a project in the test organization."""
+    project = KProject(
+        name="Authz Project",
+        org_id=test_organization.id,
+        created_by=test_user_id,
+        last_modified_by=test_user_id,
+    )
+    async_session.add(project)
+    await async_session.commit()
+    await async_session.refresh(project)
+    return project
+
+
+class TestGetPrincipalGrants:
+    """Test suite for get_principal_grants function."""
+
+    @pytest.mark.asyncio
+    async def test_grants_include_teams_and_projects(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        team: KTeam,
+        project: KProject,
+    ):
+        """Test that grants are materialized from all relationship tables."""
+        await add_team_member(
+            team.id,
+            TeamMemberCreate(principal_id=test_user_id),
+            test_user_id,
+            async_session,
+        )
+        await add_project_team(
+            project.id, ProjectTeamCreate(team_id=team.id), test_user_id, async_session
+        )
+
+        grants = await get_principal_grants(
+            test_organization.id, test_user_id, async_session
+        )
+
+        assert grants.teams == frozenset({team.id})
+        assert grants.reviewed_teams == frozenset()
+        assert grants.projects == frozenset({project.id})
+        check_team_member(grants, team.id)
+        check_project_member(grants, project.id)
+
+    @pytest.mark.asyncio
+    async def test_reviewer_grants(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        team: KTeam,
+        project: KProject,
+    ):
+        """Test that reviewers get review access but not membership."""
+        await add_team_reviewer(
+            team.id,
+            TeamReviewerCreate(principal_id=test_user_id),
+            test_user_id,
+            async_session,
+        )
+        await add_project_team(
+            project.id, ProjectTeamCreate(team_id=team.id), test_user_id, async_session
+        )
+
+        grants = await get_principal_grants(
+            test_organization.id, test_user_id, async_session
+        )
+
+        check_team_member_or_reviewer(grants, team.id)
+        check_project_member_or_reviewer(grants, project.id)
+        with pytest.raises(InsufficientPrivilegesException):
+            check_team_member(grants, team.id)
+        with pytest.raises(InsufficientPrivilegesException):
+            check_project_member(grants, project.id)
+
+    @pytest.mark.asyncio
+    async def test_non_member_is_denied_and_not_cached(
+        self,
+        async_session: AsyncSession,
+        test_organization_without_membership: KOrganization,
+        test_user_id: UUID,
+    ):
+        """Test that principals outside the organization get no grants."""
+        org_id = test_organization_without_membership.id
+
+        with pytest.raises(UnauthorizedOrganizationAccessException):
+            await get_principal_grants(org_id, test_user_id, async_session)
+
+        assert (org_id, test_user_id) not in authorization_cache
+
+    @pytest.mark.asyncio
+    async def test_grants_are_cached(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+    ):
+        """Test that cached grants are served without querying."""
+        await get_principal_grants(test_organization.id, test_user_id, async_session)
+
+        # Remove the row behind the cache's back; the cached grants still answer
+        await async_session.execute(delete(KOrganizationPrincipal))
+        await async_session.commit()
+
+        await get_principal_grants(test_organization.id, test_user_id, async_session)
+
+        assert authorization_cache.stats().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_checks_on_cached_grants_issue_no_query(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        team: KTeam,
+        statements: list[str],
+    ):
+        """Test that loading cached grants and checking them runs no statement."""
+        await add_team_member(
+            team.id,
+            TeamMemberCreate(principal_id=test_user_id),
+            test_user_id,
+            async_session,
+        )
+        await get_principal_grants(test_organization.id, test_user_id, async_session)
+        statements.clear()
+
+        grants = await get_principal_grants(
+            test_organization.id, test_user_id, async_session
+        )
+        check_team_member(grants, team.id)
+        check_team_member_or_reviewer(grants, team.id)
+
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_cached_grants_answer_membership_checks(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+    ):
+        """Test that verify_organization_membership is answered by cached grants."""
+        await get_principal_grants(test_organization.id, test_user_id, async_session)
+        await async_session.execute(delete(KOrganizationPrincipal))
+        await async_session.commit()
+
+        await verify_organization_membership(
+            org_id=test_organization.id, user_id=test_user_id, db=async_session
+        )
+
+        assert membership_cache.stats().misses == 1
+
+
+class TestGrantInvalidation:
+    """Test suite for incremental grant invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_team_member_changes_evict_the_principal(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        team: KTeam,
+    ):
+        """Test that adding and removing a member rebuilds only their grants."""
+        other_key = (test_organization.id, uuid7())
+        grants = await get_principal_grants(
+            test_organization.id, test_user_id, async_session
+        )
+        authorization_cache.set(other_key, grants._replace(principal_id=other_key[1]))
+        # End the read transaction so the logic functions commit their own writes
+        await async_session.commit()
+
+        await add_team_member(
+            team.id,
+            TeamMemberCreate(principal_id=test_user_id),
+            test_user_id,
+            async_session,
+        )
+
+        assert (test_organization.id, test_user_id) not in authorization_cache
+        assert other_key in authorization_cache
+        grants = await get_principal_grants(
+            test_organization.id, test_user_id, async_session
+        )
+        assert grants.is_team_member(team.id)
+        await async_session.commit()
+
+        await remove_team_member(team.id, test_user_id, test_user_id, async_session)
+
+        grants = await get_principal_grants(
+            test_organization.id, test_user_id, async_session
+        )
+        assert not grants.is_team_member(team.id)
+
+    @pytest.mark.asyncio
+    async def test_project_team_changes_evict_team_principals(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        team: KTeam,
+        project: KProject,
+    ):
+        """Test that project assignments evict only principals of the team."""
+        await add_team_member(
+            team.id,
+            TeamMemberCreate(principal_id=test_user_id),
+            test_user_id,
+            async_session,
+        )
+        await async_session.commit()
+        grants = await get_principal_grants(
+            test_organization.id, test_user_id, async_session
+        )
+        unrelated_key = (test_organization.id, uuid7())
+        authorization_cache.set(
+            unrelated_key,
+            grants._replace(principal_id=unrelated_key[1], teams=frozenset()),
+        )
+
+        await add_project_team(
+            project.id, ProjectTeamCreate(team_id=team.id), test_user_id, async_session
+        )
+
+        assert (test_organization.id, test_user_id) not in authorization_cache
+        assert unrelated_key in authorization_cache
+        grants = await get_principal_grants(
+            test_organization.id, test_user_id, async_session
+        )
+        assert grants.is_project_member(project.id)
+
+        await remove_project_team(project.id, team.id, test_user_id, async_session)
+
+        grants = await get_principal_grants(
+            test_organization.id, test_user_id, async_session
+        )
+        assert not grants.is_project_member(project.id)
+
+    @pytest.mark.asyncio
+    async def test_invalidation_waits_for_commit(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        team: KTeam,
+    ):
+        """Test that changes inside a transaction only evict once committed."""
+        key = (test_organization.id, test_user_id)
+        await get_principal_grants(test_organization.id, test_user_id, async_session)
+        await async_session.commit()
+
+        async with async_session.begin():
+            await add_team_member(
+                team.id,
+                TeamMemberCreate(principal_id=test_user_id),
+                test_user_id,
+                async_session,
+            )
+            assert key in authorization_cache
+
+        assert key not in authorization_cache
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_changes_do_not_evict(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        team: KTeam,
+    ):
+        """Test that rolled back changes leave the cached grants alone."""
+        key = (test_organization.id, test_user_id)
+        await get_principal_grants(test_organization.id, test_user_id, async_session)
+        await async_session.commit()
+
+        await async_session.begin()
+        await add_team_member(
+            team.id,
+            TeamMemberCreate(principal_id=test_user_id),
+            test_user_id,
+            async_session,
+        )
+        await async_session.rollback()
+
+        assert key in authorization_cache
@@ -5,12 +5,15 @@ from unittest.mock import AsyncMock, patch
 from uuid import uuid7
 
 import pytest
+from sqlalchemy import delete, event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.db.replica import REPLICA_INFO_KEY
 from app.core.exceptions.domain_exceptions import (
     InsufficientPrivilegesException,
     InvalidTokenException,
     InvalidUserIdException,
+    UnauthorizedOrganizationAccessException,
     UserNotFoundException,
 )
 from app.logic.deps import (
@@ -20,13 +23,21 @@ from app.logic.deps import (
     check_system_or_system_root_role,
     check_system_root_role,
     check_system_user_role,
+    get_org_entity,
     get_token_data,
     get_user_by_id,
     get_user_from_token,
+    invalidate_organization_membership,
+    membership_cache,
+    principal_cache,
+    verify_organization_membership,
 )
-from app.models import KPrincipal
+from app.logic.v1.organization_principals import remove_organization_principal
+from app.logic.v1.organizations import delete_organization
+from app.logic.v1.users import delete_user, update_user
+from app.models import KOrganization, KOrganizationPrincipal, KPrincipal
 from app.models.k_principal import SystemRole
-from app.schemas.user import TokenData, UserDetail
+from app.schemas.user import TokenData, UserDetail, UserUpdate
 
 
 class TestGetTokenData:
@@ -159,6 +170,111 @@ class TestGetUserById:
         assert exc_info.value.user_id == mock_principal.id
 
 
+class TestPrincipalCache:
+    """Test suite for the principal cache behind get_user_by_id."""
+
+    @pytest.fixture
+    async def principal(self, async_session: AsyncSession, creator_id) -> KPrincipal:
+        """Create a stored principal."""
+        principal = KPrincipal(
+            id=uuid7(),
+            scope="global",
+            username="cacheduser",
+            primary_email="cached@example.com",
+            first_name="Cached",
+            last_name="User",
+            display_name="Cached User",
+            created_by=creator_id,
+            last_modified_by=creator_id,
+        )
+        async_session.add(principal)
+        await async_session.commit()
+        return principal
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_served_from_cache(
+        self, async_session: AsyncSession, principal: KPrincipal
+    ):
+        """Test that a second lookup returns the same object without a query."""
+        first = await get_user_by_id(principal.id, async_session)
+        with patch.object(async_session, "execute") as mock_execute:
+            second = await get_user_by_id(principal.id, async_session)
+
+        mock_execute.assert_not_called()
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_cached_user_is_immutable(
+        self, async_session: AsyncSession, principal: KPrincipal
+    ):
+        """Test that a shared cached user cannot be modified by a request."""
+        from pydantic import ValidationError
+
+        user = await get_user_by_id(principal.id, async_session)
+
+        with pytest.raises(ValidationError):
+            user.display_name = "Changed"  # type: ignore[misc]
+
+    @pytest.mark.asyncio
+    async def test_missing_user_cached_negatively(self, async_session: AsyncSession):
+        """Test that a missing principal is remembered as missing."""
+        missing_id = uuid7()
+        with pytest.raises(UserNotFoundException):
+            await get_user_by_id(missing_id, async_session)
+
+        with patch.object(async_session, "execute") as mock_execute:
+            with pytest.raises(UserNotFoundException):
+                await get_user_by_id(missing_id, async_session)
+
+        mock_execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_user_invalidates(
+        self, async_session: AsyncSession, principal: KPrincipal
+    ):
+        """Test that updating a user drops the cached copy."""
+        await get_user_by_id(principal.id, async_session)
+
+        await update_user(
+            principal.id,
+            UserUpdate(display_name="Renamed"),
+            requesting_user_id=principal.id,
+            scope="global",
+            system_role=SystemRole.SYSTEM_USER,
+            db=async_session,
+        )
+
+        user = await get_user_by_id(principal.id, async_session)
+        assert user.display_name == "Renamed"
+
+    @pytest.mark.asyncio
+    async def test_delete_user_invalidates(
+        self, async_session: AsyncSession, principal: KPrincipal
+    ):
+        """Test that deleting a user makes later lookups fail."""
+        await get_user_by_id(principal.id, async_session)
+
+        await delete_user(
+            principal.id,
+            scope="global",
+            requesting_user_id=principal.id,
+            system_role=SystemRole.SYSTEM,
+            db=async_session,
+        )
+        await async_session.commit()
+
+        with pytest.raises(UserNotFoundException):
+            await get_user_by_id(principal.id, async_session)
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, async_session: AsyncSession, principal: KPrincipal):
+        """Test that a TTL of 0 disables caching."""
+        with patch.object(principal_cache, "ttl", 0):
+            await get_user_by_id(principal.id, async_session)
+
+        assert len(principal_cache) == 0
+
+
 class TestGetUserFromToken:
     """Test suite for get_user_from_token function."""
 
@@ -1185,3 +1301,218 @@ class TestCheckSystemAdminRole:
 
         assert exc_info.value.required_privilege == "system, systemRoot, or systemAdmin"
         assert exc_info.value.user_id == user.id
+
+
+class TestVerifyOrganizationMembership:
+    """Test suite for verify_organization_membership function."""
+
+    @pytest.mark.asyncio
+    async def test_membership_is_cached(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id,
+    ):
+        """Test that a confirmed membership is served from the cache."""
+        await verify_organization_membership(
+            org_id=test_organization.id, user_id=test_user_id, db=async_session
+        )
+
+        # Remove the row behind the cache's back; the cached entry still answers
+        await async_session.execute(delete(KOrganizationPrincipal))
+        await async_session.commit()
+
+        await verify_organization_membership(
+            org_id=test_organization.id, user_id=test_user_id, db=async_session
+        )
+
+        assert membership_cache.stats().hits == 1
+        assert membership_cache.stats().misses == 1
+
+    @pytest.mark.asyncio
+    async def test_non_membership_is_not_cached(
+        self,
+        async_session: AsyncSession,
+        test_organization_without_membership: KOrganization,
+        test_user_id,
+    ):
+        """Test that a denied lookup is not cached."""
+        org_id = test_organization_without_membership.id
+
+        with pytest.raises(UnauthorizedOrganizationAccessException):
+            await verify_organization_membership(
+                org_id=org_id, user_id=test_user_id, db=async_session
+            )
+
+        assert (org_id, test_user_id) not in membership_cache
+
+    @pytest.mark.asyncio
+    async def test_replica_read_after_change_is_not_cached(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id,
+    ):
+        """Test that a replica read right after a membership change is not cached."""
+        invalidate_organization_membership(test_organization.id, test_user_id)
+        async_session.info[REPLICA_INFO_KEY] = True
+        try:
+            await verify_organization_membership(
+                org_id=test_organization.id, user_id=test_user_id, db=async_session
+            )
+        finally:
+            del async_session.info[REPLICA_INFO_KEY]
+
+        assert (test_organization.id, test_user_id) not in membership_cache
+
+    @pytest.mark.asyncio
+    async def test_remove_principal_invalidates_membership(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id,
+    ):
+        """Test that removing a principal drops its cached membership."""
+        await verify_organization_membership(
+            org_id=test_organization.id, user_id=test_user_id, db=async_session
+        )
+        assert (test_organization.id, test_user_id) in membership_cache
+
+        await remove_organization_principal(
+            org_id=test_organization.id,
+            principal_id=test_user_id,
+            user_id=test_user_id,
+            system_role=SystemRole.SYSTEM_ADMIN,
+            db=async_session,
+        )
+
+        assert (test_organization.id, test_user_id) not in membership_cache
+
+    @pytest.mark.asyncio
+    async def test_delete_organization_invalidates_memberships(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id,
+    ):
+        """Test that deleting an organization drops all of its cached memberships."""
+        await verify_organization_membership(
+            org_id=test_organization.id, user_id=test_user_id, db=async_session
+        )
+        other_org_key = (uuid7(), test_user_id)
+        membership_cache.set(other_org_key, True)
+
+        await delete_organization(
+            org_id=test_organization.id,
+            scope="global",
+            user_id=test_user_id,
+            system_role=SystemRole.SYSTEM_ADMIN,
+            db=async_session,
+        )
+
+        assert (test_organization.id, test_user_id) not in membership_cache
+        assert other_org_key in membership_cache
+
+
+class TestGetOrgEntity:
+    """Test suite for get_org_entity function."""
+
+    @pytest.fixture
+    def statements(self, async_engine) -> list[str]:
+        """Record every statement sent to the test database."""
+        executed: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+        yield executed
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    @pytest.mark.asyncio
+    async def test_member_gets_entity_in_one_statement(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id,
+        statements: list[str],
+    ):
+        """Test that the entity and membership are fetched together."""
+        stmt = select(KOrganization).where(KOrganization.id == test_organization.id)
+
+        org = await get_org_entity(
+            stmt, org_id=test_organization.id, user_id=test_user_id, db=async_session
+        )
+
+        assert org is test_organization
+        assert len(statements) == 1
+        assert (test_organization.id, test_user_id) in membership_cache
+
+    @pytest.mark.asyncio
+    async def test_cached_membership_skips_exists(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id,
+        statements: list[str],
+    ):
+        """Test that a cached membership leaves the SELECT untouched."""
+        membership_cache.set((test_organization.id, test_user_id), True)
+        stmt = select(KOrganization).where(KOrganization.id == test_organization.id)
+
+        await get_org_entity(
+            stmt, org_id=test_organization.id, user_id=test_user_id, db=async_session
+        )
+
+        assert len(statements) == 1
+        assert "EXISTS" not in statements[0].upper()
+
+    @pytest.mark.asyncio
+    async def test_member_gets_none_for_missing_entity(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id,
+    ):
+        """Test that a member looking up a missing entity gets None."""
+        stmt = select(KOrganization).where(KOrganization.id == uuid7())
+
+        org = await get_org_entity(
+            stmt, org_id=test_organization.id, user_id=test_user_id, db=async_session
+        )
+
+        assert org is None
+
+    @pytest.mark.asyncio
+    async def test_non_member_is_denied_existing_entity(
+        self,
+        async_session: AsyncSession,
+        test_organization_without_membership: KOrganization,
+        test_user_id,
+    ):
+        """Test that a non-member is denied even though the entity exists."""
+        org_id = test_organization_without_membership.id
+        stmt = select(KOrganization).where(KOrganization.id == org_id)
+
+        with pytest.raises(UnauthorizedOrganizationAccessException):
+            await get_org_entity(
+                stmt, org_id=org_id, user_id=test_user_id, db=async_session
+            )
+
+        assert (org_id, test_user_id) not in membership_cache
+
+    @pytest.mark.asyncio
+    async def test_non_member_is_denied_missing_entity(
+        self,
+        async_session: AsyncSession,
+        test_organization_without_membership: KOrganization,
+        test_user_id,
+    ):
+        """Test that a non-member gets an authorization error, not a not found."""
+        org_id = test_organization_without_membership.id
+        stmt = select(KOrganization).where(KOrganization.id == uuid7())
+
+        with pytest.raises(UnauthorizedOrganizationAccessException):
+            await get_org_entity(
+                stmt, org_id=org_id, user_id=test_user_id, db=async_session
+            )
@@ -17,7 +17,9 @@ from app.logic.auth import (
     begin_fido2_registration,
     complete_fido2_authentication,
     complete_fido2_registration,
+    credential_descriptor_cache,
     delete_credential,
+    get_credential_descriptors,
     list_user_credentials,
     perform_2fa_login,
     perform_passwordless_login,
@@ -231,7 +233,7 @@ class TestCompleteFido2Registration:
 
         session_id = "test_session"
         challenge = secrets.token_bytes(32)
-        store_challenge(session_id, challenge)
+        await store_challenge(session_id, challenge)
 
         # Mock the FIDO2 server verification
         with patch("app.logic.auth.get_fido2_server") as mock_server:
@@ -370,7 +372,7 @@ class TestCompleteFido2Authentication:
 
         session_id = "test_session"
         challenge = secrets.token_bytes(32)
-        store_challenge(session_id, challenge)
+        await store_challenge(session_id, challenge)
 
         credential_id_b64 = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode()
         assertion_response = {"id": credential_id_b64, "response": {}}
@@ -496,6 +498,68 @@ class TestPerform2faLogin:
                 )
 
 
+class TestCredentialDescriptorCache:
+    """Test suite for cached credential descriptors."""
+
+    @pytest.mark.asyncio
+    async def test_descriptors_cached_per_principal(
+        self, async_session, test_user, mock_credential
+    ):
+        """Test that a second lookup is served without querying the database."""
+        mock_credential.principal_id = test_user.id
+        async_session.add(mock_credential)
+        await async_session.commit()
+
+        first = await get_credential_descriptors(test_user.id, async_session)
+        with patch.object(async_session, "execute") as mock_execute:
+            second = await get_credential_descriptors(test_user.id, async_session)
+
+        mock_execute.assert_not_called()
+        assert second is first
+        [descriptor] = first
+        assert descriptor.id == mock_credential.credential_id
+        assert descriptor.transports == ["usb"]
+
+    @pytest.mark.asyncio
+    async def test_delete_credential_invalidates(
+        self, async_session, test_user, mock_credential
+    ):
+        """Test that deleting a credential drops the cached descriptors."""
+        mock_credential.principal_id = test_user.id
+        async_session.add(mock_credential)
+        await async_session.commit()
+        await get_credential_descriptors(test_user.id, async_session)
+
+        await delete_credential(test_user.id, mock_credential.id, async_session)
+
+        assert test_user.id not in credential_descriptor_cache
+        assert await get_credential_descriptors(test_user.id, async_session) == ()
+
+    @pytest.mark.asyncio
+    async def test_update_nickname_invalidates(
+        self, async_session, test_user, mock_credential
+    ):
+        """Test that renaming a credential drops the cached descriptors."""
+        mock_credential.principal_id = test_user.id
+        async_session.add(mock_credential)
+        await async_session.commit()
+        await get_credential_descriptors(test_user.id, async_session)
+
+        await update_credential_nickname(
+            test_user.id, mock_credential.id, "Renamed", async_session
+        )
+
+        assert test_user.id not in credential_descriptor_cache
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, async_session, test_user):
+        """Test that a TTL of 0 disables caching."""
+        with patch.object(credential_descriptor_cache, "ttl", 0):
+            await get_credential_descriptors(test_user.id, async_session)
+
+        assert len(credential_descriptor_cache) == 0
+
+
 class TestListUserCredentials:
     """Test suite for list_user_credentials function."""
 
@@ -0,0 +1,162 @@
+"""Unit tests for keyset pagination."""
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions.domain_exceptions import InvalidCursorException
+from app.logic.pagination import Page, SortKey, encode_cursor, paginate
+from app.logic.v1.docs import list_docs
+from app.models import KDoc, KOrganization
+from app.schemas.pagination import PageParams
+
+
+@pytest.fixture
+async def docs(
+    async_session: AsyncSession, test_organization: KOrganization, test_user_id: UUID
+) -> list[KDoc]:
+    """Create docs sharing one creation time, so only the ID orders them."""
+    created = datetime(2025, 1, 1)
+    docs = [
+        KDoc(
+            name=f"Doc {i}",
+            content="Content",
+            org_id=test_organization.id,
+            created=created,
+            created_by=test_user_id,
+            last_modified_by=test_user_id,
+        )
+        for i in range(5)
+    ]
+    docs.append(
+        KDoc(
+            name="Later Doc",
+            content="Content",
+            org_id=test_organization.id,
+            created=created + timedelta(days=1),
+            created_by=test_user_id,
+            last_modified_by=test_user_id,
+        )
+    )
+    async_session.add_all(docs)
+    await async_session.commit()
+    return docs
+
+
+def _query(org_id: UUID):
+    return select(KDoc).where(KDoc.org_id == org_id)  # type: ignore[arg-type]
+
+
+class TestPaginate:
+    """Test suite for paginate function."""
+
+    @pytest.mark.asyncio
+    async def test_single_page(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        docs: list[KDoc],
+    ):
+        """Test that a list smaller than the page has no next cursor."""
+        page = await paginate(_query(test_organization.id), KDoc, async_session)
+
+        assert isinstance(page, Page)
+        assert len(page) == 6
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_walks_all_pages_in_order(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        docs: list[KDoc],
+    ):
+        """Test that following cursors visits every row once, ties broken by ID."""
+        seen: list[KDoc] = []
+        params = PageParams(limit=2)
+        while True:
+            page = await paginate(
+                _query(test_organization.id), KDoc, async_session, params
+            )
+            seen.extend(page)
+            if page.next_cursor is None:
+                break
+            params = PageParams(limit=2, cursor=page.next_cursor)
+
+        expected = sorted(docs, key=lambda d: (d.created, d.id))
+        assert [d.id for d in seen] == [d.id for d in expected]
+
+    @pytest.mark.asyncio
+    async def test_descending_sort_key(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        docs: list[KDoc],
+    ):
+        """Test paging in descending order of another column."""
+        sort = SortKey("name", descending=True)
+        first = await paginate(
+            _query(test_organization.id),
+            KDoc,
+            async_session,
+            PageParams(limit=4),
+            sort,
+        )
+        second = await paginate(
+            _query(test_organization.id),
+            KDoc,
+            async_session,
+            PageParams(limit=4, cursor=first.next_cursor),
+            sort,
+        )
+
+        names = [d.name for d in [*first, *second]]
+        assert names == sorted((d.name for d in docs), reverse=True)
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor(
+        self, async_session: AsyncSession, test_organization: KOrganization
+    ):
+        """Test that a cursor that does not decode is rejected."""
+        with pytest.raises(InvalidCursorException):
+            await paginate(
+                _query(test_organization.id),
+                KDoc,
+                async_session,
+                PageParams(cursor="!!not base64!!"),
+            )
+
+    @pytest.mark.asyncio
+    async def test_cursor_for_other_sort(
+        self, async_session: AsyncSession, test_organization: KOrganization
+    ):
+        """Test that a cursor only resumes the sort order it was issued for."""
+        cursor = encode_cursor(SortKey("name"), ["Doc 1", "not-a-uuid"])
+
+        with pytest.raises(InvalidCursorException):
+            await paginate(
+                _query(test_organization.id),
+                KDoc,
+                async_session,
+                PageParams(cursor=cursor),
+            )
+
+    @pytest.mark.asyncio
+    async def test_list_function_pages(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        docs: list[KDoc],
+    ):
+        """Test that list functions return pages of the requested size."""
+        page = await list_docs(
+            test_organization.id, test_user_id, async_session, PageParams(limit=5)
+        )
+
+        assert len(page) == 5
+        assert page.next_cursor is not None
@@ -0,0 +1,122 @@
+"""Unit tests for column projection of read operations."""
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions.domain_exceptions import InvalidFieldsException
+from app.logic.pagination import paginate
+from app.logic.projection import projection_columns
+from app.logic.v1.docs import get_doc, list_docs
+from app.models import KDoc, KOrganization
+from app.schemas.pagination import PageParams
+
+
+@pytest.fixture
+async def docs(
+    async_session: AsyncSession, test_organization: KOrganization, test_user_id: UUID
+) -> list[KDoc]:
+    """Create docs created a day apart."""
+    created = datetime(2025, 1, 1)
+    docs = [
+        KDoc(
+            name=f"Doc {i}",
+            content="Content " * 100,
+            org_id=test_organization.id,
+            created=created + timedelta(days=i),
+            created_by=test_user_id,
+            last_modified_by=test_user_id,
+        )
+        for i in range(5)
+    ]
+    async_session.add_all(docs)
+    await async_session.commit()
+    return docs
+
+
+class TestProjectionColumns:
+    """Test suite for projection_columns function."""
+
+    def test_requested_order_without_duplicates(self):
+        """Test that columns come in the requested order, each once."""
+        columns = projection_columns(KDoc, ["name", "id", "name"])
+
+        assert [column.key for column in columns] == ["name", "id"]
+
+    def test_unknown_field(self):
+        """Test that a field that is not a column is rejected."""
+        with pytest.raises(InvalidFieldsException) as exc_info:
+            projection_columns(KDoc, ["name", "author"])
+
+        assert exc_info.value.fields == ["author"]
+        assert "author" in exc_info.value.message
+
+    def test_no_fields(self):
+        """Test that an empty projection is rejected."""
+        with pytest.raises(InvalidFieldsException):
+            projection_columns(KDoc, [])
+
+
+class TestProjectedReads:
+    """Test suite for reads that return only requested fields."""
+
+    @pytest.mark.asyncio
+    async def test_projected_pages(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        docs: list[KDoc],
+    ):
+        """Test that projected pages hold only the requested fields and still page."""
+        stmt = select(KDoc).where(KDoc.org_id == test_organization.id)  # type: ignore[arg-type]
+        seen: list[dict] = []
+        params = PageParams(limit=2)
+        while True:
+            page = await paginate(stmt, KDoc, async_session, params, fields=["name"])
+            seen.extend(page)
+            if page.next_cursor is None:
+                break
+            params = PageParams(limit=2, cursor=page.next_cursor)
+
+        assert seen == [{"name": doc.name} for doc in docs]
+
+    @pytest.mark.asyncio
+    async def test_list_function_fields(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        docs: list[KDoc],
+    ):
+        """Test that list functions return mappings of the requested fields."""
+        page = await list_docs(
+            test_organization.id,
+            test_user_id,
+            async_session,
+            PageParams(limit=10),
+            fields=["id", "name"],
+        )
+
+        assert page == [{"id": doc.id, "name": doc.name} for doc in docs]
+
+    @pytest.mark.asyncio
+    async def test_get_function_fields(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        docs: list[KDoc],
+    ):
+        """Test that get functions return a mapping of the requested fields."""
+        doc = await get_doc(
+            docs[0].id,
+            test_organization.id,
+            test_user_id,
+            async_session,
+            fields=["name", "created"],
+        )
+
+        assert doc == {"name": docs[0].name, "created": docs[0].created}
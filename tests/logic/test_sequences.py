@@ -0,0 +1,127 @@
+"""Unit tests for per-organization sequence allocation."""
+
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.core.task_id import generate_task_id
+from app.logic.sequences import SequenceKind, allocate_next_number
+from app.models import KOrgSequence, KTask, KTeam
+
+
+class TestAllocateNextNumber:
+    """Test suite for allocate_next_number function."""
+
+    @pytest.fixture
+    async def team(
+        self, async_session: AsyncSession, test_org_id: UUID, creator_id: UUID
+    ) -> KTeam:
+        """Create a team to attach seeded tasks to."""
+        team = KTeam(
+            name="Sequence Team",
+            org_id=test_org_id,
+            created_by=creator_id,
+            last_modified_by=creator_id,
+        )
+        async_session.add(team)
+        await async_session.commit()
+        await async_session.refresh(team)
+        return team
+
+    @pytest.mark.asyncio
+    async def test_first_allocation_starts_at_one(
+        self, async_session: AsyncSession, test_org_id: UUID
+    ):
+        """Test that an organization without rows starts numbering at 1."""
+        number = await allocate_next_number(
+            test_org_id, SequenceKind.TASK, async_session
+        )
+
+        assert number == 1
+
+    @pytest.mark.asyncio
+    async def test_allocations_increment(
+        self, async_session: AsyncSession, test_org_id: UUID
+    ):
+        """Test that consecutive allocations return consecutive numbers."""
+        numbers = [
+            await allocate_next_number(test_org_id, SequenceKind.TASK, async_session)
+            for _ in range(3)
+        ]
+
+        assert numbers == [1, 2, 3]
+
+        result = await async_session.execute(
+            select(KOrgSequence).where(
+                KOrgSequence.org_id == test_org_id,
+                KOrgSequence.kind == SequenceKind.TASK,
+            )
+        )
+        assert result.scalar_one().last_value == 3
+
+    @pytest.mark.asyncio
+    async def test_kinds_are_independent(
+        self, async_session: AsyncSession, test_org_id: UUID
+    ):
+        """Test that task and feature numbers are allocated independently."""
+        await allocate_next_number(test_org_id, SequenceKind.TASK, async_session)
+        await allocate_next_number(test_org_id, SequenceKind.TASK, async_session)
+
+        number = await allocate_next_number(
+            test_org_id, SequenceKind.FEATURE, async_session
+        )
+
+        assert number == 1
+
+    @pytest.mark.asyncio
+    async def test_seeds_from_existing_rows(
+        self,
+        async_session: AsyncSession,
+        test_org_id: UUID,
+        team: KTeam,
+        creator_id: UUID,
+    ):
+        """Test that the first allocation skips numbers used by existing rows."""
+        for number, deleted_at in ((4, None), (7, datetime.now())):
+            async_session.add(
+                KTask(
+                    id=generate_task_id(test_org_id, number),
+                    org_id=test_org_id,
+                    team_id=team.id,
+                    deleted_at=deleted_at,
+                    created_by=creator_id,
+                    last_modified_by=creator_id,
+                )
+            )
+        await async_session.commit()
+
+        first = await allocate_next_number(
+            test_org_id, SequenceKind.TASK, async_session
+        )
+        second = await allocate_next_number(
+            test_org_id, SequenceKind.TASK, async_session
+        )
+
+        # Soft-deleted task 7 still holds its ID, so numbering resumes after it
+        assert first == 8
+        assert second == 9
+
+    @pytest.mark.asyncio
+    async def test_allocation_rolls_back_with_transaction(
+        self, async_session: AsyncSession, test_org_id: UUID
+    ):
+        """Test that a rolled back allocation releases its number."""
+        await allocate_next_number(test_org_id, SequenceKind.TASK, async_session)
+        await async_session.commit()
+
+        await allocate_next_number(test_org_id, SequenceKind.TASK, async_session)
+        await async_session.rollback()
+
+        number = await allocate_next_number(
+            test_org_id, SequenceKind.TASK, async_session
+        )
+
+        assert number == 2
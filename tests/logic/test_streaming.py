@@ -0,0 +1,101 @@
+"""Unit tests for streaming whole lists."""
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.exceptions.domain_exceptions import InvalidFieldsException
+from app.logic.pagination import SortKey
+from app.logic.streaming import stream_batches
+from app.models import KDoc, KOrganization
+
+
+@pytest.fixture
+async def docs(
+    async_session: AsyncSession, test_organization: KOrganization, test_user_id: UUID
+) -> list[KDoc]:
+    """Create docs created a day apart."""
+    created = datetime(2025, 1, 1)
+    docs = [
+        KDoc(
+            name=f"Doc {i}",
+            content="Content",
+            org_id=test_organization.id,
+            created=created + timedelta(days=i),
+            created_by=test_user_id,
+            last_modified_by=test_user_id,
+        )
+        for i in range(5)
+    ]
+    async_session.add_all(docs)
+    await async_session.commit()
+    return docs
+
+
+@pytest.fixture
+def batch_size(monkeypatch: pytest.MonkeyPatch) -> int:
+    """Stream in batches of two rows."""
+    monkeypatch.setattr(settings, "list_stream_batch_size", 2)
+    return 2
+
+
+def _query(org_id: UUID):
+    return select(KDoc).where(KDoc.org_id == org_id)  # type: ignore[arg-type]
+
+
+class TestStreamBatches:
+    """Test suite for stream_batches function."""
+
+    @pytest.mark.asyncio
+    async def test_batches_in_sort_order(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        docs: list[KDoc],
+        batch_size: int,
+    ):
+        """Test that every row is streamed, in batches of the configured size."""
+        batches = await stream_batches(
+            _query(test_organization.id),
+            KDoc,
+            async_session,
+            SortKey("created", descending=True),
+        )
+        sizes: list[int] = []
+        names: list[str] = []
+        async for batch in batches:
+            sizes.append(len(batch))
+            names.extend(doc.name for doc in batch)
+
+        assert sizes == [2, 2, 1]
+        assert names == [doc.name for doc in reversed(docs)]
+
+    @pytest.mark.asyncio
+    async def test_projected_batches(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        docs: list[KDoc],
+        batch_size: int,
+    ):
+        """Test that projected streams hold only the requested fields."""
+        batches = await stream_batches(
+            _query(test_organization.id), KDoc, async_session, fields=["name"]
+        )
+        rows = [row async for batch in batches for row in batch]
+
+        assert rows == [{"name": doc.name} for doc in docs]
+
+    @pytest.mark.asyncio
+    async def test_unknown_field(
+        self, async_session: AsyncSession, test_organization: KOrganization
+    ):
+        """Test that unknown fields are rejected before streaming starts."""
+        with pytest.raises(InvalidFieldsException):
+            await stream_batches(
+                _query(test_organization.id), KDoc, async_session, fields=["author"]
+            )
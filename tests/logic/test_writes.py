@@ -0,0 +1,270 @@
+"""Unit tests for single-statement write helpers."""
+
+from uuid import UUID, uuid7
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions.domain_exceptions import (
+    DocNotFoundException,
+    UnauthorizedOrganizationAccessException,
+)
+from app.logic.deps import membership_cache, write_org_entity
+from app.logic.v1.docs import delete_doc, update_doc
+from app.logic.writes import (
+    delete_returning,
+    insert_returning,
+    update_returning,
+    update_values,
+)
+from app.models import KDoc, KOrganization
+from app.schemas.doc import DocUpdate
+
+
+@pytest.fixture
+def statements(async_engine) -> list[str]:
+    """Record every statement sent to the test database."""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+async def doc(
+    async_session: AsyncSession, test_organization: KOrganization, test_user_id: UUID
+) -> KDoc:
+    """Create a doc in the test organization."""
+    doc = KDoc(
+        name="Writes Doc",
+        description="Original",
+        content="Original content",
+        org_id=test_organization.id,
+        meta={"version": 1},
+        created_by=test_user_id,
+        last_modified_by=test_user_id,
+    )
+    async_session.add(doc)
+    await async_session.commit()
+    return doc
+
+
+class TestInsertReturning:
+    """Test suite for insert_returning function."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_in_one_statement(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        statements: list[str],
+    ):
+        """Test that the row is inserted and returned without a refresh."""
+        new_doc = KDoc(
+            name="Inserted",
+            content="Body",
+            org_id=test_organization.id,
+            created_by=test_user_id,
+            last_modified_by=test_user_id,
+        )
+
+        inserted = await insert_returning(new_doc, async_session)
+
+        assert len(statements) == 1
+        assert "RETURNING" in statements[0].upper()
+        assert inserted.id == new_doc.id
+        assert inserted.meta == {}
+        assert inserted in async_session
+
+
+class TestUpdateReturning:
+    """Test suite for update_values and update_returning functions."""
+
+    def test_update_values_skip_unset_fields(self, test_user_id: UUID):
+        """Test that only provided fields and audit fields are written."""
+        values = update_values(DocUpdate(name="Renamed"), test_user_id)
+
+        assert set(values) == {"name", "last_modified", "last_modified_by"}
+        assert values["last_modified_by"] == test_user_id
+
+    @pytest.mark.asyncio
+    async def test_partial_update_in_one_statement(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        doc: KDoc,
+        statements: list[str],
+    ):
+        """Test that update_doc writes and returns the row in one statement."""
+        membership_cache.set((test_organization.id, test_user_id), True)
+
+        updated = await update_doc(
+            doc.id,
+            DocUpdate(description="Changed"),
+            test_user_id,
+            test_organization.id,
+            async_session,
+        )
+
+        assert len(statements) == 1
+        assert statements[0].upper().startswith("UPDATE")
+        assert updated.description == "Changed"
+        assert updated.name == "Writes Doc"
+        assert updated.content == "Original content"
+
+    @pytest.mark.asyncio
+    async def test_deleted_rows_are_not_updated(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        doc: KDoc,
+    ):
+        """Test that a soft deleted row is reported as not found."""
+        await delete_doc(doc.id, test_organization.id, test_user_id, async_session)
+
+        with pytest.raises(DocNotFoundException):
+            await update_doc(
+                doc.id,
+                DocUpdate(name="Too late"),
+                test_user_id,
+                test_organization.id,
+                async_session,
+            )
+
+
+class TestDeleteReturning:
+    """Test suite for delete_returning function."""
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_in_one_statement(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        doc: KDoc,
+        statements: list[str],
+    ):
+        """Test that a soft delete is a single UPDATE returning the ID."""
+        membership_cache.set((test_organization.id, test_user_id), True)
+
+        await delete_doc(doc.id, test_organization.id, test_user_id, async_session)
+
+        assert len(statements) == 1
+        assert statements[0].upper().startswith("UPDATE")
+        assert doc.deleted_at is not None
+
+    @pytest.mark.asyncio
+    async def test_hard_delete_removes_row(
+        self,
+        async_session: AsyncSession,
+        test_user_id: UUID,
+        doc: KDoc,
+    ):
+        """Test that a hard delete removes the row and returns its ID."""
+        stmt = delete_returning(KDoc, test_user_id, KDoc.id == doc.id, hard_delete=True)
+
+        result = await async_session.execute(stmt)
+
+        assert result.scalar_one() == doc.id
+        remaining = await async_session.execute(select(KDoc).where(KDoc.id == doc.id))
+        assert remaining.scalar_one_or_none() is None
+
+    @pytest.mark.asyncio
+    async def test_returning_column(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        doc: KDoc,
+    ):
+        """Test that another column can be returned instead of the key."""
+        stmt = delete_returning(
+            KDoc, test_user_id, KDoc.id == doc.id, returning=KDoc.org_id
+        )
+
+        result = await async_session.execute(stmt)
+
+        assert result.scalar_one() == test_organization.id
+
+
+class TestWriteOrgEntity:
+    """Test suite for write_org_entity function."""
+
+    @pytest.mark.asyncio
+    async def test_member_writes_and_caches_membership(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+        doc: KDoc,
+        statements: list[str],
+    ):
+        """Test that the membership check rides along on the write."""
+        stmt = update_returning(
+            KDoc, DocUpdate(name="Checked"), test_user_id, KDoc.id == doc.id
+        )
+
+        updated = await write_org_entity(
+            stmt, org_id=test_organization.id, user_id=test_user_id, db=async_session
+        )
+
+        assert updated.name == "Checked"
+        assert len(statements) == 1
+        assert "EXISTS" in statements[0].upper()
+        assert (test_organization.id, test_user_id) in membership_cache
+
+    @pytest.mark.asyncio
+    async def test_member_gets_none_for_missing_entity(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+    ):
+        """Test that a member writing a missing entity gets None."""
+        stmt = update_returning(
+            KDoc, DocUpdate(name="Missing"), test_user_id, KDoc.id == uuid7()
+        )
+
+        written = await write_org_entity(
+            stmt, org_id=test_organization.id, user_id=test_user_id, db=async_session
+        )
+
+        assert written is None
+
+    @pytest.mark.asyncio
+    async def test_non_member_is_denied_and_nothing_written(
+        self,
+        async_session: AsyncSession,
+        test_organization_without_membership: KOrganization,
+        test_user_id: UUID,
+    ):
+        """Test that a non-member is denied and the row is left unchanged."""
+        org_id = test_organization_without_membership.id
+        doc = KDoc(
+            name="Foreign",
+            content="Body",
+            org_id=org_id,
+            created_by=test_user_id,
+            last_modified_by=test_user_id,
+        )
+        async_session.add(doc)
+        await async_session.commit()
+        stmt = update_returning(
+            KDoc, DocUpdate(name="Hijacked"), test_user_id, KDoc.id == doc.id
+        )
+
+        with pytest.raises(UnauthorizedOrganizationAccessException):
+            await write_org_entity(
+                stmt, org_id=org_id, user_id=test_user_id, db=async_session
+            )
+
+        result = await async_session.execute(select(KDoc.name).where(KDoc.id == doc.id))
+        assert result.scalar_one() == "Foreign"
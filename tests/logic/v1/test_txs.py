@@ -6,6 +6,7 @@ from uuid import UUID, uuid7
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.logic.pagination import SortKey
 from app.logic.v1.txs import (
     DependencyGraph,
     OperationRegistry,
@@ -14,8 +15,10 @@ from app.logic.v1.txs import (
     execute_operation,
     execute_transaction_group,
     execute_transactions,
+    is_read_only_request,
     operation_registry,
 )
+from app.models.k_task import TaskStatus
 from app.schemas.txs import (
     CreateParams,
     GetParams,
@@ -141,7 +144,7 @@ class TestParameterBuilder:
         self, sample_user_id, sample_org_id, mock_db
     ):
         """Test building list parameters for standard domain objects."""
-        filters = {"org_id": str(sample_org_id), "status": "active"}
+        filters = {"org_id": str(sample_org_id), "status": "InProgress"}
 
         params = ParameterBuilder.build_list_params(
             domain_object="task",
@@ -153,6 +156,84 @@ class TestParameterBuilder:
         assert params["org_id"] == sample_org_id
         assert params["user_id"] == sample_user_id
         assert params["db"] == mock_db
+        assert "page" not in params
+
+    def test_build_list_params_with_pagination(
+        self, sample_user_id, sample_org_id, mock_db
+    ):
+        """Test that list pagination is passed through as page parameters."""
+        params = ParameterBuilder.build_list_params(
+            domain_object="task",
+            filters={"org_id": str(sample_org_id)},
+            user_id=sample_user_id,
+            db=mock_db,
+            pagination={"page_size": 25, "cursor": "abc"},
+        )
+
+        assert params["page"].limit == 25
+        assert params["page"].cursor == "abc"
+
+    def test_build_list_params_with_filters_and_sort(
+        self, sample_user_id, sample_org_id, mock_db
+    ):
+        """Test that task filters and sort use the REST list vocabulary."""
+        params = ParameterBuilder.build_list_params(
+            domain_object="task",
+            filters={"org_id": str(sample_org_id), "status": "InProgress"},
+            user_id=sample_user_id,
+            db=mock_db,
+            sort=[{"field": "last_modified", "direction": "desc"}],
+        )
+
+        assert params["filters"].status == [TaskStatus.IN_PROGRESS]
+        assert params["sort"] == SortKey("last_modified", descending=True)
+
+    def test_build_list_params_rejects_unsortable_field(
+        self, sample_user_id, sample_org_id, mock_db
+    ):
+        """Test that sorting by an unsupported field is rejected."""
+        with pytest.raises(ValueError, match="can be sorted by"):
+            ParameterBuilder.build_list_params(
+                domain_object="task",
+                filters={"org_id": str(sample_org_id)},
+                user_id=sample_user_id,
+                db=mock_db,
+                sort=[{"field": "guestimate", "direction": "asc"}],
+            )
+
+    def test_build_get_params_with_fields(
+        self, sample_user_id, sample_org_id, sample_task_id, mock_db
+    ):
+        """Test that requested fields are passed through to get operations."""
+        resolved_params = {
+            "id": str(sample_task_id),
+            "org_id": str(sample_org_id),
+            "fields": ["id", "summary"],
+        }
+
+        params = ParameterBuilder.build_get_params(
+            domain_object="task",
+            obj_id=sample_task_id,
+            resolved_params=resolved_params,
+            user_id=sample_user_id,
+            db=mock_db,
+        )
+
+        assert params["fields"] == ["id", "summary"]
+
+    def test_build_list_params_with_fields(
+        self, sample_user_id, sample_org_id, mock_db
+    ):
+        """Test that requested fields are passed through to list operations."""
+        params = ParameterBuilder.build_list_params(
+            domain_object="doc",
+            filters={"org_id": str(sample_org_id)},
+            user_id=sample_user_id,
+            db=mock_db,
+            fields=["id", "name"],
+        )
+
+        assert params["fields"] == ["id", "name"]
 
     def test_build_update_params_standard_domain(
         self, sample_user_id, sample_org_id, sample_task_id, mock_db
@@ -1032,3 +1113,53 @@ class TestExecuteTransactions:
             assert len(response.transactions) == 2  # Both executed
             assert response.transactions[0].status == "success"
             assert response.transactions[1].status == "failure"
+
+
+class TestIsReadOnlyRequest:
+    """Test suite for is_read_only_request function."""
+
+    def test_gets_and_lists_are_read_only(self):
+        """Test that a batch of only gets and lists is read-only."""
+        request = TransactionsRequest(
+            txs=[
+                TransactionGroup(
+                    operations=[
+                        Operation(
+                            operation="list", domain_object="task", params=ListParams()
+                        ),
+                        Operation(
+                            operation="get",
+                            domain_object="task",
+                            params=GetParams(id=str(uuid7())),
+                        ),
+                    ]
+                )
+            ]
+        )
+
+        assert is_read_only_request(request) is True
+
+    def test_any_write_makes_batch_writable(self):
+        """Test that a single write operation makes the batch writable."""
+        request = TransactionsRequest(
+            txs=[
+                TransactionGroup(
+                    operations=[
+                        Operation(
+                            operation="list", domain_object="task", params=ListParams()
+                        )
+                    ]
+                ),
+                TransactionGroup(
+                    operations=[
+                        Operation(
+                            operation="create",
+                            domain_object="task",
+                            params=CreateParams(data={}),
+                        )
+                    ]
+                ),
+            ]
+        )
+
+        assert is_read_only_request(request) is False
@@ -0,0 +1,43 @@
+"""Unit tests for KFido2Challenge model."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import KFido2Challenge
+
+
+class TestKFido2ChallengeModel:
+    """Test suite for KFido2Challenge model."""
+
+    @pytest.mark.asyncio
+    async def test_create_challenge(self, session: AsyncSession):
+        """Test creating a pending challenge."""
+        expires_at = datetime(2026, 1, 1, 12, 5, 0)
+        challenge = KFido2Challenge(
+            session_id="session", challenge=b"\x00\x01", expires_at=expires_at
+        )
+
+        session.add(challenge)
+        await session.commit()
+        await session.refresh(challenge)
+
+        assert challenge.challenge == b"\x00\x01"
+        assert challenge.expires_at == expires_at
+
+    @pytest.mark.asyncio
+    async def test_session_id_unique(self, session: AsyncSession):
+        """Test that a session ID holds one challenge."""
+        expires_at = datetime(2026, 1, 1, 12, 5, 0)
+        session.add(
+            KFido2Challenge(session_id="s", challenge=b"1", expires_at=expires_at)
+        )
+        await session.commit()
+
+        session.add(
+            KFido2Challenge(session_id="s", challenge=b"2", expires_at=expires_at)
+        )
+        with pytest.raises(IntegrityError):
+            await session.commit()
@@ -0,0 +1,53 @@
+"""Unit tests for KOrgSequence model."""
+
+from uuid import UUID
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models import KOrgSequence
+
+
+class TestKOrgSequenceModel:
+    """Test suite for KOrgSequence model."""
+
+    @pytest.mark.asyncio
+    async def test_create_org_sequence(self, session: AsyncSession, test_org_id: UUID):
+        """Test creating a sequence row with default values."""
+        sequence = KOrgSequence(org_id=test_org_id, kind="task")
+
+        session.add(sequence)
+        await session.commit()
+        await session.refresh(sequence)
+
+        assert sequence.org_id == test_org_id
+        assert sequence.kind == "task"
+        assert sequence.last_value == 0
+
+    @pytest.mark.asyncio
+    async def test_one_row_per_org_and_kind(
+        self, session: AsyncSession, test_org_id: UUID
+    ):
+        """Test that (org_id, kind) is unique."""
+        session.add(KOrgSequence(org_id=test_org_id, kind="task", last_value=3))
+        await session.commit()
+
+        session.add(KOrgSequence(org_id=test_org_id, kind="task", last_value=5))
+        with pytest.raises(IntegrityError):
+            await session.commit()
+
+    @pytest.mark.asyncio
+    async def test_kinds_share_org(self, session: AsyncSession, test_org_id: UUID):
+        """Test that different kinds can coexist for one organization."""
+        session.add(KOrgSequence(org_id=test_org_id, kind="task", last_value=3))
+        session.add(KOrgSequence(org_id=test_org_id, kind="feature", last_value=5))
+        await session.commit()
+
+        result = await session.execute(
+            select(KOrgSequence).where(KOrgSequence.org_id == test_org_id)
+        )
+        sequences = {seq.kind: seq.last_value for seq in result.scalars().all()}
+
+        assert sequences == {"task": 3, "feature": 5}
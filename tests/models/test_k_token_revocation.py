@@ -0,0 +1,47 @@
+"""Unit tests for KTokenRevocation model."""
+
+from datetime import datetime
+from uuid import uuid7
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import KTokenRevocation
+
+
+class TestKTokenRevocationModel:
+    """Test suite for KTokenRevocation model."""
+
+    @pytest.mark.asyncio
+    async def test_create_token_revocation(self, session: AsyncSession):
+        """Test revoking a single token."""
+        principal_id = uuid7()
+        revocation = KTokenRevocation(
+            jti="token-id",
+            principal_id=principal_id,
+            revoked_at=datetime(2026, 1, 1, 12, 0, 0),
+            expires_at=datetime(2026, 1, 1, 12, 30, 0),
+        )
+
+        session.add(revocation)
+        await session.commit()
+        await session.refresh(revocation)
+
+        assert revocation.id is not None
+        assert revocation.jti == "token-id"
+        assert revocation.principal_id == principal_id
+
+    @pytest.mark.asyncio
+    async def test_create_principal_revocation(self, session: AsyncSession):
+        """Test revoking every token of a principal (no token ID)."""
+        revocation = KTokenRevocation(
+            principal_id=uuid7(),
+            revoked_at=datetime(2026, 1, 1, 12, 0, 0),
+            expires_at=datetime(2026, 1, 8, 12, 0, 0),
+        )
+
+        session.add(revocation)
+        await session.commit()
+        await session.refresh(revocation)
+
+        assert revocation.jti is None
@@ -49,10 +49,13 @@ def app_with_overrides(
         return mock_user
 
     from app.core.auth import oauth2_scheme
-    from app.core.db.database import get_db
+    from app.core.db.database import get_db, get_read_db
     from app.routes.deps import get_current_token, get_current_user
+    from app.routes.streaming import get_list_db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_list_db] = override_get_db
     app.dependency_overrides[oauth2_scheme] = override_oauth2_scheme
     app.dependency_overrides[get_current_token] = override_get_current_token
     app.dependency_overrides[get_current_user] = override_get_current_user
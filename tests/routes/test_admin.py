@@ -0,0 +1,68 @@
+"""Unit tests for admin endpoints."""
+
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.db.slow_query import SlowQuery, slow_query_log
+from app.models.k_principal import SystemRole
+from app.routes.admin import router
+from app.routes.deps import get_current_user
+
+
+@pytest.fixture
+def app(app_with_overrides: FastAPI) -> FastAPI:
+    """Create a FastAPI app with the admin router."""
+    app_with_overrides.include_router(router, prefix="/api")
+    return app_with_overrides
+
+
+@pytest.fixture
+def captured_plan():
+    """Put a captured plan in the slow-query log for the duration of a test."""
+    slow_query_log.clear()
+    slow_query_log._plans.append(
+        SlowQuery(
+            captured_at=datetime(2025, 1, 2, 3, 4, 5),
+            statement="SELECT * FROM k_task WHERE org_id = ?",
+            parameters=["UUID"],
+            duration_ms=512.0,
+            caller="app.logic.v1.tasks.list_tasks",
+            request_id=None,
+            plan="Seq Scan on k_task",
+        )
+    )
+    yield
+    slow_query_log.clear()
+
+
+class TestListSlowQueries:
+    """Test suite for GET /api/admin/slow-queries."""
+
+    @pytest.mark.asyncio
+    async def test_returns_captured_plans(self, client: AsyncClient, captured_plan):
+        """Test that a system admin can read captured plans."""
+        response = await client.get("/api/admin/slow-queries")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["plans"] == 1
+        [query] = data["queries"]
+        assert query["statement"] == "SELECT * FROM k_task WHERE org_id = ?"
+        assert query["plan"] == "Seq Scan on k_task"
+        assert query["caller"] == "app.logic.v1.tasks.list_tasks"
+
+    @pytest.mark.asyncio
+    async def test_requires_system_admin(self, app: FastAPI, mock_user, captured_plan):
+        """Test that users below system admin are rejected."""
+        user = mock_user.model_copy(update={"system_role": SystemRole.SYSTEM_USER})
+        app.dependency_overrides[get_current_user] = lambda: user
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/api/admin/slow-queries")
+
+        assert response.status_code == 403
@@ -110,6 +110,26 @@ class TestLoginEndpoint:
             assert "Invalid username or password" in data["detail"]
             assert response.headers.get("WWW-Authenticate") == "Bearer"
 
+    @pytest.mark.asyncio
+    async def test_login_password_hashing_saturated(self, client: AsyncClient):
+        """Test that login returns 503 when password checks are saturated."""
+        from app.core.exceptions.domain_exceptions import (
+            PasswordHashingUnavailableException,
+        )
+
+        with patch(
+            "app.logic.auth.perform_login", new_callable=AsyncMock
+        ) as mock_login:
+            mock_login.side_effect = PasswordHashingUnavailableException()
+
+            response = await client.post(
+                "/auth/login",
+                data={"username": "testuser", "password": "testpassword"},
+            )
+
+            assert response.status_code == 503
+            assert response.headers.get("Retry-After") == "1"
+
     @pytest.mark.asyncio
     async def test_login_missing_username(self, client: AsyncClient):
         """Test login without username returns validation error."""
@@ -428,27 +448,86 @@ class TestLogoutEndpoint:
 
     @pytest.mark.asyncio
     async def test_logout_web_client(self, authenticated_client: AsyncClient):
-        """Test logout clears refresh token cookie for web clients."""
-        response = await authenticated_client.post("/auth/logout")
+        """Test logout revokes the tokens and clears the cookie for web clients."""
+        authenticated_client.cookies["refresh_token"] = "cookie_refresh_token"
+        with patch(
+            "app.logic.auth.perform_logout", new_callable=AsyncMock
+        ) as mock_logout:
+            response = await authenticated_client.post(
+                "/auth/logout",
+                headers={"Authorization": "Bearer test_access_token"},
+            )
 
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "Logged out successfully"
-        # Cookie deletion is handled by FastAPI's delete_cookie method
-        # The endpoint successfully executes the logout logic
+        assert 'refresh_token=""' in response.headers["set-cookie"]
+        mock_logout.assert_called_once_with(
+            access_token="test_access_token",
+            db=ANY,
+            refresh_token="cookie_refresh_token",
+            all_sessions=False,
+        )
 
     @pytest.mark.asyncio
     async def test_logout_mobile_client(self, authenticated_client: AsyncClient):
-        """Test logout for mobile clients (no cookie clearing)."""
-        response = await authenticated_client.post(
-            "/auth/logout",
-            headers={"X-Client-Type": "mobile"},
-        )
+        """Test logout for mobile clients revokes the refresh token from the body."""
+        with patch(
+            "app.logic.auth.perform_logout", new_callable=AsyncMock
+        ) as mock_logout:
+            response = await authenticated_client.post(
+                "/auth/logout",
+                headers={
+                    "X-Client-Type": "mobile",
+                    "Authorization": "Bearer test_access_token",
+                },
+                json={"refresh_token": "body_refresh_token"},
+            )
 
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "Logged out successfully"
         # Mobile clients don't have cookies, so no cookie clearing happens
+        assert "set-cookie" not in response.headers
+        mock_logout.assert_called_once_with(
+            access_token="test_access_token",
+            db=ANY,
+            refresh_token="body_refresh_token",
+            all_sessions=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_logout_all_sessions(self, authenticated_client: AsyncClient):
+        """Test that all_sessions is passed through to the logout logic."""
+        with patch(
+            "app.logic.auth.perform_logout", new_callable=AsyncMock
+        ) as mock_logout:
+            response = await authenticated_client.post(
+                "/auth/logout?all_sessions=true",
+                headers={"Authorization": "Bearer test_access_token"},
+            )
+
+        assert response.status_code == 200
+        assert mock_logout.call_args.kwargs["all_sessions"] is True
+
+    @pytest.mark.asyncio
+    async def test_logout_revoked_token(self, authenticated_client: AsyncClient):
+        """Test that logout returns 401 when the access token no longer verifies."""
+        from app.core.exceptions.domain_exceptions import InvalidTokenException
+
+        with patch(
+            "app.logic.auth.perform_logout", new_callable=AsyncMock
+        ) as mock_logout:
+            mock_logout.side_effect = InvalidTokenException(
+                reason="Token verification failed"
+            )
+            response = await authenticated_client.post(
+                "/auth/logout",
+                headers={"Authorization": "Bearer test_access_token"},
+            )
+
+        assert response.status_code == 401
+        assert response.headers.get("WWW-Authenticate") == "Bearer"
 
     @pytest.mark.asyncio
     async def test_logout_unauthenticated(self, client: AsyncClient):
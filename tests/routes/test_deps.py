@@ -16,6 +16,7 @@ from app.routes.deps import (
     get_current_token,
     get_current_user,
     get_optional_user,
+    get_system_admin,
     get_system_user,
 )
 from app.schemas.user import TokenData, UserDetail
@@ -856,6 +857,33 @@ class TestGetSystemUser:
         assert "insufficient privileges" in exc_info.value.detail.lower()
 
 
+class TestGetSystemAdmin:
+    """Test suite for get_system_admin dependency."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "role", [SystemRole.SYSTEM, SystemRole.SYSTEM_ROOT, SystemRole.SYSTEM_ADMIN]
+    )
+    async def test_get_system_admin_allowed(self, mock_user: UserDetail, role):
+        """Test that system admin roles and above are allowed."""
+        user = mock_user.model_copy(update={"system_role": role})
+
+        result = await get_system_admin(user)
+
+        assert result == user
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", [SystemRole.SYSTEM_USER, SystemRole.SYSTEM_CLIENT])
+    async def test_get_system_admin_denied(self, mock_user: UserDetail, role):
+        """Test that roles below system admin are denied."""
+        user = mock_user.model_copy(update={"system_role": role})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_system_admin(user)
+
+        assert exc_info.value.status_code == 403
+
+
 class TestCheckHardDeleteAuthorization:
     """Test check_hard_delete_authorization dependency."""
 
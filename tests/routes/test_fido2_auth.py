@@ -299,6 +299,31 @@ class TestLogin2faEndpoint:
 
             assert result.status_code == 401
 
+    @pytest.mark.asyncio
+    async def test_login_2fa_password_hashing_saturated(self, client: AsyncClient):
+        """Test that 2FA login returns 503 when password checks are saturated."""
+        from app.core.exceptions.domain_exceptions import (
+            PasswordHashingUnavailableException,
+        )
+
+        with patch(
+            "app.logic.auth.perform_2fa_login", new_callable=AsyncMock
+        ) as mock_login:
+            mock_login.side_effect = PasswordHashingUnavailableException()
+
+            result = await client.post(
+                "/auth/login/2fa",
+                json={
+                    "username": "testuser",
+                    "password": "testpassword",
+                    "session_id": "test_session",
+                    "credential": {"id": "test", "response": {}},
+                },
+            )
+
+            assert result.status_code == 503
+            assert result.headers.get("Retry-After") == "1"
+
 
 class TestListCredentialsEndpoint:
     """Test suite for GET /auth/fido2/credentials endpoint."""
@@ -475,7 +500,7 @@ class TestDeleteCredentialEndpoint:
         from httpx import ASGITransport, AsyncClient
 
         from app.core.auth import oauth2_scheme
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
         from app.models import KFido2Credential, KPrincipal
         from app.routes.auth import router
         from app.routes.deps import get_current_token, get_current_user
@@ -497,6 +522,7 @@ class TestDeleteCredentialEndpoint:
             return mock_system_root_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[oauth2_scheme] = override_oauth2_scheme
         app.dependency_overrides[get_current_token] = override_get_current_token
         app.dependency_overrides[get_current_user] = override_get_current_user
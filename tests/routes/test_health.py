@@ -3,6 +3,9 @@
 import pytest
 from httpx import AsyncClient
 
+from app.core.metrics import metrics_registry
+from app.models.k_principal import SystemRole
+from app.routes.deps import get_current_user
 from app.routes.health import router
 
 
@@ -39,3 +42,43 @@ class TestHealthCheck:
         response = await client.get("/health")
 
         assert response.status_code == 200
+
+
+class TestMetrics:
+    """Test suite for metrics endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_returns_registered_sources(
+        self, app, client: AsyncClient, mock_user
+    ):
+        """Test that the metrics endpoint returns the registry snapshot."""
+        app.dependency_overrides[get_current_user] = lambda: mock_user
+        metrics_registry.register("test_source", lambda: {"value": 1})
+        try:
+            response = await client.get("/metrics")
+        finally:
+            metrics_registry.unregister("test_source")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["test_source"] == {"value": 1}
+        assert "membership_cache" in data
+
+    @pytest.mark.asyncio
+    async def test_metrics_requires_authentication(self, client: AsyncClient):
+        """Test that anonymous callers cannot read metrics."""
+        response = await client.get("/metrics")
+
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_metrics_requires_system_admin(
+        self, app, client: AsyncClient, mock_user
+    ):
+        """Test that users below system admin cannot read metrics."""
+        user = mock_user.model_copy(update={"system_role": SystemRole.SYSTEM_USER})
+        app.dependency_overrides[get_current_user] = lambda: user
+
+        response = await client.get("/metrics")
+
+        assert response.status_code == 403
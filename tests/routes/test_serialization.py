@@ -0,0 +1,92 @@
+"""Unit tests for fast JSON serialization of route responses."""
+
+import json
+from datetime import datetime
+from uuid import uuid7
+
+import pytest
+from fastapi import FastAPI
+
+from app.logic.pagination import Page
+from app.models import KTask
+from app.routes.serialization import json_bytes, json_response, page_response
+from app.routes.v1.tasks import router as tasks_router
+from app.schemas.task import TaskDetail, TaskList
+
+
+@pytest.fixture
+def task() -> KTask:
+    """Create an unsaved task row."""
+    user_id = uuid7()
+    return KTask(
+        id=uuid7(),
+        org_id=uuid7(),
+        summary="Task",
+        team_id=uuid7(),
+        meta={"key": "value"},
+        created=datetime(2025, 1, 1),
+        created_by=user_id,
+        last_modified=datetime(2025, 1, 2),
+        last_modified_by=user_id,
+    )
+
+
+class TestJsonResponse:
+    """Test suite for json_bytes and json_response."""
+
+    def test_matches_schema_serialization(self, task: KTask):
+        """Test that ORM rows encode as the schema built from them would."""
+        assert (
+            json_bytes(TaskDetail, task)
+            == TaskDetail.model_validate(task).model_dump_json().encode()
+        )
+
+    def test_status_and_media_type(self, task: KTask):
+        """Test that the response carries the status and a JSON media type."""
+        response = json_response(TaskDetail, task, status_code=201)
+
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+        assert json.loads(response.body)["id"] == str(task.id)
+
+
+class TestPageResponse:
+    """Test suite for page_response."""
+
+    def test_entities(self, task: KTask):
+        """Test that a page of rows encodes as the list schema would."""
+        response = page_response("tasks", TaskDetail, Page([task], "cursor"))
+
+        expected = TaskList(
+            tasks=[TaskDetail.model_validate(task)], next_cursor="cursor"
+        )
+        assert response.body == expected.model_dump_json().encode()
+
+    def test_field_mappings(self):
+        """Test that a page of field mappings encodes them as they are."""
+        task_id = uuid7()
+        page = Page([{"id": task_id, "summary": "Task"}])
+
+        response = page_response("tasks", dict, page)
+
+        assert json.loads(response.body) == {
+            "tasks": [{"id": str(task_id), "summary": "Task"}],
+            "next_cursor": None,
+        }
+
+
+def test_openapi_keeps_response_models():
+    """Test that routes returning fast responses still document their schemas."""
+    app = FastAPI()
+    app.include_router(tasks_router)
+
+    paths = app.openapi()["paths"]
+
+    list_schema = paths["/tasks"]["get"]["responses"]["200"]["content"][
+        "application/json"
+    ]["schema"]
+    assert list_schema == {"$ref": "#/components/schemas/TaskList"}
+    create_schema = paths["/tasks"]["post"]["responses"]["201"]["content"][
+        "application/json"
+    ]["schema"]
+    assert create_schema == {"$ref": "#/components/schemas/TaskDetail"}
@@ -0,0 +1,69 @@
+"""Unit tests for NDJSON streaming of list responses."""
+
+from contextlib import asynccontextmanager
+from typing import Annotated
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.routes.streaming import NDJSON_MEDIA_TYPE, get_list_db
+
+
+class TestGetListDb:
+    """Test suite for get_list_db dependency."""
+
+    @pytest.fixture
+    def events(self) -> list[str]:
+        """Record when the session is closed and when the response is sent."""
+        return []
+
+    @pytest.fixture
+    def client(self, events: list[str]):
+        """Create a client for a list route streaming its body, with a fake session."""
+
+        @asynccontextmanager
+        async def fake_get_db_session(read_only: bool = False):
+            assert read_only
+            yield MagicMock(spec=AsyncSession)
+            events.append("session closed")
+
+        app = FastAPI()
+
+        @app.get("/")
+        async def endpoint(
+            db: Annotated[AsyncSession, Depends(get_list_db, scope="function")],
+        ) -> StreamingResponse:
+            async def body():
+                events.append("response sent")
+                yield b"ok"
+
+            return StreamingResponse(body())
+
+        with patch("app.routes.streaming.get_db_session", fake_get_db_session):
+            yield AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+    @pytest.mark.asyncio
+    async def test_json_session_released_before_response(
+        self, client: AsyncClient, events: list[str]
+    ):
+        """Test that a JSON request's session is closed when the route returns."""
+        async with client:
+            response = await client.get("/")
+
+        assert response.status_code == 200
+        assert events == ["session closed", "response sent"]
+
+    @pytest.mark.asyncio
+    async def test_ndjson_session_kept_open_while_streaming(
+        self, client: AsyncClient, events: list[str]
+    ):
+        """Test that an NDJSON request's session stays open until the stream is sent."""
+        async with client:
+            response = await client.get("/", headers={"Accept": NDJSON_MEDIA_TYPE})
+
+        assert response.status_code == 200
+        assert events == ["response sent", "session closed"]
@@ -33,8 +33,9 @@ def app_with_root_user_overrides(
     privileges to perform hard deletes.
     """
     from app.core.auth import oauth2_scheme
-    from app.core.db.database import get_db
+    from app.core.db.database import get_db, get_read_db
     from app.routes.deps import get_current_token, get_current_user
+    from app.routes.streaming import get_list_db
 
     app = FastAPI()
 
@@ -51,6 +52,8 @@ def app_with_root_user_overrides(
         return mock_system_root_user
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_list_db] = override_get_db
     app.dependency_overrides[oauth2_scheme] = override_oauth2_scheme
     app.dependency_overrides[get_current_token] = override_get_current_token
     app.dependency_overrides[get_current_user] = override_get_current_user
@@ -82,8 +85,9 @@ def app_with_system_user_overrides(
     perform user CUD operations.
     """
     from app.core.auth import oauth2_scheme
-    from app.core.db.database import get_db
+    from app.core.db.database import get_db, get_read_db
     from app.routes.deps import get_current_token, get_current_user
+    from app.routes.streaming import get_list_db
 
     app = FastAPI()
 
@@ -100,6 +104,8 @@ def app_with_system_user_overrides(
         return mock_system_user
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_list_db] = override_get_db
     app.dependency_overrides[oauth2_scheme] = override_oauth2_scheme
     app.dependency_overrides[get_current_token] = override_get_current_token
     app.dependency_overrides[get_current_user] = override_get_current_user
@@ -130,8 +136,9 @@ def app_with_system_admin_user_overrides(
     perform organization and organization_principal CUD operations.
     """
     from app.core.auth import oauth2_scheme
-    from app.core.db.database import get_db
+    from app.core.db.database import get_db, get_read_db
     from app.routes.deps import get_current_token, get_current_user
+    from app.routes.streaming import get_list_db
 
     app = FastAPI()
 
@@ -148,6 +155,8 @@ def app_with_system_admin_user_overrides(
         return mock_system_admin_user
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_list_db] = override_get_db
     app.dependency_overrides[oauth2_scheme] = override_oauth2_scheme
     app.dependency_overrides[get_current_token] = override_get_current_token
     app.dependency_overrides[get_current_user] = override_get_current_user
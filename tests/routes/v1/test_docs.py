@@ -1,5 +1,7 @@
 """Unit tests for doc management endpoints."""
 
+import hashlib
+import json
 from uuid import UUID, uuid7
 
 import pytest
@@ -162,6 +164,128 @@ class TestListDocs:
         assert "Doc Alpha" in doc_names
         assert "Doc Beta" in doc_names
 
+    async def test_list_docs_summaries(
+        self, client: AsyncClient, test_organization: KOrganization
+    ):
+        """Test that docs are listed without content by default."""
+        content = "# Spec\n\nA long product requirements document."
+        response = await client.post(
+            f"/documents?org_id={test_organization.id}",
+            json={"name": "Spec", "content": content},
+        )
+        assert response.status_code == 201
+
+        response = await client.get(
+            f"/documents?org_id={test_organization.id}&excerpt=6"
+        )
+
+        assert response.status_code == 200
+        (doc,) = response.json()["docs"]
+        assert "content" not in doc
+        assert doc["name"] == "Spec"
+        assert doc["content_length"] == len(content)
+        assert doc["content_hash"] == hashlib.sha256(content.encode()).hexdigest()
+        assert doc["excerpt"] == "# Spec"
+
+    async def test_list_docs_full_view(
+        self,
+        client: AsyncClient,
+        test_organization: KOrganization,
+        async_session: AsyncSession,
+        test_user_id: UUID,
+    ):
+        """Test that the full view lists docs with their content."""
+        async_session.add(
+            KDoc(
+                name="Doc",
+                content="Full content",
+                org_id=test_organization.id,
+                created_by=test_user_id,
+                last_modified_by=test_user_id,
+            )
+        )
+        await async_session.commit()
+
+        response = await client.get(
+            f"/documents?org_id={test_organization.id}&view=full"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["docs"][0]["content"] == "Full content"
+
+    async def test_list_docs_ndjson(
+        self, client: AsyncClient, test_organization: KOrganization
+    ):
+        """Test streaming doc summaries as NDJSON."""
+        for name in ["Alpha", "Beta"]:
+            await client.post(
+                f"/documents?org_id={test_organization.id}",
+                json={"name": name, "content": f"{name} content"},
+            )
+
+        response = await client.get(
+            f"/documents?org_id={test_organization.id}&excerpt=4",
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        docs = [json.loads(line) for line in response.text.splitlines()]
+        assert [doc["excerpt"] for doc in docs] == ["Alph", "Beta"]
+        assert all("content" not in doc for doc in docs)
+
+    async def test_list_docs_paginated(
+        self,
+        client: AsyncClient,
+        test_organization: KOrganization,
+        async_session: AsyncSession,
+        test_user_id: UUID,
+    ):
+        """Test walking the doc list page by page with cursors."""
+        for i in range(5):
+            async_session.add(
+                KDoc(
+                    name=f"Doc {i}",
+                    content="Content",
+                    org_id=test_organization.id,
+                    created_by=test_user_id,
+                    last_modified_by=test_user_id,
+                )
+            )
+        await async_session.commit()
+
+        names: list[str] = []
+        url = f"/documents?org_id={test_organization.id}&limit=2"
+        cursor = None
+        for _ in range(3):
+            response = await client.get(url + (f"&cursor={cursor}" if cursor else ""))
+            assert response.status_code == 200
+            data = response.json()
+            names.extend(d["name"] for d in data["docs"])
+            cursor = data["next_cursor"]
+
+        assert cursor is None
+        assert sorted(names) == [f"Doc {i}" for i in range(5)]
+
+    async def test_list_docs_invalid_cursor(
+        self, client: AsyncClient, test_organization: KOrganization
+    ):
+        """Test that a malformed cursor is rejected."""
+        response = await client.get(
+            f"/documents?org_id={test_organization.id}&cursor=not-a-cursor"
+        )
+
+        assert response.status_code == 400
+
+    async def test_list_docs_limit_too_large(
+        self, client: AsyncClient, test_organization: KOrganization
+    ):
+        """Test that page sizes above the maximum are rejected."""
+        response = await client.get(
+            f"/documents?org_id={test_organization.id}&limit=100000"
+        )
+
+        assert response.status_code == 422
+
     async def test_list_docs_unauthorized_org(self, client: AsyncClient):
         """Test that listing docs in unauthorized org fails."""
         unauthorized_org_id = uuid7()
@@ -252,6 +376,91 @@ class TestGetDoc:
         assert response.status_code == 403
 
 
+class TestGetDocContent:
+    """Test suite for GET /docs/{doc_id}/content endpoint."""
+
+    @pytest.fixture
+    async def doc(
+        self,
+        async_session: AsyncSession,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+    ) -> KDoc:
+        """Create a doc with ten characters of content."""
+        doc = KDoc(
+            name="Doc",
+            content="0123456789",
+            org_id=test_organization.id,
+            created_by=test_user_id,
+            last_modified_by=test_user_id,
+        )
+        async_session.add(doc)
+        await async_session.commit()
+        return doc
+
+    async def test_get_doc_content(
+        self, client: AsyncClient, test_organization: KOrganization, doc: KDoc
+    ):
+        """Test fetching the full content."""
+        response = await client.get(
+            f"/documents/{doc.id}/content?org_id={test_organization.id}"
+        )
+
+        assert response.status_code == 200
+        assert response.text == "0123456789"
+        assert response.headers["accept-ranges"] == "chars"
+
+    async def test_get_doc_content_range(
+        self, client: AsyncClient, test_organization: KOrganization, doc: KDoc
+    ):
+        """Test fetching a closed and an open-ended range of the content."""
+        url = f"/documents/{doc.id}/content?org_id={test_organization.id}"
+
+        response = await client.get(url, headers={"Range": "chars=2-4"})
+        assert response.status_code == 206
+        assert response.text == "234"
+        assert response.headers["content-range"] == "chars 2-4/10"
+
+        response = await client.get(url, headers={"Range": "chars=7-"})
+        assert response.status_code == 206
+        assert response.text == "789"
+        assert response.headers["content-range"] == "chars 7-9/10"
+
+    async def test_get_doc_content_byte_range_ignored(
+        self, client: AsyncClient, test_organization: KOrganization, doc: KDoc
+    ):
+        """Test that ranges in other units are ignored."""
+        response = await client.get(
+            f"/documents/{doc.id}/content?org_id={test_organization.id}",
+            headers={"Range": "bytes=0-1"},
+        )
+
+        assert response.status_code == 200
+        assert response.text == "0123456789"
+
+    async def test_get_doc_content_range_not_satisfiable(
+        self, client: AsyncClient, test_organization: KOrganization, doc: KDoc
+    ):
+        """Test that a range starting past the end is rejected."""
+        response = await client.get(
+            f"/documents/{doc.id}/content?org_id={test_organization.id}",
+            headers={"Range": "chars=10-"},
+        )
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "chars */10"
+
+    async def test_get_doc_content_not_found(
+        self, client: AsyncClient, test_organization: KOrganization
+    ):
+        """Test fetching the content of a non-existent doc."""
+        response = await client.get(
+            f"/documents/{uuid7()}/content?org_id={test_organization.id}"
+        )
+
+        assert response.status_code == 404
+
+
 class TestUpdateDoc:
     """Test suite for PATCH /docs/{doc_id} endpoint."""
 
@@ -327,6 +536,28 @@ class TestUpdateDoc:
         assert data["description"] == "Original description"  # Unchanged
         assert data["content"] == "Updated content"  # Changed
 
+    async def test_update_doc_content_digest(
+        self, client: AsyncClient, test_organization: KOrganization
+    ):
+        """Test that updating content refreshes its length and hash."""
+        response = await client.post(
+            f"/documents?org_id={test_organization.id}",
+            json={"name": "Doc", "content": "Short"},
+        )
+        doc_id = response.json()["id"]
+
+        response = await client.patch(
+            f"/documents/{doc_id}?org_id={test_organization.id}",
+            json={"content": "Much longer content"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["content_length"] == len("Much longer content")
+        assert (
+            data["content_hash"] == hashlib.sha256(b"Much longer content").hexdigest()
+        )
+
     async def test_update_doc_not_found(
         self, client: AsyncClient, test_organization: KOrganization
     ):
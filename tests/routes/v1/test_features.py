@@ -204,6 +204,52 @@ class TestListFeatures:
         assert "Feature 1" in feature_names
         assert "Feature 2" in feature_names
 
+    async def test_list_features_filtered_and_sorted(
+        self,
+        client: AsyncClient,
+        test_organization: KOrganization,
+        async_session: AsyncSession,
+        test_user_id: UUID,
+    ):
+        """Test filtering features by parent and type and sorting by name."""
+        parent_id = get_test_feature_id(test_organization.id)
+        async_session.add(
+            KFeature(
+                id=parent_id,
+                name="Parent",
+                feature_type=FeatureType.PRODUCT,
+                org_id=test_organization.id,
+                created_by=test_user_id,
+                last_modified_by=test_user_id,
+            )
+        )
+        for name, feature_type in [
+            ("Child A", FeatureType.ENGINEERING),
+            ("Child B", FeatureType.ENGINEERING),
+            ("Child C", FeatureType.PRODUCT),
+        ]:
+            async_session.add(
+                KFeature(
+                    id=get_test_feature_id(test_organization.id),
+                    name=name,
+                    parent=parent_id,
+                    feature_type=feature_type,
+                    org_id=test_organization.id,
+                    created_by=test_user_id,
+                    last_modified_by=test_user_id,
+                )
+            )
+        await async_session.commit()
+
+        response = await client.get(
+            f"/features?org_id={test_organization.id}&parent={parent_id}"
+            "&feature_type=Engineering&sort=name&direction=desc"
+        )
+
+        assert response.status_code == 200
+        names = [f["name"] for f in response.json()["features"]]
+        assert names == ["Child B", "Child A"]
+
     async def test_list_features_unauthorized_org(self, client: AsyncClient):
         """Test that listing features in unauthorized org fails."""
         unauthorized_org_id = uuid7()
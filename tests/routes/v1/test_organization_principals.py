@@ -1,5 +1,6 @@
 """Unit tests for organization principal management endpoints."""
 
+import json
 from uuid import UUID, uuid7
 
 import pytest
@@ -211,6 +212,22 @@ class TestListOrganizationPrincipals:
         assert len(data["principals"]) == 1
         assert data["principals"][0]["principal_id"] == str(test_user_id)
 
+    async def test_list_organization_principals_ndjson(
+        self,
+        client: AsyncClient,
+        test_organization: KOrganization,
+        test_user_id: UUID,
+    ):
+        """Test streaming organization principals as NDJSON."""
+        response = await client.get(
+            f"/organizations/{test_organization.id}/principals",
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        (principal,) = [json.loads(line) for line in response.text.splitlines()]
+        assert principal["principal_id"] == str(test_user_id)
+
     async def test_list_organization_principals_single(
         self,
         client: AsyncClient,
@@ -710,7 +727,7 @@ class TestSystemRoleAuthorization:
         async_session: AsyncSession,
     ):
         """Test adding a principal without proper system role."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
         from app.routes.deps import get_current_user
 
         app = FastAPI()
@@ -723,6 +740,7 @@ class TestSystemRoleAuthorization:
             return mock_client_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -747,7 +765,7 @@ class TestSystemRoleAuthorization:
         async_session: AsyncSession,
     ):
         """Test updating a principal without proper system role."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
         from app.routes.deps import get_current_user
 
         # First create an organization principal with admin user
@@ -773,6 +791,7 @@ class TestSystemRoleAuthorization:
             return mock_client_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -797,7 +816,7 @@ class TestSystemRoleAuthorization:
         async_session: AsyncSession,
     ):
         """Test removing a principal without proper system role."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
         from app.routes.deps import get_current_user
 
         # First create an organization principal with admin user
@@ -823,6 +842,7 @@ class TestSystemRoleAuthorization:
             return mock_client_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -844,7 +864,7 @@ class TestSystemRoleAuthorization:
         async_session: AsyncSession,
     ):
         """Test hard delete requires SYSTEM or SYSTEM_ROOT role (not SYSTEM_ADMIN)."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
         from app.models.k_principal import SystemRole
         from app.routes.deps import get_current_user
         from app.schemas.user import UserDetail as UD
@@ -898,6 +918,7 @@ class TestSystemRoleAuthorization:
             return system_admin_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -21,7 +21,7 @@ def app_with_overrides(
     """Create a FastAPI app with organization router included."""
     from fastapi import FastAPI
 
-    from app.core.db.database import get_db
+    from app.core.db.database import get_db, get_read_db
     from app.routes.deps import get_current_token, get_current_user
 
     app = FastAPI()
@@ -60,6 +60,7 @@ def app_with_overrides(
         return mock_system_admin_user
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_token] = override_get_current_token
     app.dependency_overrides[get_current_user] = override_get_current_user
 
@@ -1238,7 +1239,7 @@ class TestSystemRoleAuthorization:
         from fastapi import FastAPI
         from httpx import ASGITransport, AsyncClient
 
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
         from app.routes.deps import get_current_token, get_current_user
         from app.routes.v1.organizations import router
 
@@ -1256,6 +1257,7 @@ class TestSystemRoleAuthorization:
             return mock_client_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_token] = override_get_current_token
         app.dependency_overrides[get_current_user] = override_get_current_user
 
@@ -1279,7 +1281,7 @@ class TestSystemRoleAuthorization:
         from fastapi import FastAPI
         from httpx import ASGITransport, AsyncClient
 
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
         from app.models import KOrganization, KPrincipal
         from app.routes.deps import get_current_token, get_current_user
         from app.routes.v1.organizations import router
@@ -1327,6 +1329,7 @@ class TestSystemRoleAuthorization:
             return mock_client_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_token] = override_get_current_token
         app.dependency_overrides[get_current_user] = override_get_current_user
 
@@ -1350,7 +1353,7 @@ class TestSystemRoleAuthorization:
         from fastapi import FastAPI
         from httpx import ASGITransport, AsyncClient
 
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
         from app.models import KOrganization, KPrincipal
         from app.routes.deps import get_current_token, get_current_user
         from app.routes.v1.organizations import router
@@ -1398,6 +1401,7 @@ class TestSystemRoleAuthorization:
             return mock_client_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_token] = override_get_current_token
         app.dependency_overrides[get_current_user] = override_get_current_user
 
@@ -1420,7 +1424,7 @@ class TestSystemRoleAuthorization:
         from fastapi import FastAPI
         from httpx import ASGITransport, AsyncClient
 
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
         from app.models.k_principal import SystemRole
         from app.routes.deps import get_current_user
         from app.routes.v1.organizations import router
@@ -1492,6 +1496,7 @@ class TestSystemRoleAuthorization:
             return system_admin_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
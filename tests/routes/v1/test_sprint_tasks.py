@@ -1,5 +1,6 @@
 """Unit tests for sprint task management endpoints."""
 
+import json
 from uuid import UUID, uuid7
 
 import pytest
@@ -255,6 +256,58 @@ class TestListSprintTasks:
         response = await client.get(f"/sprints/{non_existent_id}/tasks")
         assert response.status_code == 404
 
+    async def test_list_sprint_tasks_ndjson(
+        self,
+        client: AsyncClient,
+        sprint: KSprint,
+        async_session: AsyncSession,
+        test_org_id: UUID,
+        test_user_id: UUID,
+        team: KTeam,
+    ):
+        """Test streaming sprint tasks as NDJSON."""
+        task = KTask(
+            id=get_test_task_id(test_org_id),
+            summary="Task One",
+            team_id=team.id,
+            org_id=test_org_id,
+            created_by=test_user_id,
+            last_modified_by=test_user_id,
+        )
+        async_session.add(task)
+        await async_session.commit()
+        async_session.add(
+            KSprintTask(
+                sprint_id=sprint.id,
+                task_id=task.id,
+                org_id=test_org_id,
+                role="primary",
+                created_by=test_user_id,
+                last_modified_by=test_user_id,
+            )
+        )
+        await async_session.commit()
+
+        response = await client.get(
+            f"/sprints/{sprint.id}/tasks", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        (sprint_task,) = [json.loads(line) for line in response.text.splitlines()]
+        assert sprint_task["task_id"] == str(task.id)
+        assert sprint_task["role"] == "primary"
+
+    async def test_list_sprint_tasks_ndjson_nonexistent_sprint(
+        self,
+        client: AsyncClient,
+    ):
+        """Test that streaming tasks of a non-existent sprint fails before streaming."""
+        response = await client.get(
+            f"/sprints/{uuid7()}/tasks", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 404
+
 
 class TestGetSprintTask:
     """Test suite for GET /sprints/{sprint_id}/tasks/{task_id} endpoint."""
@@ -1,5 +1,6 @@
 """Unit tests for task management endpoints."""
 
+import json
 from uuid import UUID, uuid7
 
 import pytest
@@ -161,7 +162,7 @@ class TestCreateTask:
         async_session.add(existing_task)
         await async_session.commit()
 
-        # Now create a new task via the API (which uses get_next_task_number)
+        # Now create a new task via the API (which allocates from the org sequence)
         task_data = {
             "team_id": str(test_team.id),
             "summary": "New task after existing",
@@ -238,6 +239,128 @@ class TestListTasks:
         assert "First task summary" in task_summaries
         assert "Second task summary" in task_summaries
 
+    async def test_list_tasks_filtered_and_sorted(
+        self,
+        client: AsyncClient,
+        test_organization: KOrganization,
+        test_team: KTeam,
+        async_session: AsyncSession,
+        test_user_id: UUID,
+    ):
+        """Test filtering tasks by status and guestimate and sorting them."""
+        for summary, status, guestimate in [
+            ("Small backlog", TaskStatus.BACKLOG, 1.0),
+            ("Large backlog", TaskStatus.BACKLOG, 8.0),
+            ("Small on deck", TaskStatus.ON_DECK, 2.0),
+            ("Done", TaskStatus.DONE, 1.0),
+        ]:
+            async_session.add(
+                KTask(
+                    id=get_test_task_id(test_organization.id),
+                    summary=summary,
+                    org_id=test_organization.id,
+                    team_id=test_team.id,
+                    status=status,
+                    guestimate=guestimate,
+                    created_by=test_user_id,
+                    last_modified_by=test_user_id,
+                )
+            )
+        await async_session.commit()
+
+        response = await client.get(
+            f"/tasks?org_id={test_organization.id}"
+            "&status=Backlog&status=OnDeck&guestimate_max=4"
+            "&sort=status&direction=desc"
+        )
+
+        assert response.status_code == 200
+        summaries = [t["summary"] for t in response.json()["tasks"]]
+        assert summaries == ["Small on deck", "Small backlog"]
+
+    async def test_list_tasks_invalid_sort_field(
+        self, client: AsyncClient, test_organization: KOrganization
+    ):
+        """Test that sorting by an unsupported field is rejected."""
+        response = await client.get(
+            f"/tasks?org_id={test_organization.id}&sort=guestimate"
+        )
+
+        assert response.status_code == 422
+
+    async def test_list_tasks_fields(
+        self,
+        client: AsyncClient,
+        test_organization: KOrganization,
+        test_team: KTeam,
+        async_session: AsyncSession,
+        test_user_id: UUID,
+    ):
+        """Test that listing tasks with fields returns only those fields."""
+        task = KTask(
+            id=get_test_task_id(test_organization.id),
+            summary="Projected",
+            description="Long description",
+            org_id=test_organization.id,
+            team_id=test_team.id,
+            created_by=test_user_id,
+            last_modified_by=test_user_id,
+        )
+        async_session.add(task)
+        await async_session.commit()
+
+        response = await client.get(
+            f"/tasks?org_id={test_organization.id}&fields=id,summary,status"
+        )
+
+        assert response.status_code == 200
+        assert response.json()["tasks"] == [
+            {"id": str(task.id), "summary": "Projected", "status": "Backlog"}
+        ]
+
+    async def test_list_tasks_unknown_field(
+        self, client: AsyncClient, test_organization: KOrganization
+    ):
+        """Test that requesting a field tasks do not have is rejected."""
+        response = await client.get(
+            f"/tasks?org_id={test_organization.id}&fields=id,owner"
+        )
+
+        assert response.status_code == 400
+        assert "owner" in response.json()["detail"]
+
+    async def test_list_tasks_ndjson(
+        self,
+        client: AsyncClient,
+        test_organization: KOrganization,
+        test_team: KTeam,
+        async_session: AsyncSession,
+        test_user_id: UUID,
+    ):
+        """Test streaming every task as NDJSON, regardless of the page size."""
+        for i in range(3):
+            async_session.add(
+                KTask(
+                    id=get_test_task_id(test_organization.id),
+                    summary=f"Task {i}",
+                    org_id=test_organization.id,
+                    team_id=test_team.id,
+                    created_by=test_user_id,
+                    last_modified_by=test_user_id,
+                )
+            )
+        await async_session.commit()
+
+        response = await client.get(
+            f"/tasks?org_id={test_organization.id}&limit=1&fields=summary",
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == [{"summary": f"Task {i}"} for i in range(3)]
+
     async def test_list_tasks_unauthorized_org(self, client: AsyncClient):
         """Test that listing tasks in unauthorized org fails."""
         unauthorized_org_id = uuid7()
@@ -279,6 +402,33 @@ class TestGetTask:
         assert data["summary"] == "Test summary"
         assert data["status"] == "InProgress"
 
+    async def test_get_task_fields(
+        self,
+        client: AsyncClient,
+        test_organization: KOrganization,
+        test_team: KTeam,
+        async_session: AsyncSession,
+        test_user_id: UUID,
+    ):
+        """Test that getting a task with fields returns only those fields."""
+        task = KTask(
+            id=get_test_task_id(test_organization.id),
+            summary="Test summary",
+            org_id=test_organization.id,
+            team_id=test_team.id,
+            created_by=test_user_id,
+            last_modified_by=test_user_id,
+        )
+        async_session.add(task)
+        await async_session.commit()
+
+        response = await client.get(
+            f"/tasks/{task.id}?org_id={test_organization.id}&fields=summary"
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"summary": "Test summary"}
+
     async def test_get_task_not_found(
         self, client: AsyncClient, test_organization: KOrganization
     ):
@@ -1,19 +1,29 @@
 """Unit tests for transaction batch API endpoint."""
 
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch
 from uuid import UUID, uuid7
 
 import pytest
 from httpx import AsyncClient
 
-from app.routes.v1.txs import router
-from app.schemas.txs import TransactionResult, TransactionsResponse
+from app.routes.v1.txs import get_txs_db, router
+from app.schemas.txs import (
+    TransactionResult,
+    TransactionsRequest,
+    TransactionsResponse,
+)
 
 
 @pytest.fixture
-def app_with_overrides(app_with_overrides):
+def app_with_overrides(app_with_overrides, async_session):
     """Create a FastAPI app with txs router included."""
+
+    async def override_get_txs_db():
+        yield async_session
+
     app_with_overrides.include_router(router)
+    app_with_overrides.dependency_overrides[get_txs_db] = override_get_txs_db
     return app_with_overrides
 
 
@@ -82,3 +92,50 @@ class TestExecuteTransactions:
             call_args = mock_execute.call_args
             assert call_args.kwargs["user_id"] == test_user_id
             assert call_args.kwargs["request"].execution_mode == "serial"
+
+
+class TestGetTxsDb:
+    """Test suite for get_txs_db dependency."""
+
+    @staticmethod
+    def batch(*operations: str) -> TransactionsRequest:
+        """Build a one-transaction batch with the given operation types."""
+        return TransactionsRequest.model_validate(
+            {
+                "txs": [
+                    {
+                        "id": "tx-001",
+                        "operations": [
+                            {
+                                "id": f"op-{index}",
+                                "operation": operation,
+                                "domain_object": "task",
+                                "params": {},
+                            }
+                            for index, operation in enumerate(operations)
+                        ],
+                    }
+                ]
+            }
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("operations", "read_only"),
+        [(("get", "list"), True), (("get", "update"), False)],
+    )
+    async def test_opens_one_session(self, operations, read_only):
+        """Test that a single session is opened, on the replica only for reads."""
+        session = object()
+
+        @asynccontextmanager
+        async def fake_session(read_only: bool = False):
+            opened.append(read_only)
+            yield session
+
+        opened: list[bool] = []
+        with patch("app.routes.v1.txs.get_db_session", fake_session):
+            async for db in get_txs_db(self.batch(*operations)):
+                assert db is session
+
+        assert opened == [read_only]
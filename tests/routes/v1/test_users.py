@@ -1,6 +1,7 @@
 """Unit tests for user management endpoints."""
 
 from datetime import datetime
+from unittest.mock import AsyncMock, patch
 from uuid import UUID, uuid7
 
 import pytest
@@ -82,7 +83,7 @@ def app_with_overrides(
     async_session: AsyncSession, mock_user_detail: UserDetail
 ) -> FastAPI:
     """Create a FastAPI app with dependency overrides for testing."""
-    from app.core.db.database import get_db
+    from app.core.db.database import get_db, get_read_db
 
     app = FastAPI()
     app.include_router(router)
@@ -95,6 +96,7 @@ def app_with_overrides(
         return mock_user_detail
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     app.dependency_overrides[get_current_user] = override_get_current_user
 
     return app
@@ -119,7 +121,7 @@ class TestCreateUser:
         mock_root_user: UserDetail,
     ):
         """Test successfully creating a new user."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         app = FastAPI()
         app.include_router(router)
@@ -131,6 +133,7 @@ class TestCreateUser:
             return mock_root_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -163,7 +166,7 @@ class TestCreateUser:
         mock_client_user: UserDetail,
     ):
         """Test that non-root users cannot create users."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         app = FastAPI()
         app.include_router(router)
@@ -175,6 +178,7 @@ class TestCreateUser:
             return mock_client_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -201,7 +205,7 @@ class TestCreateUser:
         mock_root_user: UserDetail,
     ):
         """Test that creating a user with duplicate username fails."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create existing user
         existing_user = KPrincipal(
@@ -227,6 +231,7 @@ class TestCreateUser:
             return mock_root_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -246,6 +251,54 @@ class TestCreateUser:
             assert response.status_code == 409
             assert "already exists" in response.json()["detail"]
 
+    @pytest.mark.asyncio
+    async def test_create_user_password_hashing_saturated(
+        self,
+        async_session: AsyncSession,
+        mock_root_user: UserDetail,
+    ):
+        """Test that creating a user returns 503 when password hashing is saturated."""
+        from app.core.db.database import get_db, get_read_db
+        from app.core.exceptions.domain_exceptions import (
+            PasswordHashingUnavailableException,
+        )
+
+        app = FastAPI()
+        app.include_router(router)
+
+        async def override_get_db():
+            yield async_session
+
+        async def override_get_current_user():
+            return mock_root_user
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
+        app.dependency_overrides[get_current_user] = override_get_current_user
+
+        with patch(
+            "app.logic.v1.users.get_password_hash",
+            new_callable=AsyncMock,
+            side_effect=PasswordHashingUnavailableException(),
+        ):
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.post(
+                    "/users",
+                    json={
+                        "username": "newuser",
+                        "password": "SecurePassword123!",
+                        "primary_email": "new@example.com",
+                        "first_name": "New",
+                        "last_name": "User",
+                        "display_name": "New User",
+                    },
+                )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
 
 class TestListUsers:
     """Test suite for GET /users endpoint."""
@@ -267,7 +320,7 @@ class TestListUsers:
         mock_user_detail: UserDetail,
     ):
         """Test listing multiple users."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create multiple users in the same scope
         for i in range(3):
@@ -294,6 +347,7 @@ class TestListUsers:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -345,7 +399,7 @@ class TestGetUser:
         mock_user_detail: UserDetail,
     ):
         """Test successfully retrieving a user by ID."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create a user
         user = KPrincipal(
@@ -372,6 +426,7 @@ class TestGetUser:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -410,7 +465,7 @@ class TestUpdateUser:
         mock_user_detail: UserDetail,
     ):
         """Test successfully updating own user information."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create the current user in DB
         user = KPrincipal(
@@ -437,6 +492,7 @@ class TestUpdateUser:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -465,7 +521,7 @@ class TestUpdateUser:
         test_user_id: UUID,
     ):
         """Test that users without system or systemRoot role cannot update users."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create a user with insufficient privileges (SYSTEM_USER role)
         now = datetime.now()
@@ -520,6 +576,7 @@ class TestUpdateUser:
             return insufficient_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -540,7 +597,7 @@ class TestUpdateUser:
         mock_user_detail: UserDetail,
     ):
         """Test updating a non-existent user."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         app = FastAPI()
         app.include_router(router)
@@ -552,6 +609,7 @@ class TestUpdateUser:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -572,7 +630,7 @@ class TestUpdateUser:
         mock_user_detail: UserDetail,
     ):
         """Test updating user with all optional fields."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create the current user in DB
         user = KPrincipal(
@@ -599,6 +657,7 @@ class TestUpdateUser:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -645,7 +704,7 @@ class TestUpdateUserUsername:
         mock_user_detail: UserDetail,
     ):
         """Test successfully updating own username."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create the current user in DB
         user = KPrincipal(
@@ -672,6 +731,7 @@ class TestUpdateUserUsername:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -694,7 +754,7 @@ class TestUpdateUserUsername:
         mock_user_detail: UserDetail,
     ):
         """Test updating username to an existing username fails."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create existing user with target username
         existing_user = KPrincipal(
@@ -734,6 +794,7 @@ class TestUpdateUserUsername:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -754,7 +815,7 @@ class TestUpdateUserUsername:
         test_user_id: UUID,
     ):
         """Test that users without system or systemRoot role cannot update usernames."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create a user with insufficient privileges (SYSTEM_USER role)
         now = datetime.now()
@@ -809,6 +870,7 @@ class TestUpdateUserUsername:
             return insufficient_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -831,7 +893,7 @@ class TestUpdateUserUsername:
         mock_user_detail: UserDetail,
     ):
         """Test updating username for a non-existent user."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         app = FastAPI()
         app.include_router(router)
@@ -843,6 +905,7 @@ class TestUpdateUserUsername:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -867,7 +930,7 @@ class TestUpdateUserEmail:
         mock_user_detail: UserDetail,
     ):
         """Test successfully updating own email."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create the current user in DB
         user = KPrincipal(
@@ -895,6 +958,7 @@ class TestUpdateUserEmail:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -918,7 +982,7 @@ class TestUpdateUserEmail:
         test_user_id: UUID,
     ):
         """Test that users without system or systemRoot role cannot update emails."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create a user with insufficient privileges (SYSTEM_USER role)
         now = datetime.now()
@@ -973,6 +1037,7 @@ class TestUpdateUserEmail:
             return insufficient_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -995,7 +1060,7 @@ class TestUpdateUserEmail:
         mock_user_detail: UserDetail,
     ):
         """Test updating email for a non-existent user."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         app = FastAPI()
         app.include_router(router)
@@ -1007,6 +1072,7 @@ class TestUpdateUserEmail:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1031,7 +1097,7 @@ class TestUpdateUserPrimaryPhone:
         mock_user_detail: UserDetail,
     ):
         """Test successfully updating own primary phone."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create the current user in DB
         user = KPrincipal(
@@ -1060,6 +1126,7 @@ class TestUpdateUserPrimaryPhone:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1083,7 +1150,7 @@ class TestUpdateUserPrimaryPhone:
         test_user_id: UUID,
     ):
         """Test that users without system or systemRoot role cannot update phones."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create a user with insufficient privileges (SYSTEM_USER role)
         now = datetime.now()
@@ -1138,6 +1205,7 @@ class TestUpdateUserPrimaryPhone:
             return insufficient_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1160,7 +1228,7 @@ class TestUpdateUserPrimaryPhone:
         mock_user_detail: UserDetail,
     ):
         """Test updating phone for a non-existent user."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         app = FastAPI()
         app.include_router(router)
@@ -1172,6 +1240,7 @@ class TestUpdateUserPrimaryPhone:
             return mock_user_detail
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1198,7 +1267,7 @@ class TestDeleteUser:
         """Test successfully soft deleting a user (default behavior)."""
         from sqlalchemy import select
 
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create a user to delete
         user = KPrincipal(
@@ -1227,6 +1296,7 @@ class TestDeleteUser:
             return mock_root_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1253,7 +1323,7 @@ class TestDeleteUser:
         """Test that soft-deleted users are not visible in list."""
         from datetime import datetime
 
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create users
         user1 = KPrincipal(
@@ -1290,6 +1360,7 @@ class TestDeleteUser:
             return mock_root_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1312,7 +1383,7 @@ class TestDeleteUser:
         """Test that soft-deleted users cannot be retrieved."""
         from datetime import datetime
 
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create a soft-deleted user
         user = KPrincipal(
@@ -1340,6 +1411,7 @@ class TestDeleteUser:
             return mock_root_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1358,7 +1430,7 @@ class TestDeleteUser:
         """Test that soft-deleted users cannot be deleted again."""
         from datetime import datetime
 
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create a soft-deleted user
         user = KPrincipal(
@@ -1386,6 +1458,7 @@ class TestDeleteUser:
             return mock_root_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1404,7 +1477,7 @@ class TestDeleteUser:
         """Test hard delete with systemRoot role."""
         from sqlalchemy import select
 
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create a user to delete
         user = KPrincipal(
@@ -1433,6 +1506,7 @@ class TestDeleteUser:
             return mock_root_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1458,7 +1532,7 @@ class TestDeleteUser:
         """Test that delete endpoint allows system role."""
         from sqlalchemy import select
 
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create mock system user (should be allowed to delete)
         now = datetime.now()
@@ -1515,6 +1589,7 @@ class TestDeleteUser:
             return mock_system_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1539,7 +1614,7 @@ class TestDeleteUser:
         test_user_id: UUID,
     ):
         """Test that delete endpoint requires systemRoot role (systemAdmin not allowed)."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create mock systemAdmin user (not allowed to access delete endpoint)
         now = datetime.now()
@@ -1594,6 +1669,7 @@ class TestDeleteUser:
             return mock_admin_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1612,7 +1688,7 @@ class TestDeleteUser:
         test_user_id: UUID,
     ):
         """Test that users without system or systemRoot role cannot delete users."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         # Create a user with insufficient privileges (SYSTEM_USER role)
         now = datetime.now()
@@ -1667,6 +1743,7 @@ class TestDeleteUser:
             return insufficient_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1684,7 +1761,7 @@ class TestDeleteUser:
         mock_root_user: UserDetail,
     ):
         """Test deleting a non-existent user."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         app = FastAPI()
         app.include_router(router)
@@ -1696,6 +1773,7 @@ class TestDeleteUser:
             return mock_root_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
@@ -1713,7 +1791,7 @@ class TestDeleteUser:
         mock_root_user: UserDetail,
     ):
         """Test hard deleting a non-existent user."""
-        from app.core.db.database import get_db
+        from app.core.db.database import get_db, get_read_db
 
         app = FastAPI()
         app.include_router(router)
@@ -1725,6 +1803,7 @@ class TestDeleteUser:
             return mock_root_user
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         async with AsyncClient(
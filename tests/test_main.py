@@ -134,6 +134,31 @@ class TestLifespanManager:
         async with lifespan(app):
             pass
 
+    @pytest.mark.asyncio
+    @patch("app.main.invalidation_bus")
+    @patch("app.main.cleanup_database")
+    @patch("app.main.initialize_database")
+    async def test_lifespan_manages_invalidation_bus(
+        self, mock_init_db, mock_cleanup_db, mock_bus, monkeypatch
+    ):
+        """Test that the cache invalidation bus is started and stopped."""
+        from app.core.invalidation import PostgresNotifyTransport
+        from app.main import lifespan, settings
+
+        monkeypatch.setattr(settings, "cache_invalidation_enabled", True)
+
+        mock_bus.start = AsyncMock()
+        mock_bus.stop = AsyncMock()
+
+        app = MagicMock(spec=FastAPI)
+
+        async with lifespan(app):
+            mock_bus.start.assert_awaited_once()
+            (transport,) = mock_bus.start.await_args.args
+            assert isinstance(transport, PostgresNotifyTransport)
+
+        mock_bus.stop.assert_awaited_once()
+
 
 class TestApplicationEndpoints:
     """Integration tests for application endpoints."""